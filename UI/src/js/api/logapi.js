@@ -142,6 +142,23 @@ export const LogAPI = {
         }
     },
 
+    /**
+     * 노드 실행 로그 하나 조회 (파라미터/결과 포함)
+     * 목록 조회에는 파라미터/결과가 없으므로 로그를 열 때 호출합니다.
+     * @param {number} logId - 로그 ID
+     * @returns {Promise<Object>} 로그 (parameters, result 포함)
+     */
+    async getNodeExecutionLog(logId) {
+        try {
+            const result = await apiCall(`/api/logs/node-execution/${logId}`);
+            return result.data || result;
+        } catch (error) {
+            const logger = getLogger();
+            logger.error('[LogAPI] ❌ 로그 상세 조회 실패:', error);
+            throw error;
+        }
+    },
+
     /**
      * 특정 노드 실행 로그 삭제
      * @param {number} logId - 로그 ID
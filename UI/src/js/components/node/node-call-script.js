@@ -0,0 +1,31 @@
+// node-call-script.js
+// 스크립트 호출 노드 정의 (다른 스크립트를 서브 워크플로우로 실행)
+
+(function () {
+    if (!window.NodeManager) {
+        return;
+    }
+
+    window.NodeManager.registerNodeType('call-script', {
+        renderContent(nodeData) {
+            const icon = window.NodeIcons ? window.NodeIcons.getIcon('call-script', nodeData) : '📞';
+            // 파라미터는 nodeData에 직접 저장됨 (nodeData.script_id)
+            const scriptId = nodeData.script_id || nodeData.parameters?.script_id;
+            const description = scriptId ? `스크립트 #${scriptId} 호출` : '호출할 스크립트 미지정';
+            return `
+                <div class="node-input"></div>
+                <div class="node-content">
+                    <div class="node-icon-box">
+                        <div class="node-icon">${icon}</div>
+                    </div>
+                    <div class="node-text-area">
+                        <div class="node-title">${this.escapeHtml(nodeData.title || '스크립트 호출')}</div>
+                        <div class="node-description">${this.escapeHtml(description)}</div>
+                    </div>
+                </div>
+                <div class="node-output"></div>
+                <div class="node-settings">⚙</div>
+            `;
+        }
+    });
+})();
@@ -16,10 +16,13 @@ const NODE_ICONS = {
     wait: '🕐', // 대기 노드: 시계 아이콘
     'image-touch': '🖼️', // 이미지 터치 노드: 이미지 아이콘
     'process-focus': '🖥️', // 프로세스 포커스 노드: 모니터 아이콘
+    'input-sequence': '⌨️', // 입력 시퀀스 노드: 키보드 아이콘
+    'macro-playback': '⏯️', // 매크로 재생 노드: 재생 아이콘
 
     // 로직 노드
     condition: '🔐', // 조건 노드: 자물쇠 아이콘
     loop: '🔁', // 반복 노드: 반복 아이콘
+    'call-script': '📞', // 스크립트 호출 노드: 전화 아이콘
 
     // 기본/폴백
     default: '⚙' // 기본 노드: 기어 아이콘
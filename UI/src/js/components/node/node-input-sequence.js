@@ -0,0 +1,42 @@
+// node-input-sequence.js
+// 입력 시퀀스 노드 정의 (마우스/키보드 입력 여러 개를 정해진 간격으로 실행)
+
+(function () {
+    if (!window.NodeManager) {
+        return;
+    }
+
+    window.NodeManager.registerNodeType('input-sequence', {
+        renderContent(nodeData) {
+            const icon = window.NodeIcons ? window.NodeIcons.getIcon('input-sequence', nodeData) : '⌨️';
+            // 파라미터는 nodeData에 직접 저장됨 (nodeData.events, JSON 문자열 또는 배열)
+            const events = nodeData.events ?? nodeData.parameters?.events;
+            let count = 0;
+            if (Array.isArray(events)) {
+                count = events.length;
+            } else if (typeof events === 'string' && events.trim()) {
+                try {
+                    const parsed = JSON.parse(events);
+                    count = Array.isArray(parsed) ? parsed.length : 0;
+                } catch (e) {
+                    count = 0;
+                }
+            }
+            const description = count > 0 ? `입력 ${count}개 실행` : '입력 이벤트 미지정';
+            return `
+                <div class="node-input"></div>
+                <div class="node-content">
+                    <div class="node-icon-box">
+                        <div class="node-icon">${icon}</div>
+                    </div>
+                    <div class="node-text-area">
+                        <div class="node-title">${this.escapeHtml(nodeData.title || '입력 시퀀스')}</div>
+                        <div class="node-description">${this.escapeHtml(description)}</div>
+                    </div>
+                </div>
+                <div class="node-output"></div>
+                <div class="node-settings">⚙</div>
+            `;
+        }
+    });
+})();
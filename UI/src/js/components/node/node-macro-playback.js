@@ -0,0 +1,35 @@
+// node-macro-playback.js
+// 매크로 재생 노드 정의 (녹화한 마우스/키보드 매크로 재생)
+
+(function () {
+    if (!window.NodeManager) {
+        return;
+    }
+
+    window.NodeManager.registerNodeType('macro-playback', {
+        renderContent(nodeData) {
+            const icon = window.NodeIcons ? window.NodeIcons.getIcon('macro-playback', nodeData) : '⏯️';
+            // 파라미터는 nodeData에 직접 저장됨 (nodeData.macro, nodeData.speed)
+            const macro = nodeData.macro || nodeData.parameters?.macro;
+            const speed = Number(nodeData.speed ?? nodeData.parameters?.speed ?? 1);
+            let description = '재생할 매크로 미지정';
+            if (macro) {
+                description = speed && speed !== 1 ? `${macro} 재생 (${speed}배속)` : `${macro} 재생`;
+            }
+            return `
+                <div class="node-input"></div>
+                <div class="node-content">
+                    <div class="node-icon-box">
+                        <div class="node-icon">${icon}</div>
+                    </div>
+                    <div class="node-text-area">
+                        <div class="node-title">${this.escapeHtml(nodeData.title || '매크로 재생')}</div>
+                        <div class="node-description">${this.escapeHtml(description)}</div>
+                    </div>
+                </div>
+                <div class="node-output"></div>
+                <div class="node-settings">⚙</div>
+            `;
+        }
+    });
+})();
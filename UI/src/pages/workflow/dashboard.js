@@ -352,8 +352,8 @@ export class DashboardManager {
         try {
             const apiHost = window.API_HOST || 'localhost';
             const apiPort = window.API_PORT || 8001;
-            // 실행 기록 저장 후에는 캐시를 사용하지 않고 최신 데이터 조회
-            const response = await fetch(`http://${apiHost}:${apiPort}/api/dashboard/stats?use_cache=false`);
+            // 저장된 통계는 DB 트리거가 기록과 함께 갱신하므로 항상 최신 (재계산 없이 조회)
+            const response = await fetch(`http://${apiHost}:${apiPort}/api/dashboard/stats`);
 
             if (!response.ok) {
                 throw new Error(`HTTP error! status: ${response.status}`);
@@ -369,22 +369,12 @@ export class HistoryManager {
                     }
                 </div>
                 ${
-                    log.parameters && Object.keys(log.parameters).length > 0
+                    log.has_parameters || log.has_result
                         ? `
-                <div class="history-item-parameters">
-                    <div class="history-item-label">파라미터:</div>
-                    <pre class="history-item-value">${this.escapeHtml(JSON.stringify(log.parameters, null, 2))}</pre>
-                </div>
-                `
-                        : ''
-                }
-                ${
-                    log.result && Object.keys(log.result).length > 0
-                        ? `
-                <div class="history-item-result">
-                    <div class="history-item-label">결과:</div>
-                    <pre class="history-item-value">${this.escapeHtml(JSON.stringify(log.result, null, 2))}</pre>
-                </div>
+                <details class="history-item-payload">
+                    <summary>파라미터/결과 보기</summary>
+                    <div class="history-item-payload-body"></div>
+                </details>
                 `
                         : ''
                 }
@@ -394,16 +384,10 @@ export class HistoryManager {
                 <div class="history-item-error">
                     <div class="history-item-label">에러:</div>
                     <div class="history-item-error-message">${this.escapeHtml(log.error_message)}</div>
-                    ${
-                        log.error_traceback
-                            ? `
                     <details class="history-item-traceback">
                         <summary>스택 트레이스</summary>
-                        <pre>${this.escapeHtml(log.error_traceback)}</pre>
+                        <pre></pre>
                     </details>
-                    `
-                            : ''
-                    }
                 </div>
                 `
                         : ''
@@ -411,6 +395,28 @@ export class HistoryManager {
             </div>
         `;
 
+        // 파라미터/결과는 목록에 포함되지 않으므로 처음 펼칠 때 조회
+        const payload = item.querySelector('.history-item-payload');
+        if (payload) {
+            payload.addEventListener('toggle', () => {
+                if (payload.open && !payload.dataset.loaded) {
+                    payload.dataset.loaded = 'true';
+                    this.loadLogPayload(log.id, payload.querySelector('.history-item-payload-body'));
+                }
+            });
+        }
+
+        // 스택 트레이스도 목록에 포함되지 않으므로 처음 펼칠 때 조회
+        const traceback = item.querySelector('.history-item-traceback');
+        if (traceback) {
+            traceback.addEventListener('toggle', () => {
+                if (traceback.open && !traceback.dataset.loaded) {
+                    traceback.dataset.loaded = 'true';
+                    this.loadLogTraceback(log.id, traceback.querySelector('pre'));
+                }
+            });
+        }
+
         // 삭제 버튼 이벤트
         const deleteBtn = item.querySelector('.history-delete-item-btn');
         deleteBtn.addEventListener('click', async (e) => {
@@ -421,6 +427,51 @@ export class HistoryManager {
         return item;
     }
 
+    /**
+     * 로그 하나의 파라미터/결과를 조회해 표시
+     */
+    async loadLogPayload(logId, container) {
+        container.textContent = '불러오는 중...';
+        try {
+            const log = await LogAPI.getNodeExecutionLog(logId);
+            const sections = [
+                ['history-item-parameters', '파라미터:', log.parameters],
+                ['history-item-result', '결과:', log.result]
+            ].filter(([, , value]) => value && Object.keys(value).length > 0);
+            container.innerHTML = sections
+                .map(
+                    ([className, label, value]) => `
+                <div class="${className}">
+                    <div class="history-item-label">${label}</div>
+                    <pre class="history-item-value">${this.escapeHtml(JSON.stringify(value, null, 2))}</pre>
+                </div>
+                `
+                )
+                .join('');
+        } catch (error) {
+            const logger = getLogger();
+            logger.error(`[HistoryManager] 로그 상세 조회 실패 - 로그 ID: ${logId}`, error);
+            container.textContent = '파라미터/결과를 불러오지 못했습니다.';
+            delete container.parentElement.dataset.loaded;
+        }
+    }
+
+    /**
+     * 로그 하나의 스택 트레이스를 조회해 표시
+     */
+    async loadLogTraceback(logId, container) {
+        container.textContent = '불러오는 중...';
+        try {
+            const log = await LogAPI.getNodeExecutionLog(logId);
+            container.textContent = log.error_traceback || '스택 트레이스가 없습니다.';
+        } catch (error) {
+            const logger = getLogger();
+            logger.error(`[HistoryManager] 스택 트레이스 조회 실패 - 로그 ID: ${logId}`, error);
+            container.textContent = '스택 트레이스를 불러오지 못했습니다.';
+            delete container.parentElement.dataset.loaded;
+        }
+    }
+
     /**
      * 개별 로그 삭제
      */
@@ -4,10 +4,14 @@ API 패키지 초기화 파일
 
 from .action_node_router import router as action_node_router
 from .action_router import router as action_router
+from .checkpoint_router import router as checkpoint_router
 from .config_router import router as config_router
 from .dashboard_router import router as dashboard_router
 from .log_router import router as log_router
+from .macro_router import router as macro_router
 from .node_router import router as node_router
+from .queue_router import router as queue_router
+from .schedule_router import router as schedule_router
 from .screenshot_router import router as screenshot_router
 from .script_router import router as script_router
 from .state_router import router as state_router
@@ -15,10 +19,14 @@ from .state_router import router as state_router
 __all__ = [
     "action_node_router",
     "action_router",
+    "checkpoint_router",
     "config_router",
     "dashboard_router",
     "log_router",
+    "macro_router",
     "node_router",
+    "queue_router",
+    "schedule_router",
     "screenshot_router",
     "script_router",
     "state_router",
@@ -26,8 +26,12 @@ from models.process_focus_models import (
 from models.response_models import ListResponse
 from nodes.excelnodes.excel_manager import cleanup_excel_objects
 from services.action_service import ActionService
+from services.execution_queue import execution_queue, resources_for_nodes
 from services.node_execution_context import NodeExecutionContext
+from services.node_result_cache import cache_referenced_node_ids, node_result_cache
+from utils.cancellation import CancellationToken, apply_workflow_timeout, cancellation_registry
 from utils.execution_id_generator import generate_execution_id
+from utils.parameter_template import compile_node_templates, referenced_node_refs
 
 router = APIRouter(prefix="/api", tags=["actions"])
 action_service = ActionService()
@@ -52,14 +56,69 @@ async def execute_nodes(request: NodeExecutionRequest) -> ActionResponse:
     """
     노드 기반 워크플로우를 실행합니다.
     노드 간 데이터 전달을 지원합니다.
-    """
-    logger.info(f"[API] execute_nodes 호출됨 - 노드 개수: {len(request.nodes)}, 실행 모드: {request.execution_mode}")
-    logger.debug(f"[API] 요청 데이터: {request}")
 
+    요청에 포함된 노드가 점유하는 리소스(마우스/키보드, Excel 등)를 실행 큐와 공유하므로,
+    같은 리소스를 쓰는 다른 실행이 끝날 때까지 기다린 뒤 실행됩니다.
+    """
     # 실행 ID 생성 (같은 실행의 노드들을 그룹화)
     # 반복 노드 실행 시 클라이언트에서 전달된 execution_id 사용, 없으면 새로 생성
     execution_id = request.execution_id if request.execution_id else generate_execution_id()
 
+    # 취소 토큰 등록 (리소스 대기 중에도 POST /api/executions/{execution_id}/cancel로 취소 가능)
+    resources = resources_for_nodes(request.nodes)
+    with cancellation_registry.track(execution_id) as cancel_token:
+        async with execution_queue.resource_slot(resources):
+            # 워크플로우 제한 시간은 리소스를 점유한 뒤(실제 실행 시작)부터 계산
+            apply_workflow_timeout(cancel_token, request.timeout_seconds)
+            return await _execute_nodes_impl(request, execution_id, cancel_token)
+
+
+@router.get("/executions", response_model=ListResponse)
+@api_handler
+async def get_active_executions() -> ListResponse:
+    """실행 중인 워크플로우 실행 목록을 조회합니다. (취소 가능한 execution_id 확인용)"""
+    return list_response(cancellation_registry.list_active(), "실행 중인 실행 목록 조회 완료")
+
+
+@router.post("/executions/{execution_id}/cancel", response_model=SuccessResponse)
+@api_handler
+async def cancel_execution(execution_id: str) -> SuccessResponse:
+    """
+    실행 중인 워크플로우를 취소합니다.
+    실행 중인 노드의 대기/이미지 탐색/HTTP 요청이 즉시 중단되고, 남은 노드는 실행되지 않습니다.
+    """
+    logger.info(f"[API] 실행 취소 요청 - 실행 ID: {execution_id}")
+    if not cancellation_registry.cancel(execution_id):
+        raise HTTPException(status_code=404, detail=f"실행 중인 실행을 찾을 수 없습니다: {execution_id}")
+    return success_response({"execution_id": execution_id}, "실행 취소를 요청했습니다.")
+
+
+@router.get("/node-cache", response_model=SuccessResponse)
+@api_handler
+async def get_node_cache_stats() -> SuccessResponse:
+    """노드 결과 캐시 통계(항목 수, 히트/미스 횟수, 히트율)를 조회합니다."""
+    return success_response(node_result_cache.stats(), "노드 결과 캐시 통계 조회 완료")
+
+
+@router.delete("/node-cache", response_model=SuccessResponse)
+@api_handler
+async def clear_node_cache() -> SuccessResponse:
+    """노드 결과 캐시를 비웁니다. (외부 데이터가 바뀌어 캐시된 결과를 버려야 할 때 사용)"""
+    logger.info("[API] 노드 결과 캐시 초기화 요청")
+    cleared = node_result_cache.clear()
+    return success_response({"cleared": cleared}, f"노드 결과 캐시 {cleared}개 항목을 삭제했습니다.")
+
+
+async def _execute_nodes_impl(
+    request: NodeExecutionRequest, execution_id: str, cancel_token: CancellationToken
+) -> ActionResponse:
+    """
+    노드 기반 워크플로우 실행 본체 (리소스 점유 상태에서 호출됨)
+    취소 토큰이 취소되면 다음 노드부터 실행하지 않고, 실행 중인 노드는 대기/폴링/HTTP 요청이 중단됩니다.
+    """
+    logger.info(f"[API] execute_nodes 호출됨 - 노드 개수: {len(request.nodes)}, 실행 모드: {request.execution_mode}")
+    logger.debug(f"[API] 요청 데이터: {request}")
+
     # 스크립트 ID 추출 (요청에서 가져오거나 None)
     # request.script_id가 None이 아닌 경우 그 값을 사용, None이면 getattr로 다시 확인
     script_id = request.script_id if request.script_id is not None else getattr(request, "script_id", None)
@@ -84,7 +143,11 @@ async def execute_nodes(request: NodeExecutionRequest) -> ActionResponse:
 
     # 노드 실행 컨텍스트 생성 (데이터 전달)
     # 노드 간 데이터 전달을 위한 컨텍스트 객체 (이전 노드의 출력을 다음 노드에 전달)
-    context = NodeExecutionContext()
+    context = NodeExecutionContext(cancel_token=cancel_token)
+    # 노드 파라미터 템플릿 컴파일 (표현식은 여기서 한 번만 해석되고, 노드 실행 시에는 컴파일된 접근 함수만 호출)
+    context.parameter_templates = compile_node_templates(request.nodes)
+    # 다른 노드가 참조하는 노드 결과(템플릿, 캐시 inputs)는 보존 정책과 관계없이 유지
+    context.pin(*referenced_node_refs(context.parameter_templates), *cache_referenced_node_ids(request.nodes))
 
     # 클라이언트에서 전달된 이전 노드 결과가 있으면 컨텍스트에 추가
     # 반복 노드나 조건 노드에서 이전 반복/분기의 결과를 사용하기 위함
@@ -130,6 +193,9 @@ async def execute_nodes(request: NodeExecutionRequest) -> ActionResponse:
                 iteration_results = []
                 # 요청된 노드들을 순차적으로 실행
                 for i, node in enumerate(request.nodes):
+                    # 실행이 취소되었으면 남은 노드는 실행하지 않음
+                    if cancel_token.cancelled:
+                        break
                     node_id = node.get("id", f"node_{i}")
                     node_type = node.get("type", "unknown")
                     node_name = node.get("data", {}).get("title") or node.get("data", {}).get("name") or node_id
@@ -233,12 +299,17 @@ async def execute_nodes(request: NodeExecutionRequest) -> ActionResponse:
                 # 반복 실행
                 all_iteration_results = []
                 for iteration in range(repeat_count):
+                    # 실행이 취소되었으면 남은 반복은 실행하지 않음
+                    if cancel_token.cancelled:
+                        break
                     logger.info(f"[API] 반복 실행 {iteration + 1}/{repeat_count} 시작")
                     # iteration_results: 현재 반복의 실행 결과 리스트
                     iteration_results = []
 
                     # 요청된 노드들을 순차적으로 실행
                     for i, node in enumerate(request.nodes):
+                        if cancel_token.cancelled:
+                            break
                         node_id = node.get("id", f"node_{i}")
                         node_type = node.get("type", "unknown")
                         node_name = node.get("data", {}).get("title") or node.get("data", {}).get("name") or node_id
@@ -344,6 +415,9 @@ async def execute_nodes(request: NodeExecutionRequest) -> ActionResponse:
         else:
             # 일반 노드 실행 (반복 정보가 없는 경우)
             for i, node in enumerate(request.nodes):
+                # 실행이 취소되었으면 남은 노드는 실행하지 않음
+                if cancel_token.cancelled:
+                    break
                 node_id = node.get("id", f"node_{i}")
                 node_type = node.get("type", "unknown")
                 node_name = node.get("data", {}).get("title") or node.get("data", {}).get("name") or node_id
@@ -420,6 +494,13 @@ async def execute_nodes(request: NodeExecutionRequest) -> ActionResponse:
     )
     logger.debug(f"[API] 실행 결과 상세: {results}")
 
+    # 실행 취소 확인 (취소된 실행은 실패로 응답하고 실행 기록은 cancelled 상태로 남김)
+    cancelled = cancel_token.cancelled
+    if cancelled:
+        has_error = True
+        error_message = cancel_token.reason
+        logger.info(f"[API] 실행 취소됨 - 실행 ID: {execution_id}, 사유: {cancel_token.reason}")
+
     # 엑셀 객체 정리 (열려있는 엑셀 파일이 있으면 닫기)
     # execution_id를 기준으로 해당 실행에서 생성된 엑셀 객체들을 정리
     try:
@@ -436,7 +517,7 @@ async def execute_nodes(request: NodeExecutionRequest) -> ActionResponse:
     # script_id와 execution_record_id가 모두 있으면 DB에 실행 결과 업데이트
     if script_id and execution_record_id:
         try:
-            final_status = "error" if has_error else "success"
+            final_status = "cancelled" if cancelled else "error" if has_error else "success"
             db_manager.record_script_execution(
                 script_id=script_id,
                 status=final_status,
@@ -468,6 +549,7 @@ async def execute_nodes(request: NodeExecutionRequest) -> ActionResponse:
                 "results": results,
                 "context": context.to_dict(),  # 컨텍스트 정보도 반환 (디버깅용)
                 "execution_id": execution_id,  # 실행 ID 반환 (로그 확인용)
+                "cancelled": cancelled,  # 실행 취소 여부
             },
         )
 
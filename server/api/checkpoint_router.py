@@ -0,0 +1,82 @@
+"""
+실행 체크포인트 관련 API 라우터
+"""
+
+from fastapi import APIRouter, HTTPException
+
+from api.response_helpers import list_response, success_response
+from api.router_wrapper import api_handler
+from db.database import db_manager
+from db.execution_checkpoint_repository import RESUMABLE_STATUSES
+from log import log_manager
+from models.queue_models import QueueEnqueueRequest
+from models.response_models import ListResponse, SuccessResponse
+from services.execution_queue import execution_queue
+
+router = APIRouter(prefix="/api/checkpoints", tags=["checkpoints"])
+logger = log_manager.logger
+
+
+@router.get("", response_model=ListResponse)
+@api_handler
+async def get_checkpoints(status: str | None = None, script_id: int | None = None, limit: int = 100) -> ListResponse:
+    """실행 체크포인트 목록을 조회합니다. (status, script_id로 필터링)"""
+    checkpoints = db_manager.execution_checkpoints.list_checkpoints(
+        status=status, script_id=script_id, limit=max(1, min(limit, 1000))
+    )
+    return list_response(checkpoints, "체크포인트 목록 조회 완료")
+
+
+@router.get("/{execution_id}", response_model=SuccessResponse)
+@api_handler
+async def get_checkpoint(execution_id: str, include_results: bool = False) -> SuccessResponse:
+    """실행 체크포인트 한 건을 조회합니다. (include_results=true이면 보존된 노드 결과 포함)"""
+    checkpoint = db_manager.execution_checkpoints.get_checkpoint(execution_id, include_results=include_results)
+    if not checkpoint:
+        raise HTTPException(status_code=404, detail=f"체크포인트를 찾을 수 없습니다: {execution_id}")
+    return success_response(checkpoint, "체크포인트 조회 완료")
+
+
+@router.post("/{execution_id}/resume", response_model=SuccessResponse)
+@api_handler
+async def resume_execution(execution_id: str, request: QueueEnqueueRequest | None = None) -> SuccessResponse:
+    """
+    마지막 체크포인트부터 실행을 재개합니다.
+    재개 실행은 실행 큐에 등록되며, 원래 실행 ID를 그대로 사용합니다.
+    """
+    checkpoint = db_manager.execution_checkpoints.get_checkpoint(execution_id)
+    if not checkpoint:
+        raise HTTPException(status_code=404, detail=f"체크포인트를 찾을 수 없습니다: {execution_id}")
+    if checkpoint["status"] not in RESUMABLE_STATUSES:
+        raise HTTPException(
+            status_code=409,
+            detail=f"재개할 수 없는 상태입니다: {checkpoint['status']} (재개 가능: {', '.join(RESUMABLE_STATUSES)})",
+        )
+
+    logger.info(
+        f"[API] 실행 재개 요청 - 실행 ID: {execution_id}, 스크립트 ID: {checkpoint['script_id']}, "
+        f"체크포인트 순번: {checkpoint['sequence']}"
+    )
+    try:
+        run = await execution_queue.enqueue_script(
+            checkpoint["script_id"],
+            priority=request.priority if request else 0,
+            source="resume",
+            timeout_seconds=request.timeout_seconds if request else None,
+            resume_execution_id=execution_id,
+            checkpoint_interval_seconds=request.checkpoint_interval_seconds if request else None,
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=404, detail=str(e))
+    # 재개 대기 상태로 표시 (중복 재개 방지, 서버가 다시 종료되면 시작 시 interrupted로 돌아감)
+    db_manager.execution_checkpoints.update_status(execution_id, "resuming")
+    return success_response(run.to_dict(), "실행 재개가 큐에 등록되었습니다.")
+
+
+@router.delete("/{execution_id}", response_model=SuccessResponse)
+@api_handler
+async def delete_checkpoint(execution_id: str) -> SuccessResponse:
+    """실행 체크포인트를 삭제합니다."""
+    if not db_manager.execution_checkpoints.delete_checkpoint(execution_id):
+        raise HTTPException(status_code=404, detail=f"체크포인트를 찾을 수 없습니다: {execution_id}")
+    return success_response({"execution_id": execution_id}, "체크포인트가 삭제되었습니다.")
@@ -77,22 +77,11 @@ async def increment_execution_count(request: Request, data: dict = Body(...)) ->
 
     try:
         is_success = data.get("success", True)
-        current_stats = db_manager.get_dashboard_stats(use_cache=False)
 
-        # 현재 통계 가져오기 (None 체크 및 타입 보장)
-        current_executions = current_stats.get("all_executions", 0) or 0
-        current_failed = current_stats.get("all_failed_scripts", 0) or 0
-
-        # 타입 보장 (int로 변환)
-        current_executions = int(current_executions)
-        current_failed = int(current_failed)
-
-        # 통계 증가
-        new_executions = current_executions + 1
-        new_failed = current_failed + (0 if is_success else 1)
-
-        # 통계 업데이트
-        db_manager.set_all_execution_stats(new_executions, new_failed)
+        # 통계 증가 (DB에서 원자적으로 증가하므로 동시에 호출되어도 누락 없음)
+        updated = db_manager.increment_all_execution_stats(bool(is_success))
+        new_executions = updated["all_executions"]
+        new_failed = updated["all_failed_scripts"]
 
         logger.info(f"[API] 전체 실행 횟수 증가 완료 - 총 실행: {new_executions}, 실패: {new_failed}")
         return success_response(
@@ -2,18 +2,130 @@
 로그 관련 API 라우터
 """
 
+import asyncio
+from collections.abc import Iterator
+import csv
+import io
+import json
+from typing import Any
+import zlib
+
 from fastapi import APIRouter, HTTPException, Query, Request
+from fastapi.responses import StreamingResponse
+from pydantic import TypeAdapter, ValidationError
 
-from api.response_helpers import list_response, success_response
+from api.response_helpers import cursor_list_response, list_response, paginated_response, success_response
 from api.router_wrapper import api_handler
+from config.server_config import settings
 from db.database import db_manager
+from db.node_execution_log_repository import LOG_FIELDS, resolve_log_fields
 from log import log_manager
 from models.log_models import NodeExecutionLogRequest, NodeExecutionLogResponse
-from models.response_models import ListResponse, SuccessResponse
+from models.response_models import CursorListResponse, ListResponse, PaginatedResponse, SuccessResponse
+from services.log_retention import log_retention
+from services.log_sink import log_sink
 
 router = APIRouter(prefix="/api/logs", tags=["logs"])
 logger = log_manager.logger
 
+# 일괄 수집 요청 검증기 (레코드 목록 전체를 한 번에 검증하고 모든 오류를 함께 보고)
+_log_batch_adapter = TypeAdapter(list[NodeExecutionLogRequest])
+
+
+# 내보내기 형식별 Content-Type
+_EXPORT_MEDIA_TYPES = {"ndjson": "application/x-ndjson", "csv": "text/csv; charset=utf-8"}
+
+
+def _export_value(value: Any) -> Any:
+    """CSV 셀 값 변환 (딕셔너리/목록은 JSON 문자열, None은 빈 칸)"""
+    if value is None:
+        return ""
+    if isinstance(value, dict | list):
+        return json.dumps(value, ensure_ascii=False)
+    return value
+
+
+def _export_stream(
+    chunks: Iterator[list[dict[str, Any]]], fields: tuple[str, ...], export_format: str, compress: bool
+) -> Iterator[bytes]:
+    """
+    로그 묶음을 내보내기 형식의 바이트로 바꿔 차례로 내보냅니다. (한 번에 한 묶음만 메모리에 둠)
+
+    Args:
+        chunks: 로그 묶음 (NodeExecutionLogRepository.iter_logs)
+        fields: 내보낼 필드 (CSV 헤더 순서)
+        export_format: "ndjson" 또는 "csv"
+        compress: gzip으로 압축할지 여부
+
+    Yields:
+        응답 본문 조각
+    """
+    # wbits=31: gzip 헤더/트레일러를 붙여 .gz 파일로 바로 열 수 있게 함
+    compressor = zlib.compressobj(6, zlib.DEFLATED, 31) if compress else None
+    exported = 0
+    buffer = io.StringIO()
+    writer = csv.writer(buffer, lineterminator="\n")
+    if export_format == "csv":
+        # BOM: 엑셀에서 열 때 한글이 깨지지 않도록 UTF-8임을 표시
+        buffer.write("\ufeff")
+        writer.writerow(fields)
+
+    for logs in chunks:
+        if export_format == "csv":
+            writer.writerows([_export_value(log.get(field)) for field in fields] for log in logs)
+        else:
+            buffer.writelines(json.dumps(log, ensure_ascii=False) + "\n" for log in logs)
+        data = buffer.getvalue().encode("utf-8")
+        buffer.seek(0)
+        buffer.truncate()
+        exported += len(logs)
+        if compressor:
+            data = compressor.compress(data)
+        if data:
+            yield data
+
+    if buffer.tell():
+        # 로그가 없어도 CSV 헤더는 내보냄
+        data = buffer.getvalue().encode("utf-8")
+        yield compressor.compress(data) if compressor else data
+    if compressor:
+        yield compressor.flush()
+    logger.info(f"[API] 노드 실행 로그 내보내기 완료 - 형식: {export_format}, 로그: {exported}개, gzip: {compress}")
+
+
+def _parse_log_batch(body: bytes, content_type: str) -> list[Any]:
+    """
+    일괄 수집 요청 본문을 레코드 목록으로 변환합니다.
+
+    Args:
+        body: 요청 본문 (JSON 배열 또는 한 줄에 JSON 객체 하나인 NDJSON)
+        content_type: 요청 Content-Type
+
+    Returns:
+        검증 전 레코드 목록
+
+    Raises:
+        HTTPException: JSON 형식이 잘못된 경우 (400)
+    """
+    text = body.decode("utf-8").strip()
+    if "ndjson" not in content_type and text.startswith("["):
+        try:
+            records = json.loads(text)
+        except json.JSONDecodeError as e:
+            raise HTTPException(status_code=400, detail=f"JSON 배열 형식이 올바르지 않습니다: {e!s}")
+        if not isinstance(records, list):
+            raise HTTPException(status_code=400, detail="요청 본문은 JSON 배열이어야 합니다.")
+        return records
+    records = []
+    for line_number, line in enumerate(text.splitlines(), start=1):
+        if not line.strip():
+            continue
+        try:
+            records.append(json.loads(line))
+        except json.JSONDecodeError as e:
+            raise HTTPException(status_code=400, detail=f"NDJSON {line_number}번째 줄 형식이 올바르지 않습니다: {e!s}")
+    return records
+
 
 @router.post("/node-execution", response_model=NodeExecutionLogResponse)
 @api_handler
@@ -42,16 +154,9 @@ async def create_node_execution_log(request: NodeExecutionLogRequest, api_reques
             result=request.result,
             error_message=request.error_message,
             error_traceback=request.error_traceback,
+            attempt=request.attempt,
         )
 
-        # 통계 업데이트 (completed 또는 failed 상태일 때만, running은 제외)
-        # running 상태는 나중에 completed/failed로 업데이트되므로 중복 카운팅 방지
-        if request.status in ("completed", "failed"):
-            try:
-                db_manager.log_stats.calculate_and_update_stats()
-            except Exception as stats_error:
-                logger.warning(f"[API] 로그 통계 업데이트 실패 (무시): {stats_error!s}")
-
         logger.info(
             f"[API] 노드 실행 로그 생성 성공 - 로그 ID: {log_id}, 노드 ID: {request.node_id}, 상태: {request.status}"
         )
@@ -62,7 +167,61 @@ async def create_node_execution_log(request: NodeExecutionLogRequest, api_reques
         raise HTTPException(status_code=500, detail=f"로그 생성 실패: {e!s}")
 
 
-@router.get("/node-execution", response_model=ListResponse)
+@router.post("/node-execution/batch", response_model=SuccessResponse)
+@api_handler
+async def create_node_execution_logs_batch(api_request: Request) -> SuccessResponse:
+    """
+    노드 실행 로그 여러 건을 한 번에 생성합니다. (원격 워커용)
+    본문은 JSON 배열 또는 NDJSON(Content-Type: application/x-ndjson)이며, 모든 레코드를 먼저 검증한 뒤
+    하나의 트랜잭션으로 기록합니다. 잘못된 레코드가 하나라도 있으면 아무것도 기록하지 않습니다.
+    """
+    records = _parse_log_batch(await api_request.body(), api_request.headers.get("content-type", ""))
+    if not records:
+        raise HTTPException(status_code=400, detail="기록할 로그가 없습니다.")
+    if len(records) > settings.LOG_BATCH_MAX_RECORDS:
+        raise HTTPException(
+            status_code=413,
+            detail=f"요청 하나에 최대 {settings.LOG_BATCH_MAX_RECORDS}개까지 보낼 수 있습니다. (받은 개수: {len(records)})",
+        )
+    try:
+        validated = _log_batch_adapter.validate_python(records)
+    except ValidationError as e:
+        raise HTTPException(status_code=422, detail=e.errors(include_url=False))
+
+    written = await asyncio.to_thread(
+        db_manager.node_execution_logs.write_logs, [record.model_dump() for record in validated]
+    )
+
+    logger.info(f"[API] 노드 실행 로그 일괄 생성 - 받은 로그: {len(validated)}개, 반영: {written}개")
+    return success_response({"received": len(validated), "written": written}, "노드 실행 로그가 일괄 생성되었습니다.")
+
+
+def _parse_log_fields(fields: str | None) -> tuple[str, ...] | None:
+    """
+    fields 쿼리(쉼표로 구분한 필드 이름)를 조회할 필드 목록으로 변환합니다.
+
+    Args:
+        fields: 필드 쿼리 (예: "id,node_name,status")
+
+    Returns:
+        조회할 필드 목록 (비어 있으면 None - 기본 요약)
+
+    Raises:
+        HTTPException: 알 수 없는 필드를 요청한 경우 (400)
+    """
+    if not fields:
+        return None
+    names = tuple(dict.fromkeys(name.strip() for name in fields.split(",") if name.strip()))
+    unknown = [name for name in names if name not in LOG_FIELDS]
+    if unknown:
+        raise HTTPException(
+            status_code=400,
+            detail=f"알 수 없는 필드입니다: {', '.join(unknown)} (사용 가능: {', '.join(LOG_FIELDS)})",
+        )
+    return names or None
+
+
+@router.get("/node-execution", response_model=CursorListResponse)
 @api_handler
 async def get_node_execution_logs(
     http_request: Request,
@@ -70,58 +229,167 @@ async def get_node_execution_logs(
     script_id: int | None = Query(None, description="스크립트 ID"),
     node_id: str | None = Query(None, description="노드 ID"),
     limit: int = Query(100, ge=1, le=1000, description="조회할 최대 개수"),
-    offset: int = Query(0, ge=0, description="건너뛸 개수"),
-) -> ListResponse:
+    cursor: str | None = Query(None, description="다음 페이지 커서 (이전 응답의 next_cursor)"),
+    offset: int = Query(0, ge=0, description="건너뛸 개수 (cursor가 없을 때만 사용)"),
+    fields: str | None = Query(None, description="조회할 필드 (쉼표로 구분, 예: id,node_name,status)"),
+    include_payloads: bool = Query(False, description="파라미터/결과 포함 여부 (기본은 has_parameters/has_result만)"),
+) -> CursorListResponse:
     """
     노드 실행 로그를 조회합니다.
+    목록에는 파라미터/결과를 넣지 않으며, 로그를 열 때 /api/logs/node-execution/{log_id}로 가져옵니다.
+    execution_id가 없으면 최신순으로 한 페이지씩 조회하며, 다음 페이지는 응답의 next_cursor로 요청합니다.
     """
     client_ip = http_request.client.host if http_request.client else "unknown"
     logger.debug(
         f"[API] 노드 실행 로그 조회 요청 - execution_id: {execution_id}, script_id: {script_id}, node_id: {node_id}, 클라이언트 IP: {client_ip}"
     )
 
+    selected = resolve_log_fields(_parse_log_fields(fields), include_payloads)
     try:
+        repository = db_manager.node_execution_logs
+        next_cursor = None
         if execution_id:
-            logs = db_manager.node_execution_logs.get_logs_by_execution_id(execution_id)
-        elif script_id:
-            logs = db_manager.node_execution_logs.get_logs_by_script_id(script_id, limit=limit, offset=offset)
-        elif node_id:
-            logs = db_manager.node_execution_logs.get_logs_by_node_id(node_id, limit=limit, offset=offset)
+            logs = repository.get_logs_by_execution_id(execution_id, fields=selected)
         else:
-            logs = db_manager.node_execution_logs.get_recent_logs(limit=limit)
+            logs, next_cursor = repository.list_logs(
+                script_id=script_id, node_id=node_id, limit=limit, cursor=cursor, offset=offset, fields=selected
+            )
 
         logger.info(f"[API] 노드 실행 로그 조회 성공 - 로그 개수: {len(logs)}개")
 
-        return list_response(logs, "노드 실행 로그 조회 완료")
+        return cursor_list_response(logs, next_cursor, "노드 실행 로그 조회 완료")
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         logger.error(f"[API] 노드 실행 로그 조회 실패: {e!s}")
         raise HTTPException(status_code=500, detail=f"로그 조회 실패: {e!s}")
 
 
-@router.get("/node-execution/failed", response_model=ListResponse)
+@router.get("/node-execution/failed", response_model=CursorListResponse)
 @api_handler
 async def get_failed_node_execution_logs(
     http_request: Request,
     script_id: int | None = Query(None, description="스크립트 ID (선택사항)"),
     limit: int = Query(100, ge=1, le=1000, description="조회할 최대 개수"),
-) -> ListResponse:
+    cursor: str | None = Query(None, description="다음 페이지 커서 (이전 응답의 next_cursor)"),
+    fields: str | None = Query(None, description="조회할 필드 (쉼표로 구분, 예: id,node_name,error_message)"),
+    include_payloads: bool = Query(False, description="파라미터/결과 포함 여부 (기본은 has_parameters/has_result만)"),
+) -> CursorListResponse:
     """
-    실패한 노드 실행 로그를 조회합니다.
+    실패한 노드 실행 로그를 최신순으로 한 페이지씩 조회합니다.
     """
     client_ip = http_request.client.host if http_request.client else "unknown"
     logger.debug(f"[API] 실패한 노드 실행 로그 조회 요청 - script_id: {script_id}, 클라이언트 IP: {client_ip}")
 
+    selected = resolve_log_fields(_parse_log_fields(fields), include_payloads)
     try:
-        logs = db_manager.node_execution_logs.get_failed_logs(script_id=script_id, limit=limit)
+        logs, next_cursor = db_manager.node_execution_logs.list_logs(
+            script_id=script_id, status="failed", limit=limit, cursor=cursor, fields=selected
+        )
 
         logger.info(f"[API] 실패한 노드 실행 로그 조회 성공 - 로그 개수: {len(logs)}개")
 
-        return list_response(logs, "실패한 노드 실행 로그 조회 완료")
+        return cursor_list_response(logs, next_cursor, "실패한 노드 실행 로그 조회 완료")
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         logger.error(f"[API] 실패한 노드 실행 로그 조회 실패: {e!s}")
         raise HTTPException(status_code=500, detail=f"로그 조회 실패: {e!s}")
 
 
+@router.get("/search", response_model=PaginatedResponse)
+@api_handler
+async def search_node_execution_logs(
+    http_request: Request,
+    q: str = Query(..., min_length=1, description="검색어 (공백으로 구분한 단어를 모두 포함, 단어는 접두어로 검색)"),
+    script_id: int | None = Query(None, description="스크립트 ID"),
+    node_id: str | None = Query(None, description="노드 ID"),
+    status: str | None = Query(None, description="실행 상태 (running, completed, failed)"),
+    since: str | None = Query(
+        None, description="이 시각 이후에 시작한 로그만 (예: 2024-01-01 또는 2024-01-01T10:00:00)"
+    ),
+    until: str | None = Query(None, description="이 시각 이전에 시작한 로그만 (예: 2024-01-08)"),
+    page: int = Query(1, ge=1, description="페이지 (1부터 시작)"),
+    page_size: int = Query(50, ge=1, le=500, description="페이지 크기"),
+) -> PaginatedResponse:
+    """
+    노드 이름, 에러 메시지, 스택 트레이스, 결과(검색 필드)에서 로그를 전문 검색합니다.
+    관련도순으로 정렬하며, 각 로그에 순위 점수(rank, 작을수록 관련도 높음)와 일치 부분 발췌(snippet)를 포함합니다.
+    """
+    client_ip = http_request.client.host if http_request.client else "unknown"
+    logger.debug(
+        f"[API] 노드 실행 로그 검색 요청 - 검색어: {q}, script_id: {script_id}, status: {status}, 클라이언트 IP: {client_ip}"
+    )
+
+    try:
+        logs, total = await asyncio.to_thread(
+            db_manager.node_execution_logs.search_logs,
+            q,
+            script_id=script_id,
+            node_id=node_id,
+            status=status,
+            since=since,
+            until=until,
+            limit=page_size,
+            offset=(page - 1) * page_size,
+        )
+
+        logger.info(f"[API] 노드 실행 로그 검색 성공 - 검색어: {q}, 결과: {total}개")
+
+        return paginated_response(logs, page, page_size, total, "노드 실행 로그 검색 완료")
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        logger.error(f"[API] 노드 실행 로그 검색 실패: {e!s}")
+        raise HTTPException(status_code=500, detail=f"로그 검색 실패: {e!s}")
+
+
+@router.get("/export")
+@api_handler
+async def export_node_execution_logs(
+    http_request: Request,
+    export_format: str = Query("ndjson", alias="format", pattern="^(ndjson|csv)$", description="형식 (ndjson, csv)"),
+    execution_id: str | None = Query(None, description="워크플로우 실행 ID"),
+    script_id: int | None = Query(None, description="스크립트 ID"),
+    node_id: str | None = Query(None, description="노드 ID"),
+    status: str | None = Query(None, description="실행 상태 (running, completed, failed)"),
+    since: str | None = Query(
+        None, description="이 시각 이후에 시작한 로그만 (예: 2024-01-01 또는 2024-01-01T10:00:00)"
+    ),
+    until: str | None = Query(None, description="이 시각 이전에 시작한 로그만 (예: 2024-01-08)"),
+    fields: str | None = Query(None, description="내보낼 필드 (쉼표로 구분, 기본은 목록 요약 필드)"),
+    include_payloads: bool = Query(False, description="파라미터/결과 포함 여부"),
+    gzip: bool = Query(False, description="gzip 압축 여부 (.gz 파일로 내려받음)"),
+    chunk_size: int = Query(1000, ge=100, le=10000, description="한 번에 조회할 로그 수"),
+) -> StreamingResponse:
+    """
+    노드 실행 로그를 NDJSON 또는 CSV 파일로 내보냅니다. (로그 ID순)
+    로그를 chunk_size개씩 조회해 바로 응답으로 흘려보내므로, 내보내는 로그 수와 관계없이 메모리 사용량이 일정합니다.
+    """
+    client_ip = http_request.client.host if http_request.client else "unknown"
+    logger.debug(
+        f"[API] 노드 실행 로그 내보내기 요청 - 형식: {export_format}, script_id: {script_id}, status: {status}, 클라이언트 IP: {client_ip}"
+    )
+
+    selected = resolve_log_fields(_parse_log_fields(fields), include_payloads)
+    chunks = db_manager.node_execution_logs.iter_logs(
+        execution_id=execution_id,
+        script_id=script_id,
+        node_id=node_id,
+        status=status,
+        since=since,
+        until=until,
+        fields=selected,
+        chunk_size=chunk_size,
+    )
+    filename = f"node_execution_logs.{export_format}{'.gz' if gzip else ''}"
+    return StreamingResponse(
+        _export_stream(chunks, selected, export_format, gzip),
+        media_type="application/gzip" if gzip else _EXPORT_MEDIA_TYPES[export_format],
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+    )
+
+
 @router.delete("/node-execution/{log_id}", response_model=SuccessResponse)
 @api_handler
 async def delete_node_execution_log(log_id: int, http_request: Request) -> SuccessResponse:
@@ -136,8 +404,8 @@ async def delete_node_execution_log(log_id: int, http_request: Request) -> Succe
         if not deleted:
             raise HTTPException(status_code=404, detail="로그를 찾을 수 없습니다.")
 
-        # 통계 업데이트
-        stats = db_manager.log_stats.calculate_and_update_stats()
+        # 삭제 후 통계 (트리거가 삭제와 함께 갱신)
+        stats = db_manager.log_stats.get_log_stats()
 
         logger.info(f"[API] 노드 실행 로그 삭제 성공 - 로그 ID: {log_id}")
         return success_response(
@@ -163,8 +431,8 @@ async def delete_node_execution_logs_by_execution_id(execution_id: str, http_req
     try:
         deleted_count = db_manager.node_execution_logs.delete_logs_by_execution_id(execution_id)
 
-        # 통계 업데이트
-        stats = db_manager.log_stats.calculate_and_update_stats()
+        # 삭제 후 통계 (트리거가 삭제와 함께 갱신)
+        stats = db_manager.log_stats.get_log_stats()
 
         logger.info(
             f"[API] 실행 ID별 노드 실행 로그 삭제 성공 - execution_id: {execution_id}, 삭제된 개수: {deleted_count}"
@@ -190,8 +458,8 @@ async def delete_all_node_execution_logs(http_request: Request) -> SuccessRespon
     try:
         deleted_count = db_manager.node_execution_logs.delete_all_logs()
 
-        # 통계 업데이트
-        stats = db_manager.log_stats.calculate_and_update_stats()
+        # 삭제 후 통계 (트리거가 삭제와 함께 갱신)
+        stats = db_manager.log_stats.get_log_stats()
 
         logger.info(f"[API] 전체 노드 실행 로그 삭제 성공 - 삭제된 개수: {deleted_count}")
         return success_response(
@@ -300,3 +568,61 @@ async def check_logs_ready(
     except Exception as e:
         logger.error(f"[API] 로그 저장 완료 확인 실패: {e!s}")
         raise HTTPException(status_code=500, detail=f"로그 저장 확인 실패: {e!s}")
+
+
+@router.get("/node-execution/{log_id}", response_model=SuccessResponse)
+@api_handler
+async def get_node_execution_log(log_id: int) -> SuccessResponse:
+    """노드 실행 로그 하나를 파라미터/결과까지 조회합니다. (실행 기록에서 로그를 열 때 호출)"""
+    log = db_manager.node_execution_logs.get_log(log_id)
+    if log is None:
+        raise HTTPException(status_code=404, detail="로그를 찾을 수 없습니다.")
+    return success_response(log, "노드 실행 로그 조회 완료")
+
+
+@router.get("/stats", response_model=SuccessResponse)
+@api_handler
+async def get_log_stats() -> SuccessResponse:
+    """로그 통계(전체 실행 수, 완료/실패/시간 초과/캐시 히트 로그 수, 평균 실행 시간)를 조회합니다."""
+    return success_response(db_manager.log_stats.get_log_stats(), "로그 통계 조회 완료")
+
+
+@router.get("/rollups", response_model=ListResponse)
+@api_handler
+async def get_log_rollups(
+    script_id: int | None = Query(None, description="스크립트 ID (0이면 스크립트 없이 실행된 로그)"),
+    node_type: str | None = Query(None, description="노드 타입"),
+    since: str | None = Query(None, pattern=r"^\d{4}-\d{2}-\d{2}$", description="시작 날짜 (YYYY-MM-DD, 포함)"),
+    until: str | None = Query(None, pattern=r"^\d{4}-\d{2}-\d{2}$", description="끝 날짜 (YYYY-MM-DD, 포함)"),
+    limit: int = Query(1000, ge=1, le=10000, description="조회할 최대 개수"),
+) -> ListResponse:
+    """보존 기간이 지나 정리된 로그의 일별 집계(날짜, 스크립트, 노드 타입별 개수와 실행 시간 p50/p95)를 조회합니다."""
+    rollups = db_manager.log_rollups.get_rollups(
+        script_id=script_id, node_type=node_type, since=since, until=until, limit=limit
+    )
+    return list_response(rollups, "로그 일별 집계 조회 완료")
+
+
+@router.get("/retention", response_model=SuccessResponse)
+@api_handler
+async def get_log_retention_status() -> SuccessResponse:
+    """로그 보존 정책 설정과 마지막 실행 결과를 조회합니다."""
+    return success_response(log_retention.status(), "로그 보존 정책 상태 조회 완료")
+
+
+@router.post("/retention/run", response_model=SuccessResponse)
+@api_handler
+async def run_log_retention() -> SuccessResponse:
+    """로그 보존 정책을 바로 실행합니다. (이미 실행 중이면 409)"""
+    try:
+        report = await asyncio.to_thread(log_retention.run)
+    except RuntimeError as e:
+        raise HTTPException(status_code=409, detail=str(e))
+    return success_response(report, f"로그 {report['retired']}개를 정리했습니다.")
+
+
+@router.get("/sink", response_model=SuccessResponse)
+@api_handler
+async def get_log_sink_stats() -> SuccessResponse:
+    """노드 실행 로그 싱크 상태(대기 중인 로그, 기록/버린 로그 수, 마지막 기록 소요 시간)를 조회합니다."""
+    return success_response(log_sink.stats(), "로그 싱크 상태 조회 완료")
@@ -0,0 +1,82 @@
+"""
+매크로 녹화/조회 관련 API 라우터
+"""
+
+import os
+
+from fastapi import APIRouter, HTTPException
+
+from api.response_helpers import list_response, success_response
+from api.router_wrapper import api_handler
+from automation.macro import Macro, MacroRecorder, load_macro, resolve_macro_path
+from config.server_config import settings
+from log import log_manager
+from models.macro_models import MacroRecordStartRequest, MacroRecordStopRequest
+from models.response_models import ListResponse, SuccessResponse
+
+router = APIRouter(prefix="/api/macros", tags=["macros"])
+logger = log_manager.logger
+
+# 진행 중인 녹화 (서버 프로세스에서 한 번에 하나만 녹화)
+_recorder: MacroRecorder | None = None
+
+
+@router.get("", response_model=ListResponse)
+@api_handler
+async def get_macros() -> ListResponse:
+    """저장된 매크로 목록을 조회합니다. (MACRO_DIR의 .npz 파일, 이름순)"""
+    macros = []
+    if os.path.isdir(settings.MACRO_DIR):
+        for file_name in sorted(os.listdir(settings.MACRO_DIR)):
+            path = os.path.join(settings.MACRO_DIR, file_name)
+            if file_name.endswith(".npz") and os.path.isfile(path):
+                stat = os.stat(path)
+                macros.append({"name": file_name[:-4], "size_bytes": stat.st_size, "modified_at": stat.st_mtime})
+    return list_response(macros, "매크로 목록 조회 완료")
+
+
+@router.get("/{name}", response_model=SuccessResponse)
+@api_handler
+async def get_macro(name: str) -> SuccessResponse:
+    """매크로 요약 정보(이벤트 종류별 개수, 길이, 사용한 키)를 조회합니다."""
+    try:
+        macro = load_macro(name)
+    except ValueError as e:
+        raise HTTPException(status_code=404, detail=str(e))
+    return success_response({"name": name, **macro.to_dict()}, "매크로 조회 완료")
+
+
+@router.post("/record/start", response_model=SuccessResponse)
+@api_handler
+async def start_recording(request: MacroRecordStartRequest | None = None) -> SuccessResponse:
+    """서버가 실행 중인 PC의 마우스/키보드 입력 녹화를 시작합니다."""
+    global _recorder
+    if _recorder is not None and _recorder.recording:
+        raise HTTPException(status_code=409, detail="이미 매크로를 녹화 중입니다.")
+    request = request or MacroRecordStartRequest()
+    _recorder = MacroRecorder(move_interval=request.move_interval_seconds, stop_key=request.stop_key)
+    _recorder.start()
+    logger.info(f"[API] 매크로 녹화 시작 - 종료 키: {request.stop_key}")
+    return success_response({"recording": True, "stop_key": request.stop_key}, "매크로 녹화를 시작했습니다.")
+
+
+@router.post("/record/stop", response_model=SuccessResponse)
+@api_handler
+async def stop_recording(request: MacroRecordStopRequest) -> SuccessResponse:
+    """녹화를 끝내고 매크로를 MACRO_DIR에 저장합니다. (종료 키로 이미 끝난 녹화도 저장)"""
+    global _recorder
+    if _recorder is None:
+        raise HTTPException(status_code=400, detail="녹화 중인 매크로가 없습니다.")
+    path = resolve_macro_path(os.path.join(settings.MACRO_DIR, request.name))
+    if os.path.exists(path) and not request.overwrite:
+        raise HTTPException(status_code=409, detail=f"같은 이름의 매크로가 이미 있습니다: {request.name}")
+
+    recorder, _recorder = _recorder, None
+    macro: Macro = recorder.stop()
+    macro.save(path)
+    summary = {"name": request.name, "path": path, "coalesced_moves": recorder.coalesced_moves, **macro.to_dict()}
+    logger.info(
+        f"[API] 매크로 저장 - 이름: {request.name}, 이벤트: {len(macro)}개, 길이: {macro.duration:.3f}초, "
+        f"합친 이동: {recorder.coalesced_moves}개"
+    )
+    return success_response(summary, "매크로를 저장했습니다.")
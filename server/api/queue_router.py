@@ -0,0 +1,127 @@
+"""
+실행 큐 관련 API 라우터
+"""
+
+from fastapi import APIRouter, HTTPException
+
+from api.response_helpers import success_response
+from api.router_wrapper import api_handler
+from log import log_manager
+from models.queue_models import QueueEnqueueRequest, QueueReorderRequest
+from models.response_models import SuccessResponse
+from services.execution_queue import execution_queue
+
+router = APIRouter(prefix="/api/queue", tags=["queue"])
+logger = log_manager.logger
+
+
+@router.get("", response_model=SuccessResponse)
+@api_handler
+async def get_queue() -> SuccessResponse:
+    """
+    실행 큐 상태를 조회합니다.
+    대기 중인 실행(실행될 순서), 실행 중인 실행, 최근 종료된 실행을 반환합니다.
+    """
+    return success_response(
+        {
+            "queued": [run.to_dict() for run in execution_queue.list_queued()],
+            "running": [run.to_dict() for run in execution_queue.list_running()],
+            "recent": [run.to_dict() for run in execution_queue.list_history()],
+        },
+        "실행 큐 조회 완료",
+    )
+
+
+@router.get("/metrics", response_model=SuccessResponse)
+@api_handler
+async def get_queue_metrics() -> SuccessResponse:
+    """실행 큐 메트릭(대기열 깊이, 대기 시간, 리소스 사용량)을 조회합니다."""
+    return success_response(execution_queue.get_metrics(), "실행 큐 메트릭 조회 완료")
+
+
+@router.get("/runs/{run_id}", response_model=SuccessResponse)
+@api_handler
+async def get_queued_run(run_id: str) -> SuccessResponse:
+    """큐 실행 한 건을 조회합니다."""
+    run = execution_queue.get_run(run_id)
+    if run is None:
+        raise HTTPException(status_code=404, detail=f"실행을 찾을 수 없습니다: {run_id}")
+    return success_response(run.to_dict(), "실행 조회 완료")
+
+
+@router.post("/scripts/{script_id}", response_model=SuccessResponse)
+@api_handler
+async def enqueue_script(script_id: int, request: QueueEnqueueRequest | None = None) -> SuccessResponse:
+    """스크립트 실행을 큐에 등록합니다."""
+    priority = request.priority if request else 0
+    timeout_seconds = request.timeout_seconds if request else None
+    checkpoint_interval_seconds = request.checkpoint_interval_seconds if request else None
+    logger.info(f"[API] 스크립트 실행 큐 등록 요청 - 스크립트 ID: {script_id}, 우선순위: {priority}")
+    try:
+        run = await execution_queue.enqueue_script(
+            script_id,
+            priority=priority,
+            timeout_seconds=timeout_seconds,
+            checkpoint_interval_seconds=checkpoint_interval_seconds,
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=404, detail=str(e))
+    return success_response(run.to_dict(), "스크립트 실행이 큐에 등록되었습니다.")
+
+
+@router.post("/run-all-active", response_model=SuccessResponse)
+@api_handler
+async def enqueue_active_scripts(request: QueueEnqueueRequest | None = None) -> SuccessResponse:
+    """활성 스크립트 전체를 execution_order 순서대로 큐에 등록합니다."""
+    priority = request.priority if request else 0
+    timeout_seconds = request.timeout_seconds if request else None
+    checkpoint_interval_seconds = request.checkpoint_interval_seconds if request else None
+    logger.info(f"[API] 활성 스크립트 전체 실행 큐 등록 요청 - 우선순위: {priority}")
+    runs = await execution_queue.enqueue_active_scripts(
+        priority=priority, timeout_seconds=timeout_seconds, checkpoint_interval_seconds=checkpoint_interval_seconds
+    )
+    return success_response(
+        {"batch_id": runs[0].batch_id if runs else None, "runs": [run.to_dict() for run in runs]},
+        f"활성 스크립트 {len(runs)}개가 큐에 등록되었습니다.",
+    )
+
+
+@router.patch("/runs/{run_id}", response_model=SuccessResponse)
+@api_handler
+async def reorder_queued_run(run_id: str, request: QueueReorderRequest) -> SuccessResponse:
+    """대기 중인 실행의 위치 또는 우선순위를 변경합니다."""
+    if request.position is None and request.priority is None:
+        raise HTTPException(status_code=400, detail="position 또는 priority 중 하나는 필수입니다.")
+
+    logger.info(
+        f"[API] 큐 실행 순서 변경 요청 - 실행 ID: {run_id}, 위치: {request.position}, 우선순위: {request.priority}"
+    )
+    if request.priority is not None and not execution_queue.set_priority(run_id, request.priority):
+        raise HTTPException(status_code=404, detail=f"대기 중인 실행을 찾을 수 없습니다: {run_id}")
+    if request.position is not None and not execution_queue.move_run(run_id, request.position):
+        raise HTTPException(status_code=404, detail=f"대기 중인 실행을 찾을 수 없습니다: {run_id}")
+
+    return success_response(
+        {"queued": [run.to_dict() for run in execution_queue.list_queued()]}, "실행 순서가 변경되었습니다."
+    )
+
+
+@router.delete("/runs/{run_id}", response_model=SuccessResponse)
+@api_handler
+async def cancel_queued_run(run_id: str) -> SuccessResponse:
+    """대기 중이거나 실행 중인 실행을 취소합니다."""
+    logger.info(f"[API] 큐 실행 취소 요청 - 실행 ID: {run_id}")
+    if not execution_queue.cancel_run(run_id):
+        raise HTTPException(status_code=404, detail=f"취소할 수 있는 실행을 찾을 수 없습니다: {run_id}")
+    return success_response({"run_id": run_id}, "실행이 취소되었습니다.")
+
+
+@router.delete("/batches/{batch_id}", response_model=SuccessResponse)
+@api_handler
+async def cancel_queued_batch(batch_id: str) -> SuccessResponse:
+    """배치(활성 스크립트 전체 실행 등)에 속한 모든 실행을 취소합니다."""
+    logger.info(f"[API] 큐 배치 취소 요청 - 배치 ID: {batch_id}")
+    cancelled_count = execution_queue.cancel_batch(batch_id)
+    return success_response(
+        {"batch_id": batch_id, "cancelled_count": cancelled_count}, f"{cancelled_count}개 실행이 취소되었습니다."
+    )
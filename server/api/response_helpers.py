@@ -5,7 +5,13 @@ API 응답 헬퍼 함수
 
 from typing import Any
 
-from models.response_models import ErrorResponse, ListResponse, SuccessResponse
+from models.response_models import (
+    CursorListResponse,
+    ErrorResponse,
+    ListResponse,
+    PaginatedResponse,
+    SuccessResponse,
+)
 
 
 def success_response(
@@ -97,3 +103,66 @@ def list_response(
         count=len(items),
         **kwargs,
     )
+
+
+def cursor_list_response(
+    items: list[Any],
+    next_cursor: str | None,
+    message: str | None = None,
+) -> CursorListResponse:
+    """
+    커서 페이지네이션 리스트 응답 생성
+
+    Args:
+        items: 응답에 포함할 리스트 데이터 (한 페이지)
+        next_cursor: 다음 페이지 커서 (마지막 페이지면 None)
+        message: 성공 메시지
+
+    Returns:
+        CursorListResponse: 커서 페이지네이션 응답 모델
+
+    Examples:
+        >>> cursor_list_response(logs, next_cursor, "로그 조회 완료")
+    """
+    return CursorListResponse(
+        success=True,
+        message=message,
+        data=items,
+        count=len(items),
+        next_cursor=next_cursor,
+    )
+
+
+def paginated_response(
+    items: list[Any],
+    page: int,
+    page_size: int,
+    total: int,
+    message: str | None = None,
+) -> PaginatedResponse:
+    """
+    페이지네이션 리스트 응답 생성
+
+    Args:
+        items: 응답에 포함할 리스트 데이터 (한 페이지)
+        page: 현재 페이지 (1부터 시작)
+        page_size: 페이지 크기
+        total: 전체 항목 수
+        message: 성공 메시지
+
+    Returns:
+        PaginatedResponse: 페이지네이션 응답 모델
+
+    Examples:
+        >>> paginated_response(logs, page=1, page_size=20, total=135, message="검색 완료")
+    """
+    return PaginatedResponse(
+        success=True,
+        message=message,
+        data=items,
+        count=len(items),
+        page=page,
+        page_size=page_size,
+        total=total,
+        total_pages=(total + page_size - 1) // page_size,
+    )
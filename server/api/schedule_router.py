@@ -0,0 +1,122 @@
+"""
+스크립트 예약 실행 관련 API 라우터
+"""
+
+from datetime import datetime
+
+from fastapi import APIRouter, HTTPException
+
+from api.response_helpers import list_response, success_response
+from api.router_wrapper import api_handler
+from db.database import db_manager
+from log import log_manager
+from models.response_models import ListResponse, SuccessResponse
+from models.schedule_models import ScheduleCreateRequest, ScheduleUpdateRequest
+from services.script_scheduler import compute_next_run, format_schedule_time, script_scheduler
+
+router = APIRouter(prefix="/api/schedules", tags=["schedules"])
+logger = log_manager.logger
+
+# 변경 시 다음 실행 시각을 다시 계산해야 하는 필드
+_TIMING_FIELDS = {"schedule_type", "cron_expression", "interval_seconds", "enabled"}
+
+
+def _next_run_at(schedule_type: str, cron_expression: str | None, interval_seconds: int | None) -> str:
+    """예약 설정을 검증하고 현재 이후의 다음 실행 시각을 계산"""
+    try:
+        next_at = compute_next_run(schedule_type, cron_expression, interval_seconds, datetime.now())
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return format_schedule_time(next_at)
+
+
+@router.get("", response_model=ListResponse)
+@api_handler
+async def get_schedules(script_id: int | None = None) -> ListResponse:
+    """예약 실행 목록을 조회합니다. (script_id 지정 시 해당 스크립트의 예약만)"""
+    schedules = db_manager.schedules.get_all_schedules(script_id)
+    return list_response(schedules, "예약 목록 조회 완료")
+
+
+@router.get("/upcoming", response_model=SuccessResponse)
+@api_handler
+async def get_upcoming_schedules() -> SuccessResponse:
+    """스케줄러에 등록된 활성 예약의 다음 실행 시각(지터 포함)을 조회합니다."""
+    return success_response(
+        {"running": script_scheduler.running, "upcoming": script_scheduler.list_upcoming()},
+        "예정된 실행 조회 완료",
+    )
+
+
+@router.get("/{schedule_id}", response_model=SuccessResponse)
+@api_handler
+async def get_schedule(schedule_id: int) -> SuccessResponse:
+    """예약 실행 한 건을 조회합니다."""
+    schedule = db_manager.schedules.get_schedule(schedule_id)
+    if not schedule:
+        raise HTTPException(status_code=404, detail=f"예약을 찾을 수 없습니다: {schedule_id}")
+    return success_response(schedule, "예약 조회 완료")
+
+
+@router.post("", response_model=SuccessResponse)
+@api_handler
+async def create_schedule(request: ScheduleCreateRequest) -> SuccessResponse:
+    """예약 실행을 생성합니다."""
+    logger.info(
+        f"[API] 예약 생성 요청 - 스크립트 ID: {request.script_id}, 방식: {request.schedule_type}, "
+        f"크론: {request.cron_expression}, 간격: {request.interval_seconds}"
+    )
+    if not db_manager.scripts.get_script(request.script_id):
+        raise HTTPException(status_code=404, detail=f"스크립트를 찾을 수 없습니다: {request.script_id}")
+
+    next_run_at = _next_run_at(request.schedule_type, request.cron_expression, request.interval_seconds)
+    schedule_id = db_manager.schedules.create_schedule(
+        script_id=request.script_id,
+        schedule_type=request.schedule_type,
+        name=request.name,
+        cron_expression=request.cron_expression,
+        interval_seconds=request.interval_seconds,
+        jitter_seconds=request.jitter_seconds,
+        missed_run_policy=request.missed_run_policy,
+        priority=request.priority,
+        enabled=request.enabled,
+        next_run_at=next_run_at,
+    )
+    await script_scheduler.reload_schedule(schedule_id)
+
+    logger.info(f"[API] 예약 생성 완료 - 예약 ID: {schedule_id}, 다음 실행: {next_run_at}")
+    return success_response(db_manager.schedules.get_schedule(schedule_id), "예약이 생성되었습니다.")
+
+
+@router.patch("/{schedule_id}", response_model=SuccessResponse)
+@api_handler
+async def update_schedule(schedule_id: int, request: ScheduleUpdateRequest) -> SuccessResponse:
+    """예약 실행을 수정합니다. (활성화/비활성화 포함, 지정한 필드만 반영)"""
+    schedule = db_manager.schedules.get_schedule(schedule_id)
+    if not schedule:
+        raise HTTPException(status_code=404, detail=f"예약을 찾을 수 없습니다: {schedule_id}")
+
+    updates = request.model_dump(exclude_unset=True)
+    logger.info(f"[API] 예약 수정 요청 - 예약 ID: {schedule_id}, 변경: {updates}")
+
+    # 실행 주기나 활성화 상태가 바뀌면 다음 실행 시각을 현재 기준으로 다시 계산
+    if _TIMING_FIELDS & updates.keys():
+        merged = {**schedule, **updates}
+        updates["next_run_at"] = _next_run_at(
+            merged["schedule_type"], merged["cron_expression"], merged["interval_seconds"]
+        )
+
+    db_manager.schedules.update_schedule(schedule_id, **updates)
+    await script_scheduler.reload_schedule(schedule_id)
+    return success_response(db_manager.schedules.get_schedule(schedule_id), "예약이 수정되었습니다.")
+
+
+@router.delete("/{schedule_id}", response_model=SuccessResponse)
+@api_handler
+async def delete_schedule(schedule_id: int) -> SuccessResponse:
+    """예약 실행을 삭제합니다. (이미 큐에 등록된 실행은 취소되지 않음)"""
+    logger.info(f"[API] 예약 삭제 요청 - 예약 ID: {schedule_id}")
+    if not db_manager.schedules.delete_schedule(schedule_id):
+        raise HTTPException(status_code=404, detail=f"예약을 찾을 수 없습니다: {schedule_id}")
+    script_scheduler.remove_schedule(schedule_id)
+    return success_response({"schedule_id": schedule_id}, "예약이 삭제되었습니다.")
@@ -13,12 +13,15 @@ from models import (
     BaseResponse,
     NodeExecutionRequest,
     ScriptCreateRequest,
+    ScriptDryRunRequest,
     ScriptResponse,
     ScriptUpdateRequest,
     StandardResponseType,
 )
 from models.response_models import ListResponse, SuccessResponse
 from services.action_service import ActionService
+from services.script_runner import ScriptRunner
+from utils.dry_run import DryRunSession, ReplayFrameSource
 
 router = APIRouter(prefix="/api", tags=["scripts"])
 action_service = ActionService()
@@ -111,13 +114,6 @@ async def create_script(request: ScriptCreateRequest, http_request: Request) ->
         script_id = db_manager.create_script(request.name, description)
         logger.info(f"[DB 저장] 스크립트 생성 완료 - 스크립트 ID: {script_id}, 이름: {request.name}")
 
-        # 대시보드 통계 업데이트 (전체 워크플로우 개수)
-        try:
-            db_manager.update_stat("total_scripts")
-            logger.info("[DB 통계] 전체 워크플로우 통계 업데이트 완료")
-        except Exception as e:
-            logger.warning(f"[DB 통계] 통계 업데이트 실패 (무시): {e!s}")
-
         # 생성된 스크립트 정보 조회 (클라이언트에서 목록에 추가하기 위해)
         logger.info(f"[DB 조회] 생성된 스크립트 정보 조회 시작 - 스크립트 ID: {script_id}")
         created_script = db_manager.get_script(script_id)
@@ -209,13 +205,6 @@ async def delete_script(script_id: int, request: Request) -> SuccessResponse:
         if success:
             logger.info(f"[DB 삭제] 스크립트 삭제 완료 - 스크립트 ID: {script_id}, 이름: {script_name}")
 
-            # 대시보드 통계 업데이트 (전체 워크플로우 개수)
-            try:
-                db_manager.update_stat("total_scripts")
-                logger.info("[DB 통계] 전체 워크플로우 통계 업데이트 완료")
-            except Exception as e:
-                logger.warning(f"[DB 통계] 통계 업데이트 실패 (무시): {e!s}")
-
             logger.info(f"[API] 스크립트 삭제 성공 - 스크립트 ID: {script_id}, 이름: {script_name}")
             return success_response({"id": script_id}, "스크립트가 삭제되었습니다.")
         logger.warning(f"[DB 삭제] 스크립트 삭제 실패 - 스크립트 ID: {script_id}")
@@ -368,6 +357,45 @@ async def execute_script(script_id: int, request: NodeExecutionRequest) -> Stand
         raise HTTPException(status_code=500, detail=f"스크립트 실행 실패: {e!s}")
 
 
+@router.post("/scripts/{script_id}/dry-run", response_model=SuccessResponse)
+async def dry_run_script(script_id: int, request: ScriptDryRunRequest | None = None) -> SuccessResponse:
+    """
+    스크립트 드라이런 (가상 시계로 실행하여 흐름만 검증)
+
+    대기/재시도 간격은 가상 시간으로 즉시 지나가고, 클릭/창 포커스 등 입력 동작은 수행하지 않고 기록하며,
+    이미지 찾기는 replay_frames_dir의 프레임 이미지를 화면 대신 사용합니다.
+    실행 기록/체크포인트/노드 실행 로그는 남기지 않습니다.
+    """
+    request = request or ScriptDryRunRequest()
+    logger.info(f"[API] 스크립트 드라이런 요청 - 스크립트 ID: {script_id}, 재생 프레임: {request.replay_frames_dir}")
+
+    try:
+        frame_source = (
+            ReplayFrameSource(request.replay_frames_dir, loop=request.loop_frames)
+            if request.replay_frames_dir
+            else None
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    session = DryRunSession(frame_source=frame_source)
+    try:
+        summary = await ScriptRunner(action_service=action_service).run_script(
+            script_id, timeout_seconds=request.timeout_seconds, dry_run=session
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=404, detail=str(e))
+    except Exception as e:
+        logger.error(f"[API] 스크립트 드라이런 실패 - 스크립트 ID: {script_id}, 에러: {e!s}")
+        raise HTTPException(status_code=500, detail=f"스크립트 드라이런 실패: {e!s}")
+
+    logger.info(
+        f"[API] 스크립트 드라이런 완료 - 스크립트 ID: {script_id}, 상태: {summary['status']}, "
+        f"가상 시간: {summary['dry_run']['virtual_elapsed_seconds']}초, 실제 시간: {summary['execution_time_ms']}ms"
+    )
+    return success_response(summary, "스크립트 드라이런 완료")
+
+
 @router.patch("/scripts/{script_id}/active", response_model=SuccessResponse)
 async def toggle_script_active(
     script_id: int, request: Request, active: bool = Body(..., embed=True)
@@ -396,13 +424,6 @@ async def toggle_script_active(
         if success:
             logger.info(f"[DB 저장] 스크립트 활성 상태 업데이트 완료 - 스크립트 ID: {script_id}, 활성: {active}")
 
-            # 대시보드 통계 업데이트 (비활성 스크립트 개수)
-            try:
-                db_manager.update_stat("inactive_scripts")
-                logger.info("[DB 통계] 비활성 스크립트 통계 업데이트 완료")
-            except Exception as e:
-                logger.warning(f"[DB 통계] 통계 업데이트 실패 (무시): {e!s}")
-
             logger.info(
                 f"[API] 스크립트 활성 상태 변경 성공 - 스크립트 ID: {script_id}, 이름: {script_name}, 활성: {active}"
             )
@@ -1,16 +1,38 @@
 # 자동화 모듈
 from .application_state import ApplicationState
+from .input_backend import (
+    InputBackend,
+    PacingPolicy,
+    PyAutoGUIInputBackend,
+    RecordingInputBackend,
+    create_input_backend,
+)
 from .input_handler import InputHandler
+from .input_sequence import InputSequence, InputSequencer, SequenceReport, input_sequencer
+from .macro import Macro, MacroRecorder, MacroSequence, load_macro
 from .screen_capture import ScreenCapture
 from .workflow_engine import ExecutionMode, NodeStatus, NodeType, WorkflowEngine, WorkflowNode
 
 __all__ = [
     "ApplicationState",
     "ExecutionMode",
+    "InputBackend",
     "InputHandler",
+    "InputSequence",
+    "InputSequencer",
+    "Macro",
+    "MacroRecorder",
+    "MacroSequence",
     "NodeStatus",
     "NodeType",
+    "PacingPolicy",
+    "PyAutoGUIInputBackend",
+    "RecordingInputBackend",
     "ScreenCapture",
+    "SequenceReport",
     "WorkflowEngine",
     "WorkflowNode",
+    "create_input_backend",
+    "input_sequencer",
+    "load_macro",
 ]
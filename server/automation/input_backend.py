@@ -0,0 +1,345 @@
+"""
+입력 백엔드
+마우스/키보드 입력을 실제로 수행하는 백엔드와, 입력 사이의 대기 시간(페이싱) 정책을 정의합니다.
+
+- PyAutoGUIInputBackend: pyautogui로 실제 입력 수행 (pyautogui 자체의 PAUSE는 0으로 두고 PacingPolicy가 대기를 담당)
+- RecordingInputBackend: 입력을 수행하지 않고 타임스탬프와 함께 기록 (헤드리스 테스트/드라이런용)
+- PacingPolicy: 입력 동작 후 대기 시간 (기존 pyautogui.PAUSE = 0.1을 명시적인 정책으로 분리, 동작별 재정의 가능)
+
+백엔드는 INPUT_BACKEND 설정으로 선택합니다. ("pyautogui", "recording" 또는 기록도 하지 않는 "noop")
+"""
+
+from abc import ABC, abstractmethod
+from collections.abc import Callable
+import json
+import threading
+import time
+from typing import Any
+
+from config.server_config import settings
+
+# 페이싱 정책에서 사용하는 입력 동작 이름
+INPUT_ACTIONS = ("click", "move", "drag", "scroll", "key", "hotkey", "type")
+
+
+class InputBackend(ABC):
+    """
+    입력 백엔드 기본 클래스
+    각 메서드는 입력 하나를 수행하며 대기(페이싱)는 하지 않습니다. 실패하면 예외를 발생시킵니다.
+    """
+
+    # name: 백엔드 이름 (설정/통계 표시용)
+    name = "base"
+
+    @abstractmethod
+    def click(self, x: int, y: int, button: str = "left", clicks: int = 1, interval: float = 0.0) -> None:
+        """(x, y)를 클릭합니다. clicks번 누르며 누름 사이에 interval초 대기합니다."""
+
+    @abstractmethod
+    def move(self, x: int, y: int, duration: float = 0.0) -> None:
+        """마우스를 (x, y)로 이동합니다."""
+
+    @abstractmethod
+    def drag(
+        self, start_x: int, start_y: int, end_x: int, end_y: int, duration: float = 0.0, button: str = "left"
+    ) -> None:
+        """시작 좌표에서 끝 좌표까지 드래그합니다."""
+
+    @abstractmethod
+    def mouse_down(self, x: int, y: int, button: str = "left") -> None:
+        """(x, y)에서 마우스 버튼을 누릅니다. (놓지 않음, 매크로 재생용)"""
+
+    @abstractmethod
+    def mouse_up(self, x: int, y: int, button: str = "left") -> None:
+        """(x, y)에서 마우스 버튼을 놓습니다."""
+
+    @abstractmethod
+    def scroll(self, clicks: int, x: int | None = None, y: int | None = None) -> None:
+        """스크롤합니다. (양수는 위, 음수는 아래)"""
+
+    @abstractmethod
+    def press(self, key: str, presses: int = 1, interval: float = 0.0) -> None:
+        """키를 presses번 누릅니다."""
+
+    @abstractmethod
+    def key_down(self, key: str) -> None:
+        """키를 누릅니다. (놓지 않음, 매크로 재생용)"""
+
+    @abstractmethod
+    def key_up(self, key: str) -> None:
+        """키를 놓습니다."""
+
+    @abstractmethod
+    def hotkey(self, *keys: str) -> None:
+        """키 조합을 입력합니다."""
+
+    @abstractmethod
+    def type_text(self, text: str, interval: float = 0.0) -> None:
+        """텍스트를 입력합니다."""
+
+    @abstractmethod
+    def position(self) -> tuple[int, int]:
+        """현재 마우스 위치를 반환합니다."""
+
+
+class PyAutoGUIInputBackend(InputBackend):
+    """pyautogui로 실제 입력을 수행하는 백엔드"""
+
+    name = "pyautogui"
+
+    def __init__(self, failsafe: bool = True) -> None:
+        """
+        PyAutoGUIInputBackend 초기화
+
+        Args:
+            failsafe: 마우스를 화면 모서리로 옮기면 입력을 중단하는 pyautogui 안전 장치 사용 여부
+        """
+        # 디스플레이가 없는 환경에서도 automation 패키지를 import할 수 있도록 지연 import
+        import pyautogui
+
+        pyautogui.FAILSAFE = failsafe
+        # 입력 후 대기는 PacingPolicy가 담당 (pyautogui 전역 대기를 끄지 않으면 모든 입력에 0.1초가 더해짐)
+        pyautogui.PAUSE = 0
+        self._pyautogui = pyautogui
+
+    def click(self, x: int, y: int, button: str = "left", clicks: int = 1, interval: float = 0.0) -> None:
+        self._pyautogui.click(x, y, clicks=clicks, interval=interval, button=button)
+
+    def move(self, x: int, y: int, duration: float = 0.0) -> None:
+        self._pyautogui.moveTo(x, y, duration=duration)
+
+    def drag(
+        self, start_x: int, start_y: int, end_x: int, end_y: int, duration: float = 0.0, button: str = "left"
+    ) -> None:
+        self._pyautogui.moveTo(start_x, start_y)
+        self._pyautogui.dragTo(end_x, end_y, duration=duration, button=button)
+
+    def mouse_down(self, x: int, y: int, button: str = "left") -> None:
+        self._pyautogui.mouseDown(x, y, button=button)
+
+    def mouse_up(self, x: int, y: int, button: str = "left") -> None:
+        self._pyautogui.mouseUp(x, y, button=button)
+
+    def scroll(self, clicks: int, x: int | None = None, y: int | None = None) -> None:
+        self._pyautogui.scroll(clicks, x=x, y=y)
+
+    def press(self, key: str, presses: int = 1, interval: float = 0.0) -> None:
+        self._pyautogui.press(key, presses=presses, interval=interval)
+
+    def key_down(self, key: str) -> None:
+        self._pyautogui.keyDown(key)
+
+    def key_up(self, key: str) -> None:
+        self._pyautogui.keyUp(key)
+
+    def hotkey(self, *keys: str) -> None:
+        self._pyautogui.hotkey(*keys)
+
+    def type_text(self, text: str, interval: float = 0.0) -> None:
+        self._pyautogui.typewrite(text, interval=interval)
+
+    def position(self) -> tuple[int, int]:
+        pos = self._pyautogui.position()
+        return (pos.x, pos.y)
+
+
+class RecordingInputBackend(InputBackend):
+    """
+    입력을 수행하지 않고 기록하는 백엔드 (헤드리스 테스트, 드라이런용)
+    기록은 events에 쌓이며, sink가 있으면 대신 sink로 전달합니다. (예: DryRunSession.record_action)
+    """
+
+    name = "recording"
+
+    def __init__(
+        self,
+        clock: Callable[[], float] = time.monotonic,
+        sink: Callable[..., Any] | None = None,
+        max_events: int = 10000,
+    ) -> None:
+        """
+        RecordingInputBackend 초기화
+
+        Args:
+            clock: 타임스탬프용 시계 (기본 time.monotonic, 드라이런은 가상 시계)
+            sink: 입력 기록을 전달할 함수 sink(동작, **정보) (None이면 events에 기록)
+            max_events: events에 기록할 최대 개수 (넘으면 개수만 셈)
+        """
+        self.clock = clock
+        self.sink = sink
+        self.max_events = max_events
+        # events: 기록한 입력 [{"t": 기록 시작부터 경과 시간(초), "action": 동작, ...}, ...]
+        self.events: list[dict[str, Any]] = []
+        # dropped_events: max_events를 넘어 기록하지 않은 입력 수
+        self.dropped_events = 0
+        self._started_at = clock()
+        self._position = (0, 0)
+        self._lock = threading.Lock()
+
+    def _record(self, action: str, **details: Any) -> None:
+        """입력 하나를 기록합니다."""
+        if self.sink is not None:
+            self.sink(action, **details)
+            return
+        with self._lock:
+            if len(self.events) < self.max_events:
+                self.events.append({"t": round(self.clock() - self._started_at, 6), "action": action, **details})
+            else:
+                self.dropped_events += 1
+
+    def click(self, x: int, y: int, button: str = "left", clicks: int = 1, interval: float = 0.0) -> None:
+        self._position = (x, y)
+        self._record("click", x=x, y=y, button=button, clicks=clicks)
+
+    def move(self, x: int, y: int, duration: float = 0.0) -> None:
+        self._position = (x, y)
+        self._record("move", x=x, y=y, duration=duration)
+
+    def drag(
+        self, start_x: int, start_y: int, end_x: int, end_y: int, duration: float = 0.0, button: str = "left"
+    ) -> None:
+        self._position = (end_x, end_y)
+        self._record(
+            "drag", start_x=start_x, start_y=start_y, end_x=end_x, end_y=end_y, duration=duration, button=button
+        )
+
+    def mouse_down(self, x: int, y: int, button: str = "left") -> None:
+        self._position = (x, y)
+        self._record("mouse_down", x=x, y=y, button=button)
+
+    def mouse_up(self, x: int, y: int, button: str = "left") -> None:
+        self._position = (x, y)
+        self._record("mouse_up", x=x, y=y, button=button)
+
+    def scroll(self, clicks: int, x: int | None = None, y: int | None = None) -> None:
+        self._record("scroll", clicks=clicks, x=x, y=y)
+
+    def press(self, key: str, presses: int = 1, interval: float = 0.0) -> None:
+        self._record("key", key=key, presses=presses)
+
+    def key_down(self, key: str) -> None:
+        self._record("key_down", key=key)
+
+    def key_up(self, key: str) -> None:
+        self._record("key_up", key=key)
+
+    def hotkey(self, *keys: str) -> None:
+        self._record("hotkey", keys=list(keys))
+
+    def type_text(self, text: str, interval: float = 0.0) -> None:
+        self._record("type", text=text)
+
+    def position(self) -> tuple[int, int]:
+        return self._position
+
+    def clear(self) -> None:
+        """기록을 비웁니다."""
+        with self._lock:
+            self.events.clear()
+            self.dropped_events = 0
+            self._started_at = self.clock()
+
+
+class PacingPolicy:
+    """
+    입력 페이싱 정책 클래스
+    입력 동작 후 대상 애플리케이션이 입력을 처리할 수 있도록 대기할 시간을 정하고, 실제로 대기한 시간을 집계합니다.
+    """
+
+    __slots__ = ("default_pause", "overrides", "pause_count", "paused_seconds")
+
+    def __init__(self, default_pause: float = 0.0, overrides: dict[str, float] | None = None) -> None:
+        """
+        PacingPolicy 초기화
+
+        Args:
+            default_pause: 입력 동작 후 기본 대기 시간 (초)
+            overrides: 동작별 대기 시간 (예: {"move": 0, "type": 0.05}, 동작 이름은 INPUT_ACTIONS)
+
+        Raises:
+            ValueError: 대기 시간이 음수이거나 알 수 없는 동작인 경우
+        """
+        overrides = dict(overrides or {})
+        unknown = set(overrides) - set(INPUT_ACTIONS)
+        if unknown:
+            raise ValueError(f"알 수 없는 입력 동작입니다: {', '.join(sorted(unknown))}")
+        if default_pause < 0 or any(value < 0 for value in overrides.values()):
+            raise ValueError("입력 대기 시간은 0 이상이어야 합니다.")
+        self.default_pause = float(default_pause)
+        self.overrides = {action: float(value) for action, value in overrides.items()}
+        # 통계 (대기 횟수, 대기한 총 시간)
+        self.pause_count = 0
+        self.paused_seconds = 0.0
+
+    @classmethod
+    def from_settings(cls) -> "PacingPolicy":
+        """
+        서버 설정(INPUT_PAUSE_SECONDS, INPUT_PAUSE_OVERRIDES)으로 정책을 만듭니다.
+
+        Raises:
+            ValueError: INPUT_PAUSE_OVERRIDES가 잘못된 경우
+        """
+        overrides: dict[str, float] = {}
+        if settings.INPUT_PAUSE_OVERRIDES:
+            try:
+                overrides = json.loads(settings.INPUT_PAUSE_OVERRIDES)
+            except json.JSONDecodeError as e:
+                raise ValueError(f"INPUT_PAUSE_OVERRIDES는 JSON 객체여야 합니다: {e!s}") from e
+            if not isinstance(overrides, dict):
+                raise ValueError("INPUT_PAUSE_OVERRIDES는 JSON 객체여야 합니다.")
+        return cls(settings.INPUT_PAUSE_SECONDS, overrides)
+
+    def delay_for(self, action: str) -> float:
+        """동작 후 대기 시간 (초)"""
+        return self.overrides.get(action, self.default_pause)
+
+    def pause(self, action: str) -> float:
+        """
+        동작 후 대기합니다.
+
+        Args:
+            action: 입력 동작 이름
+
+        Returns:
+            대기한 시간 (초)
+        """
+        delay = self.delay_for(action)
+        if delay <= 0:
+            return 0.0
+        time.sleep(delay)
+        self.pause_count += 1
+        self.paused_seconds += delay
+        return delay
+
+    def to_dict(self) -> dict[str, Any]:
+        """정책과 통계를 딕셔너리로 변환"""
+        return {
+            "default_pause": self.default_pause,
+            "overrides": dict(self.overrides),
+            "pause_count": self.pause_count,
+            "paused_seconds": round(self.paused_seconds, 3),
+        }
+
+
+def create_input_backend(name: str | None = None) -> InputBackend:
+    """
+    이름으로 입력 백엔드를 생성합니다.
+
+    Args:
+        name: 백엔드 이름 ("pyautogui", "recording", "noop", None이면 INPUT_BACKEND 설정값)
+
+    Returns:
+        입력 백엔드
+
+    Raises:
+        ValueError: 알 수 없는 백엔드 이름인 경우
+    """
+    name = (name or settings.INPUT_BACKEND).lower()
+    if name == PyAutoGUIInputBackend.name:
+        return PyAutoGUIInputBackend()
+    if name == RecordingInputBackend.name:
+        return RecordingInputBackend()
+    if name == "noop":
+        # 기록도 남기지 않는 백엔드 (입력 수만 dropped_events로 셈)
+        return RecordingInputBackend(max_events=0)
+    raise ValueError(f"알 수 없는 입력 백엔드입니다: {name} (pyautogui, recording 또는 noop)")
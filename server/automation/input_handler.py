@@ -1,28 +1,80 @@
 import time
 from typing import Any
 
-import pyautogui
-from pynput.keyboard import Listener as KeyboardListener
-from pynput.mouse import Listener as MouseListener
-
+from automation.input_backend import InputBackend, PacingPolicy, create_input_backend
 from log import log_manager
 
 logger = log_manager.logger
 
 
 class InputHandler:
-    """입력 처리 클래스"""
+    """
+    입력 처리 클래스
+    입력은 입력 백엔드(InputBackend)로 수행하고, 입력 후 대기는 페이싱 정책(PacingPolicy)을 따릅니다.
+    """
+
+    def __init__(self, backend: InputBackend | None = None, pacing: PacingPolicy | None = None) -> None:
+        """
+        InputHandler 초기화
 
-    def __init__(self) -> None:
-        # PyAutoGUI 설정
-        pyautogui.FAILSAFE = True
-        pyautogui.PAUSE = 0.1
+        Args:
+            backend: 입력 백엔드 (None이면 INPUT_BACKEND 설정의 백엔드)
+            pacing: 입력 후 대기 정책 (None이면 INPUT_PAUSE_SECONDS/INPUT_PAUSE_OVERRIDES 설정)
+        """
+        self.backend = backend or create_input_backend()
+        self.pacing = pacing or PacingPolicy.from_settings()
 
-        # 마우스/키보드 리스너
-        self.mouse_listener: MouseListener | None = None
-        self.keyboard_listener: KeyboardListener | None = None
+        # 마우스/키보드 리스너 (pynput, start_input_monitoring에서 생성)
+        self.mouse_listener: Any = None
+        self.keyboard_listener: Any = None
         self.last_click_position: tuple[int, int] | None = None
         self.last_key_press: str | None = None
+        # 통계 (수행한 입력 수, 백엔드에서 입력 수행에 걸린 시간)
+        self.action_count = 0
+        self.backend_seconds = 0.0
+
+    def _perform(self, action: str, description: str, func: Any, *args: Any, **kwargs: Any) -> bool:
+        """
+        백엔드로 입력 하나를 수행하고 페이싱 정책에 따라 대기합니다.
+
+        Args:
+            action: 입력 동작 이름 (페이싱 정책의 동작 이름)
+            description: 실패 로그에 사용할 설명
+            func: 호출할 백엔드 메서드
+            *args, **kwargs: 백엔드 메서드 인자
+
+        Returns:
+            입력 성공 여부
+        """
+        start = time.perf_counter()
+        try:
+            func(*args, **kwargs)
+        except Exception as e:
+            logger.error(f"{description} 실패: {e}")
+            return False
+        finally:
+            self.backend_seconds += time.perf_counter() - start
+        self.action_count += 1
+        self.pacing.pause(action)
+        return True
+
+    def latency_stats(self) -> dict[str, Any]:
+        """
+        입력 지연 통계를 반환합니다. (입력 수행 시간과 페이싱 대기 시간을 분리하여 순수 대기 오버헤드 측정용)
+
+        Returns:
+            통계 딕셔너리
+            - backend: 입력 백엔드 이름
+            - actions: 수행한 입력 수
+            - backend_seconds: 백엔드에서 입력 수행에 걸린 시간 (초)
+            - pacing: 페이싱 정책과 대기 통계 (pause_count, paused_seconds)
+        """
+        return {
+            "backend": self.backend.name,
+            "actions": self.action_count,
+            "backend_seconds": round(self.backend_seconds, 3),
+            "pacing": self.pacing.to_dict(),
+        }
 
     def click(self, x: int, y: int, button: str = "left", clicks: int = 1, interval: float = 0.1) -> bool:
         """
@@ -37,13 +89,12 @@ class InputHandler:
         Returns:
             클릭 성공 여부
         """
-        try:
-            pyautogui.click(x, y, clicks=clicks, interval=interval, button=button)
+        success = self._perform(
+            "click", "클릭", self.backend.click, x, y, button=button, clicks=clicks, interval=interval
+        )
+        if success:
             self.last_click_position = (x, y)
-            return True
-        except Exception as e:
-            logger.error(f"클릭 실패: {e}")
-            return False
+        return success
 
     def double_click(self, x: int, y: int) -> bool:
         """더블 클릭을 수행합니다."""
@@ -65,12 +116,7 @@ class InputHandler:
         Returns:
             드래그 성공 여부
         """
-        try:
-            pyautogui.drag(end_x - start_x, end_y - start_y, duration=duration, button="left")
-            return True
-        except Exception as e:
-            logger.error(f"드래그 실패: {e}")
-            return False
+        return self._perform("drag", "드래그", self.backend.drag, start_x, start_y, end_x, end_y, duration=duration)
 
     def type_text(self, text: str, interval: float = 0.1) -> bool:
         """
@@ -83,12 +129,7 @@ class InputHandler:
         Returns:
             입력 성공 여부
         """
-        try:
-            pyautogui.typewrite(text, interval=interval)
-            return True
-        except Exception as e:
-            logger.error(f"텍스트 입력 실패: {e}")
-            return False
+        return self._perform("type", "텍스트 입력", self.backend.type_text, text, interval=interval)
 
     def press_key(self, key: str, presses: int = 1, interval: float = 0.1) -> bool:
         """
@@ -102,13 +143,10 @@ class InputHandler:
         Returns:
             키 입력 성공 여부
         """
-        try:
-            pyautogui.press(key, presses=presses, interval=interval)
+        success = self._perform("key", "키 입력", self.backend.press, key, presses=presses, interval=interval)
+        if success:
             self.last_key_press = key
-            return True
-        except Exception as e:
-            logger.error(f"키 입력 실패: {e}")
-            return False
+        return success
 
     def key_combination(self, *keys: str) -> bool:
         """
@@ -120,12 +158,7 @@ class InputHandler:
         Returns:
             키 조합 입력 성공 여부
         """
-        try:
-            pyautogui.hotkey(*keys)
-            return True
-        except Exception as e:
-            logger.error(f"키 조합 입력 실패: {e}")
-            return False
+        return self._perform("hotkey", "키 조합 입력", self.backend.hotkey, *keys)
 
     def scroll(self, x: int, y: int, clicks: int = 3, direction: str = "up") -> bool:
         """
@@ -139,13 +172,8 @@ class InputHandler:
         Returns:
             스크롤 성공 여부
         """
-        try:
-            scroll_direction = 1 if direction == "up" else -1
-            pyautogui.scroll(scroll_direction * clicks, x=x, y=y)
-            return True
-        except Exception as e:
-            logger.error(f"스크롤 실패: {e}")
-            return False
+        scroll_direction = 1 if direction == "up" else -1
+        return self._perform("scroll", "스크롤", self.backend.scroll, scroll_direction * clicks, x=x, y=y)
 
     def move_mouse(self, x: int, y: int, duration: float = 0.5) -> bool:
         """
@@ -158,20 +186,17 @@ class InputHandler:
         Returns:
             이동 성공 여부
         """
-        try:
-            pyautogui.moveTo(x, y, duration=duration)
-            return True
-        except Exception as e:
-            logger.error(f"마우스 이동 실패: {e}")
-            return False
+        return self._perform("move", "마우스 이동", self.backend.move, x, y, duration=duration)
 
     def get_mouse_position(self) -> tuple[int, int]:
         """현재 마우스 위치를 반환합니다."""
-        pos = pyautogui.position()
-        return (pos.x, pos.y)
+        return self.backend.position()
 
     def start_input_monitoring(self) -> None:
         """입력 모니터링을 시작합니다."""
+        # 디스플레이가 없는 환경에서도 import할 수 있도록 모니터링을 시작할 때 pynput을 import
+        from pynput.keyboard import Listener as KeyboardListener
+        from pynput.mouse import Listener as MouseListener
 
         def on_click(x: int, y: int, button: Any, pressed: bool) -> None:
             if pressed:
@@ -0,0 +1,354 @@
+"""
+입력 시퀀스 실행기
+입력 이벤트 목록(이동/클릭/키/드래그/스크롤 등)을 전용 작업 스레드 하나에서 정해진 시각에 맞춰 실행합니다.
+
+- 각 이벤트의 실행 시각은 시퀀스 시작부터의 오프셋으로 미리 계산합니다. (at: 절대 오프셋, delay: 직전 이벤트 이후 간격,
+  둘 다 없으면 직전 동작에 대한 페이싱 정책 대기 시간)
+- 대기는 monotonic 시계 기준으로, 마감 직전까지는 잠들고(취소 시 즉시 깨어남) 마지막 구간만 바쁜 대기로 맞춥니다.
+- 이벤트마다 예정 시각과 실제 실행 시각의 차이(드리프트)를 측정하여 보고합니다.
+- 모든 시퀀스는 같은 작업 스레드에서 순서대로 실행되므로 서로 다른 시퀀스의 입력이 섞이지 않습니다.
+
+이벤트 형식 (dict):
+    {"action": "move", "x": 100, "y": 200, "duration": 0}
+    {"action": "click", "x": 100, "y": 200, "button": "left", "clicks": 1, "delay": 0.05}
+    {"action": "key", "key": "enter", "presses": 1}
+    {"action": "hotkey", "keys": ["ctrl", "c"]}
+    {"action": "type", "text": "hello"}
+    {"action": "drag", "start_x": 0, "start_y": 0, "end_x": 100, "end_y": 100, "duration": 0.2}
+    {"action": "scroll", "clicks": -3, "x": 100, "y": 200, "at": 1.5}
+"""
+
+from collections.abc import Callable, Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
+import threading
+import time
+from typing import Any
+
+from automation.input_backend import INPUT_ACTIONS, InputBackend, PacingPolicy
+from config.server_config import settings
+from utils.cancellation import CancellationToken
+
+# 드리프트가 이 값(밀리초)을 넘은 이벤트는 늦은 이벤트로 집계
+LATE_THRESHOLD_MS = 2.0
+
+
+def _int_field(event: dict[str, Any], key: str, default: int | None = None) -> int | None:
+    """이벤트 필드를 정수로 변환합니다. (없으면 기본값)"""
+    value = event.get(key, default)
+    if value is None:
+        return None
+    try:
+        return int(value)
+    except (TypeError, ValueError) as e:
+        raise ValueError(f"{key}는 정수여야 합니다: {value!r}") from e
+
+
+def _float_field(event: dict[str, Any], key: str, default: float = 0.0) -> float:
+    """이벤트 필드를 0 이상의 실수로 변환합니다. (없으면 기본값)"""
+    value = event.get(key, default)
+    try:
+        number = float(value)
+    except (TypeError, ValueError) as e:
+        raise ValueError(f"{key}는 숫자여야 합니다: {value!r}") from e
+    if number < 0:
+        raise ValueError(f"{key}는 0 이상이어야 합니다: {number}")
+    return number
+
+
+def _bind_event(event: dict[str, Any]) -> Callable[[InputBackend], None]:
+    """
+    이벤트를 백엔드 호출 함수로 변환합니다. (실행 전에 모든 필드를 검증)
+
+    Args:
+        event: 입력 이벤트
+
+    Returns:
+        백엔드를 받아 입력 하나를 수행하는 함수
+
+    Raises:
+        ValueError: 동작이나 필드가 잘못된 경우
+    """
+    action = event.get("action")
+    if action == "click":
+        x, y = _int_field(event, "x"), _int_field(event, "y")
+        if x is None or y is None:
+            raise ValueError("click 이벤트에는 x, y가 필요합니다.")
+        button = str(event.get("button", "left"))
+        clicks = _int_field(event, "clicks", 1) or 1
+        interval = _float_field(event, "interval")
+        return lambda backend: backend.click(x, y, button=button, clicks=clicks, interval=interval)
+    if action == "move":
+        x, y = _int_field(event, "x"), _int_field(event, "y")
+        if x is None or y is None:
+            raise ValueError("move 이벤트에는 x, y가 필요합니다.")
+        duration = _float_field(event, "duration")
+        return lambda backend: backend.move(x, y, duration=duration)
+    if action == "drag":
+        points = [_int_field(event, key) for key in ("start_x", "start_y", "end_x", "end_y")]
+        if any(point is None for point in points):
+            raise ValueError("drag 이벤트에는 start_x, start_y, end_x, end_y가 필요합니다.")
+        start_x, start_y, end_x, end_y = (int(point) for point in points if point is not None)
+        duration = _float_field(event, "duration")
+        button = str(event.get("button", "left"))
+        return lambda backend: backend.drag(start_x, start_y, end_x, end_y, duration=duration, button=button)
+    if action == "scroll":
+        clicks = _int_field(event, "clicks")
+        if clicks is None:
+            raise ValueError("scroll 이벤트에는 clicks가 필요합니다.")
+        x, y = _int_field(event, "x"), _int_field(event, "y")
+        return lambda backend: backend.scroll(clicks, x=x, y=y)
+    if action == "key":
+        key = event.get("key")
+        if not key:
+            raise ValueError("key 이벤트에는 key가 필요합니다.")
+        presses = _int_field(event, "presses", 1) or 1
+        interval = _float_field(event, "interval")
+        return lambda backend: backend.press(str(key), presses=presses, interval=interval)
+    if action == "hotkey":
+        keys = event.get("keys")
+        if not isinstance(keys, list) or not keys:
+            raise ValueError("hotkey 이벤트에는 keys 목록이 필요합니다.")
+        hotkeys = [str(key) for key in keys]
+        return lambda backend: backend.hotkey(*hotkeys)
+    if action == "type":
+        text = event.get("text")
+        if not isinstance(text, str):
+            raise ValueError("type 이벤트에는 text 문자열이 필요합니다.")
+        interval = _float_field(event, "interval")
+        return lambda backend: backend.type_text(text, interval=interval)
+    raise ValueError(f"지원하지 않는 입력 동작입니다: {action!r} ({', '.join(INPUT_ACTIONS)})")
+
+
+class InputSequence:
+    """
+    컴파일된 입력 시퀀스 클래스
+    이벤트별 실행 시각(시작부터의 오프셋)과 백엔드 호출 함수를 미리 계산해 둡니다.
+    """
+
+    __slots__ = ("actions", "calls", "offsets")
+
+    def __init__(self, actions: list[str], offsets: list[float], calls: list[Callable[[InputBackend], None]]) -> None:
+        """
+        InputSequence 초기화
+
+        Args:
+            actions: 이벤트별 동작 이름
+            offsets: 이벤트별 실행 시각 (시퀀스 시작부터의 초, 오름차순)
+            calls: 이벤트별 백엔드 호출 함수
+        """
+        self.actions = actions
+        self.offsets = offsets
+        self.calls = calls
+
+    def __len__(self) -> int:
+        return len(self.calls)
+
+    @property
+    def duration(self) -> float:
+        """예정된 시퀀스 길이 (마지막 이벤트 실행 시각, 초)"""
+        return self.offsets[-1] if self.offsets else 0.0
+
+    def steps(self) -> Iterator[tuple[float, Callable[[InputBackend], None]]]:
+        """(실행 시각, 백엔드 호출 함수)를 실행 순서대로 반환합니다. (하위 클래스는 호출 함수를 필요할 때 생성 가능)"""
+        return zip(self.offsets, self.calls, strict=True)
+
+    @classmethod
+    def compile(cls, events: list[dict[str, Any]], pacing: PacingPolicy | None = None) -> "InputSequence":
+        """
+        입력 이벤트 목록을 검증하고 실행 시각을 계산합니다.
+
+        Args:
+            events: 입력 이벤트 목록
+            pacing: 간격이 지정되지 않은 이벤트에 적용할 페이싱 정책 (None이면 간격 0)
+
+        Returns:
+            컴파일된 입력 시퀀스
+
+        Raises:
+            ValueError: 이벤트가 잘못되었거나 at이 이전 이벤트보다 앞선 경우 (몇 번째 이벤트인지 포함)
+        """
+        actions: list[str] = []
+        offsets: list[float] = []
+        calls: list[Callable[[InputBackend], None]] = []
+        previous_offset = 0.0
+        previous_action: str | None = None
+        for index, event in enumerate(events):
+            try:
+                if not isinstance(event, dict):
+                    raise ValueError("이벤트는 객체여야 합니다.")
+                calls.append(_bind_event(event))
+                if "at" in event:
+                    offset = _float_field(event, "at")
+                    if offset < previous_offset:
+                        raise ValueError(f"at({offset})이 이전 이벤트 시각({previous_offset})보다 앞섭니다.")
+                elif "delay" in event:
+                    offset = previous_offset + _float_field(event, "delay")
+                else:
+                    gap = pacing.delay_for(previous_action) if pacing and previous_action else 0.0
+                    offset = previous_offset + gap
+            except ValueError as e:
+                raise ValueError(f"{index + 1}번째 입력 이벤트 오류: {e!s}") from e
+            previous_action = str(event["action"])
+            actions.append(previous_action)
+            offsets.append(offset)
+            previous_offset = offset
+        return cls(actions, offsets, calls)
+
+
+class SequenceReport:
+    """입력 시퀀스 실행 결과 클래스 (드리프트 통계 포함)"""
+
+    __slots__ = ("actual_duration", "cancelled", "drifts_ms", "error", "executed", "scheduled_duration", "total")
+
+    def __init__(self, total: int, scheduled_duration: float) -> None:
+        self.total = total
+        self.scheduled_duration = scheduled_duration
+        self.executed = 0
+        self.actual_duration = 0.0
+        # drifts_ms: 이벤트별 드리프트 (실제 실행 시각 - 예정 시각, 밀리초)
+        self.drifts_ms: list[float] = []
+        self.cancelled = False
+        self.error: str | None = None
+
+    def to_dict(self) -> dict[str, Any]:
+        """
+        실행 결과를 딕셔너리로 변환합니다.
+
+        Returns:
+            결과 딕셔너리
+            - total / executed: 전체/실행한 이벤트 수
+            - scheduled_duration / actual_duration: 예정/실제 시퀀스 길이 (초)
+            - drift_ms: 드리프트 통계 {"mean", "p95", "max"} (밀리초)
+            - late_events: 드리프트가 LATE_THRESHOLD_MS를 넘은 이벤트 수
+            - cancelled: 취소 여부
+            - error: 입력 실패 시 에러 메시지
+        """
+        drifts = sorted(self.drifts_ms)
+        drift = {"mean": 0.0, "p95": 0.0, "max": 0.0}
+        if drifts:
+            drift = {
+                "mean": round(sum(drifts) / len(drifts), 3),
+                "p95": round(drifts[min(len(drifts) - 1, int(len(drifts) * 0.95))], 3),
+                "max": round(drifts[-1], 3),
+            }
+        return {
+            "total": self.total,
+            "executed": self.executed,
+            "scheduled_duration": round(self.scheduled_duration, 6),
+            "actual_duration": round(self.actual_duration, 6),
+            "drift_ms": drift,
+            "late_events": sum(1 for value in drifts if value > LATE_THRESHOLD_MS),
+            "cancelled": self.cancelled,
+            "error": self.error,
+        }
+
+
+class InputSequencer:
+    """
+    입력 시퀀스 실행기 클래스
+    전용 작업 스레드 하나에서 시퀀스를 순서대로 실행합니다.
+    """
+
+    def __init__(self, spin_seconds: float | None = None) -> None:
+        """
+        InputSequencer 초기화
+
+        Args:
+            spin_seconds: 예정 시각 직전 바쁜 대기 구간 (초, None이면 INPUT_SEQUENCE_SPIN_SECONDS)
+        """
+        self.spin_seconds = settings.INPUT_SEQUENCE_SPIN_SECONDS if spin_seconds is None else max(0.0, spin_seconds)
+        self._executor: ThreadPoolExecutor | None = None
+        self._lock = threading.Lock()
+
+    def submit(
+        self,
+        sequence: InputSequence,
+        backend: InputBackend,
+        cancel_token: CancellationToken | None = None,
+    ) -> "Future[SequenceReport]":
+        """
+        시퀀스 실행을 작업 스레드에 등록합니다. (비동기 코드에서는 asyncio.wrap_future로 대기)
+
+        Args:
+            sequence: 컴파일된 입력 시퀀스
+            backend: 입력 백엔드
+            cancel_token: 실행 취소 토큰 (취소되면 남은 이벤트를 실행하지 않음)
+
+        Returns:
+            실행 결과 Future
+        """
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="input-sequencer")
+            executor = self._executor
+        return executor.submit(self.run, sequence, backend, cancel_token)
+
+    def run(
+        self,
+        sequence: InputSequence,
+        backend: InputBackend,
+        cancel_token: CancellationToken | None = None,
+    ) -> SequenceReport:
+        """
+        현재 스레드에서 시퀀스를 실행합니다. (일반적으로 submit을 통해 작업 스레드에서 호출)
+
+        Args:
+            sequence: 컴파일된 입력 시퀀스
+            backend: 입력 백엔드
+            cancel_token: 실행 취소 토큰
+
+        Returns:
+            실행 결과
+        """
+        token = cancel_token or CancellationToken()
+        # clock: 가상 시계가 있으면 (드라이런) 가상 시각 기준으로 대기 (실제로 잠들지 않음)
+        clock = token.clock.monotonic if token.clock is not None else time.perf_counter
+        report = SequenceReport(len(sequence), sequence.duration)
+        start = clock()
+        for offset, call in sequence.steps():
+            if self._wait_until(start + offset, token, clock):
+                report.cancelled = True
+                break
+            report.drifts_ms.append((clock() - start - offset) * 1000)
+            try:
+                call(backend)
+            except Exception as e:
+                report.error = str(e)
+                break
+            report.executed += 1
+        report.actual_duration = clock() - start
+        return report
+
+    def _wait_until(self, target: float, token: CancellationToken, clock: Callable[[], float]) -> bool:
+        """
+        예정 시각까지 대기합니다. 바쁜 대기 구간 전까지는 취소 토큰으로 잠들어 취소 시 즉시 깨어납니다.
+
+        Args:
+            target: 예정 시각 (clock 기준)
+            token: 실행 취소 토큰
+            clock: 시계 함수
+
+        Returns:
+            취소 여부
+        """
+        if token.cancelled:
+            return True
+        remaining = target - clock()
+        if token.clock is not None:
+            return token.wait(remaining) if remaining > 0 else token.cancelled
+        if remaining > self.spin_seconds and token.wait(remaining - self.spin_seconds):
+            return True
+        while clock() < target:
+            pass
+        return token.cancelled
+
+    def shutdown(self) -> None:
+        """작업 스레드를 종료합니다. (실행 중인 시퀀스는 끝까지 실행)"""
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=True)
+
+
+# 전역 입력 시퀀스 실행기 인스턴스 (모든 입력 시퀀스가 같은 작업 스레드를 사용)
+input_sequencer = InputSequencer()
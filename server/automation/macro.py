@@ -0,0 +1,465 @@
+"""
+매크로 녹화/재생
+pynput으로 마우스/키보드 입력을 녹화하여 numpy 구조화 배열로 저장하고, 입력 시퀀스 실행기로 재생합니다.
+
+- 녹화 형식: MACRO_DTYPE 구조화 배열 한 개 (이벤트 하나당 21바이트, t/type/x/y/code)
+  + 키 이름 표 (KEY_DOWN/KEY_UP 이벤트의 code는 키 이름 표의 인덱스)
+- 마우스 이동은 MACRO_MOVE_COALESCE_SECONDS 간격 안의 이동을 하나로 합쳐 마지막 위치만 남깁니다.
+- 파일은 압축하지 않은 .npz로 저장하여, 큰 매크로도 파싱 없이 배열 그대로 읽습니다.
+- 재생 시 실행 시각은 numpy로 한 번에 계산하고, 백엔드 호출 함수는 실행 직전에 하나씩 만들어 전달합니다.
+  (수만 개 이벤트도 미리 함수 목록을 만들지 않고 바로 재생 시작)
+
+사용 예시:
+    recorder = MacroRecorder(stop_key="esc")
+    recorder.start()
+    ...
+    macro = recorder.stop()
+    macro.save("macros/login.npz")
+
+    sequence = Macro.load("macros/login.npz").to_sequence(speed=1.5)
+    input_sequencer.submit(sequence, backend, cancel_token)
+"""
+
+from collections import OrderedDict
+from collections.abc import Callable, Iterator
+import os
+import threading
+import time
+from typing import Any
+
+import numpy as np
+
+from automation.input_backend import InputBackend
+from automation.input_sequence import InputSequence
+from config.server_config import settings
+
+# 매크로 이벤트 배열 형식
+# t: 녹화 시작부터의 시각 (초), type: 이벤트 종류, x/y: 마우스 좌표, code: 버튼/스크롤 양/키 이름 인덱스
+MACRO_DTYPE = np.dtype([("t", "<f8"), ("type", "u1"), ("x", "<i4"), ("y", "<i4"), ("code", "<i4")])
+
+# 매크로 파일 형식 버전 (형식이 바뀌면 증가)
+MACRO_FORMAT_VERSION = 1
+
+# 이벤트 종류
+MOVE = 0
+MOUSE_DOWN = 1
+MOUSE_UP = 2
+SCROLL = 3
+KEY_DOWN = 4
+KEY_UP = 5
+
+# 이벤트 종류 이름 (재생 시 동작 이름, 요약 통계용)
+EVENT_NAMES = ("move", "mouse_down", "mouse_up", "scroll", "key_down", "key_up")
+
+# 마우스 버튼 (MOUSE_DOWN/MOUSE_UP 이벤트의 code)
+MOUSE_BUTTONS = ("left", "right", "middle")
+
+# pynput 키 이름 → pyautogui 키 이름 (밑줄만 빼면 되는 키는 제외)
+_PYNPUT_KEY_NAMES = {
+    "alt_l": "altleft",
+    "alt_r": "altright",
+    "alt_gr": "altright",
+    "ctrl_l": "ctrlleft",
+    "ctrl_r": "ctrlright",
+    "shift_l": "shiftleft",
+    "shift_r": "shiftright",
+    "cmd": "win",
+    "cmd_l": "winleft",
+    "cmd_r": "winright",
+}
+
+# 로드한 매크로 캐시 최대 개수 (반복 재생 시 파일을 다시 읽지 않음)
+_MACRO_CACHE_SIZE = 16
+
+
+def _key_name(key: Any) -> str | None:
+    """
+    pynput 키 객체를 pyautogui 키 이름으로 변환합니다.
+
+    Args:
+        key: pynput Key 또는 KeyCode
+
+    Returns:
+        키 이름 (재생할 수 없는 키는 None)
+    """
+    char = getattr(key, "char", None)
+    if char:
+        return str(char)
+    name = getattr(key, "name", None)
+    if not name:
+        return None
+    return _PYNPUT_KEY_NAMES.get(name, name.replace("_", ""))
+
+
+def _bind_macro_event(event_type: int, x: int, y: int, code: int, keys: list[str]) -> Callable[[InputBackend], None]:
+    """매크로 이벤트 하나를 백엔드 호출 함수로 변환합니다."""
+    if event_type == MOVE:
+        return lambda backend: backend.move(x, y)
+    if event_type == MOUSE_DOWN:
+        return lambda backend: backend.mouse_down(x, y, button=MOUSE_BUTTONS[code])
+    if event_type == MOUSE_UP:
+        return lambda backend: backend.mouse_up(x, y, button=MOUSE_BUTTONS[code])
+    if event_type == SCROLL:
+        return lambda backend: backend.scroll(code, x=x, y=y)
+    if event_type == KEY_DOWN:
+        return lambda backend: backend.key_down(keys[code])
+    if event_type == KEY_UP:
+        return lambda backend: backend.key_up(keys[code])
+    raise ValueError(f"알 수 없는 매크로 이벤트 종류입니다: {event_type}")
+
+
+class Macro:
+    """
+    녹화된 매크로 클래스
+    이벤트 배열(MACRO_DTYPE)과 키 이름 표를 보관합니다.
+    """
+
+    __slots__ = ("events", "keys")
+
+    def __init__(self, events: np.ndarray, keys: list[str] | None = None) -> None:
+        """
+        Macro 초기화
+
+        Args:
+            events: 이벤트 배열 (MACRO_DTYPE, 시각 오름차순)
+            keys: 키 이름 표 (KEY_DOWN/KEY_UP 이벤트의 code가 가리킴)
+
+        Raises:
+            ValueError: 배열 형식이 다르거나 code가 범위를 벗어난 경우
+        """
+        if events.dtype != MACRO_DTYPE or events.ndim != 1:
+            raise ValueError(f"매크로 이벤트 배열 형식이 올바르지 않습니다: {events.dtype}")
+        self.events = events
+        self.keys = list(keys or [])
+        if len(events):
+            types = events["type"]
+            codes = events["code"]
+            if int(types.max()) >= len(EVENT_NAMES):
+                raise ValueError("매크로에 알 수 없는 이벤트 종류가 있습니다.")
+            if np.any(np.diff(events["t"]) < 0):
+                raise ValueError("매크로 이벤트 시각이 오름차순이 아닙니다.")
+            button_codes = codes[(types == MOUSE_DOWN) | (types == MOUSE_UP)]
+            if len(button_codes) and (button_codes.min() < 0 or button_codes.max() >= len(MOUSE_BUTTONS)):
+                raise ValueError("매크로에 알 수 없는 마우스 버튼이 있습니다.")
+            key_codes = codes[(types == KEY_DOWN) | (types == KEY_UP)]
+            if len(key_codes) and (key_codes.min() < 0 or key_codes.max() >= len(self.keys)):
+                raise ValueError("매크로의 키 인덱스가 키 이름 표 범위를 벗어났습니다.")
+
+    def __len__(self) -> int:
+        return len(self.events)
+
+    @property
+    def duration(self) -> float:
+        """첫 이벤트부터 마지막 이벤트까지의 길이 (초)"""
+        if not len(self.events):
+            return 0.0
+        return float(self.events["t"][-1] - self.events["t"][0])
+
+    def save(self, path: str) -> None:
+        """
+        매크로를 .npz 파일로 저장합니다. (압축하지 않음, 상위 폴더는 자동 생성)
+
+        Args:
+            path: 저장 경로
+        """
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        np.savez(
+            path,
+            version=np.array(MACRO_FORMAT_VERSION),
+            events=self.events,
+            keys=np.array(self.keys, dtype=str),
+        )
+
+    @classmethod
+    def load(cls, path: str) -> "Macro":
+        """
+        .npz 파일에서 매크로를 읽습니다.
+
+        Args:
+            path: 매크로 파일 경로
+
+        Returns:
+            매크로
+
+        Raises:
+            ValueError: 파일이 없거나 매크로 형식이 아닌 경우
+        """
+        if not os.path.isfile(path):
+            raise ValueError(f"매크로 파일을 찾을 수 없습니다: {path}")
+        try:
+            with np.load(path, allow_pickle=False) as data:
+                version = int(data["version"])
+                events = data["events"]
+                keys = [str(key) for key in data["keys"].tolist()]
+        except (KeyError, OSError, ValueError) as e:
+            raise ValueError(f"매크로 파일 형식이 아닙니다: {path} ({e!s})") from e
+        if version > MACRO_FORMAT_VERSION:
+            raise ValueError(f"지원하지 않는 매크로 형식 버전입니다: {version}")
+        return cls(events, keys)
+
+    def to_sequence(self, speed: float = 1.0, max_idle_seconds: float | None = None) -> "MacroSequence":
+        """
+        재생용 입력 시퀀스로 변환합니다.
+
+        Args:
+            speed: 재생 속도 배율 (2.0이면 두 배 빠르게)
+            max_idle_seconds: 이벤트 사이 최대 간격 (초, 더 긴 대기는 이 값으로 줄임, None이면 그대로)
+
+        Returns:
+            매크로 입력 시퀀스
+
+        Raises:
+            ValueError: 속도나 최대 간격이 잘못된 경우
+        """
+        if speed <= 0:
+            raise ValueError("재생 속도는 0보다 커야 합니다.")
+        if max_idle_seconds is not None and max_idle_seconds < 0:
+            raise ValueError("최대 간격은 0 이상이어야 합니다.")
+        gaps = np.diff(self.events["t"], prepend=self.events["t"][:1])
+        if max_idle_seconds is not None:
+            gaps = np.minimum(gaps, max_idle_seconds)
+        # 첫 이벤트를 시각 0으로 맞춤 (녹화 시작 후 첫 입력까지의 대기는 재생하지 않음)
+        offsets = np.cumsum(gaps) / speed
+        return MacroSequence(self, offsets.tolist())
+
+    def to_dict(self) -> dict[str, Any]:
+        """매크로 요약 정보 (이벤트 종류별 개수, 길이, 사용한 키)"""
+        counts = np.bincount(self.events["type"], minlength=len(EVENT_NAMES))
+        return {
+            "events": len(self.events),
+            "duration": round(self.duration, 3),
+            "counts": {name: int(count) for name, count in zip(EVENT_NAMES, counts, strict=False)},
+            "keys": list(self.keys),
+            "size_bytes": int(self.events.nbytes),
+        }
+
+
+class MacroSequence(InputSequence):
+    """
+    매크로 재생용 입력 시퀀스 클래스
+    실행 시각만 미리 계산해 두고, 백엔드 호출 함수는 재생하면서 이벤트 배열에서 하나씩 만듭니다.
+    """
+
+    __slots__ = ("macro",)
+
+    def __init__(self, macro: Macro, offsets: list[float]) -> None:
+        """
+        MacroSequence 초기화
+
+        Args:
+            macro: 재생할 매크로
+            offsets: 이벤트별 실행 시각 (시퀀스 시작부터의 초)
+        """
+        super().__init__([], offsets, [])
+        self.macro = macro
+
+    def __len__(self) -> int:
+        return len(self.macro)
+
+    def steps(self) -> Iterator[tuple[float, Callable[[InputBackend], None]]]:
+        events = self.macro.events
+        keys = self.macro.keys
+        rows = zip(
+            self.offsets,
+            events["type"].tolist(),
+            events["x"].tolist(),
+            events["y"].tolist(),
+            events["code"].tolist(),
+            strict=True,
+        )
+        for offset, event_type, x, y, code in rows:
+            yield offset, _bind_macro_event(event_type, x, y, code, keys)
+
+
+class MacroRecorder:
+    """
+    매크로 녹화 클래스
+    pynput 리스너로 마우스/키보드 입력을 받아 이벤트 행으로 쌓고, stop()에서 매크로 배열로 변환합니다.
+    """
+
+    def __init__(self, move_interval: float | None = None, stop_key: str | None = None) -> None:
+        """
+        MacroRecorder 초기화
+
+        Args:
+            move_interval: 마우스 이동을 합칠 간격 (초, None이면 MACRO_MOVE_COALESCE_SECONDS, 0이면 합치지 않음)
+            stop_key: 누르면 녹화를 끝내는 키 이름 (예: "esc", 이 키 입력은 녹화하지 않음)
+        """
+        self.move_interval = settings.MACRO_MOVE_COALESCE_SECONDS if move_interval is None else max(0.0, move_interval)
+        self.stop_key = stop_key
+        # _rows: 녹화한 이벤트 (t, type, x, y, code)
+        self._rows: list[tuple[float, int, int, int, int]] = []
+        # _key_index: 키 이름 → 키 이름 표 인덱스
+        self._key_index: dict[str, int] = {}
+        self._lock = threading.Lock()
+        self._stopped = threading.Event()
+        self._started_at = 0.0
+        self._position = (0, 0)
+        # _move_anchor: 마지막 이동 이벤트가 처음 기록된 시각 (이 시각부터 move_interval 안의 이동은 합침)
+        self._move_anchor = 0.0
+        self._listeners: list[Any] = []
+        # coalesced_moves: 합쳐서 버린 마우스 이동 수
+        self.coalesced_moves = 0
+
+    @property
+    def recording(self) -> bool:
+        """녹화 중 여부"""
+        return bool(self._listeners) and not self._stopped.is_set()
+
+    def _now(self) -> float:
+        return time.perf_counter() - self._started_at
+
+    def _append(self, event_type: int, x: int, y: int, code: int = 0) -> None:
+        with self._lock:
+            self._rows.append((self._now(), event_type, x, y, code))
+            self._position = (x, y)
+
+    def _on_move(self, x: int, y: int) -> None:
+        now = self._now()
+        with self._lock:
+            if (x, y) == self._position:
+                return
+            self._position = (x, y)
+            if self._rows and self._rows[-1][1] == MOVE and now - self._move_anchor < self.move_interval:
+                # 직전 이동과 합침 (위치와 시각만 갱신)
+                self._rows[-1] = (now, MOVE, x, y, 0)
+                self.coalesced_moves += 1
+                return
+            self._rows.append((now, MOVE, x, y, 0))
+            self._move_anchor = now
+
+    def _on_click(self, x: int, y: int, button: Any, pressed: bool) -> None:
+        name = getattr(button, "name", "left")
+        if name not in MOUSE_BUTTONS:
+            return
+        self._append(MOUSE_DOWN if pressed else MOUSE_UP, int(x), int(y), MOUSE_BUTTONS.index(name))
+
+    def _on_scroll(self, x: int, y: int, dx: int, dy: int) -> None:
+        if dy:
+            self._append(SCROLL, int(x), int(y), int(dy))
+
+    def _on_key(self, key: Any, pressed: bool) -> bool | None:
+        name = _key_name(key)
+        if name is None:
+            return None
+        if self.stop_key is not None and name == self.stop_key:
+            self._stopped.set()
+            # 다른 리스너도 종료 (이 리스너는 False 반환으로 종료)
+            for listener in self._listeners:
+                listener.stop()
+            return False
+        with self._lock:
+            code = self._key_index.setdefault(name, len(self._key_index))
+            self._rows.append((self._now(), KEY_DOWN if pressed else KEY_UP, *self._position, code))
+        return None
+
+    def start(self) -> None:
+        """
+        녹화를 시작합니다.
+
+        Raises:
+            RuntimeError: 이미 녹화 중인 경우
+        """
+        if self.recording:
+            raise RuntimeError("이미 매크로를 녹화 중입니다.")
+        # 디스플레이가 없는 환경에서도 import할 수 있도록 녹화를 시작할 때 pynput을 import
+        from pynput.keyboard import Listener as KeyboardListener
+        from pynput.mouse import Listener as MouseListener
+
+        with self._lock:
+            self._rows.clear()
+            self._key_index.clear()
+            self.coalesced_moves = 0
+        self._stopped.clear()
+        self._started_at = time.perf_counter()
+        self._listeners = [
+            MouseListener(on_move=self._on_move, on_click=self._on_click, on_scroll=self._on_scroll),
+            KeyboardListener(
+                on_press=lambda key: self._on_key(key, True),
+                on_release=lambda key: self._on_key(key, False),
+            ),
+        ]
+        for listener in self._listeners:
+            listener.start()
+
+    def wait(self, timeout: float | None = None) -> bool:
+        """
+        종료 키가 눌릴 때까지 대기합니다.
+
+        Args:
+            timeout: 최대 대기 시간 (초)
+
+        Returns:
+            종료 키로 녹화가 끝났는지 여부
+        """
+        return self._stopped.wait(timeout)
+
+    def stop(self) -> Macro:
+        """
+        녹화를 끝내고 매크로를 반환합니다. (종료 키로 이미 끝났어도 호출 가능)
+
+        Returns:
+            녹화한 매크로
+        """
+        self._stopped.set()
+        for listener in self._listeners:
+            listener.stop()
+        self._listeners = []
+        with self._lock:
+            events = np.array(self._rows, dtype=MACRO_DTYPE)
+            keys = sorted(self._key_index, key=self._key_index.__getitem__)
+        return Macro(events, keys)
+
+
+# _macro_cache: (경로, 수정 시각) → 매크로 (최근 사용 순)
+_macro_cache: "OrderedDict[tuple[str, int], Macro]" = OrderedDict()
+_macro_cache_lock = threading.Lock()
+
+
+def resolve_macro_path(name: str) -> str:
+    """
+    매크로 이름이나 경로를 파일 경로로 변환합니다.
+
+    Args:
+        name: 매크로 파일 경로 또는 MACRO_DIR 안의 매크로 이름 (확장자 생략 가능)
+
+    Returns:
+        매크로 파일 경로
+    """
+    if os.path.isfile(name):
+        return name
+    path = name if os.path.isabs(name) else os.path.join(settings.MACRO_DIR, name)
+    return path if path.endswith(".npz") else f"{path}.npz"
+
+
+def load_macro(name: str) -> Macro:
+    """
+    매크로를 읽습니다. 같은 파일을 다시 읽으면 캐시된 매크로를 반환합니다. (파일이 바뀌면 다시 읽음)
+
+    Args:
+        name: 매크로 파일 경로 또는 MACRO_DIR 안의 매크로 이름
+
+    Returns:
+        매크로
+
+    Raises:
+        ValueError: 파일이 없거나 매크로 형식이 아닌 경우
+    """
+    path = os.path.abspath(resolve_macro_path(name))
+    try:
+        cache_key = (path, os.stat(path).st_mtime_ns)
+    except OSError as e:
+        raise ValueError(f"매크로 파일을 찾을 수 없습니다: {name}") from e
+    with _macro_cache_lock:
+        macro = _macro_cache.get(cache_key)
+        if macro is not None:
+            _macro_cache.move_to_end(cache_key)
+            return macro
+    macro = Macro.load(path)
+    with _macro_cache_lock:
+        _macro_cache[cache_key] = macro
+        while len(_macro_cache) > _MACRO_CACHE_SIZE:
+            _macro_cache.popitem(last=False)
+    return macro
@@ -1,10 +1,11 @@
-import time
+from typing import Any
 
 import cv2
 import numpy as np
-import pyautogui
 
 from log import log_manager
+from utils.cancellation import CancellationToken
+from utils.dry_run import ReplayFrameSource
 
 logger = log_manager.logger
 
@@ -12,9 +13,24 @@ logger = log_manager.logger
 class ScreenCapture:
     """화면 캡처 및 이미지 처리 클래스"""
 
-    def __init__(self) -> None:
-        self.screen_width = pyautogui.size().width
-        self.screen_height = pyautogui.size().height
+    def __init__(self, frame_source: ReplayFrameSource | None = None) -> None:
+        """
+        ScreenCapture 초기화
+
+        Args:
+            frame_source: 화면 재생 소스 (드라이런 실행, 있으면 실제 화면 대신 재생 프레임을 캡처 결과로 사용)
+        """
+        self.frame_source = frame_source
+        # _pyautogui: 실제 화면 캡처용 모듈 (재생 소스를 사용하면 디스플레이가 필요 없으므로 import하지 않음)
+        self._pyautogui: Any = None
+        if frame_source is not None:
+            self.screen_height, self.screen_width = frame_source.peek().shape[:2]
+        else:
+            import pyautogui
+
+            self._pyautogui = pyautogui
+            self.screen_width = pyautogui.size().width
+            self.screen_height = pyautogui.size().height
 
     def capture_screen(self, region: tuple[int, int, int, int] | None = None) -> np.ndarray:
         """
@@ -26,17 +42,24 @@ class ScreenCapture:
         Returns:
             캡처된 이미지 (numpy array)
         """
+        if self.frame_source is not None:
+            return self.frame_source.next_frame(region)
         if region:
-            screenshot = pyautogui.screenshot(region=region)
+            screenshot = self._pyautogui.screenshot(region=region)
         else:
-            screenshot = pyautogui.screenshot()
+            screenshot = self._pyautogui.screenshot()
 
         # PIL Image를 OpenCV 형식으로 변환
         img_array = np.array(screenshot)
         return cv2.cvtColor(img_array, cv2.COLOR_RGB2BGR)
 
     def find_template(
-        self, template_path: str, threshold: float = 0.7, max_attempts: int = 5, delay: float = 0.5
+        self,
+        template_path: str,
+        threshold: float = 0.7,
+        max_attempts: int = 5,
+        delay: float = 0.5,
+        cancel_token: CancellationToken | None = None,
     ) -> tuple[int, int, int, int] | None:
         """
         템플릿 매칭을 통해 특정 이미지를 찾습니다.
@@ -45,12 +68,17 @@ class ScreenCapture:
         Args:
             template_path: 템플릿 이미지 경로
             threshold: 매칭 임계값 (기본값 0.7, 0.8에서 낮춤)
-            max_attempts: 최대 시도 횟수 (기본값 5)
+            max_attempts: 최대 시도 횟수 (기본값 5, 0 이하면 찾거나 취소 토큰이 취소/시간 초과될 때까지 계속 시도)
             delay: 각 시도 간 딜레이 (초, 기본값 0.5)
+            cancel_token: 실행 취소 토큰 (취소되면 시도 간 대기를 즉시 중단)
 
         Returns:
             찾은 위치 (x, y, width, height) 또는 None
+
+        Raises:
+            ExecutionCancelledError: 이미지 찾기 중 실행이 취소된 경우
         """
+        cancel_token = cancel_token or CancellationToken()
         import os
 
         # 경로 정규화 (Windows 경로 문제 해결)
@@ -83,9 +111,13 @@ class ScreenCapture:
 
         logger.debug(f"이미지 로드 성공: {template_path}, 크기: {template.shape}")
 
-        # 여러 번 시도하여 이미지 찾기
-        for attempt in range(1, max_attempts + 1):
-            logger.debug(f"이미지 찾기 시도 {attempt}/{max_attempts}")
+        # 여러 번 시도하여 이미지 찾기 (max_attempts가 0 이하면 무제한)
+        unlimited = max_attempts <= 0
+        attempt = 0
+        while unlimited or attempt < max_attempts:
+            attempt += 1
+            cancel_token.raise_if_cancelled()
+            logger.debug(f"이미지 찾기 시도 {attempt}" + ("" if unlimited else f"/{max_attempts}"))
 
             # 화면 캡처
             screen = self.capture_screen()
@@ -109,15 +141,16 @@ class ScreenCapture:
                 )
                 return (max_loc[0], max_loc[1], w, h)
             logger.debug(
-                f"이미지 찾기 실패 (시도 {attempt}/{max_attempts}): 매칭 점수 {max_val:.4f}가 임계값 {threshold}보다 낮습니다."
+                f"이미지 찾기 실패 (시도 {attempt}): 매칭 점수 {max_val:.4f}가 임계값 {threshold}보다 낮습니다."
             )
 
-            # 마지막 시도가 아니면 딜레이
-            if attempt < max_attempts:
+            # 마지막 시도가 아니면 딜레이 (취소되면 즉시 중단)
+            if unlimited or attempt < max_attempts:
                 logger.debug(f"{delay}초 대기 후 재시도...")
-                time.sleep(delay)
+                if cancel_token.wait(delay):
+                    cancel_token.raise_if_cancelled()
 
-        logger.debug(f"모든 시도 실패: {max_attempts}번 시도했지만 이미지를 찾을 수 없습니다.")
+        logger.debug(f"모든 시도 실패: {attempt}번 시도했지만 이미지를 찾을 수 없습니다.")
         return None
 
     def find_color_region(self, color: tuple[int, int, int], tolerance: int = 10) -> list:
@@ -1,8 +1,9 @@
-import asyncio
 from enum import Enum
 import time
 from typing import TYPE_CHECKING, Any
 
+from utils.cancellation import CancellationToken, ExecutionCancelledError
+
 if TYPE_CHECKING:
     from collections.abc import Callable
 
@@ -32,6 +33,7 @@ class NodeStatus(Enum):
     COMPLETED = "completed"
     FAILED = "failed"
     SKIPPED = "skipped"
+    CANCELLED = "cancelled"
 
 
 class WorkflowNode:
@@ -79,6 +81,8 @@ class WorkflowEngine:
         self.end_time: float | None = None
         # results: 각 노드의 실행 결과 리스트
         self.results: list[dict[str, Any]] = []
+        # cancel_token: 실행 취소 토큰 (stop_execution() 호출 시 취소되어 대기 중인 노드가 즉시 중단됨)
+        self.cancel_token = CancellationToken()
 
         # 노드 핸들러 등록: 노드 타입별 실행 함수 매핑
         # node_handlers: 노드 타입을 키로 하고 해당 노드 타입의 실행 함수를 값으로 하는 딕셔너리
@@ -117,6 +121,7 @@ class WorkflowEngine:
     async def execute_workflow(self) -> dict[str, Any]:
         """워크플로우를 실행합니다."""
         self.is_running = True
+        self.cancel_token = CancellationToken()
         self.start_time = time.time()
         self.current_node_index = 0
         self.results = []
@@ -145,6 +150,9 @@ class WorkflowEngine:
         """순차 실행"""
         # 모든 노드를 순차적으로 실행
         for i, node in enumerate(self.nodes):
+            # 실행이 중지되었으면 남은 노드들은 실행하지 않음
+            if self.cancel_token.cancelled:
+                break
             # current_node_index: 현재 실행 중인 노드 인덱스 업데이트
             self.current_node_index = i
             # 현재 노드 실행
@@ -161,6 +169,8 @@ class WorkflowEngine:
     async def _execute_conditional(self) -> None:
         """조건부 실행"""
         for i, node in enumerate(self.nodes):
+            if self.cancel_token.cancelled:
+                break
             self.current_node_index = i
 
             # 조건 노드인 경우 조건 확인
@@ -195,6 +205,11 @@ class WorkflowEngine:
             # 실행 결과를 노드에 저장
             node.result = result
 
+        except ExecutionCancelledError as e:
+            # 실행 중지로 대기가 중단된 경우 노드 상태를 CANCELLED로 설정
+            node.status = NodeStatus.CANCELLED
+            node.error_message = e.reason
+
         except Exception as e:
             # 예외 발생 시 노드 상태를 FAILED로 설정
             node.status = NodeStatus.FAILED
@@ -218,7 +233,7 @@ class WorkflowEngine:
         clicks = node.data.get("clicks", 1)
 
         # 실제 클릭 로직 구현
-        await asyncio.sleep(0.1)  # 시뮬레이션
+        await self.cancel_token.sleep(0.1)  # 시뮬레이션
 
         return {"action": "click", "coordinates": (x, y), "button": button, "clicks": clicks, "success": True}
 
@@ -227,8 +242,8 @@ class WorkflowEngine:
         # duration: 대기 시간(초) (기본값: 1.0초)
         duration = node.data.get("duration", 1.0)
 
-        # 지정된 시간만큼 대기
-        await asyncio.sleep(duration)
+        # 지정된 시간만큼 대기 (실행 중지 시 즉시 중단)
+        await self.cancel_token.sleep(duration)
 
         # 대기 완료 결과 반환
         return {"action": "wait", "duration": duration, "success": True}
@@ -255,6 +270,8 @@ class WorkflowEngine:
         for i in range(loop_count):
             # 루프 내부 노드들 실행
             for loop_node_data in loop_nodes:
+                # 실행이 중지되었으면 루프 중단
+                self.cancel_token.raise_if_cancelled()
                 # 각 반복마다 새로운 WorkflowNode 객체 생성 (고유한 ID 부여)
                 loop_node = WorkflowNode(
                     node_id=f"{node.id}_loop_{i}_{loop_node_data.get('id', 'unknown')}",
@@ -275,7 +292,7 @@ class WorkflowEngine:
         custom_action = node.data.get("custom_action", "unknown")
 
         # 커스텀 액션 로직 구현
-        await asyncio.sleep(0.5)  # 시뮬레이션 (실제 구현에서는 커스텀 액션 수행)
+        await self.cancel_token.sleep(0.5)  # 시뮬레이션 (실제 구현에서는 커스텀 액션 수행)
 
         # 커스텀 노드 실행 결과 반환
         return {"action": "custom", "custom_action": custom_action, "success": True}
@@ -305,6 +322,8 @@ class WorkflowEngine:
         failed_nodes = len([n for n in self.nodes if n.status == NodeStatus.FAILED])
         # skipped_nodes: 스킵된 노드 개수 (SKIPPED 상태인 노드들)
         skipped_nodes = len([n for n in self.nodes if n.status == NodeStatus.SKIPPED])
+        # cancelled_nodes: 실행 중지로 중단된 노드 개수 (CANCELLED 상태인 노드들)
+        cancelled_nodes = len([n for n in self.nodes if n.status == NodeStatus.CANCELLED])
 
         # execution_time: 실행 시간 계산 (종료 시간 - 시작 시간)
         # end_time과 start_time이 모두 존재하는 경우에만 계산, 없으면 0
@@ -313,7 +332,7 @@ class WorkflowEngine:
         # 실행 요약 정보 반환
         return {
             # success: 실패한 노드가 없으면 True (모든 노드가 성공적으로 완료)
-            "success": failed_nodes == 0,
+            "success": failed_nodes == 0 and not self.cancel_token.cancelled,
             # execution_time: 총 실행 시간(초)
             "execution_time": execution_time,
             # total_nodes: 전체 노드 개수
@@ -324,6 +343,10 @@ class WorkflowEngine:
             "failed_nodes": failed_nodes,
             # skipped_nodes: 스킵된 노드 개수
             "skipped_nodes": skipped_nodes,
+            # cancelled_nodes: 실행 중지로 중단된 노드 개수
+            "cancelled_nodes": cancelled_nodes,
+            # cancelled: 실행 중지 여부
+            "cancelled": self.cancel_token.cancelled,
             # success_rate: 성공률 (완료된 노드 / 전체 노드 * 100), 전체 노드가 0이면 0
             "success_rate": (completed_nodes / total_nodes * 100) if total_nodes > 0 else 0,
             # results: 각 노드의 실행 결과 리스트
@@ -331,7 +354,8 @@ class WorkflowEngine:
         }
 
     def stop_execution(self) -> None:
-        """실행을 중지합니다."""
+        """실행을 중지합니다. 실행 중인 노드의 대기가 즉시 중단되고 남은 노드는 실행되지 않습니다."""
+        self.cancel_token.cancel("워크플로우 실행이 중지되었습니다.")
         self.is_running = False
 
     def get_current_status(self) -> dict[str, Any]:
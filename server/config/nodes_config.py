@@ -162,6 +162,118 @@ NODES_CONFIG: dict[str, dict[str, Any]] = {
             },
         },
     },
+    "input-sequence": {
+        "label": "입력 시퀀스",
+        "title": "입력 시퀀스",
+        "description": "마우스/키보드 입력 여러 개를 정해진 간격으로 한 번에 실행합니다.",
+        "script": "node-input-sequence.js",
+        "is_boundary": False,
+        "category": "action",
+        # 노드 레벨 파라미터
+        "parameters": {
+            "events": {
+                "type": "string",
+                "label": "입력 이벤트 (JSON 배열)",
+                "description": "실행할 입력 이벤트 목록입니다. 동작: move, click, drag, scroll, key, hotkey, type. "
+                "delay(직전 이벤트 이후 초) 또는 at(시작부터 초)으로 실행 시각을 지정할 수 있습니다.",
+                "default": "[]",
+                "required": True,
+                "placeholder": '예: [{"action": "click", "x": 100, "y": 200}, {"action": "key", "key": "enter", "delay": 0.05}]',
+            },
+            "default_delay": {
+                "type": "number",
+                "label": "기본 간격 (초)",
+                "description": "간격을 지정하지 않은 이벤트 사이의 대기 시간입니다. 비워 두면 서버 입력 페이싱 설정을 사용합니다.",
+                "default": None,
+                "min": 0,
+                "max": 60,
+                "required": False,
+            },
+        },
+        # 상세 노드 타입 정의
+        "detail_types": {},
+        "input_schema": {
+            "action": {"type": "string", "description": "이전 노드 타입"},
+            "status": {"type": "string", "description": "이전 노드 실행 상태"},
+            "output": {"type": "any", "description": "이전 노드 출력 데이터"},
+        },
+        "output_schema": {
+            "action": {"type": "string", "description": "노드 타입"},
+            "status": {"type": "string", "description": "실행 상태"},
+            "output": {
+                "type": "object",
+                "description": "출력 데이터",
+                "properties": {
+                    "total": {"type": "number", "description": "전체 이벤트 수"},
+                    "executed": {"type": "number", "description": "실행한 이벤트 수"},
+                    "scheduled_duration": {"type": "number", "description": "예정된 시퀀스 길이 (초)"},
+                    "actual_duration": {"type": "number", "description": "실제 시퀀스 길이 (초)"},
+                    "drift_ms": {"type": "object", "description": "예정 시각 대비 지연 통계 (mean, p95, max, 밀리초)"},
+                    "late_events": {"type": "number", "description": "2ms 넘게 늦은 이벤트 수"},
+                },
+            },
+        },
+    },
+    "macro-playback": {
+        "label": "매크로 재생",
+        "title": "매크로 재생",
+        "description": "녹화한 마우스/키보드 매크로를 녹화 당시의 간격대로 재생합니다.",
+        "script": "node-macro-playback.js",
+        "is_boundary": False,
+        "category": "action",
+        # 노드 레벨 파라미터
+        "parameters": {
+            "macro": {
+                "type": "string",
+                "label": "매크로",
+                "description": "매크로 이름 (MACRO_DIR 폴더) 또는 .npz 파일 경로입니다. 매크로는 /api/macros/record로 녹화합니다.",
+                "default": "",
+                "required": True,
+                "placeholder": "예: login",
+            },
+            "speed": {
+                "type": "number",
+                "label": "재생 속도 (배)",
+                "description": "1보다 크면 빠르게, 작으면 느리게 재생합니다.",
+                "default": 1.0,
+                "min": 0.1,
+                "max": 10,
+                "required": False,
+            },
+            "max_idle_seconds": {
+                "type": "number",
+                "label": "최대 대기 간격 (초)",
+                "description": "입력 사이의 대기가 이 값보다 길면 이 값으로 줄입니다. 비워 두면 녹화 그대로 재생합니다.",
+                "default": None,
+                "min": 0,
+                "required": False,
+            },
+        },
+        # 상세 노드 타입 정의
+        "detail_types": {},
+        "input_schema": {
+            "action": {"type": "string", "description": "이전 노드 타입"},
+            "status": {"type": "string", "description": "이전 노드 실행 상태"},
+            "output": {"type": "any", "description": "이전 노드 출력 데이터"},
+        },
+        "output_schema": {
+            "action": {"type": "string", "description": "노드 타입"},
+            "status": {"type": "string", "description": "실행 상태"},
+            "output": {
+                "type": "object",
+                "description": "출력 데이터",
+                "properties": {
+                    "macro": {"type": "string", "description": "재생한 매크로"},
+                    "total": {"type": "number", "description": "전체 이벤트 수"},
+                    "executed": {"type": "number", "description": "실행한 이벤트 수"},
+                    "scheduled_duration": {"type": "number", "description": "예정된 재생 길이 (초)"},
+                    "actual_duration": {"type": "number", "description": "실제 재생 길이 (초)"},
+                    "drift_ms": {"type": "object", "description": "예정 시각 대비 지연 통계 (mean, p95, max, 밀리초)"},
+                    "late_events": {"type": "number", "description": "2ms 넘게 늦은 이벤트 수"},
+                },
+            },
+        },
+    },
     # === 로직 노드 (Logic Nodes) ===
     "condition": {
         "label": "조건 노드",
@@ -189,6 +301,12 @@ NODES_CONFIG: dict[str, dict[str, Any]] = {
                     {"value": "less_or_equal", "label": "작거나 같음 (<=)"},
                     {"value": "is_empty", "label": "비어있음"},
                     {"value": "is_not_empty", "label": "비어있지 않음"},
+                    {"value": "regex", "label": "정규식 일치 (regex)"},
+                    {"value": "not_regex", "label": "정규식 불일치 (!regex)"},
+                    {"value": "between", "label": "범위 안 (최소,최대)"},
+                    {"value": "not_between", "label": "범위 밖 (최소,최대)"},
+                    {"value": "in", "label": "목록에 포함 (a,b,c)"},
+                    {"value": "not_in", "label": "목록에 없음 (a,b,c)"},
                 ],
             },
             "field_path": {
@@ -202,7 +320,7 @@ NODES_CONFIG: dict[str, dict[str, Any]] = {
             "compare_value": {
                 "type": "string",
                 "label": "비교할 값",
-                "description": "조건을 만족하는지 확인할 값을 입력하세요.",
+                "description": "조건을 만족하는지 확인할 값을 입력하세요. (정규식: 패턴, 범위: 최소,최대, 목록: 쉼표로 구분)",
                 "default": "",
                 "required": True,
                 "placeholder": "비교할 값을 입력하세요",
@@ -338,6 +456,55 @@ NODES_CONFIG: dict[str, dict[str, Any]] = {
             },
         },
     },
+    "call-script": {
+        "label": "스크립트 호출 노드",
+        "title": "스크립트 호출",
+        "description": "다른 스크립트를 현재 실행 안에서 호출하고 결과를 다음 노드로 전달하는 노드입니다.",
+        "script": "node-call-script.js",
+        "is_boundary": False,
+        "category": "logic",
+        # 노드 레벨 파라미터
+        "parameters": {
+            "script_id": {
+                "type": "number",
+                "label": "호출할 스크립트 ID",
+                "description": "호출할 스크립트의 ID를 입력하세요.",
+                "default": None,
+                "min": 1,
+                "required": True,
+            },
+            "inputs": {
+                "type": "string",
+                "label": "입력 파라미터 (JSON)",
+                "description": "호출한 스크립트에 전달할 값을 JSON 객체로 입력하세요. 호출된 스크립트에서는 {{params.이름}}으로 참조합니다.",
+                "default": "{}",
+                "required": False,
+                "placeholder": '예: {"item": "{{previous.output.name}}"}',
+            },
+        },
+        # 상세 노드 타입 정의
+        "detail_types": {},
+        "input_schema": {
+            "action": {"type": "string", "description": "이전 노드 타입"},
+            "status": {"type": "string", "description": "이전 노드 실행 상태"},
+            "output": {"type": "any", "description": "이전 노드 출력 데이터"},
+        },
+        "output_schema": {
+            "action": {"type": "string", "description": "노드 타입"},
+            "status": {"type": "string", "description": "실행 상태"},
+            "output": {
+                "type": "object",
+                "description": "출력 데이터",
+                "properties": {
+                    "script_id": {"type": "number", "description": "호출한 스크립트 ID"},
+                    "script_name": {"type": "string", "description": "호출한 스크립트 이름"},
+                    "executed_count": {"type": "number", "description": "실행한 노드 수"},
+                    "result": {"type": "any", "description": "호출한 스크립트의 마지막 노드 출력"},
+                    "outputs": {"type": "object", "description": "호출한 스크립트의 노드 ID별 출력"},
+                },
+            },
+        },
+    },
     # === 예시 노드: 파일 읽기 ===
     "file-read": {
         "label": "파일 읽기 노드",
@@ -599,6 +766,33 @@ NODES_CONFIG: dict[str, dict[str, Any]] = {
 }
 
 
+# 노드 타입별 점유 리소스 정의
+# 실행 큐가 같은 리소스를 사용하는 실행을 동시에 돌리지 않도록 판단할 때 사용합니다.
+# key: 노드 타입, value: 노드 실행 중 독점적으로 사용하는 리소스 이름 목록
+# - input: 마우스/키보드 (두 스크립트가 동시에 입력을 보내면 서로 방해됨)
+# - excel: Excel COM 애플리케이션
+NODE_RESOURCES: dict[str, list[str]] = {
+    "image-touch": ["input"],
+    "click": ["input"],
+    "process-focus": ["input"],
+    "input-sequence": ["input"],
+    "macro-playback": ["input"],
+    "excel-open": ["excel"],
+    "excel-close": ["excel"],
+}
+
+
+# 노드 타입별 기본 파라미터 템플릿 정의
+# 파라미터가 비어 있으면 적용되어 이전 노드의 출력을 자동으로 전달합니다. (표현식 형식은 utils/parameter_template.py 참조)
+# key: 노드 타입, value: {파라미터 이름: 템플릿 표현식}
+# - condition: 직전 노드의 출력을 조건 평가 입력으로 사용
+# - excel-close: 직전 엑셀 열기 노드 출력의 execution_id로 엑셀 객체를 찾음
+NODE_DEFAULT_TEMPLATES: dict[str, dict[str, str]] = {
+    "condition": {"previous_output": "{{previous.output}}"},
+    "excel-close": {"execution_id": "{{previous.output.execution_id}}"},
+}
+
+
 def get_node_config(node_type: str) -> dict[str, Any] | None:
     """노드 설정 가져오기"""
     return NODES_CONFIG.get(node_type)
@@ -624,7 +818,32 @@ def is_boundary_node(node_type: str) -> bool:
     return config.get("is_boundary", False) if config else False
 
 
+def get_node_resources(node_type: str) -> list[str]:
+    """노드가 점유하는 리소스 목록 가져오기"""
+    return NODE_RESOURCES.get(node_type, [])
+
+
 def get_node_label(node_type: str) -> str:
     """노드 라벨 가져오기"""
     config = get_node_config(node_type)
     return config.get("label", node_type) if config else node_type
+
+
+def get_node_default_timeout(node_type: str) -> float | None:
+    """노드 설정의 timeout 파라미터 기본값 가져오기 (초, 없으면 None)"""
+    config = get_node_config(node_type)
+    timeout_config = (config or {}).get("parameters", {}).get("timeout") or {}
+    default = timeout_config.get("default")
+    return float(default) if isinstance(default, (int, float)) and default > 0 else None
+
+
+def get_node_default_templates(node_type: str) -> dict[str, str]:
+    """노드 타입별 기본 파라미터 템플릿 가져오기"""
+    return NODE_DEFAULT_TEMPLATES.get(node_type, {})
+
+
+def get_previous_output_parameters(node_type: str) -> list[str]:
+    """이전 노드 출력에서 값을 선택하는 파라미터(source: previous_output) 이름 목록 가져오기"""
+    config = get_node_config(node_type)
+    parameters = (config or {}).get("parameters", {})
+    return [key for key, spec in parameters.items() if spec.get("source") == "previous_output"]
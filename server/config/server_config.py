@@ -34,6 +34,128 @@ class Settings:
     # 로그 설정
     LOG_LEVEL: str = os.getenv("LOG_LEVEL", "INFO")
     LOG_DIR: str = os.getenv("LOG_DIR", "log/logs")
+    # LOG_FILE_MAX_BYTES: 로그 파일 최대 크기 (바이트, 넘으면 server.log.1, .2, ...로 회전, 0이면 크기로 회전하지 않음)
+    LOG_FILE_MAX_BYTES: int = int(os.getenv("LOG_FILE_MAX_BYTES", str(10 * 1024 * 1024)))
+    # LOG_FILE_BACKUP_COUNT: 보관할 이전 로그 파일 수 (넘으면 가장 오래된 파일부터 삭제)
+    LOG_FILE_BACKUP_COUNT: int = int(os.getenv("LOG_FILE_BACKUP_COUNT", "10"))
+    # LOG_FILE_ROTATE_WHEN: 시간 기준 로그 파일 회전 주기 (midnight: 매일 자정, hour: 매 정시, 빈 값: 시간으로 회전하지 않음)
+    LOG_FILE_ROTATE_WHEN: str = os.getenv("LOG_FILE_ROTATE_WHEN", "midnight")
+    # LOG_MODULE_LEVELS: 모듈별 로그 레벨 ("모듈=레벨" 쉼표 구분, 모듈은 server 폴더 기준 점 경로, 하위 모듈에도 적용)
+    # 예: "services.action_service=DEBUG,db=WARNING"
+    LOG_MODULE_LEVELS: str = os.getenv("LOG_MODULE_LEVELS", "")
+
+    # 노드 실행 로그 싱크 설정
+    # LOG_SINK_MODE: 노드 실행 로그 전송 방식
+    # (local: 서버 프로세스 안의 로그 싱크로 일괄 기록, http: 로그마다 /api/logs로 전송, buffered: 모아서 /api/logs/node-execution/batch로 전송 - 원격 워커용)
+    LOG_SINK_MODE: str = os.getenv("LOG_SINK_MODE", "local").lower()
+    # LOG_SINK_BATCH_SIZE: 한 트랜잭션으로 기록할 최대 로그 수
+    LOG_SINK_BATCH_SIZE: int = int(os.getenv("LOG_SINK_BATCH_SIZE", "200"))
+    # LOG_SINK_FLUSH_INTERVAL_SECONDS: 첫 로그가 들어온 뒤 배치가 차지 않아도 기록할 때까지의 최대 대기 시간 (초)
+    LOG_SINK_FLUSH_INTERVAL_SECONDS: float = float(os.getenv("LOG_SINK_FLUSH_INTERVAL_SECONDS", "0.5"))
+    # LOG_SINK_MAX_QUEUE_SIZE: 기록 대기 로그 최대 개수 (가득 차면 가장 오래된 로그를 버림)
+    LOG_SINK_MAX_QUEUE_SIZE: int = int(os.getenv("LOG_SINK_MAX_QUEUE_SIZE", "10000"))
+    # LOG_BATCH_MAX_RECORDS: 일괄 수집 API(/api/logs/node-execution/batch) 요청 하나의 최대 로그 수
+    LOG_BATCH_MAX_RECORDS: int = int(os.getenv("LOG_BATCH_MAX_RECORDS", "5000"))
+    # LOG_CLIENT_BATCH_SIZE: buffered 모드 LogClient가 한 요청으로 보낼 최대 로그 수 (버퍼가 차면 즉시 전송)
+    LOG_CLIENT_BATCH_SIZE: int = int(os.getenv("LOG_CLIENT_BATCH_SIZE", "100"))
+    # LOG_CLIENT_FLUSH_INTERVAL_SECONDS: buffered 모드 LogClient가 버퍼가 차지 않아도 전송할 때까지의 최대 대기 시간 (초)
+    LOG_CLIENT_FLUSH_INTERVAL_SECONDS: float = float(os.getenv("LOG_CLIENT_FLUSH_INTERVAL_SECONDS", "1.0"))
+    # STATS_RECONCILE_INTERVAL_SECONDS: 트리거로 유지하는 로그/대시보드 통계를 전체 재계산으로 보정하는 주기 (초, 0이면 보정 안 함)
+    STATS_RECONCILE_INTERVAL_SECONDS: float = float(os.getenv("STATS_RECONCILE_INTERVAL_SECONDS", "3600"))
+
+    # 노드 실행 로그 보존 설정 (기간/개수 제한을 넘은 로그는 일별 집계에 더한 뒤 삭제)
+    # LOG_RETENTION_DAYS: 로그 보존 기간 (일, 0이면 기간 제한 없음)
+    LOG_RETENTION_DAYS: int = int(os.getenv("LOG_RETENTION_DAYS", "30"))
+    # LOG_RETENTION_MAX_ROWS: 보존할 최대 로그 수 (넘으면 오래된 로그부터 정리, 0이면 개수 제한 없음)
+    LOG_RETENTION_MAX_ROWS: int = int(os.getenv("LOG_RETENTION_MAX_ROWS", "200000"))
+    # LOG_RETENTION_INTERVAL_SECONDS: 보존 정책 자동 실행 주기 (초, 0이면 자동 실행 안 함)
+    LOG_RETENTION_INTERVAL_SECONDS: float = float(os.getenv("LOG_RETENTION_INTERVAL_SECONDS", "3600"))
+    # LOG_RETENTION_CHUNK_SIZE: 한 트랜잭션에서 정리할 최대 로그 수 (작을수록 로그 기록이 기다리는 시간이 짧음)
+    LOG_RETENTION_CHUNK_SIZE: int = int(os.getenv("LOG_RETENTION_CHUNK_SIZE", "500"))
+    # LOG_RETENTION_CHUNK_PAUSE_SECONDS: 청크 사이 쉬는 시간 (초, 이 사이에 다른 쓰기가 진행됨)
+    LOG_RETENTION_CHUNK_PAUSE_SECONDS: float = float(os.getenv("LOG_RETENTION_CHUNK_PAUSE_SECONDS", "0.05"))
+    # LOG_ARCHIVE_DIR: 정리한 원본 로그를 gzip 압축 NDJSON 세그먼트 파일로 보관할 폴더 (빈 값이면 보관하지 않음)
+    LOG_ARCHIVE_DIR: str = os.getenv("LOG_ARCHIVE_DIR", "")
+    # LOG_VACUUM_PAGES: 청크를 정리할 때마다 파일 시스템에 반환할 최대 빈 페이지 수 (auto_vacuum=INCREMENTAL DB만, 0이면 안 함)
+    LOG_VACUUM_PAGES: int = int(os.getenv("LOG_VACUUM_PAGES", "256"))
+
+    # 노드 실행 로그 파라미터/결과 저장 설정
+    # LOG_PAYLOAD_COMPRESS_THRESHOLD_BYTES: 이 크기(바이트)를 넘는 파라미터/결과는 zlib 압축 BLOB으로 저장 (0이면 압축 안 함)
+    LOG_PAYLOAD_COMPRESS_THRESHOLD_BYTES: int = int(os.getenv("LOG_PAYLOAD_COMPRESS_THRESHOLD_BYTES", "1024"))
+    # LOG_PAYLOAD_MAX_STRING_CHARS: 파라미터/결과 안의 문자열 값 최대 길이 (넘으면 잘라내고 생략 표시, 0이면 제한 없음)
+    LOG_PAYLOAD_MAX_STRING_CHARS: int = int(os.getenv("LOG_PAYLOAD_MAX_STRING_CHARS", "4000"))
+    # LOG_PAYLOAD_MAX_LIST_ITEMS: 파라미터/결과 안의 목록 값 최대 항목 수 (0이면 제한 없음)
+    LOG_PAYLOAD_MAX_LIST_ITEMS: int = int(os.getenv("LOG_PAYLOAD_MAX_LIST_ITEMS", "100"))
+    # LOG_PAYLOAD_FIELD_LIMITS: 필드 이름별 문자열 최대 길이 ("필드=길이" 쉼표 구분, 하위 값에도 적용, error_traceback은 스택 트레이스 컬럼)
+    LOG_PAYLOAD_FIELD_LIMITS: str = os.getenv("LOG_PAYLOAD_FIELD_LIMITS", "headers=256,data=8000,error_traceback=16000")
+    # LOG_PAYLOAD_DEDUP_MIN_BYTES: 이 크기(바이트) 이상인 파라미터는 내용 해시로 한 번만 저장하고 로그는 해시로 참조
+    LOG_PAYLOAD_DEDUP_MIN_BYTES: int = int(os.getenv("LOG_PAYLOAD_DEDUP_MIN_BYTES", "256"))
+    # LOG_SEARCH_RESULT_FIELDS: 로그 전문 검색 색인에 넣는 결과 필드 경로 (쉼표 구분, 바꾸면 이후 기록하는 로그부터 적용)
+    LOG_SEARCH_RESULT_FIELDS: str = os.getenv(
+        "LOG_SEARCH_RESULT_FIELDS", "error.reason,error.message,output.reason,output.message"
+    )
+
+    # 실행 큐 설정
+    # QUEUE_SCHEDULING: 대기열 정렬 방식 (priority: 우선순위 높은 순 → 등록 순, fifo: 등록 순)
+    QUEUE_SCHEDULING: str = os.getenv("QUEUE_SCHEDULING", "priority").lower()
+    # QUEUE_MAX_CONCURRENT_RUNS: 동시에 실행할 수 있는 최대 실행 수 (리소스 제한과 별개의 전체 상한)
+    QUEUE_MAX_CONCURRENT_RUNS: int = int(os.getenv("QUEUE_MAX_CONCURRENT_RUNS", "4"))
+    # QUEUE_RESOURCE_LIMITS: 리소스별 동시 사용 한도 ("리소스=한도" 쉼표 구분, 예: "input=1,excel=1")
+    QUEUE_RESOURCE_LIMITS: str = os.getenv("QUEUE_RESOURCE_LIMITS", "input=1,excel=1")
+    # QUEUE_HISTORY_SIZE: 완료된 실행 기록 및 대기 시간 샘플을 메모리에 보관할 개수
+    QUEUE_HISTORY_SIZE: int = int(os.getenv("QUEUE_HISTORY_SIZE", "200"))
+
+    # 예약 실행 설정
+    # SCHEDULER_ENABLED: 서버 시작 시 예약 실행 스케줄러 시작 여부
+    SCHEDULER_ENABLED: bool = os.getenv("SCHEDULER_ENABLED", "True").lower() == "true"
+    # SCHEDULER_MISFIRE_GRACE_SECONDS: 예정 시각보다 이 시간(초) 이상 늦으면 놓친 실행으로 처리
+    SCHEDULER_MISFIRE_GRACE_SECONDS: int = int(os.getenv("SCHEDULER_MISFIRE_GRACE_SECONDS", "60"))
+
+    # 실행 시간 제한 설정 (0이면 제한 없음)
+    # NODE_DEFAULT_TIMEOUT_SECONDS: timeout 파라미터도 노드 설정 기본값도 없는 노드의 타임아웃 (초)
+    NODE_DEFAULT_TIMEOUT_SECONDS: float = float(os.getenv("NODE_DEFAULT_TIMEOUT_SECONDS", "0"))
+    # WORKFLOW_TIMEOUT_SECONDS: 요청에 제한 시간이 없을 때 워크플로우 전체 실행 제한 시간 (초)
+    WORKFLOW_TIMEOUT_SECONDS: float = float(os.getenv("WORKFLOW_TIMEOUT_SECONDS", "0"))
+
+    # 노드 결과 캐시 설정 (cache 파라미터로 켠 노드에만 적용)
+    # NODE_CACHE_MAX_ENTRIES: 캐시 최대 항목 수 (초과 시 가장 오래 사용되지 않은 항목부터 제거)
+    NODE_CACHE_MAX_ENTRIES: int = int(os.getenv("NODE_CACHE_MAX_ENTRIES", "256"))
+    # NODE_CACHE_DEFAULT_TTL_SECONDS: cache 설정에 ttl_seconds가 없을 때의 캐시 유지 시간 (초)
+    NODE_CACHE_DEFAULT_TTL_SECONDS: float = float(os.getenv("NODE_CACHE_DEFAULT_TTL_SECONDS", "60"))
+
+    # 노드 실행 컨텍스트 설정 (워크플로우 실행 중 노드 결과 보관)
+    # NODE_CONTEXT_MAX_RESULTS: 보존할 최근 노드 결과 개수 (0이면 제한 없음, 다른 노드가 ID로 참조하는 노드는 항상 보존)
+    NODE_CONTEXT_MAX_RESULTS: int = int(os.getenv("NODE_CONTEXT_MAX_RESULTS", "200"))
+    # NODE_CONTEXT_SPILL_THRESHOLD_BYTES: 이 크기(바이트)를 넘는 노드 출력은 임시 파일로 내보냄 (0이면 사용 안 함)
+    NODE_CONTEXT_SPILL_THRESHOLD_BYTES: int = int(os.getenv("NODE_CONTEXT_SPILL_THRESHOLD_BYTES", "262144"))
+
+    # 서브 워크플로우(call-script 노드) 설정
+    # WORKFLOW_PLAN_CACHE_MAX_ENTRIES: 캐시할 스크립트 실행 계획 개수 (스크립트 저장/삭제 시 해당 계획은 무효화)
+    WORKFLOW_PLAN_CACHE_MAX_ENTRIES: int = int(os.getenv("WORKFLOW_PLAN_CACHE_MAX_ENTRIES", "64"))
+    # CALL_SCRIPT_MAX_DEPTH: 스크립트 호출 최대 중첩 깊이 (호출한 스크립트 포함)
+    CALL_SCRIPT_MAX_DEPTH: int = int(os.getenv("CALL_SCRIPT_MAX_DEPTH", "8"))
+
+    # 실행 체크포인트 설정 (서버 측 스크립트 실행의 중단 후 재개용)
+    # CHECKPOINT_ENABLED: 체크포인트 저장 여부
+    CHECKPOINT_ENABLED: bool = os.getenv("CHECKPOINT_ENABLED", "true").lower() == "true"
+    # CHECKPOINT_INTERVAL_SECONDS: 체크포인트 저장 최소 간격 (초, 0이면 노드마다 저장 - 짧을수록 재개 시 다시 실행할 노드가 적지만 쓰기가 늘어남)
+    CHECKPOINT_INTERVAL_SECONDS: float = float(os.getenv("CHECKPOINT_INTERVAL_SECONDS", "5"))
+
+    # 입력(마우스/키보드) 설정
+    # INPUT_BACKEND: 입력 백엔드 (pyautogui: 실제 입력, recording: 입력하지 않고 기록, noop: 아무것도 하지 않음 - 헤드리스 테스트용)
+    INPUT_BACKEND: str = os.getenv("INPUT_BACKEND", "pyautogui")
+    # INPUT_PAUSE_SECONDS: 입력 동작 후 기본 대기 시간 (초, 기존 pyautogui.PAUSE 값 - 대상 애플리케이션이 입력을 처리할 시간)
+    INPUT_PAUSE_SECONDS: float = float(os.getenv("INPUT_PAUSE_SECONDS", "0.1"))
+    # INPUT_PAUSE_OVERRIDES: 동작별 대기 시간 JSON (예: {"move": 0, "type": 0.02}, 동작: click, move, drag, scroll, key, hotkey, type)
+    INPUT_PAUSE_OVERRIDES: str = os.getenv("INPUT_PAUSE_OVERRIDES", "")
+    # INPUT_SEQUENCE_SPIN_SECONDS: 입력 시퀀스 실행 시 예정 시각 직전 바쁜 대기(busy-wait) 구간 (초, sleep 오차 보정용)
+    INPUT_SEQUENCE_SPIN_SECONDS: float = float(os.getenv("INPUT_SEQUENCE_SPIN_SECONDS", "0.002"))
+
+    # 매크로 녹화/재생 설정
+    # MACRO_DIR: 매크로 파일(.npz) 저장 폴더 (매크로 재생 노드에 이름만 지정하면 이 폴더에서 찾음)
+    MACRO_DIR: str = os.getenv("MACRO_DIR", "macros")
+    # MACRO_MOVE_COALESCE_SECONDS: 녹화 시 이 간격 안의 마우스 이동은 하나로 합침 (초, 0이면 모두 기록)
+    MACRO_MOVE_COALESCE_SECONDS: float = float(os.getenv("MACRO_MOVE_COALESCE_SECONDS", "0.01"))
 
 
 settings = Settings()
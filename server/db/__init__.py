@@ -1,7 +1,9 @@
 # db 패키지 초기화 파일
 from .connection import DatabaseConnection
 from .database import DatabaseManager, db_manager
+from .execution_checkpoint_repository import ExecutionCheckpointRepository
 from .node_repository import NodeRepository
+from .schedule_repository import ScheduleRepository
 from .script_repository import ScriptRepository
 from .table_manager import TableManager
 from .user_settings_repository import UserSettingsRepository
@@ -9,7 +11,9 @@ from .user_settings_repository import UserSettingsRepository
 __all__ = [
     "DatabaseConnection",
     "DatabaseManager",
+    "ExecutionCheckpointRepository",
     "NodeRepository",
+    "ScheduleRepository",
     "ScriptRepository",
     "TableManager",
     "UserSettingsRepository",
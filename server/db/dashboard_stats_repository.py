@@ -12,6 +12,9 @@ except ImportError:
     sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
     from db.connection import DatabaseConnection
 
+# 대시보드 통계 조회 API가 반환하는 키
+DASHBOARD_STAT_KEYS = ("total_scripts", "all_executions", "all_failed_scripts", "inactive_scripts")
+
 
 class DashboardStatsRepository:
     """대시보드 통계 관련 데이터베이스 작업을 처리하는 클래스"""
@@ -124,3 +127,36 @@ class DashboardStatsRepository:
                 (stat_key, stat_value),
             )
         return True
+
+    def increment_stats(self, deltas: dict[str, int]) -> dict[str, int]:
+        """
+        여러 통계 값을 한 번에 증감 (읽고 다시 쓰지 않으므로 동시에 호출해도 누락 없음)
+
+        Args:
+            deltas: 통계 키-변화량 딕셔너리 (없는 키는 0에서 시작)
+
+        Returns:
+            증감 후 통계 키-값 딕셔너리
+        """
+        result: dict[str, int] = self.connection.execute_with_connection(
+            lambda _conn, cursor: self._increment_stats_impl(cursor, deltas)
+        )
+        return result
+
+    def _increment_stats_impl(self, cursor: sqlite3.Cursor, deltas: dict[str, int]) -> dict[str, int]:
+        """여러 통계 값 증감 구현"""
+        values: dict[str, int] = {}
+        for stat_key, delta in deltas.items():
+            cursor.execute(
+                """
+                INSERT INTO dashboard_stats (stat_key, stat_value, updated_at)
+                VALUES (?, ?, CURRENT_TIMESTAMP)
+                ON CONFLICT(stat_key) DO UPDATE SET
+                    stat_value = stat_value + excluded.stat_value,
+                    updated_at = CURRENT_TIMESTAMP
+                RETURNING stat_value
+                """,
+                (stat_key, delta),
+            )
+            values[stat_key] = int(cursor.fetchone()[0])
+        return values
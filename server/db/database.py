@@ -1,5 +1,6 @@
 """통합 데이터베이스 관리자 모듈"""
 
+from collections.abc import Callable
 import logging
 import os
 import sys
@@ -11,10 +12,13 @@ logger = logging.getLogger(__name__)
 # 직접 실행 시와 모듈로 import 시 모두 지원
 try:
     from .connection import DatabaseConnection
-    from .dashboard_stats_repository import DashboardStatsRepository
+    from .dashboard_stats_repository import DASHBOARD_STAT_KEYS, DashboardStatsRepository
+    from .execution_checkpoint_repository import ExecutionCheckpointRepository
+    from .log_rollup_repository import LogRollupRepository
     from .log_stats_repository import LogStatsRepository
     from .node_execution_log_repository import NodeExecutionLogRepository
     from .node_repository import NodeRepository
+    from .schedule_repository import ScheduleRepository
     from .script_repository import ScriptRepository
     from .table_manager import TableManager
     from .user_settings_repository import UserSettingsRepository
@@ -22,10 +26,13 @@ except ImportError:
     # 직접 실행 시 절대 import 사용
     sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
     from db.connection import DatabaseConnection
-    from db.dashboard_stats_repository import DashboardStatsRepository
+    from db.dashboard_stats_repository import DASHBOARD_STAT_KEYS, DashboardStatsRepository
+    from db.execution_checkpoint_repository import ExecutionCheckpointRepository
+    from db.log_rollup_repository import LogRollupRepository
     from db.log_stats_repository import LogStatsRepository
     from db.node_execution_log_repository import NodeExecutionLogRepository
     from db.node_repository import NodeRepository
+    from db.schedule_repository import ScheduleRepository
     from db.script_repository import ScriptRepository
     from db.table_manager import TableManager
     from db.user_settings_repository import UserSettingsRepository
@@ -57,6 +64,12 @@ class DatabaseManager:
         self.dashboard_stats = DashboardStatsRepository(self.connection)  # 대시보드 통계
         self.node_execution_logs = NodeExecutionLogRepository(self.connection)  # 노드 실행 로그
         self.log_stats = LogStatsRepository(self.connection)  # 로그 통계
+        self.log_rollups = LogRollupRepository(self.connection)  # 로그 일별 집계/보존 정리
+        self.schedules = ScheduleRepository(self.connection)  # 예약 실행
+        self.execution_checkpoints = ExecutionCheckpointRepository(self.connection)  # 실행 체크포인트
+
+        # 스크립트 변경 리스너 (노드 저장/스크립트 삭제 시 호출, 실행 계획 캐시 무효화 등에 사용)
+        self._script_change_listeners: list[Callable[[int], None]] = []
 
         # 데이터베이스 초기화는 main.py의 startup_event에서 수행
         # (모듈 로드 시점에는 DB 파일이 없을 수 있으므로)
@@ -137,12 +150,35 @@ class DatabaseManager:
         if success:
             # 2. 스크립트 업데이트 시간 갱신
             self.scripts.update_script_timestamp(script_id)
+            # 3. 변경 알림 (캐시된 실행 계획 무효화)
+            self._notify_script_changed(script_id)
 
         return success
 
     def delete_script(self, script_id: int) -> bool:
         """스크립트 삭제"""
-        return self.scripts.delete_script(script_id)
+        success = self.scripts.delete_script(script_id)
+        if success:
+            self._notify_script_changed(script_id)
+        return success
+
+    def add_script_change_listener(self, listener: Callable[[int], None]) -> None:
+        """
+        스크립트 변경 리스너 등록
+
+        Args:
+            listener: 변경된 스크립트 ID를 받는 함수 (노드 저장 또는 스크립트 삭제 시 호출)
+        """
+        if listener not in self._script_change_listeners:
+            self._script_change_listeners.append(listener)
+
+    def _notify_script_changed(self, script_id: int) -> None:
+        """등록된 리스너에 스크립트 변경 알림 (리스너 오류는 무시)"""
+        for listener in self._script_change_listeners:
+            try:
+                listener(script_id)
+            except Exception as e:
+                logger.warning(f"스크립트 변경 리스너 실행 실패 (무시): {e!s}")
 
     def update_script_active(self, script_id: int, active: bool) -> bool:
         """스크립트 활성/비활성 상태 업데이트"""
@@ -158,13 +194,16 @@ class DatabaseManager:
         대시보드 통계 조회
 
         Args:
-            use_cache: 캐시 사용 여부 (기본값: True, 현재는 사용하지 않음)
+            use_cache: 저장된 통계 사용 여부 (기본값: True, 트리거가 유지하는 값을 읽기만 함)
+                False면 스크립트 개수를 다시 세어 보정한 뒤 반환
 
         Returns:
             통계 딕셔너리
         """
-        # 항상 최신 데이터로 계산
-        return self.calculate_and_update_dashboard_stats()
+        if not use_cache:
+            return self.calculate_and_update_dashboard_stats()
+        cached_stats = self.dashboard_stats.get_all_stats()
+        return {key: cached_stats.get(key, 0) for key in DASHBOARD_STAT_KEYS}
 
     def _is_cache_valid(self, cached_stats: dict[str, int]) -> bool:
         """
@@ -216,6 +255,18 @@ class DatabaseManager:
         """대시보드 통계 업데이트"""
         return self.dashboard_stats.update_all_stats(stats)
 
+    def increment_all_execution_stats(self, success: bool) -> dict[str, int]:
+        """
+        전체 실행 통계 증가 (스크립트 하나 실행 후)
+
+        Args:
+            success: 실행 성공 여부 (실패면 실패한 스크립트 개수도 증가)
+
+        Returns:
+            증가 후 전체 실행 통계 (all_executions, all_failed_scripts)
+        """
+        return self.dashboard_stats.increment_stats({"all_executions": 1, "all_failed_scripts": 0 if success else 1})
+
     def set_all_execution_stats(self, total_executions: int, failed_count: int) -> bool:
         """
         전체 실행 통계 설정 (전체 실행 기준)
@@ -240,17 +291,9 @@ class DatabaseManager:
         Returns:
             성공 여부
         """
-        if stat_key == "total_scripts":
-            # 전체 스크립트 개수
-            all_scripts = self.get_all_scripts()
-            total_scripts = len(all_scripts)
-            return self.dashboard_stats.set_stat("total_scripts", total_scripts)
-
-        if stat_key == "inactive_scripts":
-            # 비활성 스크립트 개수
-            all_scripts = self.get_all_scripts()
-            inactive_scripts = sum(1 for script in all_scripts if not script.get("active", True))
-            return self.dashboard_stats.set_stat("inactive_scripts", inactive_scripts)
+        if stat_key in ("total_scripts", "inactive_scripts"):
+            # 전체/비활성 스크립트 개수 (평소에는 scripts 트리거가 유지)
+            return self.dashboard_stats.set_stat(stat_key, self._count_scripts()[stat_key])
 
         if stat_key == "today_executions":
             # 오늘 실행 횟수
@@ -342,44 +385,44 @@ class DatabaseManager:
         finally:
             conn.close()
 
+    def _count_scripts(self) -> dict[str, int]:
+        """전체/비활성 스크립트 개수 조회 (보정용)"""
+        conn = self.connection.get_connection()
+        cursor = self.connection.get_cursor(conn)
+
+        try:
+            cursor.execute(
+                "SELECT COUNT(*), COALESCE(SUM(CASE WHEN COALESCE(active, 1) = 0 THEN 1 ELSE 0 END), 0) FROM scripts"
+            )
+            total_scripts, inactive_scripts = cursor.fetchone()
+            return {"total_scripts": total_scripts, "inactive_scripts": inactive_scripts}
+        finally:
+            conn.close()
+
     def calculate_and_update_dashboard_stats(self) -> dict[str, int | float | None]:
         """
-        대시보드 통계 계산 및 업데이트
+        대시보드 통계 계산 및 업데이트 (보정용, 평소에는 트리거와 실행 API가 값을 유지)
         - 전체 스크립트 개수
         - 전체 실행 횟수 (전체 실행 시 실행된 스크립트 개수)
         - 전체 실패한 스크립트 개수 (전체 실행 시 실패한 스크립트 개수)
         - 비활성 스크립트 개수
         """
-        # 전체 스크립트 개수
-        all_scripts = self.get_all_scripts()
-        total_scripts = len(all_scripts)
-
-        # 비활성 스크립트 개수
-        inactive_scripts = sum(1 for script in all_scripts if not script.get("active", True))
+        # 전체/비활성 스크립트 개수는 다시 세어 저장
+        script_counts = self._count_scripts()
+        self.update_dashboard_stats(script_counts)
 
-        # 전체 실행 통계 조회 (dashboard_stats 테이블에서)
+        # 전체 실행 통계는 실행 API가 저장한 값을 그대로 사용 (dashboard_stats 테이블에서)
         # 초기값이 없으면 0으로 설정 (마이그레이션 대비)
         all_executions = self.dashboard_stats.get_stat("all_executions", 0)
         all_failed_scripts = self.dashboard_stats.get_stat("all_failed_scripts", 0)
 
-        stats = {
-            "total_scripts": total_scripts,
+        return {
+            "total_scripts": script_counts["total_scripts"],
             "all_executions": all_executions,  # 전체 실행 시 실행된 스크립트 개수
             "all_failed_scripts": all_failed_scripts,  # 전체 실행 시 실패한 스크립트 개수
-            "inactive_scripts": inactive_scripts,
+            "inactive_scripts": script_counts["inactive_scripts"],
         }
 
-        # 통계 업데이트 (초기값이 없으면 자동으로 생성됨)
-        stats_to_cache = {
-            "total_scripts": total_scripts,
-            "all_executions": all_executions,
-            "all_failed_scripts": all_failed_scripts,
-            "inactive_scripts": inactive_scripts,
-        }
-        self.update_dashboard_stats(stats_to_cache)
-
-        return stats
-
     def _initialize_log_stats(self) -> None:
         """
         서버 최초 실행 시 기존 로그가 있으면 통계를 계산하여 저장합니다.
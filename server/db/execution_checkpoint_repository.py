@@ -0,0 +1,284 @@
+"""실행 체크포인트 리포지토리 모듈"""
+
+import json
+import os
+import sys
+from typing import Any
+
+# 직접 실행 시와 모듈로 import 시 모두 지원
+try:
+    from .connection import DatabaseConnection
+except ImportError:
+    # 직접 실행 시 절대 import 사용
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    from db.connection import DatabaseConnection
+
+# 조회 컬럼 (SELECT 순서와 dict 키 순서를 일치시킴)
+_CHECKPOINT_COLUMNS = [
+    "execution_id",
+    "script_id",
+    "status",
+    "cursor_state",
+    "node_name_map",
+    "sequence",
+    "completed_nodes",
+    "error_message",
+    "created_at",
+    "updated_at",
+]
+
+# 재개할 수 있는 체크포인트 상태
+RESUMABLE_STATUSES = ("interrupted", "failed", "cancelled")
+
+
+class ExecutionCheckpointRepository:
+    """실행 체크포인트(execution_checkpoints 테이블) 관련 데이터베이스 작업을 처리하는 클래스"""
+
+    def __init__(self, connection: DatabaseConnection) -> None:
+        """
+        ExecutionCheckpointRepository 초기화
+
+        Args:
+            connection: DatabaseConnection 인스턴스
+        """
+        self.connection = connection
+
+    def _row_to_dict(self, row: tuple) -> dict[str, Any]:
+        """조회 결과 행을 딕셔너리로 변환 (JSON 컬럼은 파싱)"""
+        checkpoint = dict(zip(_CHECKPOINT_COLUMNS, row, strict=True))
+        checkpoint["cursor_state"] = json.loads(checkpoint["cursor_state"] or "{}")
+        checkpoint["node_name_map"] = json.loads(checkpoint["node_name_map"] or "{}")
+        return checkpoint
+
+    def save_checkpoint(
+        self,
+        execution_id: str,
+        script_id: int,
+        cursor_state: dict[str, Any],
+        node_name_map: dict[str, str],
+        sequence: int,
+        completed_nodes: int,
+        upserts: list[tuple[str, str | None, int, str]],
+        deletes: list[str],
+        status: str = "running",
+    ) -> None:
+        """
+        체크포인트를 저장합니다. (실행 위치 1행 갱신 + 변경된 노드 결과만 반영, 하나의 트랜잭션)
+
+        Args:
+            execution_id: 워크플로우 실행 ID
+            script_id: 스크립트 ID
+            cursor_state: 다음에 실행할 위치
+            node_name_map: 노드 이름 → 노드 ID
+            sequence: 체크포인트 순번
+            completed_nodes: 지금까지 실행한 노드 수
+            upserts: 새로 추가/변경된 노드 결과 [(노드 ID, 노드 이름, 순서, 결과 JSON), ...]
+            deletes: 실행 컨텍스트에서 제거된 노드 ID 목록
+            status: 체크포인트 상태
+        """
+        conn = self.connection.get_connection()
+        cursor = self.connection.get_cursor(conn)
+
+        try:
+            cursor.execute(
+                """
+                INSERT INTO execution_checkpoints (
+                    execution_id, script_id, status, cursor_state, node_name_map, sequence, completed_nodes
+                )
+                VALUES (?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT(execution_id) DO UPDATE SET
+                    status = excluded.status,
+                    cursor_state = excluded.cursor_state,
+                    node_name_map = excluded.node_name_map,
+                    sequence = excluded.sequence,
+                    completed_nodes = excluded.completed_nodes,
+                    error_message = NULL,
+                    updated_at = CURRENT_TIMESTAMP
+            """,
+                (
+                    execution_id,
+                    script_id,
+                    status,
+                    json.dumps(cursor_state, ensure_ascii=False),
+                    json.dumps(node_name_map, ensure_ascii=False),
+                    sequence,
+                    completed_nodes,
+                ),
+            )
+            if deletes:
+                cursor.executemany(
+                    "DELETE FROM execution_checkpoint_results WHERE execution_id = ? AND node_id = ?",
+                    [(execution_id, node_id) for node_id in deletes],
+                )
+            if upserts:
+                cursor.executemany(
+                    """
+                    INSERT INTO execution_checkpoint_results (execution_id, node_id, node_name, position, result)
+                    VALUES (?, ?, ?, ?, ?)
+                    ON CONFLICT(execution_id, node_id) DO UPDATE SET
+                        node_name = excluded.node_name,
+                        position = excluded.position,
+                        result = excluded.result
+                """,
+                    [(execution_id, *upsert) for upsert in upserts],
+                )
+            conn.commit()
+        finally:
+            conn.close()
+
+    def update_status(self, execution_id: str, status: str, error_message: str | None = None) -> bool:
+        """
+        체크포인트 상태를 변경합니다.
+
+        Args:
+            execution_id: 워크플로우 실행 ID
+            status: 새 상태
+            error_message: 에러 메시지 (실패/취소 시)
+
+        Returns:
+            변경 여부 (체크포인트가 없으면 False)
+        """
+        conn = self.connection.get_connection()
+        cursor = self.connection.get_cursor(conn)
+
+        try:
+            cursor.execute(
+                """
+                UPDATE execution_checkpoints
+                SET status = ?, error_message = ?, updated_at = CURRENT_TIMESTAMP
+                WHERE execution_id = ?
+            """,
+                (status, error_message, execution_id),
+            )
+            conn.commit()
+            return cursor.rowcount > 0
+        finally:
+            conn.close()
+
+    def mark_interrupted(self) -> int:
+        """
+        실행 중 상태로 남은 체크포인트를 중단 상태로 변경합니다. (서버 시작 시 호출)
+
+        Returns:
+            변경된 체크포인트 수
+        """
+        conn = self.connection.get_connection()
+        cursor = self.connection.get_cursor(conn)
+
+        try:
+            cursor.execute(
+                """
+                UPDATE execution_checkpoints
+                SET status = 'interrupted', updated_at = CURRENT_TIMESTAMP
+                WHERE status IN ('running', 'resuming')
+            """
+            )
+            conn.commit()
+            return cursor.rowcount
+        finally:
+            conn.close()
+
+    def get_checkpoint(self, execution_id: str, include_results: bool = False) -> dict[str, Any] | None:
+        """
+        체크포인트를 조회합니다.
+
+        Args:
+            execution_id: 워크플로우 실행 ID
+            include_results: 보존된 노드 결과 포함 여부
+
+        Returns:
+            체크포인트 정보 또는 None
+            - results: [{"node_id", "node_name", "position", "result"}, ...] (실행 순서, include_results일 때만)
+        """
+        conn = self.connection.get_connection()
+        cursor = self.connection.get_cursor(conn)
+
+        try:
+            cursor.execute(
+                f"SELECT {', '.join(_CHECKPOINT_COLUMNS)} FROM execution_checkpoints WHERE execution_id = ?",
+                (execution_id,),
+            )
+            row = cursor.fetchone()
+            if not row:
+                return None
+            checkpoint = self._row_to_dict(row)
+
+            if include_results:
+                cursor.execute(
+                    """
+                    SELECT node_id, node_name, position, result
+                    FROM execution_checkpoint_results
+                    WHERE execution_id = ?
+                    ORDER BY position ASC
+                """,
+                    (execution_id,),
+                )
+                checkpoint["results"] = [
+                    {"node_id": node_id, "node_name": node_name, "position": position, "result": json.loads(result)}
+                    for node_id, node_name, position, result in cursor.fetchall()
+                ]
+            return checkpoint
+        finally:
+            conn.close()
+
+    def list_checkpoints(
+        self, status: str | None = None, script_id: int | None = None, limit: int = 100
+    ) -> list[dict[str, Any]]:
+        """
+        체크포인트 목록을 조회합니다. (노드 결과 제외)
+
+        Args:
+            status: 상태 필터
+            script_id: 스크립트 ID 필터
+            limit: 최대 개수
+
+        Returns:
+            체크포인트 목록 (최근 갱신 순)
+        """
+        conn = self.connection.get_connection()
+        cursor = self.connection.get_cursor(conn)
+
+        try:
+            conditions: list[str] = []
+            params: list[Any] = []
+            if status is not None:
+                conditions.append("status = ?")
+                params.append(status)
+            if script_id is not None:
+                conditions.append("script_id = ?")
+                params.append(script_id)
+            where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+            cursor.execute(
+                f"""
+                SELECT {", ".join(_CHECKPOINT_COLUMNS)}
+                FROM execution_checkpoints
+                {where}
+                ORDER BY updated_at DESC
+                LIMIT ?
+            """,
+                (*params, limit),
+            )
+            return [self._row_to_dict(row) for row in cursor.fetchall()]
+        finally:
+            conn.close()
+
+    def delete_checkpoint(self, execution_id: str) -> bool:
+        """
+        체크포인트와 보존된 노드 결과를 삭제합니다.
+
+        Args:
+            execution_id: 워크플로우 실행 ID
+
+        Returns:
+            삭제 여부
+        """
+        conn = self.connection.get_connection()
+        cursor = self.connection.get_cursor(conn)
+
+        try:
+            cursor.execute("DELETE FROM execution_checkpoint_results WHERE execution_id = ?", (execution_id,))
+            cursor.execute("DELETE FROM execution_checkpoints WHERE execution_id = ?", (execution_id,))
+            conn.commit()
+            return cursor.rowcount > 0
+        finally:
+            conn.close()
@@ -0,0 +1,253 @@
+"""노드 실행 로그 페이로드(파라미터/결과) 저장 형식 모듈
+
+- 필드별 잘라내기: 긴 문자열과 긴 목록은 한도까지만 남기고 생략 표시를 붙임 (필드 이름별 한도 지정 가능)
+- 압축: 직렬화한 JSON이 임계값보다 크면 zlib으로 압축해 BLOB으로 저장 (작으면 JSON 텍스트 그대로)
+- 내용 주소: 직렬화한 JSON의 SHA-256으로 같은 파라미터를 한 번만 저장 (log_payloads 테이블)
+- 검색 텍스트: 결과 중 검색할 필드만 꺼내 전문 검색 색인에 넣음 (압축한 결과는 SQL에서 읽을 수 없으므로 기록할 때 추출)
+"""
+
+import hashlib
+import json
+from typing import Any
+import zlib
+
+# 압축 BLOB의 zlib 압축 수준 (로그 기록 경로이므로 속도 우선)
+_COMPRESS_LEVEL = 6
+
+# 페이로드 JSON 인코더 (공백 없는 형식, 호출마다 인코더를 새로 만들지 않도록 재사용)
+_ENCODER = json.JSONEncoder(ensure_ascii=False, separators=(",", ":"))
+
+# 전문 검색 색인에 넣는 결과 필드 기본값 (점으로 구분한 경로)
+DEFAULT_SEARCH_RESULT_FIELDS = ("error.reason", "error.message", "output.reason", "output.message")
+
+
+class LogPayloadPolicy:
+    """로그 페이로드 저장 정책 (잘라내기 한도, 압축/중복 제거 기준 크기)"""
+
+    __slots__ = (
+        "compress_threshold",
+        "dedup_min_bytes",
+        "field_limits",
+        "max_list_items",
+        "max_string_chars",
+        "search_result_fields",
+    )
+
+    def __init__(
+        self,
+        compress_threshold: int = 1024,
+        max_string_chars: int = 4000,
+        max_list_items: int = 100,
+        field_limits: dict[str, int] | None = None,
+        dedup_min_bytes: int = 256,
+        search_result_fields: tuple[str, ...] = DEFAULT_SEARCH_RESULT_FIELDS,
+    ) -> None:
+        """
+        LogPayloadPolicy 초기화
+
+        Args:
+            compress_threshold: 이 크기(바이트)를 넘는 페이로드는 zlib 압축 BLOB으로 저장 (0이면 압축 안 함)
+            max_string_chars: 문자열 값의 기본 최대 길이 (0이면 제한 없음)
+            max_list_items: 목록 값의 최대 항목 수 (0이면 제한 없음)
+            field_limits: 필드 이름별 문자열 최대 길이 (하위 값에도 적용, 예: {"headers": 256})
+            dedup_min_bytes: 이 크기(바이트) 이상인 파라미터는 log_payloads에 한 번만 저장하고 해시로 참조
+            search_result_fields: 전문 검색 색인에 넣는 결과 필드 경로 (예: ("error.message",))
+        """
+        self.compress_threshold = max(0, compress_threshold)
+        self.max_string_chars = max(0, max_string_chars)
+        self.max_list_items = max(0, max_list_items)
+        self.field_limits = dict(field_limits or {})
+        self.dedup_min_bytes = max(1, dedup_min_bytes)
+        self.search_result_fields = tuple(search_result_fields)
+
+    def to_dict(self) -> dict[str, Any]:
+        """정책을 딕셔너리로 반환"""
+        return {
+            "compress_threshold": self.compress_threshold,
+            "max_string_chars": self.max_string_chars,
+            "max_list_items": self.max_list_items,
+            "field_limits": dict(self.field_limits),
+            "dedup_min_bytes": self.dedup_min_bytes,
+            "search_result_fields": list(self.search_result_fields),
+        }
+
+
+def parse_field_limits(raw: str) -> dict[str, int]:
+    """
+    "data=8000,headers=256" 형식의 필드별 한도 문자열을 파싱합니다.
+
+    Args:
+        raw: 필드별 한도 문자열
+
+    Returns:
+        필드 이름별 한도 딕셔너리 (잘못된 항목은 무시)
+    """
+    limits: dict[str, int] = {}
+    for item in raw.split(","):
+        name, _, value = item.partition("=")
+        name = name.strip()
+        if not name:
+            continue
+        try:
+            limits[name] = max(0, int(value.strip()))
+        except ValueError:
+            continue
+    return limits
+
+
+def parse_field_paths(raw: str) -> tuple[str, ...]:
+    """
+    "error.message,output.reason" 형식의 필드 경로 문자열을 파싱합니다.
+
+    Args:
+        raw: 쉼표로 구분한 필드 경로 문자열
+
+    Returns:
+        필드 경로 목록 (빈 항목은 무시)
+    """
+    return tuple(path.strip() for path in raw.split(",") if path.strip())
+
+
+def truncate_text(value: str, limit: int) -> str:
+    """
+    문자열을 최대 길이까지만 남깁니다.
+
+    Args:
+        value: 문자열
+        limit: 최대 길이 (0이면 제한 없음)
+
+    Returns:
+        잘라낸 문자열 (잘랐으면 생략한 글자 수 표시를 붙임)
+    """
+    if not limit or len(value) <= limit:
+        return value
+    return f"{value[:limit]}...(+{len(value) - limit}자 생략)"
+
+
+def truncate_payload(value: Any, policy: LogPayloadPolicy, limit: int | None = None) -> Any:
+    """
+    페이로드의 문자열/목록 값을 정책 한도까지 잘라냅니다. (원본은 바꾸지 않음)
+
+    Args:
+        value: 페이로드 값
+        policy: 저장 정책
+        limit: 이 값의 문자열 최대 길이 (None이면 기본 한도, 하위 값은 필드 이름별 한도가 없으면 물려받음)
+
+    Returns:
+        잘라낸 값
+    """
+    if limit is None:
+        limit = policy.max_string_chars
+    if isinstance(value, str):
+        return truncate_text(value, limit)
+    if isinstance(value, dict):
+        return {
+            key: truncate_payload(item, policy, policy.field_limits.get(str(key), limit)) for key, item in value.items()
+        }
+    if isinstance(value, list | tuple):
+        items = [truncate_payload(item, policy, limit) for item in value[: policy.max_list_items or None]]
+        if policy.max_list_items and len(value) > policy.max_list_items:
+            items.append(f"...(+{len(value) - policy.max_list_items}개 생략)")
+        return items
+    return value
+
+
+def serialize_payload(value: dict[str, Any] | None, policy: LogPayloadPolicy) -> str | None:
+    """
+    페이로드를 잘라낸 뒤 JSON 텍스트로 직렬화합니다.
+
+    Args:
+        value: 페이로드 (파라미터 또는 결과)
+        policy: 저장 정책
+
+    Returns:
+        JSON 텍스트 (비어 있으면 None)
+    """
+    if not value:
+        return None
+    return _ENCODER.encode(truncate_payload(value, policy))
+
+
+def encode_payload(text: str | None, policy: LogPayloadPolicy) -> str | bytes | None:
+    """
+    직렬화한 페이로드를 저장 형식으로 바꿉니다.
+
+    Args:
+        text: JSON 텍스트
+        policy: 저장 정책
+
+    Returns:
+        임계값 이하면 JSON 텍스트, 넘으면 zlib 압축 bytes (BLOB), 비어 있으면 None
+    """
+    if text is None:
+        return None
+    data = text.encode("utf-8")
+    if policy.compress_threshold and len(data) > policy.compress_threshold:
+        return zlib.compress(data, _COMPRESS_LEVEL)
+    return text
+
+
+def decode_payload(stored: str | bytes | None) -> dict[str, Any]:
+    """
+    저장된 페이로드(JSON 텍스트 또는 zlib 압축 BLOB)를 딕셔너리로 복원합니다.
+
+    Args:
+        stored: 저장된 값
+
+    Returns:
+        페이로드 딕셔너리 (비어 있으면 빈 딕셔너리)
+    """
+    if not stored:
+        return {}
+    if isinstance(stored, bytes):
+        stored = zlib.decompress(stored).decode("utf-8")
+    value = json.loads(stored)
+    return value if isinstance(value, dict) else {"value": value}
+
+
+def payload_hash(text: str) -> str:
+    """직렬화한 페이로드의 내용 주소 (SHA-256 16진수)"""
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+def result_markers(result: dict[str, Any] | None) -> tuple[int, str | None]:
+    """
+    통계에 쓰는 결과 값을 꺼냅니다. (결과를 압축해 저장해도 트리거가 읽을 수 있도록 별도 컬럼에 저장)
+
+    Args:
+        result: 실행 결과
+
+    Returns:
+        (캐시 히트 여부 0/1, 실패 사유 - result.error.reason)
+    """
+    if not isinstance(result, dict):
+        return 0, None
+    meta = result.get("meta")
+    error = result.get("error")
+    cache_hit = 1 if isinstance(meta, dict) and meta.get("cache_hit") == 1 else 0
+    reason = error.get("reason") if isinstance(error, dict) else None
+    return cache_hit, reason if isinstance(reason, str) else None
+
+
+def result_search_text(result: dict[str, Any] | None, fields: tuple[str, ...]) -> str | None:
+    """
+    전문 검색 색인에 넣을 결과 텍스트를 만듭니다. (지정한 필드 값만 줄바꿈으로 연결)
+
+    Args:
+        result: 실행 결과
+        fields: 점으로 구분한 결과 필드 경로 (예: "error.message")
+
+    Returns:
+        검색 텍스트 (해당 필드가 모두 없으면 None)
+    """
+    if not isinstance(result, dict):
+        return None
+    texts = []
+    for path in fields:
+        value: Any = result
+        for key in path.split("."):
+            value = value.get(key) if isinstance(value, dict) else None
+        if value is None or value == "":
+            continue
+        texts.append(value if isinstance(value, str) else _ENCODER.encode(value))
+    return "\n".join(texts) or None
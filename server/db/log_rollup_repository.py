@@ -0,0 +1,395 @@
+"""노드 실행 로그 보존(일별 집계/정리) 리포지토리 모듈"""
+
+from bisect import bisect_left
+from collections.abc import Callable
+import json
+import math
+import os
+import sqlite3
+import sys
+from typing import Any
+
+# 직접 실행 시와 모듈로 import 시 모두 지원
+try:
+    from .connection import DatabaseConnection
+    from .log_payload_codec import decode_payload
+except ImportError:
+    # 직접 실행 시 절대 import 사용
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    from db.connection import DatabaseConnection
+    from db.log_payload_codec import decode_payload
+
+# 정리할 로그 조회 컬럼 (SELECT 순서와 dict 키 순서를 일치시킴, 보관 파일에도 이 키로 기록)
+_LOG_COLUMNS = [
+    "id",
+    "execution_id",
+    "script_id",
+    "node_id",
+    "attempt",
+    "node_type",
+    "node_name",
+    "status",
+    "started_at",
+    "finished_at",
+    "execution_time_ms",
+    "parameters",
+    "result",
+    "cache_hit",
+    "error_reason",
+    "error_message",
+    "error_traceback",
+    "created_at",
+]
+
+# 정리할 로그 조회 식 (해시로 저장한 파라미터는 log_payloads에서 가져옴)
+_LOG_SELECT = ", ".join(
+    "COALESCE(p.data, l.parameters)" if column == "parameters" else f"l.{column}" for column in _LOG_COLUMNS
+)
+
+# 집계 조회 컬럼
+_ROLLUP_COLUMNS = [
+    "day",
+    "script_id",
+    "node_type",
+    "total_count",
+    "completed_count",
+    "failed_count",
+    "timeout_count",
+    "cache_hit_count",
+    "timed_count",
+    "total_execution_time_ms",
+    "max_execution_time_ms",
+    "p50_execution_time_ms",
+    "p95_execution_time_ms",
+    "duration_histogram",
+    "updated_at",
+]
+
+# 집계에 더하는 개수 필드
+_COUNT_FIELDS = (
+    "total_count",
+    "completed_count",
+    "failed_count",
+    "timeout_count",
+    "cache_hit_count",
+    "timed_count",
+    "total_execution_time_ms",
+)
+
+
+def _duration_bucket_bounds() -> tuple[int, ...]:
+    """실행 시간 히스토그램 구간 상한 (1ms부터 1.25배씩, 1일까지 약 80구간, 백분위 오차 25% 이내)"""
+    bounds: list[int] = []
+    bound = 1.0
+    while bound < 86_400_000:
+        upper = math.ceil(bound)
+        if not bounds or upper > bounds[-1]:
+            bounds.append(upper)
+        bound *= 1.25
+    return tuple(bounds)
+
+
+# 실행 시간 히스토그램 구간 상한 (마지막 구간 다음 인덱스는 1일 초과)
+DURATION_BUCKET_BOUNDS = _duration_bucket_bounds()
+
+
+def duration_percentile(histogram: dict[str, int], quantile: float, maximum: int) -> int | None:
+    """
+    히스토그램에서 실행 시간 백분위를 구합니다. (해당 구간의 상한, 최대 실행 시간을 넘지 않음)
+
+    Args:
+        histogram: 구간 인덱스(문자열) → 개수
+        quantile: 백분위 (0~1, 예: 0.95)
+        maximum: 최대 실행 시간 (밀리초)
+
+    Returns:
+        백분위 실행 시간 (밀리초, 기록이 없으면 None)
+    """
+    total = sum(histogram.values())
+    if total == 0:
+        return None
+    rank = max(1, math.ceil(total * quantile))
+    seen = 0
+    for index in sorted(histogram, key=int):
+        seen += histogram[index]
+        if seen >= rank:
+            position = int(index)
+            upper = DURATION_BUCKET_BOUNDS[position] if position < len(DURATION_BUCKET_BOUNDS) else maximum
+            return min(upper, maximum)
+    return maximum
+
+
+class LogRollupRepository:
+    """오래된 노드 실행 로그의 일별 집계(node_execution_log_rollups 테이블)와 정리를 처리하는 클래스"""
+
+    def __init__(self, connection: DatabaseConnection) -> None:
+        """
+        LogRollupRepository 초기화
+
+        Args:
+            connection: DatabaseConnection 인스턴스
+        """
+        self.connection = connection
+
+    def row_limit_threshold(self, max_rows: int) -> int | None:
+        """
+        최대 로그 수를 넘는 로그의 기준 ID를 조회합니다.
+
+        Args:
+            max_rows: 보존할 최대 로그 수
+
+        Returns:
+            이 ID 이하의 로그가 개수 제한을 넘는 로그 (넘지 않으면 None)
+        """
+        conn = self.connection.get_connection()
+        cursor = self.connection.get_cursor(conn)
+
+        try:
+            cursor.execute("SELECT id FROM node_execution_logs ORDER BY id DESC LIMIT 1 OFFSET ?", (max_rows,))
+            row = cursor.fetchone()
+            return int(row[0]) if row else None
+        finally:
+            conn.close()
+
+    def retire_logs(
+        self,
+        limit: int,
+        max_id: int | None = None,
+        started_before: str | None = None,
+        created_before: str | None = None,
+        archive: Callable[[list[dict[str, Any]]], None] | None = None,
+    ) -> int:
+        """
+        정리 대상 로그를 오래된 것부터 최대 limit개 집계에 더하고 삭제합니다. (하나의 트랜잭션)
+        쓰기 잠금을 청크 하나 동안만 잡으므로, 호출 사이에 다른 쓰기가 진행됩니다.
+
+        Args:
+            limit: 이번에 정리할 최대 로그 수
+            max_id: 이 ID 이하의 로그를 정리 (개수 제한, started_before와 함께 쓰지 않음)
+            started_before: 시작 시간이 이 값보다 이른 로그를 정리 (ISO 형식 로컬 시간, 기간 제한)
+            created_before: 시작 시간이 없는 로그는 생성 시간이 이 값보다 이르면 정리 (UTC, 기간 제한)
+            archive: 삭제 전에 원본 로그 목록을 받는 함수 (보관 파일 기록용, 실패하면 정리하지 않음)
+
+        Returns:
+            정리한 로그 수 (limit보다 작으면 남은 정리 대상 없음)
+        """
+        if max_id is not None:
+            condition, params = "l.id <= ?", (max_id,)
+        else:
+            condition = "(l.started_at < ? OR (l.started_at IS NULL AND l.created_at < ?))"
+            params = (started_before, created_before)
+
+        conn = self.connection.get_connection()
+        cursor = self.connection.get_cursor(conn)
+
+        try:
+            cursor.execute("BEGIN IMMEDIATE")
+            cursor.execute(
+                f"SELECT {_LOG_SELECT} FROM node_execution_logs l LEFT JOIN log_payloads p ON p.hash = l.parameters_hash "
+                f"WHERE {condition} ORDER BY l.id LIMIT ?",
+                (*params, limit),
+            )
+            records = [self._log_row_to_dict(row) for row in cursor.fetchall()]
+            if not records:
+                conn.rollback()
+                return 0
+
+            if archive is not None:
+                archive(records)
+            self._merge_rollups(cursor, records)
+            cursor.execute(
+                "DELETE FROM node_execution_logs WHERE id IN (SELECT value FROM json_each(?))",
+                (json.dumps([record["id"] for record in records]),),
+            )
+            # 더 이상 참조하지 않는 공유 파라미터 정리
+            cursor.execute(
+                "DELETE FROM log_payloads WHERE NOT EXISTS "
+                "(SELECT 1 FROM node_execution_logs WHERE parameters_hash = log_payloads.hash)"
+            )
+            conn.commit()
+            return len(records)
+        except Exception as e:
+            conn.rollback()
+            raise e
+        finally:
+            conn.close()
+
+    def _log_row_to_dict(self, row: tuple) -> dict[str, Any]:
+        """조회 결과 행을 딕셔너리로 변환 (파라미터/결과는 압축을 풀고 파싱)"""
+        record = dict(zip(_LOG_COLUMNS, row, strict=True))
+        record["parameters"] = decode_payload(record["parameters"])
+        record["result"] = decode_payload(record["result"])
+        return record
+
+    def _merge_rollups(self, cursor: sqlite3.Cursor, records: list[dict[str, Any]]) -> None:
+        """로그 목록을 (날짜, 스크립트, 노드 타입)별로 묶어 기존 집계에 더합니다."""
+        groups: dict[tuple[str, int, str], dict[str, Any]] = {}
+        for record in records:
+            day = str(record["started_at"] or record["created_at"] or "")[:10]
+            key = (day, record["script_id"] or 0, record["node_type"])
+            group = groups.get(key)
+            if group is None:
+                group = groups[key] = dict.fromkeys(_COUNT_FIELDS, 0)
+                group["max_execution_time_ms"] = 0
+                group["duration_histogram"] = {}
+
+            cache_hit = record["cache_hit"] == 1
+            group["total_count"] += 1
+            if record["status"] == "completed":
+                group["completed_count"] += 1
+                group["cache_hit_count"] += int(cache_hit)
+            elif record["status"] == "failed":
+                group["failed_count"] += 1
+                group["timeout_count"] += int(record["error_reason"] == "timeout")
+
+            # 실행 시간 (캐시 히트는 실제 실행이 아니므로 제외, 로그 통계의 평균 실행 시간과 같은 기준)
+            duration = record["execution_time_ms"]
+            if duration and duration > 0 and not cache_hit:
+                group["timed_count"] += 1
+                group["total_execution_time_ms"] += duration
+                group["max_execution_time_ms"] = max(group["max_execution_time_ms"], duration)
+                bucket = str(bisect_left(DURATION_BUCKET_BOUNDS, duration))
+                group["duration_histogram"][bucket] = group["duration_histogram"].get(bucket, 0) + 1
+
+        for (day, script_id, node_type), group in groups.items():
+            cursor.execute(
+                """
+                SELECT total_count, completed_count, failed_count, timeout_count, cache_hit_count, timed_count,
+                       total_execution_time_ms, max_execution_time_ms, duration_histogram
+                FROM node_execution_log_rollups
+                WHERE day = ? AND script_id = ? AND node_type = ?
+                """,
+                (day, script_id, node_type),
+            )
+            existing = cursor.fetchone()
+            if existing:
+                for field, value in zip(_COUNT_FIELDS, existing[:7], strict=True):
+                    group[field] += value
+                group["max_execution_time_ms"] = max(group["max_execution_time_ms"], existing[7])
+                for bucket, count in json.loads(existing[8] or "{}").items():
+                    group["duration_histogram"][bucket] = group["duration_histogram"].get(bucket, 0) + count
+
+            histogram = group["duration_histogram"]
+            maximum = group["max_execution_time_ms"]
+            cursor.execute(
+                """
+                INSERT INTO node_execution_log_rollups (
+                    day, script_id, node_type, total_count, completed_count, failed_count, timeout_count,
+                    cache_hit_count, timed_count, total_execution_time_ms, max_execution_time_ms,
+                    p50_execution_time_ms, p95_execution_time_ms, duration_histogram, updated_at
+                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, CURRENT_TIMESTAMP)
+                ON CONFLICT(day, script_id, node_type) DO UPDATE SET
+                    total_count = excluded.total_count,
+                    completed_count = excluded.completed_count,
+                    failed_count = excluded.failed_count,
+                    timeout_count = excluded.timeout_count,
+                    cache_hit_count = excluded.cache_hit_count,
+                    timed_count = excluded.timed_count,
+                    total_execution_time_ms = excluded.total_execution_time_ms,
+                    max_execution_time_ms = excluded.max_execution_time_ms,
+                    p50_execution_time_ms = excluded.p50_execution_time_ms,
+                    p95_execution_time_ms = excluded.p95_execution_time_ms,
+                    duration_histogram = excluded.duration_histogram,
+                    updated_at = CURRENT_TIMESTAMP
+                """,
+                (
+                    day,
+                    script_id,
+                    node_type,
+                    *(group[field] for field in _COUNT_FIELDS),
+                    maximum,
+                    duration_percentile(histogram, 0.5, maximum),
+                    duration_percentile(histogram, 0.95, maximum),
+                    json.dumps(histogram, sort_keys=True),
+                ),
+            )
+
+    def incremental_vacuum(self, pages: int) -> int:
+        """
+        빈 페이지를 최대 pages개 파일 시스템에 반환합니다. (auto_vacuum=INCREMENTAL인 DB에서만 동작)
+
+        Args:
+            pages: 반환할 최대 페이지 수
+
+        Returns:
+            반환한 페이지 수 (INCREMENTAL 모드가 아니거나 빈 페이지가 없으면 0)
+        """
+        conn = self.connection.get_connection()
+        cursor = self.connection.get_cursor(conn)
+
+        try:
+            cursor.execute("PRAGMA auto_vacuum")
+            if cursor.fetchone()[0] != 2:
+                return 0
+            cursor.execute("PRAGMA freelist_count")
+            before = cursor.fetchone()[0]
+            if before == 0:
+                return 0
+            cursor.execute(f"PRAGMA incremental_vacuum({int(pages)})")
+            cursor.fetchall()
+            cursor.execute("PRAGMA freelist_count")
+            return int(before - cursor.fetchone()[0])
+        finally:
+            conn.close()
+
+    def get_rollups(
+        self,
+        script_id: int | None = None,
+        node_type: str | None = None,
+        since: str | None = None,
+        until: str | None = None,
+        limit: int = 1000,
+    ) -> list[dict[str, Any]]:
+        """
+        일별 집계 조회 (최근 날짜부터)
+
+        Args:
+            script_id: 스크립트 ID (0이면 스크립트 없이 실행된 로그)
+            node_type: 노드 타입
+            since: 시작 날짜 (YYYY-MM-DD, 포함)
+            until: 끝 날짜 (YYYY-MM-DD, 포함)
+            limit: 조회할 최대 개수
+
+        Returns:
+            집계 목록 (평균 실행 시간 포함, 히스토그램은 제외)
+        """
+        conditions: list[str] = []
+        params: list[Any] = []
+        if script_id is not None:
+            conditions.append("script_id = ?")
+            params.append(script_id)
+        if node_type:
+            conditions.append("node_type = ?")
+            params.append(node_type)
+        if since:
+            conditions.append("day >= ?")
+            params.append(since)
+        if until:
+            conditions.append("day <= ?")
+            params.append(until)
+        where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+
+        conn = self.connection.get_connection()
+        cursor = self.connection.get_cursor(conn)
+
+        try:
+            cursor.execute(
+                f"""
+                SELECT {", ".join(_ROLLUP_COLUMNS)} FROM node_execution_log_rollups
+                {where}
+                ORDER BY day DESC, script_id, node_type
+                LIMIT ?
+                """,
+                (*params, limit),
+            )
+            rollups = []
+            for row in cursor.fetchall():
+                rollup = dict(zip(_ROLLUP_COLUMNS, row, strict=True))
+                rollup.pop("duration_histogram")
+                rollup["average_execution_time_ms"] = (
+                    rollup["total_execution_time_ms"] // rollup["timed_count"] if rollup["timed_count"] else None
+                )
+                rollups.append(rollup)
+            return rollups
+        finally:
+            conn.close()
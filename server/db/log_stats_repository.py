@@ -12,6 +12,9 @@ except ImportError:
     sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
     from db.connection import DatabaseConnection
 
+# 조회 API로 공개하는 로그 통계 키 (execution_time_total/count는 평균 계산용 내부 값)
+LOG_STAT_KEYS = ("total", "completed", "failed", "timeout", "cache_hits", "average_execution_time")
+
 
 class LogStatsRepository:
     """로그 통계 관련 데이터베이스 작업을 처리하는 클래스"""
@@ -30,7 +33,7 @@ class LogStatsRepository:
         특정 통계 값 조회
 
         Args:
-            stat_key: 통계 키 (예: 'total', 'completed', 'failed', 'average_execution_time')
+            stat_key: 통계 키 (예: 'total', 'completed', 'failed', 'timeout', 'cache_hits', 'average_execution_time')
             default_value: 기본값 (통계가 없을 경우)
 
         Returns:
@@ -95,6 +98,31 @@ class LogStatsRepository:
         finally:
             conn.close()
 
+    def get_log_stats(self) -> dict[str, int]:
+        """
+        로그 통계 조회 (트리거가 유지하는 값을 읽기만 하므로 로그 수와 관계없이 일정한 비용)
+
+        Returns:
+            통계 딕셔너리 (LOG_STAT_KEYS, 값이 없으면 0)
+        """
+        keys = (*LOG_STAT_KEYS, "execution_time_total", "execution_time_count")
+        conn = self.connection.get_connection()
+        cursor = self.connection.get_cursor(conn)
+
+        try:
+            cursor.execute(
+                f"SELECT stat_key, stat_value FROM log_stats WHERE stat_key IN ({', '.join('?' * len(keys))})",
+                keys,
+            )
+            values = {row[0]: int(row[1]) for row in cursor.fetchall()}
+            stats = {key: values.get(key, 0) for key in LOG_STAT_KEYS}
+            # 평균 실행 시간은 트리거가 유지하는 합계/개수로 계산
+            count = values.get("execution_time_count", 0)
+            stats["average_execution_time"] = values.get("execution_time_total", 0) // count if count else 0
+            return stats
+        finally:
+            conn.close()
+
     def update_all_stats(self, stats: dict[str, int]) -> bool:
         """
         여러 통계 값을 한 번에 업데이트
@@ -127,51 +155,70 @@ class LogStatsRepository:
 
     def calculate_and_update_stats(self) -> dict[str, int]:
         """
-        로그 통계를 계산하고 업데이트합니다.
+        로그 통계를 전체 로그에서 다시 계산하여 저장합니다. (주기적 보정, 서버 시작 시 사용)
+        평소에는 node_execution_logs 트리거가 통계를 증감시키므로 이 메서드를 호출할 필요가 없습니다.
+        계산하는 동안 쓰기 잠금을 잡아 그 사이에 기록된 로그의 증감이 덮어써지지 않게 합니다.
 
         Returns:
-            계산된 통계 딕셔너리
+            계산된 통계 딕셔너리 (LOG_STAT_KEYS)
         """
         conn = self.connection.get_connection()
         cursor = self.connection.get_cursor(conn)
 
         try:
+            cursor.execute("BEGIN IMMEDIATE")
+
             # 전체 스크립트 실행 개수 (execution_id 기준 고유 개수)
             cursor.execute(
                 "SELECT COUNT(DISTINCT execution_id) FROM node_execution_logs WHERE execution_id IS NOT NULL"
             )
             total = cursor.fetchone()[0] or 0
 
-            # 완료된 로그 개수 (노드 단위)
-            cursor.execute("SELECT COUNT(*) FROM node_execution_logs WHERE status = 'completed'")
-            completed = cursor.fetchone()[0] or 0
-
-            # 실패한 로그 개수 (노드 단위)
-            cursor.execute("SELECT COUNT(*) FROM node_execution_logs WHERE status = 'failed'")
-            failed = cursor.fetchone()[0] or 0
-
-            # 평균 실행 시간 계산
+            # 노드 단위 개수와 실행 시간을 한 번의 스캔으로 집계
+            # - timeout: 시간 초과로 실패한 로그 (result.error.reason = 'timeout', 기록할 때 error_reason 컬럼에 저장)
+            # - cache_hits: 캐시 히트로 완료된 로그 (result.meta.cache_hit = true, 기록할 때 cache_hit 컬럼에 저장)
+            # - 실행 시간 합계/개수: 캐시 히트는 실제 실행이 아니므로 제외 (트리거가 평균 계산에 사용)
             cursor.execute(
                 """
-                SELECT AVG(execution_time_ms)
+                SELECT
+                    SUM(CASE WHEN status = 'completed' THEN 1 ELSE 0 END),
+                    SUM(CASE WHEN status = 'failed' THEN 1 ELSE 0 END),
+                    SUM(CASE WHEN status = 'failed' AND error_reason = 'timeout' THEN 1 ELSE 0 END),
+                    SUM(CASE WHEN status = 'completed' AND cache_hit = 1 THEN 1 ELSE 0 END),
+                    SUM(CASE WHEN execution_time_ms > 0 AND cache_hit != 1 THEN execution_time_ms END),
+                    SUM(CASE WHEN execution_time_ms > 0 AND cache_hit != 1 THEN 1 ELSE 0 END)
                 FROM node_execution_logs
-                WHERE execution_time_ms IS NOT NULL AND execution_time_ms > 0
                 """
             )
-            avg_result = cursor.fetchone()[0]
-            average_execution_time = int(avg_result) if avg_result else 0
+            row = cursor.fetchone()
+            completed, failed, timeout, cache_hits, execution_time_total, execution_time_count = (
+                int(value or 0) for value in row
+            )
+            average_execution_time = execution_time_total // execution_time_count if execution_time_count else 0
 
             stats = {
                 "total": total,
                 "completed": completed,
                 "failed": failed,
+                "timeout": timeout,
+                "cache_hits": cache_hits,
                 "average_execution_time": average_execution_time,
             }
 
             # 통계 업데이트
-            self._update_all_stats_impl(cursor, stats)
+            self._update_all_stats_impl(
+                cursor,
+                {
+                    **stats,
+                    "execution_time_total": execution_time_total,
+                    "execution_time_count": execution_time_count,
+                },
+            )
             conn.commit()
 
             return stats
+        except Exception as e:
+            conn.rollback()
+            raise e
         finally:
             conn.close()
@@ -1,30 +1,362 @@
 """노드 실행 로그 리포지토리 모듈"""
 
+import base64
+from collections.abc import Iterator
 import json
 import os
+import sqlite3
 import sys
 from typing import Any
 
 # 직접 실행 시와 모듈로 import 시 모두 지원
 try:
     from .connection import DatabaseConnection
+    from .log_payload_codec import (
+        LogPayloadPolicy,
+        decode_payload,
+        encode_payload,
+        payload_hash,
+        result_markers,
+        result_search_text,
+        serialize_payload,
+        truncate_text,
+    )
 except ImportError:
     # 직접 실행 시 절대 import 사용
     sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
     from db.connection import DatabaseConnection
+    from db.log_payload_codec import (
+        LogPayloadPolicy,
+        decode_payload,
+        encode_payload,
+        payload_hash,
+        result_markers,
+        result_search_text,
+        serialize_payload,
+        truncate_text,
+    )
+
+# 실행이 끝난 로그 상태
+TERMINAL_STATUSES = ("completed", "failed")
+
+# 완료/실패 로그가 running 로그를 업데이트할 때 바꾸는 필드 (나머지는 running 로그 값 유지)
+_TERMINAL_FIELDS = ("status", "finished_at", "execution_time_ms", "result", "error_message", "error_traceback")
+
+# INSERT 컬럼 순서 (_to_row의 값 순서와 일치시킴)
+# - parameters: 작은 파라미터 (JSON 텍스트 또는 압축 BLOB), parameters_hash: log_payloads에 저장한 파라미터의 해시
+# - result: 실행 결과 (JSON 텍스트 또는 압축 BLOB), cache_hit/error_reason: 통계 트리거가 읽는 결과 값
+# - search_text: 결과에서 뽑은 검색 필드 텍스트 (전문 검색 색인 트리거가 읽음)
+_INSERT_COLUMNS = (
+    "execution_id, script_id, node_id, attempt, node_type, node_name, status, started_at, finished_at, "
+    "execution_time_ms, parameters, parameters_hash, result, cache_hit, error_reason, error_message, error_traceback, "
+    "search_text"
+)
+
+# 목록 조회 기본 컬럼 (페이로드/스택 트레이스 제외, has_parameters/has_result는 페이로드가 있는지만 표시)
+_SUMMARY_COLUMNS = (
+    "id",
+    "execution_id",
+    "script_id",
+    "node_id",
+    "attempt",
+    "node_type",
+    "node_name",
+    "status",
+    "started_at",
+    "finished_at",
+    "execution_time_ms",
+    "error_message",
+    "created_at",
+)
+
+# 조회할 수 있는 필드와 SELECT 식 (fields 프로젝션, 별칭 l: 로그, p: 공유 파라미터)
+LOG_FIELDS: dict[str, str] = {
+    **{column: f"l.{column}" for column in _SUMMARY_COLUMNS},
+    "error_traceback": "l.error_traceback",
+    "has_parameters": "(l.parameters_hash IS NOT NULL OR COALESCE(l.parameters, '{}') NOT IN ('', '{}'))",
+    "has_result": "COALESCE(l.result, '{}') NOT IN ('', '{}')",
+    "parameters": "COALESCE(p.data, l.parameters)",
+    "result": "l.result",
+}
+
+# 목록 조회 기본 필드
+DEFAULT_LOG_FIELDS = (*_SUMMARY_COLUMNS, "has_parameters", "has_result")
+
+# 압축을 풀고 파싱하는 필드 (요청한 경우에만 log_payloads를 조인)
+_PAYLOAD_FIELDS = ("parameters", "result")
+
+# 로그 하나를 열 때 조회하는 필드 (목록에서 뺀 스택 트레이스와 페이로드 포함)
+_DETAIL_LOG_FIELDS = (*DEFAULT_LOG_FIELDS, "error_traceback", *_PAYLOAD_FIELDS)
+_PAYLOAD_JOIN = "LEFT JOIN log_payloads p ON p.hash = l.parameters_hash"
+
+# 트리거가 대기열에 모은 로그를 전문 검색 색인에 반영 (rowid = 로그 ID, 로그를 기록한 트랜잭션에서 실행)
+_SYNC_SEARCH = (
+    """
+    DELETE FROM node_execution_logs_fts
+    WHERE rowid IN (SELECT log_id FROM node_execution_logs_fts_pending WHERE changed = 1)
+    """,
+    """
+    INSERT INTO node_execution_logs_fts (rowid, node_name, error_message, error_traceback, result_text)
+    SELECT id, node_name, error_message, error_traceback, search_text FROM node_execution_logs
+    WHERE id IN (SELECT log_id FROM node_execution_logs_fts_pending)
+    """,
+    "DELETE FROM node_execution_logs_fts_pending",
+)
+
+# 검색 결과 순위 (bm25, 값이 작을수록 관련도가 높음) - 노드 이름, 에러 메시지, 결과, 스택 트레이스 순으로 가중치
+_SEARCH_RANK = "bm25(node_execution_logs_fts, 8.0, 4.0, 1.0, 2.0)"
+
+# 검색 결과 일치 부분 발췌 (일치한 단어를 «»로 표시)
+_SEARCH_SNIPPET = "snippet(node_execution_logs_fts, -1, '«', '»', '…', 16)"
+
+# 더 이상 참조하지 않는 공유 파라미터 삭제 (로그를 삭제한 트랜잭션에서 실행)
+_PRUNE_PAYLOADS = """
+    DELETE FROM log_payloads
+    WHERE NOT EXISTS (SELECT 1 FROM node_execution_logs WHERE parameters_hash = log_payloads.hash)
+"""
+
+# 로그 한 건을 기록하는 단일 UPSERT 문 ((execution_id, node_id, attempt) 유니크 인덱스 기준)
+# - 같은 키의 로그가 없으면 새로 생성
+# - running 로그가 있으면: running이 오면 교체, completed/failed가 오면 완료 정보만 업데이트 (시작 시간/파라미터 유지)
+# - completed/failed 로그가 있으면 아무것도 바꾸지 않음 (이미 끝난 노드)
+# execution_id가 NULL인 로그는 유니크 검사 대상이 아니므로 항상 새로 생성됩니다.
+_UPSERT_LOG = f"""
+    INSERT INTO node_execution_logs ({_INSERT_COLUMNS})
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+    ON CONFLICT(execution_id, node_id, attempt) DO UPDATE SET
+        status = excluded.status,
+        started_at = CASE WHEN excluded.status = 'running' THEN excluded.started_at
+                          ELSE node_execution_logs.started_at END,
+        parameters = CASE WHEN excluded.status = 'running' THEN excluded.parameters
+                          ELSE node_execution_logs.parameters END,
+        parameters_hash = CASE WHEN excluded.status = 'running' THEN excluded.parameters_hash
+                               ELSE node_execution_logs.parameters_hash END,
+        finished_at = excluded.finished_at,
+        execution_time_ms = excluded.execution_time_ms,
+        result = excluded.result,
+        cache_hit = excluded.cache_hit,
+        error_reason = excluded.error_reason,
+        error_message = excluded.error_message,
+        error_traceback = excluded.error_traceback,
+        search_text = excluded.search_text
+    WHERE node_execution_logs.status = 'running'
+"""
+
+
+def coalesce_log_records(records: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    """
+    같은 (execution_id, node_id, attempt)의 로그 레코드를 create_log 규칙대로 하나로 합칩니다.
+
+    - running 뒤의 completed/failed: running 레코드에 완료 정보를 합침 (시작 시간/파라미터 유지)
+    - completed/failed 뒤의 로그: 무시 (이미 끝난 노드)
+    - running 뒤의 running: 나중 레코드로 교체
+
+    Args:
+        records: 로그 레코드 목록 (create_log 인자와 같은 키, 들어온 순서)
+
+    Returns:
+        합친 로그 레코드 목록 (각 노드의 첫 레코드 위치 유지)
+    """
+    merged: list[dict[str, Any]] = []
+    positions: dict[tuple[str, str, int], int] = {}
+    for record in records:
+        execution_id, node_id = record.get("execution_id"), record.get("node_id")
+        if not execution_id or not node_id:
+            merged.append(record)
+            continue
+        key = (execution_id, node_id, int(record.get("attempt") or 1))
+        position = positions.get(key)
+        if position is None:
+            positions[key] = len(merged)
+            merged.append(record)
+            continue
+        previous = merged[position]
+        if previous.get("status") in TERMINAL_STATUSES:
+            continue
+        if record.get("status") in TERMINAL_STATUSES:
+            merged[position] = {**previous, **{field: record.get(field) for field in _TERMINAL_FIELDS}}
+        else:
+            merged[position] = record
+    return merged
+
+
+def _to_row(record: dict[str, Any], policy: LogPayloadPolicy) -> tuple[tuple[Any, ...], tuple[str, Any, int] | None]:
+    """
+    로그 레코드를 INSERT 값 튜플로 변환합니다. (_INSERT_COLUMNS 순서)
+    파라미터/결과는 정책대로 잘라내고, 큰 값은 압축하며, 큰 파라미터는 log_payloads에 넣을 행으로 분리합니다.
+    결과의 검색 필드는 search_text로 따로 넣어 전문 검색 색인 트리거가 압축을 풀지 않고 읽게 합니다.
+
+    Returns:
+        (INSERT 값 튜플, log_payloads 행 (hash, data, size) 또는 None)
+    """
+    parameters_text = serialize_payload(record.get("parameters"), policy)
+    result = record.get("result")
+    result_text = serialize_payload(result, policy)
+    cache_hit, error_reason = result_markers(result)
+
+    parameters: str | bytes | None = None
+    parameters_key: str | None = None
+    shared_payload: tuple[str, Any, int] | None = None
+    if parameters_text is not None and len(parameters_text) >= policy.dedup_min_bytes:
+        parameters_key = payload_hash(parameters_text)
+        shared_payload = (parameters_key, encode_payload(parameters_text, policy), len(parameters_text))
+    else:
+        parameters = encode_payload(parameters_text, policy)
+
+    error_traceback = record.get("error_traceback")
+    if error_traceback:
+        error_traceback = truncate_text(
+            error_traceback, policy.field_limits.get("error_traceback", policy.max_string_chars)
+        )
+
+    row = (
+        record.get("execution_id"),
+        record.get("script_id"),
+        record["node_id"],
+        int(record.get("attempt") or 1),
+        record["node_type"],
+        record.get("node_name"),
+        record["status"],
+        record.get("started_at"),
+        record.get("finished_at"),
+        record.get("execution_time_ms"),
+        parameters,
+        parameters_key,
+        encode_payload(result_text, policy),
+        cache_hit,
+        error_reason,
+        record.get("error_message"),
+        error_traceback,
+        result_search_text(result, policy.search_result_fields),
+    )
+    return row, shared_payload
+
+
+def encode_log_cursor(started_at: str | None, log_id: int) -> str:
+    """
+    목록 다음 페이지 커서를 만듭니다. (마지막 로그의 (started_at, id), URL에 그대로 쓸 수 있는 문자열)
+
+    Args:
+        started_at: 마지막 로그의 시작 시간
+        log_id: 마지막 로그 ID
+
+    Returns:
+        커서 문자열
+    """
+    raw = json.dumps([started_at, log_id], separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_log_cursor(cursor: str) -> tuple[str | None, int]:
+    """
+    목록 커서를 (started_at, id)로 복원합니다.
+
+    Args:
+        cursor: encode_log_cursor로 만든 커서
+
+    Returns:
+        (시작 시간, 로그 ID)
+
+    Raises:
+        ValueError: 커서 형식이 잘못된 경우
+    """
+    try:
+        started_at, log_id = json.loads(base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)))
+    except (ValueError, TypeError) as e:
+        raise ValueError(f"잘못된 커서입니다: {cursor}") from e
+    if not isinstance(log_id, int) or not (started_at is None or isinstance(started_at, str)):
+        raise ValueError(f"잘못된 커서입니다: {cursor}")
+    return started_at, log_id
+
+
+def _row_to_log(fields: tuple[str, ...], row: tuple) -> dict[str, Any]:
+    """조회 행을 요청한 필드의 딕셔너리로 변환 (페이로드 필드만 압축을 풀고 파싱)"""
+    log = dict(zip(fields, row[: len(fields)], strict=True))
+    for field in ("has_parameters", "has_result"):
+        if field in log:
+            log[field] = bool(log[field])
+    for field in _PAYLOAD_FIELDS:
+        if field in log:
+            log[field] = decode_payload(log[field])
+    return log
+
+
+def to_match_query(text: str) -> str:
+    """
+    검색어를 FTS5 MATCH 식으로 변환합니다. (공백으로 구분한 단어를 모두 포함, 각 단어는 접두어로 검색)
+    FTS5 문법 문자를 그대로 쓰지 않고 단어마다 따옴표로 감싸므로 사용자가 입력한 검색어로 문법 오류가 나지 않습니다.
+
+    Args:
+        text: 검색어 (예: "timeout 이미지")
+
+    Returns:
+        MATCH 식 (예: '"timeout"* "이미지"*')
+
+    Raises:
+        ValueError: 검색할 단어가 없는 경우
+    """
+    terms = [term.replace('"', '""') for term in text.split()]
+    if not terms:
+        raise ValueError("검색어를 입력해야 합니다.")
+    return " ".join(f'"{term}"*' for term in terms)
+
+
+def resolve_log_fields(fields: tuple[str, ...] | None, include_payloads: bool) -> tuple[str, ...]:
+    """조회할 필드 결정 (None이면 기본 요약, include_payloads면 파라미터/결과 추가)"""
+    fields = fields or DEFAULT_LOG_FIELDS
+    if include_payloads:
+        fields = (*fields, *(field for field in _PAYLOAD_FIELDS if field not in fields))
+    return fields
 
 
 class NodeExecutionLogRepository:
     """노드 실행 로그 관련 데이터베이스 작업을 처리하는 클래스"""
 
-    def __init__(self, connection: DatabaseConnection) -> None:
+    def __init__(self, connection: DatabaseConnection, payload_policy: LogPayloadPolicy | None = None) -> None:
         """
         NodeExecutionLogRepository 초기화
 
         Args:
             connection: DatabaseConnection 인스턴스
+            payload_policy: 파라미터/결과 저장 정책 (None이면 기본 정책, 서버 시작 시 설정값으로 교체)
         """
         self.connection = connection
+        self.payload_policy = payload_policy or LogPayloadPolicy()
+
+    def _write_rows(self, cursor: sqlite3.Cursor, records: list[dict[str, Any]], returning: bool = False) -> int | None:
+        """
+        공유 파라미터를 먼저 넣고 로그 레코드를 UPSERT합니다. (호출한 쪽의 트랜잭션 안에서 실행)
+        추가/변경된 로그는 트리거가 모아 둔 대기열로 마지막에 한 번에 전문 검색 색인에 반영합니다.
+
+        Args:
+            cursor: 데이터베이스 커서
+            records: 로그 레코드 목록
+            returning: True면 레코드 하나를 기록하고 로그 ID를 반환 (기록하지 않았으면 None)
+
+        Returns:
+            returning이면 기록한 로그 ID, 아니면 None
+        """
+        rows = []
+        shared_payloads: dict[str, tuple[str, Any, int]] = {}
+        for record in records:
+            row, shared_payload = _to_row(record, self.payload_policy)
+            rows.append(row)
+            if shared_payload is not None:
+                shared_payloads[shared_payload[0]] = shared_payload
+        if shared_payloads:
+            cursor.executemany(
+                "INSERT OR IGNORE INTO log_payloads (hash, data, size) VALUES (?, ?, ?)", list(shared_payloads.values())
+            )
+        log_id = None
+        if returning:
+            cursor.execute(f"{_UPSERT_LOG} RETURNING id", rows[0])
+            written = cursor.fetchone()
+            log_id = written[0] if written else None
+        else:
+            cursor.executemany(_UPSERT_LOG, rows)
+        for statement in _SYNC_SEARCH:
+            cursor.execute(statement)
+        return log_id
 
     def create_log(
         self,
@@ -41,14 +373,14 @@ class NodeExecutionLogRepository:
         result: dict[str, Any] | None = None,
         error_message: str | None = None,
         error_traceback: str | None = None,
+        attempt: int = 1,
     ) -> int:
         """
-        노드 실행 로그 생성 또는 업데이트
+        노드 실행 로그 생성 또는 업데이트 (UPSERT 문 하나로 기록)
 
-        - running 상태: 같은 execution_id와 node_id의 기존 running 로그를 삭제하고 새로 생성
-          (단, 이미 completed/failed 로그가 있으면 생성하지 않음)
-        - completed/failed 상태: 같은 execution_id와 node_id의 running 로그를 찾아서 업데이트
-          (없으면 새로 생성)
+        - running 상태: 같은 execution_id, node_id, attempt의 running 로그가 있으면 교체
+          (단, 이미 completed/failed 로그가 있으면 바꾸지 않음)
+        - completed/failed 상태: 같은 키의 running 로그를 업데이트 (없으면 새로 생성)
 
         Args:
             execution_id: 워크플로우 실행 ID (같은 실행의 노드들을 그룹화)
@@ -64,140 +396,42 @@ class NodeExecutionLogRepository:
             result: 실행 결과
             error_message: 에러 메시지 (실패 시)
             error_traceback: 에러 스택 트레이스 (실패 시)
+            attempt: 같은 실행 안에서 노드의 실행 번호 (기본 1, 같은 노드를 다시 실행할 때 별도 로그로 남김)
 
         Returns:
-            생성/업데이트된 로그 ID
+            생성/업데이트된 로그 ID (이미 끝난 노드면 기존 로그 ID)
         """
+        record = {
+            "execution_id": execution_id,
+            "script_id": script_id,
+            "node_id": node_id,
+            "attempt": attempt,
+            "node_type": node_type,
+            "node_name": node_name,
+            "status": status,
+            "started_at": started_at,
+            "finished_at": finished_at,
+            "execution_time_ms": execution_time_ms,
+            "parameters": parameters,
+            "result": result,
+            "error_message": error_message,
+            "error_traceback": error_traceback,
+        }
         conn = self.connection.get_connection()
         cursor = self.connection.get_cursor(conn)
 
         try:
-            # JSON 직렬화
-            parameters_json = json.dumps(parameters) if parameters else "{}"
-            result_json = json.dumps(result) if result else "{}"
-
-            # execution_id와 node_id가 있는 경우에만 중복 방지 로직 적용
-            if execution_id and node_id:
-                if status == "running":
-                    # running 상태: 이미 completed/failed 로그가 있으면 생성하지 않음
-                    cursor.execute(
-                        """
-                        SELECT id FROM node_execution_logs
-                        WHERE execution_id = ? AND node_id = ? AND status IN ('completed', 'failed')
-                        ORDER BY id DESC
-                        LIMIT 1
-                        """,
-                        (execution_id, node_id),
-                    )
-                    completed_log = cursor.fetchone()
-                    if completed_log:
-                        conn.commit()
-                        return completed_log[0]
-
-                    # 기존 running 로그 삭제 (중복 방지)
-                    cursor.execute(
-                        """
-                        DELETE FROM node_execution_logs
-                        WHERE execution_id = ? AND node_id = ? AND status = 'running'
-                        """,
-                        (execution_id, node_id),
-                    )
-
-                elif status in ("completed", "failed"):
-                    # completed/failed 상태: running 로그를 찾아서 업데이트
-                    cursor.execute(
-                        """
-                        SELECT id FROM node_execution_logs
-                        WHERE execution_id = ? AND node_id = ? AND status = 'running'
-                        ORDER BY id DESC
-                        LIMIT 1
-                        """,
-                        (execution_id, node_id),
-                    )
-                    running_log = cursor.fetchone()
-
-                    if running_log:
-                        # running 로그를 completed/failed로 업데이트
-                        log_id_to_update = running_log[0]
-                        cursor.execute(
-                            """
-                            UPDATE node_execution_logs
-                            SET status = ?,
-                                finished_at = ?,
-                                execution_time_ms = ?,
-                                result = ?,
-                                error_message = ?,
-                                error_traceback = ?
-                            WHERE id = ?
-                            """,
-                            (
-                                status,
-                                finished_at,
-                                execution_time_ms,
-                                result_json,
-                                error_message,
-                                error_traceback,
-                                log_id_to_update,
-                            ),
-                        )
-
-                        # 남아있는 모든 running 로그 삭제 (중복 방지)
-                        cursor.execute(
-                            """
-                            DELETE FROM node_execution_logs
-                            WHERE execution_id = ? AND node_id = ? AND status = 'running'
-                            """,
-                            (execution_id, node_id),
-                        )
-
-                        conn.commit()
-                        return log_id_to_update
-
-                    # running 로그가 없고 이미 completed/failed 로그가 있으면 기존 로그 반환
-                    cursor.execute(
-                        """
-                        SELECT id FROM node_execution_logs
-                        WHERE execution_id = ? AND node_id = ? AND status IN ('completed', 'failed')
-                        ORDER BY id DESC
-                        LIMIT 1
-                        """,
-                        (execution_id, node_id),
-                    )
-                    existing_log = cursor.fetchone()
-                    if existing_log:
-                        conn.commit()
-                        return existing_log[0]
-
-            # 새 로그 생성
-            cursor.execute(
-                """
-                INSERT INTO node_execution_logs (
-                    execution_id, script_id, node_id, node_type, node_name,
-                    status, started_at, finished_at, execution_time_ms,
-                    parameters, result, error_message, error_traceback
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """,
-                (
-                    execution_id,
-                    script_id,
-                    node_id,
-                    node_type,
-                    node_name,
-                    status,
-                    started_at,
-                    finished_at,
-                    execution_time_ms,
-                    parameters_json,
-                    result_json,
-                    error_message,
-                    error_traceback,
-                ),
-            )
-
-            log_id = cursor.lastrowid
+            log_id = self._write_rows(cursor, [record], returning=True)
             if log_id is None:
-                raise ValueError("로그 생성 실패: lastrowid가 None입니다")
-
+                # 이미 끝난 노드라 바꾸지 않은 경우 기존 로그 ID 반환
+                cursor.execute(
+                    "SELECT id FROM node_execution_logs WHERE execution_id = ? AND node_id = ? AND attempt = ?",
+                    (execution_id, node_id, int(attempt or 1)),
+                )
+                existing = cursor.fetchone()
+                if existing is None:
+                    raise ValueError("로그 생성 실패: 기록된 로그를 찾을 수 없습니다")
+                log_id = existing[0]
             conn.commit()
             return log_id
         except Exception as e:
@@ -206,286 +440,395 @@ class NodeExecutionLogRepository:
         finally:
             conn.close()
 
-    def get_logs_by_execution_id(self, execution_id: str) -> list[dict[str, Any]]:
+    def write_logs(self, records: list[dict[str, Any]]) -> int:
         """
-        특정 실행 ID의 모든 로그 조회
+        노드 실행 로그 여러 건을 하나의 트랜잭션으로 생성/업데이트합니다. (로그 싱크, 일괄 수집 API용)
+        같은 노드의 레코드를 먼저 합친 뒤(coalesce_log_records) create_log와 같은 UPSERT 문을 executemany로 기록하며,
+        결과는 레코드를 순서대로 create_log에 넣은 것과 같습니다.
 
         Args:
-            execution_id: 워크플로우 실행 ID
+            records: create_log 인자와 같은 키를 가진 로그 레코드 목록 (들어온 순서)
 
         Returns:
-            로그 목록
+            합친 뒤 반영한 레코드 수
         """
+        records = coalesce_log_records(records)
+        if not records:
+            return 0
+
         conn = self.connection.get_connection()
         cursor = self.connection.get_cursor(conn)
 
         try:
-            cursor.execute(
-                """
-                SELECT
-                    id, execution_id, script_id, node_id, node_type, node_name,
-                    status, started_at, finished_at, execution_time_ms,
-                    parameters, result, error_message, error_traceback, created_at
-                FROM node_execution_logs
-                WHERE execution_id = ?
-                ORDER BY started_at ASC
-            """,
-                (execution_id,),
-            )
-
-            logs = []
-            for row in cursor.fetchall():
-                log = {
-                    "id": row[0],
-                    "execution_id": row[1],
-                    "script_id": row[2],
-                    "node_id": row[3],
-                    "node_type": row[4],
-                    "node_name": row[5],
-                    "status": row[6],
-                    "started_at": row[7],
-                    "finished_at": row[8],
-                    "execution_time_ms": row[9],
-                    "parameters": json.loads(row[10]) if row[10] else {},
-                    "result": json.loads(row[11]) if row[11] else {},
-                    "error_message": row[12],
-                    "error_traceback": row[13],
-                    "created_at": row[14],
-                }
-                logs.append(log)
-
-            return logs
+            self._write_rows(cursor, records)
+            conn.commit()
+            return len(records)
+        except Exception as e:
+            conn.rollback()
+            raise e
         finally:
             conn.close()
 
-    def get_logs_by_script_id(self, script_id: int, limit: int = 100, offset: int = 0) -> list[dict[str, Any]]:
+    def _fetch_logs(
+        self,
+        conditions: list[str],
+        params: list[Any],
+        order_by: str,
+        fields: tuple[str, ...],
+        limit: int | None = None,
+        offset: int = 0,
+    ) -> list[tuple[dict[str, Any], str | None, int]]:
         """
-        특정 스크립트의 로그 조회
+        조건에 맞는 로그를 요청한 필드만 조회합니다.
 
         Args:
-            script_id: 스크립트 ID
-            limit: 조회할 최대 개수
+            conditions: WHERE 조건 목록 (AND로 연결, 별칭 l)
+            params: 조건 파라미터
+            order_by: 정렬 (별칭 l)
+            fields: 조회할 필드 (LOG_FIELDS의 키)
+            limit: 조회할 최대 개수 (None이면 제한 없음)
             offset: 건너뛸 개수
 
         Returns:
-            로그 목록
+            (로그, 시작 시간, 로그 ID) 목록 (시작 시간과 ID는 다음 페이지 커서용)
         """
+        select = ", ".join([*(LOG_FIELDS[field] for field in fields), "l.started_at", "l.id"])
+        join = _PAYLOAD_JOIN if "parameters" in fields else ""
+        where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+        query = f"SELECT {select} FROM node_execution_logs l {join} {where} ORDER BY {order_by}"
+        if limit is not None:
+            query += " LIMIT ? OFFSET ?"
+            params = [*params, limit, offset]
+
         conn = self.connection.get_connection()
         cursor = self.connection.get_cursor(conn)
 
         try:
-            cursor.execute(
-                """
-                SELECT
-                    id, execution_id, script_id, node_id, node_type, node_name,
-                    status, started_at, finished_at, execution_time_ms,
-                    parameters, result, error_message, error_traceback, created_at
-                FROM node_execution_logs
-                WHERE script_id = ?
-                ORDER BY started_at DESC
-                LIMIT ? OFFSET ?
-            """,
-                (script_id, limit, offset),
-            )
-
-            logs = []
-            for row in cursor.fetchall():
-                log = {
-                    "id": row[0],
-                    "execution_id": row[1],
-                    "script_id": row[2],
-                    "node_id": row[3],
-                    "node_type": row[4],
-                    "node_name": row[5],
-                    "status": row[6],
-                    "started_at": row[7],
-                    "finished_at": row[8],
-                    "execution_time_ms": row[9],
-                    "parameters": json.loads(row[10]) if row[10] else {},
-                    "result": json.loads(row[11]) if row[11] else {},
-                    "error_message": row[12],
-                    "error_traceback": row[13],
-                    "created_at": row[14],
-                }
-                logs.append(log)
-
-            return logs
+            cursor.execute(query, params)
+            return [(_row_to_log(fields, row), row[-2], row[-1]) for row in cursor.fetchall()]
         finally:
             conn.close()
 
-    def get_logs_by_node_id(self, node_id: str, limit: int = 100, offset: int = 0) -> list[dict[str, Any]]:
+    def list_logs(
+        self,
+        script_id: int | None = None,
+        node_id: str | None = None,
+        status: str | None = None,
+        limit: int = 100,
+        cursor: str | None = None,
+        offset: int = 0,
+        fields: tuple[str, ...] = DEFAULT_LOG_FIELDS,
+    ) -> tuple[list[dict[str, Any]], str | None]:
         """
-        특정 노드의 로그 조회
+        로그 목록을 최신순((started_at, id) 내림차순, 시작 시간이 없는 로그는 맨 뒤)으로 한 페이지 조회합니다.
+        cursor를 주면 이전 페이지 마지막 로그 다음부터 인덱스로 바로 찾으므로, 뒤 페이지도 OFFSET처럼 느려지지 않습니다.
 
         Args:
-            node_id: 노드 ID
+            script_id: 스크립트 ID (선택)
+            node_id: 노드 ID (선택)
+            status: 실행 상태 (선택)
             limit: 조회할 최대 개수
-            offset: 건너뛸 개수
+            cursor: 이전 페이지의 next_cursor (없으면 첫 페이지)
+            offset: 건너뛸 개수 (cursor가 없을 때만 사용, 하위 호환용)
+            fields: 조회할 필드 (LOG_FIELDS의 키, 기본은 페이로드를 제외한 요약)
+
+        Returns:
+            (로그 목록, 다음 페이지 커서 - 마지막 페이지면 None)
+
+        Raises:
+            ValueError: 커서 형식이 잘못되었거나 알 수 없는 필드를 요청한 경우
+        """
+        unknown = [field for field in fields if field not in LOG_FIELDS]
+        if unknown:
+            raise ValueError(f"알 수 없는 필드입니다: {', '.join(unknown)}")
+
+        conditions: list[str] = []
+        params: list[Any] = []
+        for column, value in (("script_id", script_id), ("node_id", node_id), ("status", status)):
+            if value is not None:
+                conditions.append(f"l.{column} = ?")
+                params.append(value)
+
+        # 다음 페이지가 있는지 알 수 있도록 하나 더 조회
+        wanted = limit + 1
+        if cursor is None:
+            rows = self._fetch_logs(conditions, params, "l.started_at DESC, l.id DESC", fields, wanted, offset)
+        else:
+            after_started_at, after_id = decode_log_cursor(cursor)
+            rows = []
+            if after_started_at is not None:
+                # 1. 시작 시간이 있는 로그 중 커서 다음 로그 (행 값 비교는 NULL 시작 시간을 제외함)
+                rows = self._fetch_logs(
+                    [*conditions, "(l.started_at, l.id) < (?, ?)"],
+                    [*params, after_started_at, after_id],
+                    "l.started_at DESC, l.id DESC",
+                    fields,
+                    wanted,
+                )
+            if len(rows) < wanted:
+                # 2. 시작 시간이 없는 로그 (정렬 맨 뒤, ID 내림차순)
+                null_conditions = [*conditions, "l.started_at IS NULL"]
+                null_params = list(params)
+                if after_started_at is None:
+                    null_conditions.append("l.id < ?")
+                    null_params.append(after_id)
+                rows += self._fetch_logs(null_conditions, null_params, "l.id DESC", fields, wanted - len(rows))
+
+        next_cursor = None
+        if len(rows) > limit:
+            rows = rows[:limit]
+            next_cursor = encode_log_cursor(rows[-1][1], rows[-1][2])
+        return [log for log, _, _ in rows], next_cursor
+
+    def get_log(self, log_id: int) -> dict[str, Any] | None:
+        """
+        로그 하나를 스택 트레이스와 파라미터/결과까지 조회합니다. (실행 기록에서 로그를 열 때 사용)
+
+        Args:
+            log_id: 로그 ID
+
+        Returns:
+            로그 (없으면 None)
+        """
+        rows = self._fetch_logs(["l.id = ?"], [log_id], "l.id", _DETAIL_LOG_FIELDS)
+        return rows[0][0] if rows else None
+
+    def get_logs_by_execution_id(
+        self, execution_id: str, include_payloads: bool = False, fields: tuple[str, ...] | None = None
+    ) -> list[dict[str, Any]]:
+        """
+        특정 실행 ID의 모든 로그 조회 (시작 시간순)
+
+        Args:
+            execution_id: 워크플로우 실행 ID
+            include_payloads: 파라미터/결과 포함 여부 (기본은 목록용 요약만)
+            fields: 조회할 필드 (None이면 기본 요약, include_payloads면 파라미터/결과 추가)
 
         Returns:
             로그 목록
+
+        Raises:
+            ValueError: 알 수 없는 필드를 요청한 경우
+        """
+        fields = resolve_log_fields(fields, include_payloads)
+        rows = self._fetch_logs(["l.execution_id = ?"], [execution_id], "l.started_at ASC, l.id ASC", fields)
+        return [log for log, _, _ in rows]
+
+    def get_node_attempts(self, execution_id: str) -> dict[str, int]:
+        """
+        실행에서 노드별로 기록된 마지막 실행 번호(attempt)를 조회합니다. (재개한 실행이 번호를 이어서 사용)
+
+        Args:
+            execution_id: 워크플로우 실행 ID
+
+        Returns:
+            {노드 ID: 마지막 실행 번호}
         """
         conn = self.connection.get_connection()
         cursor = self.connection.get_cursor(conn)
 
         try:
             cursor.execute(
-                """
-                SELECT
-                    id, execution_id, script_id, node_id, node_type, node_name,
-                    status, started_at, finished_at, execution_time_ms,
-                    parameters, result, error_message, error_traceback, created_at
-                FROM node_execution_logs
-                WHERE node_id = ?
-                ORDER BY started_at DESC
-                LIMIT ? OFFSET ?
-            """,
-                (node_id, limit, offset),
+                "SELECT node_id, MAX(attempt) FROM node_execution_logs WHERE execution_id = ? GROUP BY node_id",
+                (execution_id,),
             )
-
-            logs = []
-            for row in cursor.fetchall():
-                log = {
-                    "id": row[0],
-                    "execution_id": row[1],
-                    "script_id": row[2],
-                    "node_id": row[3],
-                    "node_type": row[4],
-                    "node_name": row[5],
-                    "status": row[6],
-                    "started_at": row[7],
-                    "finished_at": row[8],
-                    "execution_time_ms": row[9],
-                    "parameters": json.loads(row[10]) if row[10] else {},
-                    "result": json.loads(row[11]) if row[11] else {},
-                    "error_message": row[12],
-                    "error_traceback": row[13],
-                    "created_at": row[14],
-                }
-                logs.append(log)
-
-            return logs
+            return {row[0]: row[1] for row in cursor.fetchall()}
         finally:
             conn.close()
 
-    def get_recent_logs(self, limit: int = 100) -> list[dict[str, Any]]:
+    def get_logs_by_script_id(
+        self, script_id: int, limit: int = 100, offset: int = 0, include_payloads: bool = False
+    ) -> list[dict[str, Any]]:
         """
-        최근 로그 조회
+        특정 스크립트의 로그 조회 (최신순, 페이지 조회는 list_logs 사용)
 
         Args:
+            script_id: 스크립트 ID
             limit: 조회할 최대 개수
+            offset: 건너뛸 개수
+            include_payloads: 파라미터/결과 포함 여부 (기본은 목록용 요약만)
 
         Returns:
             로그 목록
         """
-        conn = self.connection.get_connection()
-        cursor = self.connection.get_cursor(conn)
+        fields = resolve_log_fields(None, include_payloads)
+        return self.list_logs(script_id=script_id, limit=limit, offset=offset, fields=fields)[0]
 
-        try:
-            cursor.execute(
-                """
-                SELECT
-                    id, execution_id, script_id, node_id, node_type, node_name,
-                    status, started_at, finished_at, execution_time_ms,
-                    parameters, result, error_message, error_traceback, created_at
-                FROM node_execution_logs
-                ORDER BY started_at DESC
-                LIMIT ?
-            """,
-                (limit,),
-            )
+    def get_logs_by_node_id(
+        self, node_id: str, limit: int = 100, offset: int = 0, include_payloads: bool = False
+    ) -> list[dict[str, Any]]:
+        """
+        특정 노드의 로그 조회 (최신순, 페이지 조회는 list_logs 사용)
 
-            logs = []
-            for row in cursor.fetchall():
-                log = {
-                    "id": row[0],
-                    "execution_id": row[1],
-                    "script_id": row[2],
-                    "node_id": row[3],
-                    "node_type": row[4],
-                    "node_name": row[5],
-                    "status": row[6],
-                    "started_at": row[7],
-                    "finished_at": row[8],
-                    "execution_time_ms": row[9],
-                    "parameters": json.loads(row[10]) if row[10] else {},
-                    "result": json.loads(row[11]) if row[11] else {},
-                    "error_message": row[12],
-                    "error_traceback": row[13],
-                    "created_at": row[14],
-                }
-                logs.append(log)
+        Args:
+            node_id: 노드 ID
+            limit: 조회할 최대 개수
+            offset: 건너뛸 개수
+            include_payloads: 파라미터/결과 포함 여부 (기본은 목록용 요약만)
 
-            return logs
-        finally:
-            conn.close()
+        Returns:
+            로그 목록
+        """
+        fields = resolve_log_fields(None, include_payloads)
+        return self.list_logs(node_id=node_id, limit=limit, offset=offset, fields=fields)[0]
+
+    def get_recent_logs(self, limit: int = 100, include_payloads: bool = False) -> list[dict[str, Any]]:
+        """
+        최근 로그 조회 (페이지 조회는 list_logs 사용)
+
+        Args:
+            limit: 조회할 최대 개수
+            include_payloads: 파라미터/결과 포함 여부 (기본은 목록용 요약만)
+
+        Returns:
+            로그 목록
+        """
+        return self.list_logs(limit=limit, fields=resolve_log_fields(None, include_payloads))[0]
 
-    def get_failed_logs(self, script_id: int | None = None, limit: int = 100) -> list[dict[str, Any]]:
+    def get_failed_logs(
+        self, script_id: int | None = None, limit: int = 100, include_payloads: bool = False
+    ) -> list[dict[str, Any]]:
         """
-        실패한 로그 조회
+        실패한 로그 조회 (최신순, 페이지 조회는 list_logs 사용)
 
         Args:
             script_id: 스크립트 ID (선택사항, None이면 전체)
             limit: 조회할 최대 개수
+            include_payloads: 파라미터/결과 포함 여부 (기본은 목록용 요약만)
 
         Returns:
             로그 목록
         """
+        fields = resolve_log_fields(None, include_payloads)
+        return self.list_logs(script_id=script_id, status="failed", limit=limit, fields=fields)[0]
+
+    def iter_logs(
+        self,
+        execution_id: str | None = None,
+        script_id: int | None = None,
+        node_id: str | None = None,
+        status: str | None = None,
+        since: str | None = None,
+        until: str | None = None,
+        fields: tuple[str, ...] = DEFAULT_LOG_FIELDS,
+        chunk_size: int = 1000,
+    ) -> Iterator[list[dict[str, Any]]]:
+        """
+        조건에 맞는 로그를 로그 ID순으로 chunk_size개씩 나눠 조회합니다. (내보내기용)
+        묶음마다 이전 묶음의 마지막 ID 다음부터 새 연결로 조회하므로, 로그 수와 관계없이 메모리에는 한 묶음만 올라가고
+        내보내는 동안 읽기 트랜잭션을 오래 잡지 않습니다.
+
+        Args:
+            execution_id: 워크플로우 실행 ID (선택)
+            script_id: 스크립트 ID (선택)
+            node_id: 노드 ID (선택)
+            status: 실행 상태 (선택)
+            since: 이 시각 이후에 시작한 로그만 (started_at 기준, 선택)
+            until: 이 시각 이전에 시작한 로그만 (started_at 기준, 선택)
+            fields: 조회할 필드 (LOG_FIELDS의 키)
+            chunk_size: 한 번에 조회할 로그 수
+
+        Yields:
+            로그 묶음
+
+        Raises:
+            ValueError: 알 수 없는 필드를 요청한 경우
+        """
+        unknown = [field for field in fields if field not in LOG_FIELDS]
+        if unknown:
+            raise ValueError(f"알 수 없는 필드입니다: {', '.join(unknown)}")
+
+        conditions: list[str] = []
+        params: list[Any] = []
+        for condition, value in (
+            ("l.execution_id = ?", execution_id),
+            ("l.script_id = ?", script_id),
+            ("l.node_id = ?", node_id),
+            ("l.status = ?", status),
+            ("l.started_at >= ?", since),
+            ("l.started_at < ?", until),
+        ):
+            if value is not None:
+                conditions.append(condition)
+                params.append(value)
+
+        last_id = 0
+        while True:
+            rows = self._fetch_logs([*conditions, "l.id > ?"], [*params, last_id], "l.id", fields, chunk_size)
+            if not rows:
+                return
+            yield [log for log, _, _ in rows]
+            if len(rows) < chunk_size:
+                return
+            last_id = rows[-1][2]
+
+    def search_logs(
+        self,
+        query: str,
+        script_id: int | None = None,
+        node_id: str | None = None,
+        status: str | None = None,
+        since: str | None = None,
+        until: str | None = None,
+        limit: int = 50,
+        offset: int = 0,
+    ) -> tuple[list[dict[str, Any]], int]:
+        """
+        전문 검색 색인으로 로그를 검색합니다. (관련도순, 같으면 최신순)
+
+        Args:
+            query: 검색어 (공백으로 구분한 단어를 모두 포함하는 로그, 단어는 접두어로 검색)
+            script_id: 스크립트 ID (선택)
+            node_id: 노드 ID (선택)
+            status: 실행 상태 (선택)
+            since: 이 시각 이후에 시작한 로그만 (started_at 기준, 선택)
+            until: 이 시각 이전에 시작한 로그만 (started_at 기준, 선택)
+            limit: 조회할 최대 개수
+            offset: 건너뛸 개수
+
+        Returns:
+            (로그 목록 - 요약 필드와 rank, snippet 포함, 조건에 맞는 전체 로그 수)
+
+        Raises:
+            ValueError: 검색할 단어가 없는 경우
+        """
+        conditions = ["node_execution_logs_fts MATCH ?"]
+        params: list[Any] = [to_match_query(query)]
+        for condition, value in (
+            ("l.script_id = ?", script_id),
+            ("l.node_id = ?", node_id),
+            ("l.status = ?", status),
+            ("l.started_at >= ?", since),
+            ("l.started_at < ?", until),
+        ):
+            if value is not None:
+                conditions.append(condition)
+                params.append(value)
+        source = (
+            "FROM node_execution_logs_fts JOIN node_execution_logs l ON l.id = node_execution_logs_fts.rowid "
+            f"WHERE {' AND '.join(conditions)}"
+        )
+        select = ", ".join(
+            [*(LOG_FIELDS[field] for field in DEFAULT_LOG_FIELDS), f"{_SEARCH_RANK} AS score", _SEARCH_SNIPPET]
+        )
+
         conn = self.connection.get_connection()
         cursor = self.connection.get_cursor(conn)
 
         try:
-            if script_id is not None:
-                cursor.execute(
-                    """
-                    SELECT
-                        id, execution_id, script_id, node_id, node_type, node_name,
-                        status, started_at, finished_at, execution_time_ms,
-                        parameters, result, error_message, error_traceback, created_at
-                    FROM node_execution_logs
-                    WHERE status = 'failed' AND script_id = ?
-                    ORDER BY started_at DESC
-                    LIMIT ?
-                """,
-                    (script_id, limit),
-                )
-            else:
-                cursor.execute(
-                    """
-                    SELECT
-                        id, execution_id, script_id, node_id, node_type, node_name,
-                        status, started_at, finished_at, execution_time_ms,
-                        parameters, result, error_message, error_traceback, created_at
-                    FROM node_execution_logs
-                    WHERE status = 'failed'
-                    ORDER BY started_at DESC
-                    LIMIT ?
-                """,
-                    (limit,),
-                )
-
+            cursor.execute(f"SELECT COUNT(*) {source}", params)
+            total = cursor.fetchone()[0]
+            cursor.execute(
+                f"SELECT {select} {source} ORDER BY score, l.started_at DESC, l.id DESC LIMIT ? OFFSET ?",
+                [*params, limit, offset],
+            )
             logs = []
             for row in cursor.fetchall():
-                log = {
-                    "id": row[0],
-                    "execution_id": row[1],
-                    "script_id": row[2],
-                    "node_id": row[3],
-                    "node_type": row[4],
-                    "node_name": row[5],
-                    "status": row[6],
-                    "started_at": row[7],
-                    "finished_at": row[8],
-                    "execution_time_ms": row[9],
-                    "parameters": json.loads(row[10]) if row[10] else {},
-                    "result": json.loads(row[11]) if row[11] else {},
-                    "error_message": row[12],
-                    "error_traceback": row[13],
-                    "created_at": row[14],
-                }
+                log = _row_to_log(DEFAULT_LOG_FIELDS, row)
+                log["rank"] = row[-2]
+                log["snippet"] = row[-1]
                 logs.append(log)
-
-            return logs
+            return logs, total
         finally:
             conn.close()
 
@@ -505,6 +848,7 @@ class NodeExecutionLogRepository:
         try:
             cursor.execute("DELETE FROM node_execution_logs WHERE id = ?", (log_id,))
             deleted_count = cursor.rowcount
+            cursor.execute(_PRUNE_PAYLOADS)
             conn.commit()
             return deleted_count > 0
         except Exception as e:
@@ -529,6 +873,7 @@ class NodeExecutionLogRepository:
         try:
             cursor.execute("DELETE FROM node_execution_logs WHERE execution_id = ?", (execution_id,))
             deleted_count = cursor.rowcount
+            cursor.execute(_PRUNE_PAYLOADS)
             conn.commit()
             return deleted_count
         except Exception as e:
@@ -550,6 +895,28 @@ class NodeExecutionLogRepository:
         try:
             cursor.execute("DELETE FROM node_execution_logs")
             deleted_count = cursor.rowcount
+            cursor.execute("DELETE FROM log_payloads")
+            conn.commit()
+            return deleted_count
+        except Exception as e:
+            conn.rollback()
+            raise e
+        finally:
+            conn.close()
+
+    def prune_payloads(self) -> int:
+        """
+        어떤 로그도 참조하지 않는 공유 파라미터를 삭제합니다. (스크립트 삭제로 함께 지워진 로그 등)
+
+        Returns:
+            삭제한 공유 파라미터 수
+        """
+        conn = self.connection.get_connection()
+        cursor = self.connection.get_cursor(conn)
+
+        try:
+            cursor.execute(_PRUNE_PAYLOADS)
+            deleted_count = cursor.rowcount
             conn.commit()
             return deleted_count
         except Exception as e:
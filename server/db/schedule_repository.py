@@ -0,0 +1,274 @@
+"""스크립트 예약 실행 리포지토리 모듈"""
+
+import os
+import sys
+from typing import Any
+
+# 직접 실행 시와 모듈로 import 시 모두 지원
+try:
+    from .connection import DatabaseConnection
+except ImportError:
+    # 직접 실행 시 절대 import 사용
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    from db.connection import DatabaseConnection
+
+# 조회 컬럼 (SELECT 순서와 dict 키 순서를 일치시킴)
+_SCHEDULE_COLUMNS = [
+    "id",
+    "script_id",
+    "name",
+    "schedule_type",
+    "cron_expression",
+    "interval_seconds",
+    "jitter_seconds",
+    "missed_run_policy",
+    "priority",
+    "enabled",
+    "next_run_at",
+    "last_run_at",
+    "last_run_id",
+    "created_at",
+    "updated_at",
+]
+
+# 수정 가능한 컬럼
+_UPDATABLE_COLUMNS = {
+    "name",
+    "schedule_type",
+    "cron_expression",
+    "interval_seconds",
+    "jitter_seconds",
+    "missed_run_policy",
+    "priority",
+    "enabled",
+    "next_run_at",
+}
+
+
+class ScheduleRepository:
+    """스크립트 예약 실행(schedules 테이블) 관련 데이터베이스 작업을 처리하는 클래스"""
+
+    def __init__(self, connection: DatabaseConnection) -> None:
+        """
+        ScheduleRepository 초기화
+
+        Args:
+            connection: DatabaseConnection 인스턴스
+        """
+        self.connection = connection
+
+    def _row_to_dict(self, row: tuple) -> dict[str, Any]:
+        """조회 결과 행을 딕셔너리로 변환"""
+        schedule = dict(zip(_SCHEDULE_COLUMNS, row, strict=True))
+        schedule["enabled"] = bool(schedule["enabled"])
+        return schedule
+
+    def create_schedule(
+        self,
+        script_id: int,
+        schedule_type: str,
+        name: str | None = None,
+        cron_expression: str | None = None,
+        interval_seconds: int | None = None,
+        jitter_seconds: int = 0,
+        missed_run_policy: str = "skip",
+        priority: int = 0,
+        enabled: bool = True,
+        next_run_at: str | None = None,
+    ) -> int:
+        """
+        예약 실행 생성
+
+        Args:
+            script_id: 실행할 스크립트 ID
+            schedule_type: 예약 방식 (cron, interval)
+            name: 예약 이름
+            cron_expression: 크론 표현식 (cron 방식일 때)
+            interval_seconds: 실행 간격 초 (interval 방식일 때)
+            jitter_seconds: 실행 시각에 더할 최대 랜덤 지연 (초)
+            missed_run_policy: 놓친 실행 처리 정책 (skip, catch_up_once)
+            priority: 실행 큐 우선순위
+            enabled: 활성화 여부
+            next_run_at: 다음 실행 시각 (ISO 형식 문자열)
+
+        Returns:
+            생성된 예약 ID
+        """
+        conn = self.connection.get_connection()
+        cursor = self.connection.get_cursor(conn)
+
+        try:
+            cursor.execute(
+                """
+                INSERT INTO schedules (
+                    script_id, name, schedule_type, cron_expression, interval_seconds,
+                    jitter_seconds, missed_run_policy, priority, enabled, next_run_at
+                )
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            """,
+                (
+                    script_id,
+                    name,
+                    schedule_type,
+                    cron_expression,
+                    interval_seconds,
+                    jitter_seconds,
+                    missed_run_policy,
+                    priority,
+                    1 if enabled else 0,
+                    next_run_at,
+                ),
+            )
+            schedule_id = cursor.lastrowid
+            conn.commit()
+            if schedule_id is None:
+                raise RuntimeError("예약 생성 후 ID를 가져올 수 없습니다.")
+            return schedule_id
+        finally:
+            conn.close()
+
+    def get_schedule(self, schedule_id: int) -> dict[str, Any] | None:
+        """
+        예약 실행 조회
+
+        Args:
+            schedule_id: 예약 ID
+
+        Returns:
+            예약 정보 또는 None
+        """
+        conn = self.connection.get_connection()
+        cursor = self.connection.get_cursor(conn)
+
+        try:
+            cursor.execute(f"SELECT {', '.join(_SCHEDULE_COLUMNS)} FROM schedules WHERE id = ?", (schedule_id,))
+            row = cursor.fetchone()
+            return self._row_to_dict(row) if row else None
+        finally:
+            conn.close()
+
+    def get_all_schedules(self, script_id: int | None = None) -> list[dict[str, Any]]:
+        """
+        예약 실행 목록 조회
+
+        Args:
+            script_id: 스크립트 ID (지정 시 해당 스크립트의 예약만 조회)
+
+        Returns:
+            예약 목록 (ID 순)
+        """
+        conn = self.connection.get_connection()
+        cursor = self.connection.get_cursor(conn)
+
+        try:
+            if script_id is None:
+                cursor.execute(f"SELECT {', '.join(_SCHEDULE_COLUMNS)} FROM schedules ORDER BY id ASC")
+            else:
+                cursor.execute(
+                    f"SELECT {', '.join(_SCHEDULE_COLUMNS)} FROM schedules WHERE script_id = ? ORDER BY id ASC",
+                    (script_id,),
+                )
+            return [self._row_to_dict(row) for row in cursor.fetchall()]
+        finally:
+            conn.close()
+
+    def get_enabled_schedules(self) -> list[dict[str, Any]]:
+        """
+        활성화된 예약 실행 목록 조회 (스케줄러 시작 시 사용)
+
+        Returns:
+            활성화된 예약 목록 (다음 실행 시각 순)
+        """
+        conn = self.connection.get_connection()
+        cursor = self.connection.get_cursor(conn)
+
+        try:
+            cursor.execute(
+                f"SELECT {', '.join(_SCHEDULE_COLUMNS)} FROM schedules WHERE enabled = 1 ORDER BY next_run_at ASC"
+            )
+            return [self._row_to_dict(row) for row in cursor.fetchall()]
+        finally:
+            conn.close()
+
+    def update_schedule(self, schedule_id: int, **fields: Any) -> bool:
+        """
+        예약 실행 수정
+
+        Args:
+            schedule_id: 예약 ID
+            **fields: 수정할 컬럼과 값 (_UPDATABLE_COLUMNS에 포함된 컬럼만 반영)
+
+        Returns:
+            성공 여부 (예약이 없으면 False)
+        """
+        updates = {key: value for key, value in fields.items() if key in _UPDATABLE_COLUMNS}
+        if "enabled" in updates:
+            updates["enabled"] = 1 if updates["enabled"] else 0
+
+        conn = self.connection.get_connection()
+        cursor = self.connection.get_cursor(conn)
+
+        try:
+            assignments = "".join(f"{column} = ?, " for column in updates)
+            cursor.execute(
+                f"UPDATE schedules SET {assignments}updated_at = CURRENT_TIMESTAMP WHERE id = ?",
+                (*updates.values(), schedule_id),
+            )
+            conn.commit()
+            return cursor.rowcount > 0
+        finally:
+            conn.close()
+
+    def update_run_state(
+        self, schedule_id: int, next_run_at: str | None, last_run_at: str | None = None, last_run_id: str | None = None
+    ) -> bool:
+        """
+        예약 실행 상태 갱신 (스케줄러가 실행을 큐에 등록하거나 놓친 실행을 건너뛸 때 사용)
+
+        Args:
+            schedule_id: 예약 ID
+            next_run_at: 다음 실행 시각 (ISO 형식 문자열)
+            last_run_at: 마지막 실행 시각 (None이면 기존 값 유지)
+            last_run_id: 마지막 실행 큐 ID (None이면 기존 값 유지)
+
+        Returns:
+            성공 여부
+        """
+        conn = self.connection.get_connection()
+        cursor = self.connection.get_cursor(conn)
+
+        try:
+            cursor.execute(
+                """
+                UPDATE schedules
+                SET next_run_at = ?,
+                    last_run_at = COALESCE(?, last_run_at),
+                    last_run_id = COALESCE(?, last_run_id)
+                WHERE id = ?
+            """,
+                (next_run_at, last_run_at, last_run_id, schedule_id),
+            )
+            conn.commit()
+            return cursor.rowcount > 0
+        finally:
+            conn.close()
+
+    def delete_schedule(self, schedule_id: int) -> bool:
+        """
+        예약 실행 삭제
+
+        Args:
+            schedule_id: 예약 ID
+
+        Returns:
+            성공 여부 (예약이 없으면 False)
+        """
+        conn = self.connection.get_connection()
+        cursor = self.connection.get_cursor(conn)
+
+        try:
+            cursor.execute("DELETE FROM schedules WHERE id = ?", (schedule_id,))
+            conn.commit()
+            return cursor.rowcount > 0
+        finally:
+            conn.close()
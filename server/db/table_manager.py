@@ -8,10 +8,71 @@ import sys
 # 직접 실행 시와 모듈로 import 시 모두 지원
 try:
     from .connection import DatabaseConnection
+    from .log_payload_codec import DEFAULT_SEARCH_RESULT_FIELDS, decode_payload, result_search_text
 except ImportError:
     # 직접 실행 시 절대 import 사용
     sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
     from db.connection import DatabaseConnection
+    from db.log_payload_codec import DEFAULT_SEARCH_RESULT_FIELDS, decode_payload, result_search_text
+
+# 기존 로그로 전문 검색 색인을 채울 때 한 번에 읽는 로그 수
+_SEARCH_BACKFILL_BATCH = 1000
+
+# 로그 한 행이 각 로그 통계에 더하는 값 (LogStatsRepository.calculate_and_update_stats의 전체 집계와 같은 조건)
+# 결과(result)는 압축 BLOB일 수 있으므로 기록할 때 꺼내 둔 cache_hit, error_reason 컬럼을 사용
+_EXECUTION_TIME_CONDITION = "{row}.execution_time_ms > 0 AND {row}.cache_hit != 1"
+_LOG_STAT_TERMS = {
+    "completed": "CASE WHEN {row}.status = 'completed' THEN 1 ELSE 0 END",
+    "failed": "CASE WHEN {row}.status = 'failed' THEN 1 ELSE 0 END",
+    "timeout": "CASE WHEN {row}.status = 'failed' AND {row}.error_reason = 'timeout' THEN 1 ELSE 0 END",
+    "cache_hits": "CASE WHEN {row}.status = 'completed' AND {row}.cache_hit = 1 THEN 1 ELSE 0 END",
+    "execution_time_total": f"CASE WHEN {_EXECUTION_TIME_CONDITION} THEN {{row}}.execution_time_ms ELSE 0 END",
+    "execution_time_count": f"CASE WHEN {_EXECUTION_TIME_CONDITION} THEN 1 ELSE 0 END",
+}
+
+# 실행 ID의 첫 로그 추가/마지막 로그 삭제 여부 (total: 고유 실행 ID 개수)
+_FIRST_LOG_OF_EXECUTION = (
+    "CASE WHEN NEW.execution_id IS NOT NULL AND NOT EXISTS ("
+    "SELECT 1 FROM node_execution_logs WHERE execution_id = NEW.execution_id AND id != NEW.id"
+    ") THEN 1 ELSE 0 END"
+)
+_LAST_LOG_OF_EXECUTION = (
+    "CASE WHEN OLD.execution_id IS NOT NULL AND NOT EXISTS ("
+    "SELECT 1 FROM node_execution_logs WHERE execution_id = OLD.execution_id"
+    ") THEN 1 ELSE 0 END"
+)
+
+
+def _log_stats_delta(added: str | None, removed: str | None, total: str | None) -> str:
+    """
+    로그 통계에 변화량을 더하는 UPDATE 문을 만듭니다. (트리거 본문용)
+
+    Args:
+        added: 더할 행 (NEW, 없으면 None)
+        removed: 뺄 행 (OLD, 없으면 None)
+        total: total(고유 실행 ID 개수)에 더할 식 (없으면 None)
+
+    Returns:
+        UPDATE 문
+    """
+    deltas = []
+    for stat_key, term in _LOG_STAT_TERMS.items():
+        parts = []
+        if added:
+            parts.append(term.format(row=added))
+        if removed:
+            parts.append(f"- {term.format(row=removed)}")
+        deltas.append(f"SELECT '{stat_key}' AS stat_key, {' '.join(parts)} AS delta")
+    if total:
+        deltas.append(f"SELECT 'total' AS stat_key, {total} AS delta")
+    # 변화량이 0이 아닌 키만 업데이트 (로그 한 건당 보통 2~4개 키)
+    return f"""
+    UPDATE log_stats
+    SET stat_value = log_stats.stat_value + d.delta,
+        updated_at = CURRENT_TIMESTAMP
+    FROM ({" UNION ALL ".join(deltas)}) AS d
+    WHERE log_stats.stat_key = d.stat_key AND d.delta != 0;
+"""
 
 
 class TableManager:
@@ -32,6 +93,9 @@ class TableManager:
         cursor = self.connection.get_cursor(conn)
 
         try:
+            # 새 DB는 빈 페이지를 조금씩 반환할 수 있도록 INCREMENTAL 모드로 생성 (테이블이 생기기 전에만 적용됨)
+            cursor.execute("PRAGMA auto_vacuum = INCREMENTAL")
+
             # 스크립트 테이블 생성
             cursor.execute("""
                 CREATE TABLE IF NOT EXISTS scripts (
@@ -139,6 +203,7 @@ class TableManager:
                     execution_id TEXT,
                     script_id INTEGER,
                     node_id TEXT NOT NULL,
+                    attempt INTEGER NOT NULL DEFAULT 1,
                     node_type TEXT NOT NULL,
                     node_name TEXT,
                     status TEXT NOT NULL DEFAULT 'running',
@@ -146,9 +211,13 @@ class TableManager:
                     finished_at TIMESTAMP,
                     execution_time_ms INTEGER,
                     parameters TEXT DEFAULT '{}',
+                    parameters_hash TEXT,
                     result TEXT DEFAULT '{}',
+                    cache_hit INTEGER NOT NULL DEFAULT 0,
+                    error_reason TEXT,
                     error_message TEXT,
                     error_traceback TEXT,
+                    search_text TEXT,
                     created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
                     FOREIGN KEY (script_id) REFERENCES scripts(id) ON DELETE CASCADE
                 )
@@ -156,14 +225,9 @@ class TableManager:
             # 노드 실행 로그 인덱스 추가
             cursor.execute("CREATE INDEX IF NOT EXISTS idx_node_logs_execution_id ON node_execution_logs(execution_id)")
             cursor.execute("CREATE INDEX IF NOT EXISTS idx_node_logs_script_id ON node_execution_logs(script_id)")
-            cursor.execute("CREATE INDEX IF NOT EXISTS idx_node_logs_node_id ON node_execution_logs(node_id)")
-            cursor.execute("CREATE INDEX IF NOT EXISTS idx_node_logs_status ON node_execution_logs(status)")
-            cursor.execute(
-                "CREATE INDEX IF NOT EXISTS idx_node_logs_started_at ON node_execution_logs(started_at DESC)"
-            )
-            cursor.execute(
-                "CREATE INDEX IF NOT EXISTS idx_node_logs_script_started ON node_execution_logs(script_id, started_at DESC)"
-            )
+            self._create_node_log_list_indexes(cursor)
+            # (execution_id, node_id, attempt) 유니크 인덱스는 migrate_tables에서 생성 (기존 중복 로그 정리 후)
+            # parameters_hash 인덱스와 공유 파라미터 테이블은 migrate_tables에서 생성 (기존 DB에 컬럼 추가 후)
 
             # 로그 통계 테이블 생성 (실행 기록 페이지 통계)
             cursor.execute("""
@@ -181,13 +245,19 @@ class TableManager:
             # completed: 완료된 로그 개수
             # failed: 실패한 로그 개수
             # average_execution_time: 평균 실행 시간 (밀리초)
+            # timeout, cache_hits: 시간 초과로 실패한 로그 / 캐시 히트로 완료된 로그 개수
+            # execution_time_total, execution_time_count: 평균 실행 시간 계산용 합계와 개수 (트리거가 유지)
             cursor.execute("""
                 INSERT OR IGNORE INTO log_stats (stat_key, stat_value, updated_at, created_at)
                 VALUES
                     ('total', 0, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP),
                     ('completed', 0, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP),
                     ('failed', 0, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP),
-                    ('average_execution_time', 0, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP)
+                    ('timeout', 0, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP),
+                    ('cache_hits', 0, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP),
+                    ('average_execution_time', 0, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP),
+                    ('execution_time_total', 0, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP),
+                    ('execution_time_count', 0, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP)
             """)
 
             # 태그 테이블 생성 (스크립트 분류 및 검색용)
@@ -237,6 +307,15 @@ class TableManager:
                     ('inactive_scripts', 0, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP)
             """)
 
+            # 스크립트 예약 실행 테이블 생성
+            self._create_schedules_table(cursor)
+
+            # 실행 체크포인트 테이블 생성
+            self._create_execution_checkpoints_table(cursor)
+
+            # 노드 실행 로그 일별 집계 테이블 생성
+            self._create_log_rollups_table(cursor)
+
             # 통계 뷰 생성 (대시보드용)
             self._create_views(cursor)
 
@@ -244,6 +323,275 @@ class TableManager:
         finally:
             conn.close()
 
+    def _create_schedules_table(self, cursor: sqlite3.Cursor) -> None:
+        """스크립트 예약 실행(크론/간격) 테이블 생성"""
+        # schedule_type: cron(cron_expression 사용) / interval(interval_seconds 사용)
+        # missed_run_policy: skip(놓친 실행 건너뜀) / catch_up_once(놓친 실행을 한 번만 보충)
+        # next_run_at: 지터가 적용되지 않은 다음 정시 실행 시각
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS schedules (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                script_id INTEGER NOT NULL,
+                name TEXT,
+                schedule_type TEXT NOT NULL,
+                cron_expression TEXT,
+                interval_seconds INTEGER,
+                jitter_seconds INTEGER NOT NULL DEFAULT 0,
+                missed_run_policy TEXT NOT NULL DEFAULT 'skip',
+                priority INTEGER NOT NULL DEFAULT 0,
+                enabled INTEGER NOT NULL DEFAULT 1,
+                next_run_at TIMESTAMP,
+                last_run_at TIMESTAMP,
+                last_run_id TEXT,
+                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                FOREIGN KEY (script_id) REFERENCES scripts(id) ON DELETE CASCADE
+            )
+        """)
+        cursor.execute("CREATE INDEX IF NOT EXISTS idx_schedules_script_id ON schedules(script_id)")
+        cursor.execute("CREATE INDEX IF NOT EXISTS idx_schedules_enabled_next ON schedules(enabled, next_run_at)")
+
+    def _create_execution_checkpoints_table(self, cursor: sqlite3.Cursor) -> None:
+        """실행 체크포인트 테이블 생성 (서버 재시작 후 실행 재개용)"""
+        # status: running(실행 중) / interrupted(서버 종료로 중단) / failed / cancelled / resuming(재개 대기)
+        # cursor_state: 다음에 실행할 위치 (노드 ID, 방문한 노드, 반복 노드의 반복 횟수/위치) JSON
+        # node_name_map: 노드 이름 → 노드 ID JSON
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS execution_checkpoints (
+                execution_id TEXT PRIMARY KEY,
+                script_id INTEGER NOT NULL,
+                status TEXT NOT NULL DEFAULT 'running',
+                cursor_state TEXT NOT NULL DEFAULT '{}',
+                node_name_map TEXT NOT NULL DEFAULT '{}',
+                sequence INTEGER NOT NULL DEFAULT 0,
+                completed_nodes INTEGER NOT NULL DEFAULT 0,
+                error_message TEXT,
+                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                FOREIGN KEY (script_id) REFERENCES scripts(id) ON DELETE CASCADE
+            )
+        """)
+        cursor.execute(
+            "CREATE INDEX IF NOT EXISTS idx_execution_checkpoints_status ON execution_checkpoints(status, updated_at)"
+        )
+        # 체크포인트에 보존된 노드 결과 (변경된 노드만 증분 저장)
+        # position: 실행 컨텍스트 안에서의 순서 (복원 시 실행 순서 유지)
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS execution_checkpoint_results (
+                execution_id TEXT NOT NULL,
+                node_id TEXT NOT NULL,
+                node_name TEXT,
+                position INTEGER NOT NULL,
+                result TEXT NOT NULL,
+                PRIMARY KEY (execution_id, node_id),
+                FOREIGN KEY (execution_id) REFERENCES execution_checkpoints(execution_id) ON DELETE CASCADE
+            )
+        """)
+
+    def _create_log_rollups_table(self, cursor: sqlite3.Cursor) -> None:
+        """노드 실행 로그 일별 집계 테이블 생성 (보존 기간이 지나 삭제한 로그의 요약)"""
+        # script_id: 스크립트 없이 실행된 로그는 0
+        # timed_count, total_execution_time_ms: 실행 시간이 있는 로그 수와 합계 (캐시 히트 제외, 평균 계산용)
+        # duration_histogram: 실행 시간 구간별 개수 JSON (여러 번 나눠 집계해도 p50/p95를 다시 계산할 수 있도록 보관)
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS node_execution_log_rollups (
+                day TEXT NOT NULL,
+                script_id INTEGER NOT NULL DEFAULT 0,
+                node_type TEXT NOT NULL,
+                total_count INTEGER NOT NULL DEFAULT 0,
+                completed_count INTEGER NOT NULL DEFAULT 0,
+                failed_count INTEGER NOT NULL DEFAULT 0,
+                timeout_count INTEGER NOT NULL DEFAULT 0,
+                cache_hit_count INTEGER NOT NULL DEFAULT 0,
+                timed_count INTEGER NOT NULL DEFAULT 0,
+                total_execution_time_ms INTEGER NOT NULL DEFAULT 0,
+                max_execution_time_ms INTEGER NOT NULL DEFAULT 0,
+                p50_execution_time_ms INTEGER,
+                p95_execution_time_ms INTEGER,
+                duration_histogram TEXT NOT NULL DEFAULT '{}',
+                updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                PRIMARY KEY (day, script_id, node_type)
+            )
+        """)
+        cursor.execute(
+            "CREATE INDEX IF NOT EXISTS idx_log_rollups_script_day ON node_execution_log_rollups(script_id, day DESC)"
+        )
+
+    def _create_node_log_list_indexes(self, cursor: sqlite3.Cursor) -> None:
+        """
+        노드 실행 로그 목록 조회 인덱스 생성
+        목록은 (started_at, id) 내림차순으로 정렬하고 커서 다음 행부터 조회하므로, 필터 컬럼 뒤에 같은 순서로
+        started_at DESC, id DESC를 두어 정렬 없이 인덱스 범위 검색만으로 한 페이지를 읽게 합니다.
+        """
+        cursor.execute(
+            "CREATE INDEX IF NOT EXISTS idx_node_logs_started_id ON node_execution_logs(started_at DESC, id DESC)"
+        )
+        cursor.execute(
+            "CREATE INDEX IF NOT EXISTS idx_node_logs_script_started_id "
+            "ON node_execution_logs(script_id, started_at DESC, id DESC)"
+        )
+        cursor.execute(
+            "CREATE INDEX IF NOT EXISTS idx_node_logs_node_started_id "
+            "ON node_execution_logs(node_id, started_at DESC, id DESC)"
+        )
+        cursor.execute(
+            "CREATE INDEX IF NOT EXISTS idx_node_logs_status_started_id "
+            "ON node_execution_logs(status, started_at DESC, id DESC)"
+        )
+
+    def _create_log_payloads_table(self, cursor: sqlite3.Cursor) -> None:
+        """
+        노드 실행 로그 공유 파라미터 테이블 생성
+        반복 실행되는 노드는 같은 파라미터를 매번 기록하므로, 큰 파라미터는 내용 해시로 한 번만 저장하고
+        로그는 parameters_hash로 참조합니다. (참조하는 로그가 모두 삭제되면 함께 정리)
+        """
+        # data: JSON 텍스트 또는 zlib 압축 BLOB, size: 압축 전 JSON 길이
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS log_payloads (
+                hash TEXT PRIMARY KEY,
+                data BLOB NOT NULL,
+                size INTEGER NOT NULL,
+                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+            )
+        """)
+        cursor.execute(
+            "CREATE INDEX IF NOT EXISTS idx_node_logs_parameters_hash ON node_execution_logs(parameters_hash) "
+            "WHERE parameters_hash IS NOT NULL"
+        )
+
+    def _create_node_log_search_index(self, cursor: sqlite3.Cursor) -> None:
+        """
+        노드 실행 로그 전문 검색 색인(FTS5) 생성
+        노드 이름, 에러 메시지, 스택 트레이스, 결과 중 검색 필드를 색인하며 rowid는 로그 ID와 같습니다.
+        결과는 압축 BLOB일 수 있으므로 로그를 기록하는 쪽이 검색 필드를 search_text 컬럼에 따로 넣습니다.
+        로그 추가/변경은 트리거가 대기열(node_execution_logs_fts_pending)에 모아 기록한 트랜잭션 안에서 색인에 반영하고,
+        로그 삭제(스크립트 삭제로 인한 CASCADE, 보존 정책 정리 포함)는 트리거가 바로 색인에서 지웁니다.
+        """
+        cursor.execute("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'node_execution_logs_fts'")
+        created = cursor.fetchone() is None
+        # prefix: 검색어를 접두어로 찾으므로 짧은 접두어 색인을 함께 만듦 (한국어 조사가 붙은 단어도 검색되도록)
+        cursor.execute("""
+            CREATE VIRTUAL TABLE IF NOT EXISTS node_execution_logs_fts USING fts5(
+                node_name, error_message, error_traceback, result_text,
+                tokenize = 'unicode61 remove_diacritics 2', prefix = '2 3'
+            )
+        """)
+        # 색인할 로그 ID 대기열 (changed: 이미 색인된 로그가 바뀌어 기존 색인을 지워야 하는지)
+        # FTS5는 문장마다 색인을 반영하므로 트리거에서 행마다 색인하면 느려, 트리거는 로그 ID만 모아 두고
+        # 로그를 기록한 쪽이 같은 트랜잭션에서 한 번에 색인에 반영합니다.
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS node_execution_logs_fts_pending (
+                log_id INTEGER NOT NULL,
+                changed INTEGER NOT NULL DEFAULT 0
+            )
+        """)
+        cursor.execute("""
+            CREATE TRIGGER IF NOT EXISTS trg_node_logs_fts_insert AFTER INSERT ON node_execution_logs
+            BEGIN
+                INSERT INTO node_execution_logs_fts_pending (log_id) VALUES (NEW.id);
+            END
+        """)
+        cursor.execute("""
+            CREATE TRIGGER IF NOT EXISTS trg_node_logs_fts_update
+            AFTER UPDATE OF node_name, error_message, error_traceback, search_text ON node_execution_logs
+            BEGIN
+                INSERT INTO node_execution_logs_fts_pending (log_id, changed) VALUES (NEW.id, 1);
+            END
+        """)
+        cursor.execute("""
+            CREATE TRIGGER IF NOT EXISTS trg_node_logs_fts_delete AFTER DELETE ON node_execution_logs
+            BEGIN
+                DELETE FROM node_execution_logs_fts WHERE rowid = OLD.id;
+            END
+        """)
+        if not created:
+            return
+
+        # 기존 로그로 색인 채우기 (색인을 처음 만들 때 한 번만)
+        last_id = 0
+        while True:
+            cursor.execute(
+                """
+                SELECT id, node_name, error_message, error_traceback, result FROM node_execution_logs
+                WHERE id > ? ORDER BY id LIMIT ?
+                """,
+                (last_id, _SEARCH_BACKFILL_BATCH),
+            )
+            rows = cursor.fetchall()
+            if not rows:
+                break
+            cursor.executemany(
+                """
+                INSERT INTO node_execution_logs_fts (rowid, node_name, error_message, error_traceback, result_text)
+                VALUES (?, ?, ?, ?, ?)
+                """,
+                [
+                    (
+                        log_id,
+                        node_name,
+                        error_message,
+                        error_traceback,
+                        result_search_text(decode_payload(result), DEFAULT_SEARCH_RESULT_FIELDS),
+                    )
+                    for log_id, node_name, error_message, error_traceback, result in rows
+                ],
+            )
+            last_id = rows[-1][0]
+
+    def _create_stats_triggers(self, cursor: sqlite3.Cursor) -> None:
+        """
+        통계 트리거 생성
+        로그/스크립트가 추가, 변경, 삭제될 때 log_stats와 dashboard_stats의 값을 같은 트랜잭션에서 증감시켜
+        통계 조회가 기록 수와 관계없이 키 조회만으로 끝나게 합니다. (전체 재계산은 주기적 보정에서만 수행)
+        평균 실행 시간은 트리거가 유지하는 합계/개수로 조회할 때 계산합니다.
+        """
+        triggers = {
+            "trg_node_logs_stats_insert": (
+                "AFTER INSERT ON node_execution_logs",
+                _log_stats_delta("NEW", None, _FIRST_LOG_OF_EXECUTION),
+            ),
+            "trg_node_logs_stats_update": (
+                "AFTER UPDATE OF status, execution_time_ms, cache_hit, error_reason ON node_execution_logs",
+                _log_stats_delta("NEW", "OLD", None),
+            ),
+            "trg_node_logs_stats_delete": (
+                "AFTER DELETE ON node_execution_logs",
+                _log_stats_delta(None, "OLD", f"- {_LAST_LOG_OF_EXECUTION}"),
+            ),
+        }
+        for name, (event, body) in triggers.items():
+            cursor.execute(f"DROP TRIGGER IF EXISTS {name}")
+            cursor.execute(f"CREATE TRIGGER {name} {event} BEGIN {body} END")
+
+        # 대시보드 통계 (전체/비활성 스크립트 개수)
+        script_triggers = {
+            "trg_scripts_stats_insert": (
+                "AFTER INSERT ON scripts",
+                "CASE stat_key WHEN 'total_scripts' THEN 1 "
+                "ELSE CASE WHEN COALESCE(NEW.active, 1) = 0 THEN 1 ELSE 0 END END",
+            ),
+            "trg_scripts_stats_update": (
+                "AFTER UPDATE OF active ON scripts",
+                "CASE stat_key WHEN 'total_scripts' THEN 0 "
+                "ELSE (CASE WHEN COALESCE(NEW.active, 1) = 0 THEN 1 ELSE 0 END) "
+                "- (CASE WHEN COALESCE(OLD.active, 1) = 0 THEN 1 ELSE 0 END) END",
+            ),
+            "trg_scripts_stats_delete": (
+                "AFTER DELETE ON scripts",
+                "CASE stat_key WHEN 'total_scripts' THEN -1 "
+                "ELSE CASE WHEN COALESCE(OLD.active, 1) = 0 THEN -1 ELSE 0 END END",
+            ),
+        }
+        for name, (event, delta) in script_triggers.items():
+            cursor.execute(f"DROP TRIGGER IF EXISTS {name}")
+            cursor.execute(f"""
+                CREATE TRIGGER {name} {event} BEGIN
+                    UPDATE dashboard_stats
+                    SET stat_value = stat_value + {delta}, updated_at = CURRENT_TIMESTAMP
+                    WHERE stat_key IN ('total_scripts', 'inactive_scripts');
+                END
+            """)
+
     def _create_views(self, cursor: sqlite3.Cursor) -> None:
         """성능 최적화를 위한 뷰 생성"""
         # 스크립트 통계 뷰 (대시보드용)
@@ -264,6 +612,43 @@ class TableManager:
             GROUP BY s.id, s.name, s.active, s.last_executed_at
         """)
 
+    def _migrate_node_log_unique_key(self, cursor: sqlite3.Cursor) -> None:
+        """
+        노드 실행 로그에 (execution_id, node_id, attempt) 유니크 인덱스를 생성합니다.
+        인덱스가 없을 때만 실행하며, 먼저 같은 키의 중복 로그를 하나만 남기고 삭제합니다.
+        (완료/실패 로그가 있으면 가장 최근 완료/실패 로그를, 없으면 가장 최근 running 로그를 남김)
+
+        Args:
+            cursor: 데이터베이스 커서
+        """
+        cursor.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'index' AND name = 'idx_node_logs_execution_node_attempt'"
+        )
+        if cursor.fetchone():
+            return
+
+        # 중복 로그 정리 (execution_id가 NULL인 로그는 유니크 검사 대상이 아니므로 제외)
+        cursor.execute("""
+            DELETE FROM node_execution_logs
+            WHERE execution_id IS NOT NULL
+              AND id NOT IN (
+                  SELECT id FROM (
+                      SELECT id, ROW_NUMBER() OVER (
+                          PARTITION BY execution_id, node_id, attempt
+                          ORDER BY CASE WHEN status IN ('completed', 'failed') THEN 0 ELSE 1 END, id DESC
+                      ) AS row_number
+                      FROM node_execution_logs
+                      WHERE execution_id IS NOT NULL
+                  )
+                  WHERE row_number = 1
+              )
+        """)
+
+        cursor.execute(
+            "CREATE UNIQUE INDEX IF NOT EXISTS idx_node_logs_execution_node_attempt "
+            "ON node_execution_logs(execution_id, node_id, attempt)"
+        )
+
     def migrate_tables(self) -> None:
         """기존 테이블에 컬럼 추가 (마이그레이션)"""
         conn = self.connection.get_connection()
@@ -360,8 +745,64 @@ class TableManager:
                         ('total', 0, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP),
                         ('completed', 0, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP),
                         ('failed', 0, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP),
-                        ('average_execution_time', 0, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP)
+                        ('timeout', 0, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP),
+                        ('cache_hits', 0, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP),
+                        ('average_execution_time', 0, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP),
+                        ('execution_time_total', 0, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP),
+                        ('execution_time_count', 0, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP)
+                """)
+
+            # 스크립트 예약 실행 테이블 마이그레이션 (기존 DB에 schedules 테이블이 없으면 생성)
+            with contextlib.suppress(sqlite3.OperationalError):
+                self._create_schedules_table(cursor)
+
+            # 실행 체크포인트 테이블 마이그레이션 (기존 DB에 execution_checkpoints 테이블이 없으면 생성)
+            with contextlib.suppress(sqlite3.OperationalError):
+                self._create_execution_checkpoints_table(cursor)
+
+            # 노드 실행 로그 일별 집계 테이블 마이그레이션 (기존 DB에 node_execution_log_rollups 테이블이 없으면 생성)
+            with contextlib.suppress(sqlite3.OperationalError):
+                self._create_log_rollups_table(cursor)
+
+            # 노드 실행 로그 마이그레이션 (attempt 컬럼 추가, 중복 로그 정리 후 유니크 인덱스 생성)
+            with contextlib.suppress(sqlite3.OperationalError):
+                cursor.execute("ALTER TABLE node_execution_logs ADD COLUMN attempt INTEGER NOT NULL DEFAULT 1")
+            self._migrate_node_log_unique_key(cursor)
+
+            # 노드 실행 로그 페이로드 마이그레이션 (공유 파라미터 참조, 통계용 결과 값 컬럼 추가)
+            with contextlib.suppress(sqlite3.OperationalError):
+                cursor.execute("ALTER TABLE node_execution_logs ADD COLUMN parameters_hash TEXT")
+            with contextlib.suppress(sqlite3.OperationalError):
+                cursor.execute("ALTER TABLE node_execution_logs ADD COLUMN cache_hit INTEGER NOT NULL DEFAULT 0")
+                cursor.execute("ALTER TABLE node_execution_logs ADD COLUMN error_reason TEXT")
+                # 기존 로그의 결과 JSON에서 통계용 값을 채움 (컬럼을 처음 추가할 때 한 번만)
+                cursor.execute("""
+                    UPDATE node_execution_logs
+                    SET cache_hit = CASE WHEN json_extract(result, '$.meta.cache_hit') = 1 THEN 1 ELSE 0 END,
+                        error_reason = json_extract(result, '$.error.reason')
+                    WHERE json_valid(result)
+                      AND (json_extract(result, '$.meta.cache_hit') = 1
+                           OR json_type(result, '$.error.reason') = 'text')
                 """)
+            self._create_log_payloads_table(cursor)
+
+            # 전문 검색 색인 (결과 검색 필드 컬럼 추가, 색인을 처음 만들 때 기존 로그로 채움)
+            with contextlib.suppress(sqlite3.OperationalError):
+                cursor.execute("ALTER TABLE node_execution_logs ADD COLUMN search_text TEXT")
+            self._create_node_log_search_index(cursor)
+
+            # 목록 조회 인덱스 마이그레이션 ((started_at, id) 정렬 인덱스로 대체된 이전 인덱스 삭제)
+            self._create_node_log_list_indexes(cursor)
+            for index_name in (
+                "idx_node_logs_node_id",
+                "idx_node_logs_status",
+                "idx_node_logs_started_at",
+                "idx_node_logs_script_started",
+            ):
+                cursor.execute(f"DROP INDEX IF EXISTS {index_name}")
+
+            # 통계 트리거 (정의가 바뀔 수 있으므로 초기화할 때마다 다시 생성)
+            self._create_stats_triggers(cursor)
 
             conn.commit()
         finally:
@@ -3,7 +3,7 @@ from pathlib import Path
 
 from config.server_config import settings
 
-from .log_manager import LogManager
+from .log_manager import LogManager, parse_module_levels
 
 # server_config에서 로그 디렉토리 설정 가져오기 (server 폴더 기준 상대 경로)
 log_dir = settings.LOG_DIR
@@ -16,6 +16,12 @@ log_directory = str(server_dir / log_dir)
 # 디렉토리가 없으면 생성
 os.makedirs(log_directory, exist_ok=True)
 
-log_manager = LogManager(directory=log_directory)
+log_manager = LogManager(
+    directory=log_directory,
+    max_bytes=settings.LOG_FILE_MAX_BYTES,
+    backup_count=settings.LOG_FILE_BACKUP_COUNT,
+    rotate_when=settings.LOG_FILE_ROTATE_WHEN,
+    module_levels=parse_module_levels(settings.LOG_MODULE_LEVELS),
+)
 
 __all__ = ["log_manager"]
@@ -3,9 +3,11 @@ LogManager Module
 
 싱글톤 패턴으로 설계되어 로그 설정을 중앙에서 관리하며, 다음과 같은 주요 기능을 포함합니다:
 
-- 로그 파일 생성 및 관리
-- 컬러 로그 포맷 지원
-- 오래된 로그 파일 자동 정리
+- 비동기 로그 출력: 로거는 QueueHandler로 레코드를 큐에 넣기만 하고, 콘솔/파일 출력은 QueueListener 스레드에서 처리
+  (요청 처리 스레드와 이벤트 루프가 파일/콘솔 I/O를 기다리지 않음)
+- 로그 파일 회전: 파일 크기가 한도를 넘거나 날짜(또는 시간)가 바뀌면 새 파일로 교체하고 지정한 개수만 보관
+- 모듈별 로그 레벨: 특정 모듈만 더 자세히(또는 덜) 출력 (예: "services.action_service=DEBUG,db=WARNING")
+- 컬러 로그 포맷 지원 (콘솔)
 
 사용 예시:
 
@@ -16,16 +18,141 @@ LogManager Module
     log_manager.logger.hr("Section Start", level=2)
 """
 
-from datetime import datetime
-import glob
+import atexit
+from datetime import datetime, timedelta
 import logging
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 import os
 from pathlib import Path
-import sys
+import queue
+import time
 from typing import Optional
 
 import colorlog
 
+# 로그 포맷 (콘솔은 레벨별 색상, 파일은 색상 코드 없이 같은 형식)
+_LOG_FORMAT = "[%(asctime)s.%(msecs)03d][%(levelname).1s][%(filename)s(%(funcName)s):%(lineno)d] %(message)s"
+_COLOR_LOG_FORMAT = (
+    "[%(log_color)s%(asctime)s.%(msecs)03d][%(levelname).1s][%(filename)s(%(funcName)s):%(lineno)d] %(message)s"
+)
+_DATE_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+# 로그 파일 이름 (회전한 파일은 server.log.1, server.log.2, ... 순으로 오래됨)
+_LOG_FILE_NAME = "server.log"
+
+# 서버 모듈 경로 계산 기준 (server 폴더)
+_SERVER_DIR = Path(__file__).resolve().parent.parent
+
+
+def parse_module_levels(raw: str) -> dict[str, int]:
+    """
+    "services.action_service=DEBUG,db=WARNING" 형식의 모듈별 로그 레벨 문자열을 파싱합니다.
+
+    Args:
+        raw: 모듈별 로그 레벨 문자열 (모듈은 server 폴더 기준 점 경로, 하위 모듈에도 적용)
+
+    Returns:
+        모듈 이름별 로그 레벨 (잘못된 항목은 무시)
+    """
+    levels: dict[str, int] = {}
+    for item in raw.split(","):
+        name, _, level_name = item.partition("=")
+        level = logging.getLevelName(level_name.strip().upper())
+        if name.strip() and isinstance(level, int):
+            levels[name.strip()] = level
+    return levels
+
+
+class ModuleLevelFilter(logging.Filter):
+    """
+    로그를 남긴 모듈별로 로그 레벨을 적용하는 필터
+    모든 모듈이 같은 로거를 쓰므로, 레코드의 파일 경로에서 모듈 이름을 구해 가장 길게 일치하는 설정의 레벨을 적용합니다.
+    """
+
+    def __init__(self, default_level: int, module_levels: dict[str, int]) -> None:
+        """
+        ModuleLevelFilter 초기화
+
+        Args:
+            default_level: 설정에 없는 모듈의 로그 레벨
+            module_levels: 모듈 이름별 로그 레벨
+        """
+        super().__init__()
+        self.default_level = default_level
+        self.module_levels = module_levels
+        # 파일 경로별 레벨 캐시 (같은 파일의 로그는 모듈 이름을 다시 계산하지 않음)
+        self._levels_by_path: dict[str, int] = {}
+
+    def _level_for(self, pathname: str) -> int:
+        """파일 경로의 모듈에 적용할 로그 레벨"""
+        level = self._levels_by_path.get(pathname)
+        if level is None:
+            try:
+                module = ".".join(Path(pathname).resolve().relative_to(_SERVER_DIR).with_suffix("").parts)
+            except ValueError:
+                module = Path(pathname).stem
+            level = self.default_level
+            matched = ""
+            for name, module_level in self.module_levels.items():
+                if (module == name or module.startswith(f"{name}.")) and len(name) > len(matched):
+                    level, matched = module_level, name
+            self._levels_by_path[pathname] = level
+        return level
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        """레코드를 남긴 모듈의 로그 레벨 이상인지 확인"""
+        return record.levelno >= self._level_for(record.pathname)
+
+
+class RotatingLogFileHandler(RotatingFileHandler):
+    """
+    크기와 시간으로 회전하는 로그 파일 핸들러
+    파일이 max_bytes를 넘거나 회전 시각(자정 또는 정시)이 지나면 server.log.1, server.log.2, ...로 밀어내고
+    backup_count개까지만 보관합니다.
+    """
+
+    def __init__(self, filename: str, max_bytes: int, backup_count: int, rotate_when: str) -> None:
+        """
+        RotatingLogFileHandler 초기화
+
+        Args:
+            filename: 로그 파일 경로
+            max_bytes: 파일 최대 크기 (바이트, 0이면 크기로 회전하지 않음)
+            backup_count: 보관할 이전 로그 파일 수
+            rotate_when: 시간 회전 주기 ("midnight": 매일 자정, "hour": 매 정시, 빈 값: 시간으로 회전하지 않음)
+        """
+        super().__init__(filename, maxBytes=max_bytes, backupCount=backup_count, encoding="utf-8")
+        self.rotate_when = rotate_when
+        # 재시작 전 마지막으로 기록한 시각 기준으로 다음 회전 시각 계산 (지난 날짜 파일은 첫 로그에서 바로 회전)
+        last_write = os.path.getmtime(filename) if os.path.exists(filename) else time.time()
+        self.rollover_at = self._next_rollover_at(last_write)
+
+    def _next_rollover_at(self, timestamp: float) -> float | None:
+        """timestamp 다음 회전 시각 (시간으로 회전하지 않으면 None)"""
+        current = datetime.fromtimestamp(timestamp)
+        if self.rotate_when == "hour":
+            return (current.replace(minute=0, second=0, microsecond=0) + timedelta(hours=1)).timestamp()
+        if self.rotate_when == "midnight":
+            return datetime.combine(current.date() + timedelta(days=1), datetime.min.time()).timestamp()
+        return None
+
+    def shouldRollover(self, record: logging.LogRecord) -> bool:
+        """회전 시각이 지났거나 파일이 최대 크기를 넘는지 확인"""
+        if self.rollover_at is not None and record.created >= self.rollover_at:
+            if self.stream is None:
+                self.stream = self._open()
+            self.stream.seek(0, 2)
+            if self.stream.tell() > 0:
+                return True
+            # 빈 파일은 회전하지 않고 다음 회전 시각만 갱신
+            self.rollover_at = self._next_rollover_at(record.created)
+        return bool(super().shouldRollover(record))
+
+    def doRollover(self) -> None:
+        """파일을 회전하고 다음 회전 시각 갱신"""
+        super().doRollover()
+        self.rollover_at = self._next_rollover_at(time.time())
+
 
 class LogManager:
     """
@@ -41,13 +168,23 @@ class LogManager:
             cls._instance = super().__new__(cls)
         return cls._instance
 
-    def __init__(self, directory: str | None = None, max_files: int = 10) -> None:
+    def __init__(
+        self,
+        directory: str | None = None,
+        max_bytes: int = 10 * 1024 * 1024,
+        backup_count: int = 10,
+        rotate_when: str = "midnight",
+        module_levels: dict[str, int] | None = None,
+    ) -> None:
         """
         LogManager 초기화
 
         Args:
             directory (str, optional): 로그 파일을 저장할 디렉토리. None이면 server/log/logs 사용
-            max_files (int): 유지할 최대 로그 파일 개수 (기본값: 10)
+            max_bytes (int): 로그 파일 최대 크기 (바이트, 넘으면 회전, 0이면 크기로 회전하지 않음)
+            backup_count (int): 보관할 이전 로그 파일 수 (기본값: 10)
+            rotate_when (str): 시간 회전 주기 ("midnight", "hour", 빈 값이면 시간으로 회전하지 않음)
+            module_levels (dict, optional): 모듈별 로그 레벨 (예: {"services.action_service": logging.DEBUG})
         """
         if not hasattr(self, "initialized"):  # 이 인스턴스가 초기화되었는지 확인
             # directory가 지정되지 않으면 server/log/logs 디렉토리 사용
@@ -70,11 +207,14 @@ class LogManager:
             log_level_str = settings.LOG_LEVEL
             self.log_level = getattr(logging, log_level_str.upper(), logging.INFO)
 
-            self.max_files = max_files
+            self.max_bytes = max(0, max_bytes)
+            self.backup_count = max(0, backup_count)
+            self.rotate_when = rotate_when.strip().lower()
+            self.module_levels = dict(module_levels or {})
             self._timestamp = self._init_timestamp()
+            self._listener: QueueListener | None = None
             self.logger = self._init_logger()
             self._bind_hr_to_logger()
-            self.clean_up_logs()
             self.initialized = True
 
     def _init_timestamp(self) -> str:
@@ -82,7 +222,7 @@ class LogManager:
         return datetime.now().strftime("%Y%m%d-%H%M%S")
 
     def _init_logger(self) -> logging.Logger:
-        """로거 초기화"""
+        """로거 초기화 (로거에는 QueueHandler만 달고, 콘솔/파일 핸들러는 QueueListener 스레드에서 실행)"""
         logger = logging.getLogger("Automation")
 
         # 기존 핸들러가 있으면 제거 (중복 방지)
@@ -97,9 +237,9 @@ class LogManager:
         }
 
         formatter = colorlog.ColoredFormatter(
-            "[%(log_color)s%(asctime)s.%(msecs)03d][%(levelname).1s][%(filename)s(%(funcName)s):%(lineno)d] %(message)s",
+            _COLOR_LOG_FORMAT,
             log_colors=log_colors_config,
-            datefmt="%Y-%m-%d %H:%M:%S",
+            datefmt=_DATE_FORMAT,
             reset=True,
             secondary_log_colors={},
         )
@@ -107,27 +247,44 @@ class LogManager:
         # 콘솔 핸들러 (컬러 로그)
         stream_handler = logging.StreamHandler()
         stream_handler.setFormatter(formatter)
-        logger.addHandler(stream_handler)
 
-        # 로그 파일명 생성
-        script_name = os.path.basename(sys.argv[0]) if sys.argv else "unknown"
-        logfile = f"{self._timestamp}_{script_name}.log"
-        logpath = Path(self.directory)
+        # 파일 핸들러 (크기/시간 회전, 색상 코드 없이 기록)
+        file_handler = RotatingLogFileHandler(
+            str(Path(self.directory) / _LOG_FILE_NAME),
+            max_bytes=self.max_bytes,
+            backup_count=self.backup_count,
+            rotate_when=self.rotate_when,
+        )
+        file_handler.setFormatter(logging.Formatter(_LOG_FORMAT, datefmt=_DATE_FORMAT))
+
+        # 로거 쪽은 레코드를 큐에 넣기만 함 (모듈별 레벨 필터도 큐에 넣기 전에 적용)
+        log_queue: queue.SimpleQueue[logging.LogRecord] = queue.SimpleQueue()
+        queue_handler = QueueHandler(log_queue)
+        queue_handler.addFilter(ModuleLevelFilter(self.log_level, self.module_levels))
+        logger.addHandler(queue_handler)
 
-        # 파일 핸들러
-        file_handler = logging.FileHandler(logpath / logfile, encoding="utf-8")
-        file_handler.setFormatter(formatter)
-        file_handler.setLevel(logging.DEBUG)
-        logger.addHandler(file_handler)
+        if self._listener is not None:
+            self._listener.stop()
+        self._listener = QueueListener(log_queue, stream_handler, file_handler, respect_handler_level=True)
+        self._listener.start()
+        # 프로세스 종료 시 큐에 남은 로그를 모두 기록하고 파일을 닫음
+        atexit.register(self.shutdown)
 
         logger.propagate = False
-        # 설정된 로그 레벨 적용
-        logger.setLevel(self.log_level)
-        stream_handler.setLevel(self.log_level)
+        # 로거 레벨은 모듈별 레벨 중 가장 낮은 레벨까지 허용 (모듈별 판단은 필터에서)
+        logger.setLevel(min([self.log_level, *self.module_levels.values()]))
         logger.debug("Logger initialized")
 
         return logger
 
+    def shutdown(self) -> None:
+        """큐에 남은 로그를 모두 기록하고 출력 스레드를 멈춥니다. (프로세스 종료 시 자동 호출)"""
+        listener, self._listener = self._listener, None
+        if listener is not None:
+            listener.stop()
+            for handler in listener.handlers:
+                handler.close()
+
     def hr(self, message: str = "", level: int = 1) -> None:
         """
         구분선을 출력하는 메서드.
@@ -152,34 +309,6 @@ class LogManager:
         """시작 타임스탬프 반환"""
         return self._timestamp
 
-    def clean_up_logs(self) -> None:
-        """
-        오래된 로그 파일 정리
-
-        설정된 디렉토리에서 최대 파일 개수를 초과하는 오래된 로그 파일을 삭제합니다.
-        """
-        try:
-            # 디렉토리 내의 특정 패턴의 파일 목록을 가져옵니다.
-            files = glob.glob(os.path.join(self.directory, "*.log"))
-
-            if not files:
-                return
-
-            # 파일을 생성 시간에 따라 정렬합니다.
-            files.sort(key=os.path.getmtime)
-
-            # 지정된 개수를 초과하는 파일이 있다면, 가장 오래된 파일부터 삭제합니다.
-            while len(files) > self.max_files:
-                file_to_remove = files.pop(0)
-                try:
-                    os.remove(file_to_remove)
-                    self.logger.debug(f"오래된 로그 파일 삭제: {os.path.basename(file_to_remove)}")
-                except OSError as e:
-                    self.logger.warning(f"로그 파일 삭제 실패: {file_to_remove}, 에러: {e}")
-        except Exception as e:
-            # clean_up_logs에서 에러가 발생해도 로거 초기화는 계속 진행
-            print(f"[WARNING] 로그 정리 중 에러 발생: {e}")
-
 
 if __name__ == "__main__":
     # 테스트 코드
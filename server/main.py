@@ -10,17 +10,26 @@ import uvicorn
 from api import (
     action_node_router,
     action_router,
+    checkpoint_router,
     config_router,
     dashboard_router,
     log_router,
+    macro_router,
     node_router,
+    queue_router,
+    schedule_router,
     screenshot_router,
     script_router,
     state_router,
 )
 from config.server_config import settings
 from db.database import db_manager
+from db.log_payload_codec import LogPayloadPolicy, parse_field_limits, parse_field_paths
 from log import log_manager
+from services.log_retention import log_retention
+from services.log_sink import log_sink
+from services.script_scheduler import script_scheduler
+from services.stats_reconciler import stats_reconciler
 
 # 실행 명령어
 # cd server
@@ -56,6 +65,21 @@ def initialize_database() -> None:
         db_manager.init_database()  # 테이블 생성 및 마이그레이션
         logger.info("✅ 데이터베이스 테이블 생성/마이그레이션 완료")
 
+        # 노드 실행 로그 파라미터/결과 저장 정책 (잘라내기, 압축, 공유 파라미터 기준)
+        db_manager.node_execution_logs.payload_policy = LogPayloadPolicy(
+            compress_threshold=settings.LOG_PAYLOAD_COMPRESS_THRESHOLD_BYTES,
+            max_string_chars=settings.LOG_PAYLOAD_MAX_STRING_CHARS,
+            max_list_items=settings.LOG_PAYLOAD_MAX_LIST_ITEMS,
+            field_limits=parse_field_limits(settings.LOG_PAYLOAD_FIELD_LIMITS),
+            dedup_min_bytes=settings.LOG_PAYLOAD_DEDUP_MIN_BYTES,
+            search_result_fields=parse_field_paths(settings.LOG_SEARCH_RESULT_FIELDS),
+        )
+
+        # 이전 서버 프로세스에서 실행 중이던 체크포인트는 중단 상태로 표시 (재개 API로 이어서 실행 가능)
+        interrupted = db_manager.execution_checkpoints.mark_interrupted()
+        if interrupted:
+            logger.info(f"중단된 실행 체크포인트 {interrupted}개 발견 (/api/checkpoints에서 재개 가능)")
+
         if is_new_db:
             # 새 데이터베이스인 경우: 기본 데이터 삽입
             logger.info(f"새 데이터베이스 파일 생성됨: {db_path}")
@@ -154,9 +178,25 @@ async def startup_event() -> None:
     """서버 시작 시 실행되는 이벤트 핸들러"""
     logger.info("서버 시작 이벤트 실행 중...")
     initialize_database()
+    await log_sink.start()
+    await stats_reconciler.start()
+    await log_retention.start()
+    if settings.SCHEDULER_ENABLED:
+        await script_scheduler.start()
     logger.info("서버 시작 이벤트 완료")
 
 
+# 서버 종료 시 예약 실행 스케줄러 중지
+@app.on_event("shutdown")
+async def shutdown_event() -> None:
+    """서버 종료 시 실행되는 이벤트 핸들러"""
+    await script_scheduler.stop()
+    await stats_reconciler.stop()
+    await log_retention.stop()
+    # 큐에 남은 노드 실행 로그를 모두 기록한 뒤 종료
+    await log_sink.stop()
+
+
 # CORS 설정
 app.add_middleware(
     CORSMiddleware,
@@ -175,7 +215,11 @@ app.include_router(config_router)
 app.include_router(action_node_router)
 app.include_router(dashboard_router)
 app.include_router(log_router)
+app.include_router(queue_router)
+app.include_router(schedule_router)
+app.include_router(checkpoint_router)
 app.include_router(screenshot_router)
+app.include_router(macro_router)
 
 # 정적 파일 서빙 설정 (개발 환경)
 ui_path = os.path.join(os.path.dirname(__file__), "..", "UI", "src")
@@ -6,7 +6,9 @@ from .action_models import ActionRequest, ActionResponse, NodeExecutionRequest
 from .folder_path_models import FolderPathParams
 from .http_api_request_models import HttpApiRequestParams
 from .log_models import NodeExecutionLogRequest, NodeExecutionLogResponse
+from .macro_models import MacroRecordStartRequest, MacroRecordStopRequest
 from .process_focus_models import ProcessFocusParams
+from .queue_models import QueueEnqueueRequest, QueueReorderRequest
 from .response_models import (
     BaseResponse,
     ErrorResponse,
@@ -15,7 +17,8 @@ from .response_models import (
     StandardResponseType,
     SuccessResponse,
 )
-from .script_models import ScriptCreateRequest, ScriptResponse, ScriptUpdateRequest
+from .schedule_models import ScheduleCreateRequest, ScheduleUpdateRequest
+from .script_models import ScriptCreateRequest, ScriptDryRunRequest, ScriptResponse, ScriptUpdateRequest
 
 __all__ = [
     "ActionRequest",
@@ -25,12 +28,19 @@ __all__ = [
     "FolderPathParams",
     "HttpApiRequestParams",
     "ListResponse",
+    "MacroRecordStartRequest",
+    "MacroRecordStopRequest",
     "NodeExecutionLogRequest",
     "NodeExecutionLogResponse",
     "NodeExecutionRequest",
     "PaginatedResponse",
     "ProcessFocusParams",
+    "QueueEnqueueRequest",
+    "QueueReorderRequest",
+    "ScheduleCreateRequest",
+    "ScheduleUpdateRequest",
     "ScriptCreateRequest",
+    "ScriptDryRunRequest",
     "ScriptResponse",
     "ScriptUpdateRequest",
     "StandardResponseType",
@@ -44,3 +44,4 @@ class NodeExecutionRequest(BaseModel):
     repeat_info: dict[str, Any] | None = None  # 반복 노드 정보 (반복 횟수, 현재 반복 번호 등)
     execution_id: str | None = None  # 실행 ID (반복 노드 실행 시 같은 execution_id 사용)
     script_id: int | None = None  # 스크립트 ID (반복 노드 실행 시 같은 script_id 사용)
+    timeout_seconds: float | None = Field(None, gt=0)  # 워크플로우 제한 시간 (초, 각 노드는 남은 시간 안에서 실행)
@@ -13,6 +13,7 @@ class NodeExecutionLogRequest(BaseModel):
     execution_id: str | None = Field(None, description="워크플로우 실행 ID (같은 실행의 노드들을 그룹화)")
     script_id: int | None = Field(None, description="스크립트 ID (선택사항)")
     node_id: str = Field(..., min_length=1, description="노드 ID")
+    attempt: int = Field(1, ge=1, description="같은 실행 안에서 노드의 실행 번호 (기본 1)")
     node_type: str = Field(..., min_length=1, description="노드 타입")
     node_name: str | None = Field(None, description="노드 이름/제목")
     status: str = Field(..., description="실행 상태 (running, completed, failed)")
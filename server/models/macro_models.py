@@ -0,0 +1,23 @@
+"""
+매크로 녹화 관련 모델들
+"""
+
+from pydantic import BaseModel, Field
+
+
+class MacroRecordStartRequest(BaseModel):
+    """매크로 녹화 시작 요청 모델"""
+
+    stop_key: str | None = Field(
+        "esc", description="누르면 녹화를 끝내는 키 (이 키 입력은 녹화하지 않음, 없으면 중지 API로만 종료)"
+    )
+    move_interval_seconds: float | None = Field(
+        None, ge=0, description="이 간격 안의 마우스 이동은 하나로 합침 (초, 없으면 서버 설정값)"
+    )
+
+
+class MacroRecordStopRequest(BaseModel):
+    """매크로 녹화 중지 및 저장 요청 모델"""
+
+    name: str = Field(..., min_length=1, max_length=100, pattern=r"^[\w\-. ]+$", description="저장할 매크로 이름")
+    overwrite: bool = Field(False, description="같은 이름의 매크로가 있으면 덮어쓸지 여부")
@@ -0,0 +1,22 @@
+"""
+실행 큐 관련 모델들
+"""
+
+from pydantic import BaseModel, Field
+
+
+class QueueEnqueueRequest(BaseModel):
+    """스크립트 실행 큐 등록 요청 모델"""
+
+    priority: int = Field(0, description="우선순위 (값이 클수록 먼저 실행)")
+    timeout_seconds: float | None = Field(None, gt=0, description="실행 제한 시간 (초, 실행 시작부터 계산)")
+    checkpoint_interval_seconds: float | None = Field(
+        None, ge=0, description="체크포인트 저장 최소 간격 (초, 0이면 노드마다 저장, 없으면 서버 설정값)"
+    )
+
+
+class QueueReorderRequest(BaseModel):
+    """대기 중인 실행 순서/우선순위 변경 요청 모델"""
+
+    position: int | None = Field(None, ge=0, description="새 위치 (0부터 시작)")
+    priority: int | None = Field(None, description="새 우선순위")
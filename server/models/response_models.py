@@ -47,5 +47,11 @@ class PaginatedResponse(ListResponse):
     total_pages: int
 
 
+class CursorListResponse(ListResponse):
+    """커서 페이지네이션 응답 모델 - 다음 페이지 커서를 포함한 리스트 응답"""
+
+    next_cursor: str | None = None
+
+
 # 타입 별칭: 성공 또는 에러 응답을 반환하는 경우 사용
 StandardResponseType = SuccessResponse | ErrorResponse
@@ -0,0 +1,97 @@
+"""
+스크립트 예약 실행 관련 모델들
+"""
+
+from pydantic import BaseModel, Field, field_validator
+
+from utils.cron_expression import CronExpression
+
+SCHEDULE_TYPES = ("cron", "interval")
+MISSED_RUN_POLICIES = ("skip", "catch_up_once")
+
+
+def _validate_schedule_type(v: str | None) -> str | None:
+    """예약 방식 검증"""
+    if v is not None and v not in SCHEDULE_TYPES:
+        raise ValueError(f"예약 방식은 다음 중 하나여야 합니다: {', '.join(SCHEDULE_TYPES)}")
+    return v
+
+
+def _validate_missed_run_policy(v: str | None) -> str | None:
+    """놓친 실행 처리 정책 검증"""
+    if v is not None and v not in MISSED_RUN_POLICIES:
+        raise ValueError(f"놓친 실행 처리 정책은 다음 중 하나여야 합니다: {', '.join(MISSED_RUN_POLICIES)}")
+    return v
+
+
+def _validate_cron_expression(v: str | None) -> str | None:
+    """크론 표현식 문법 검증"""
+    if v is not None:
+        CronExpression(v)
+        return v.strip()
+    return v
+
+
+class ScheduleCreateRequest(BaseModel):
+    """예약 실행 생성 요청 모델"""
+
+    script_id: int = Field(..., ge=1, description="실행할 스크립트 ID")
+    name: str | None = Field(None, max_length=255, description="예약 이름")
+    schedule_type: str = Field(..., description="예약 방식 (cron, interval)")
+    cron_expression: str | None = Field(None, description="크론 표현식 (분 시 일 월 요일)")
+    interval_seconds: int | None = Field(None, ge=1, description="실행 간격 (초)")
+    jitter_seconds: int = Field(0, ge=0, description="실행 시각에 더할 최대 랜덤 지연 (초)")
+    missed_run_policy: str = Field("skip", description="놓친 실행 처리 정책 (skip, catch_up_once)")
+    priority: int = Field(0, description="실행 큐 우선순위")
+    enabled: bool = Field(True, description="활성화 여부")
+
+    @field_validator("schedule_type")
+    @classmethod
+    def validate_schedule_type(cls, v: str) -> str:
+        """예약 방식 검증"""
+        _validate_schedule_type(v)
+        return v
+
+    @field_validator("missed_run_policy")
+    @classmethod
+    def validate_missed_run_policy(cls, v: str) -> str:
+        """놓친 실행 처리 정책 검증"""
+        _validate_missed_run_policy(v)
+        return v
+
+    @field_validator("cron_expression")
+    @classmethod
+    def validate_cron_expression(cls, v: str | None) -> str | None:
+        """크론 표현식 문법 검증"""
+        return _validate_cron_expression(v)
+
+
+class ScheduleUpdateRequest(BaseModel):
+    """예약 실행 수정 요청 모델 (지정한 필드만 수정)"""
+
+    name: str | None = Field(None, max_length=255)
+    schedule_type: str | None = None
+    cron_expression: str | None = None
+    interval_seconds: int | None = Field(None, ge=1)
+    jitter_seconds: int | None = Field(None, ge=0)
+    missed_run_policy: str | None = None
+    priority: int | None = None
+    enabled: bool | None = None
+
+    @field_validator("schedule_type")
+    @classmethod
+    def validate_schedule_type(cls, v: str | None) -> str | None:
+        """예약 방식 검증"""
+        return _validate_schedule_type(v)
+
+    @field_validator("missed_run_policy")
+    @classmethod
+    def validate_missed_run_policy(cls, v: str | None) -> str | None:
+        """놓친 실행 처리 정책 검증"""
+        return _validate_missed_run_policy(v)
+
+    @field_validator("cron_expression")
+    @classmethod
+    def validate_cron_expression(cls, v: str | None) -> str | None:
+        """크론 표현식 문법 검증"""
+        return _validate_cron_expression(v)
@@ -4,7 +4,7 @@
 
 from typing import Any
 
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 
 
 class ScriptCreateRequest(BaseModel):
@@ -33,3 +33,13 @@ class ScriptResponse(BaseModel):
     updated_at: str
     nodes: list[dict[str, Any]]
     connections: list[dict[str, Any]]
+
+
+class ScriptDryRunRequest(BaseModel):
+    """스크립트 드라이런 요청 모델"""
+
+    replay_frames_dir: str | None = Field(
+        None, description="화면 캡처 대신 재생할 프레임 이미지 폴더 (없으면 이미지 찾기를 성공으로 가정)"
+    )
+    loop_frames: bool = Field(False, description="마지막 프레임 이후 처음 프레임부터 반복할지 여부")
+    timeout_seconds: float | None = Field(None, gt=0, description="실행 제한 시간 (가상 시간 기준 초)")
@@ -7,7 +7,7 @@ from typing import Any
 
 from nodes.base_node import BaseNode
 from nodes.node_executor_wrapper import NodeExecutor
-from utils import get_parameter
+from utils import get_dry_run, get_parameter
 
 
 class ClickNode(BaseNode):
@@ -30,4 +30,9 @@ class ClickNode(BaseNode):
         x = get_parameter(parameters, "x", default=0)
         y = get_parameter(parameters, "y", default=0)
 
+        # 드라이런 실행이면 클릭 동작을 기록
+        dry_run = get_dry_run(parameters)
+        if dry_run is not None:
+            dry_run.record_action("click", x=x, y=y)
+
         return {"action": "click", "status": "completed", "output": {"x": x, "y": y}}
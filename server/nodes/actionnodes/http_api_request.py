@@ -12,7 +12,7 @@ import aiohttp
 from models.http_api_request_models import HttpApiRequestParams
 from nodes.base_node import BaseNode
 from nodes.node_executor_wrapper import NodeExecutor
-from utils import create_failed_result
+from utils import ExecutionCancelledError, create_failed_result, get_cancel_token
 
 
 class HttpApiRequestNode(BaseNode):
@@ -65,7 +65,8 @@ class HttpApiRequestNode(BaseNode):
             if "Content-Type" not in headers:
                 headers["Content-Type"] = "application/json"
 
-        try:
+        async def send_request() -> dict[str, Any]:
+            """요청 전송 및 응답 처리 (실행 취소 시 중단될 수 있도록 별도 코루틴으로 분리)"""
             async with (
                 aiohttp.ClientSession() as session,
                 session.request(
@@ -101,6 +102,9 @@ class HttpApiRequestNode(BaseNode):
                     },
                 }
 
+        try:
+            # 실행이 취소되면 요청을 즉시 중단 (연결/응답 대기 포함)
+            return await get_cancel_token(parameters).run(send_request())
         except aiohttp.ClientError as e:
             return create_failed_result(
                 action="http-api-request",
@@ -112,6 +116,9 @@ class HttpApiRequestNode(BaseNode):
             return create_failed_result(
                 action="http-api-request", reason="timeout", message=f"요청 시간 초과: {timeout}초"
             )
+        except ExecutionCancelledError:
+            # 실행 취소는 NodeExecutor에서 처리
+            raise
         except Exception as e:
             import traceback
 
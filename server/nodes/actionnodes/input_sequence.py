@@ -0,0 +1,104 @@
+"""
+입력 시퀀스 노드
+여러 입력 이벤트(이동/클릭/키/드래그/스크롤 등)를 정해진 간격으로 한 번에 실행하는 노드입니다.
+"""
+
+import asyncio
+import json
+from typing import Any
+
+from automation.input_backend import PacingPolicy, RecordingInputBackend, create_input_backend
+from automation.input_sequence import InputSequence, input_sequencer
+from log import log_manager
+from nodes.base_node import BaseNode
+from nodes.node_executor_wrapper import NodeExecutor
+from utils import create_failed_result, get_cancel_token, get_dry_run, get_parameter
+
+logger = log_manager.logger
+
+
+def _parse_events(raw_events: Any) -> list[dict[str, Any]]:
+    """
+    events 파라미터를 이벤트 목록으로 변환합니다.
+
+    Args:
+        raw_events: 이벤트 목록 또는 JSON 배열 문자열
+
+    Returns:
+        이벤트 목록
+
+    Raises:
+        ValueError: JSON 배열이 아닌 경우
+    """
+    if isinstance(raw_events, str):
+        try:
+            raw_events = json.loads(raw_events) if raw_events.strip() else []
+        except json.JSONDecodeError as e:
+            raise ValueError(f"events가 올바른 JSON이 아닙니다: {e!s}") from e
+    if not isinstance(raw_events, list):
+        raise ValueError("events는 JSON 배열이어야 합니다.")
+    return raw_events
+
+
+class InputSequenceNode(BaseNode):
+    """입력 시퀀스 노드 클래스"""
+
+    @staticmethod
+    @NodeExecutor("input-sequence")
+    async def execute(parameters: dict[str, Any]) -> dict[str, Any]:
+        """
+        입력 이벤트 목록을 입력 작업 스레드에서 정해진 시각에 맞춰 실행합니다.
+
+        Args:
+            parameters: 노드 파라미터
+                - events: 입력 이벤트 목록 (JSON 배열, 형식은 automation/input_sequence.py 참조)
+                - default_delay: 간격(delay/at)이 없는 이벤트 사이의 대기 시간 (초, 없으면 입력 페이싱 설정)
+
+        Returns:
+            실행 결과 딕셔너리 (output: 실행한 이벤트 수, 예정/실제 길이, 드리프트 통계)
+        """
+        try:
+            events = _parse_events(get_parameter(parameters, "events", default=[]))
+            default_delay = get_parameter(parameters, "default_delay")
+            pacing = (
+                PacingPolicy.from_settings()
+                if default_delay is None or default_delay == ""
+                else PacingPolicy(float(default_delay))
+            )
+            # 실행 전에 모든 이벤트를 검증하고 실행 시각을 계산 (잘못된 이벤트가 있으면 입력을 하나도 보내지 않음)
+            sequence = InputSequence.compile(events, pacing)
+        except (TypeError, ValueError) as e:
+            return create_failed_result("input-sequence", "invalid_events", str(e))
+
+        if not len(sequence):
+            return create_failed_result("input-sequence", "no_events", "실행할 입력 이벤트가 없습니다.")
+
+        # 드라이런이면 입력을 세션에 기록 (가상 시계 기준으로 대기하므로 즉시 끝남)
+        dry_run = get_dry_run(parameters)
+        backend = (
+            RecordingInputBackend(clock=dry_run.clock.monotonic, sink=dry_run.record_action)
+            if dry_run is not None
+            else create_input_backend()
+        )
+
+        cancel_token = get_cancel_token(parameters)
+        logger.info(
+            f"[InputSequenceNode] 입력 시퀀스 실행 - 이벤트: {len(sequence)}개, 예정 길이: {sequence.duration:.3f}초"
+        )
+        report = await asyncio.wrap_future(input_sequencer.submit(sequence, backend, cancel_token))
+        if report.cancelled:
+            cancel_token.raise_if_cancelled()
+
+        output = report.to_dict()
+        logger.info(
+            f"[InputSequenceNode] 입력 시퀀스 완료 - 실행: {report.executed}/{report.total}개, "
+            f"드리프트 평균/최대: {output['drift_ms']['mean']}/{output['drift_ms']['max']}ms"
+        )
+        if report.error is not None:
+            return create_failed_result(
+                "input-sequence",
+                "input_failed",
+                f"{report.executed + 1}번째 입력 실패: {report.error}",
+                output=output,
+            )
+        return {"action": "input-sequence", "status": "completed", "output": output}
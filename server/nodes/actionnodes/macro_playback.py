@@ -0,0 +1,85 @@
+"""
+매크로 재생 노드
+녹화한 매크로(.npz)를 입력 시퀀스 실행기로 녹화 당시의 간격 그대로 재생하는 노드입니다.
+"""
+
+import asyncio
+from typing import Any
+
+from automation.input_backend import RecordingInputBackend, create_input_backend
+from automation.input_sequence import input_sequencer
+from automation.macro import load_macro
+from log import log_manager
+from nodes.base_node import BaseNode
+from nodes.node_executor_wrapper import NodeExecutor
+from utils import create_failed_result, get_cancel_token, get_dry_run, get_parameter
+
+logger = log_manager.logger
+
+
+class MacroPlaybackNode(BaseNode):
+    """매크로 재생 노드 클래스"""
+
+    @staticmethod
+    @NodeExecutor("macro-playback")
+    async def execute(parameters: dict[str, Any]) -> dict[str, Any]:
+        """
+        매크로를 읽어 입력 작업 스레드에서 재생합니다.
+
+        Args:
+            parameters: 노드 파라미터
+                - macro: 매크로 파일 경로 또는 MACRO_DIR 안의 매크로 이름
+                - speed: 재생 속도 배율 (기본 1.0)
+                - max_idle_seconds: 이벤트 사이 최대 간격 (초, 더 긴 대기는 줄임, 없으면 녹화 그대로)
+
+        Returns:
+            실행 결과 딕셔너리 (output: 매크로 이름, 실행한 이벤트 수, 예정/실제 길이, 드리프트 통계)
+        """
+        macro_name = get_parameter(parameters, "macro", default="")
+        if not macro_name:
+            return create_failed_result("macro-playback", "no_macro", "재생할 매크로가 지정되지 않았습니다.")
+
+        try:
+            speed = float(get_parameter(parameters, "speed", default=1.0) or 1.0)
+            max_idle = get_parameter(parameters, "max_idle_seconds")
+            max_idle_seconds = None if max_idle is None or max_idle == "" else float(max_idle)
+            macro = load_macro(str(macro_name))
+            sequence = macro.to_sequence(speed=speed, max_idle_seconds=max_idle_seconds)
+        except (TypeError, ValueError) as e:
+            return create_failed_result("macro-playback", "invalid_macro", str(e))
+
+        if not len(sequence):
+            return create_failed_result(
+                "macro-playback", "no_events", f"매크로에 재생할 이벤트가 없습니다: {macro_name}"
+            )
+
+        # 드라이런이면 입력을 세션에 기록 (가상 시계 기준으로 대기하므로 즉시 끝남)
+        dry_run = get_dry_run(parameters)
+        backend = (
+            RecordingInputBackend(clock=dry_run.clock.monotonic, sink=dry_run.record_action)
+            if dry_run is not None
+            else create_input_backend()
+        )
+
+        cancel_token = get_cancel_token(parameters)
+        logger.info(
+            f"[MacroPlaybackNode] 매크로 재생 - 매크로: {macro_name}, 이벤트: {len(sequence)}개, "
+            f"예정 길이: {sequence.duration:.3f}초, 속도: {speed}배"
+        )
+        report = await asyncio.wrap_future(input_sequencer.submit(sequence, backend, cancel_token))
+        if report.cancelled:
+            cancel_token.raise_if_cancelled()
+
+        output = {"macro": str(macro_name), **report.to_dict()}
+        logger.info(
+            f"[MacroPlaybackNode] 매크로 재생 완료 - 실행: {report.executed}/{report.total}개, "
+            f"드리프트 평균/최대: {output['drift_ms']['mean']}/{output['drift_ms']['max']}ms"
+        )
+        if report.error is not None:
+            return create_failed_result(
+                "macro-playback",
+                "input_failed",
+                f"{report.executed + 1}번째 입력 실패: {report.error}",
+                output=output,
+            )
+        return {"action": "macro-playback", "status": "completed", "output": output}
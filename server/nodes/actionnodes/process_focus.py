@@ -15,7 +15,7 @@ import win32process
 from log import log_manager
 from nodes.base_node import BaseNode
 from nodes.node_executor_wrapper import NodeExecutor
-from utils import create_failed_result, get_parameter
+from utils import create_failed_result, get_dry_run, get_parameter
 
 logger = log_manager.logger
 
@@ -111,6 +111,25 @@ class ProcessFocusNode(BaseNode):
                 action="process-focus", reason="no_target", message="process_id 또는 hwnd가 제공되지 않았습니다."
             )
 
+        # 드라이런 실행이면 창을 찾거나 포커스를 바꾸지 않고 포커스 동작만 기록
+        dry_run = get_dry_run(parameters)
+        if dry_run is not None:
+            dry_run.record_action(
+                "focus", process_id=process_id, hwnd=hwnd, window_title=window_title, process_name=process_name
+            )
+            return {
+                "action": "process-focus",
+                "status": "completed",
+                "message": "드라이런: 프로세스 포커스를 기록했습니다.",
+                "output": {
+                    "success": True,
+                    "process_id": process_id,
+                    "hwnd": hwnd,
+                    "window_title": window_title,
+                    "dry_run": True,
+                },
+            }
+
         # pygetwindow를 사용하여 창 찾기 (가장 안정적인 방법)
         target_window = None
 
@@ -59,16 +59,11 @@ class ExcelCloseNode(BaseNode):
         # save_changes: 변경사항 저장 여부 (기본값: False)
         save_changes = get_parameter(parameters, "save_changes", default=False)
 
-        # execution_id 가져오기 (우선순위: 사용자 입력 > 이전 노드 출력 > 메타데이터)
+        # execution_id 가져오기 (우선순위: 파라미터 > 메타데이터)
         # execution_id: 워크플로우 실행 ID (열려있는 엑셀 객체를 찾기 위해 필요)
-        # 1순위: 사용자가 직접 입력한 execution_id
-        # 2순위: 이전 노드 출력에서 가져온 execution_id (_execution_id_from_prev)
-        # 3순위: 메타데이터의 execution_id (_execution_id)
-        execution_id = (
-            get_parameter(parameters, "execution_id", default="")
-            or parameters.get("_execution_id_from_prev")
-            or parameters.get("_execution_id")
-        )
+        # 파라미터는 직접 입력한 값이거나 이전 노드 출력 참조(기본: {{previous.output.execution_id}})를 치환한 값
+        param_execution_id = get_parameter(parameters, "execution_id", default="")
+        execution_id = param_execution_id or parameters.get("_execution_id")
 
         # execution_id가 없으면 에러 반환 (열려있는 엑셀 객체를 찾을 수 없음)
         if not execution_id:
@@ -80,7 +75,7 @@ class ExcelCloseNode(BaseNode):
             )
 
         logger.info(
-            f"[ExcelCloseNode] execution_id 사용: {execution_id} (소스: 사용자입력={bool(get_parameter(parameters, 'execution_id', default=''))}, 이전노드출력={bool(parameters.get('_execution_id_from_prev'))}, 메타데이터={bool(parameters.get('_execution_id') and not parameters.get('_execution_id_from_prev'))})"
+            f"[ExcelCloseNode] execution_id 사용: {execution_id} (소스: {'파라미터' if param_execution_id else '메타데이터'})"
         )
 
         # 저장된 엑셀 객체 확인
@@ -3,15 +3,17 @@
 화면에서 이미지를 찾아 터치하는 노드입니다.
 """
 
+import asyncio
 import os
 from typing import Any
 
+from automation.input_backend import PacingPolicy, RecordingInputBackend
 from automation.input_handler import InputHandler
 from automation.screen_capture import ScreenCapture
 from log import log_manager
 from nodes.base_node import BaseNode
 from nodes.node_executor_wrapper import NodeExecutor
-from utils import create_failed_result, get_parameter
+from utils import ExecutionCancelledError, create_failed_result, get_cancel_token, get_dry_run, get_parameter
 
 logger = log_manager.logger
 
@@ -28,9 +30,13 @@ class ImageTouchNode(BaseNode):
         Args:
             parameters: 노드 파라미터
                 - folder_path: 이미지 폴더 경로 (필수)
+                - timeout: 이미지를 찾을 때까지 대기할 최대 시간 (초, 노드 타임아웃으로 적용됨)
 
         Returns:
             실행 결과 딕셔너리
+
+        드라이런 실행에서는 화면 대신 재생 프레임에서 이미지를 찾고 클릭은 기록만 합니다.
+        재생 프레임이 없으면 모든 이미지를 찾은 것으로 가정합니다. (흐름 검증용, position은 None)
         """
         logger.info(f"[ImageTouchNode] execute 호출됨, parameters: {parameters}")
         logger.info(f"[ImageTouchNode] parameters 키 목록: {list(parameters.keys()) if parameters else []}")
@@ -75,22 +81,63 @@ class ImageTouchNode(BaseNode):
         if not image_files:
             return create_failed_result(action="image-touch", reason="no_images", message="이미지 파일이 없습니다.")
 
+        # dry_run: 드라이런 세션 (있으면 실제 화면 캡처/클릭 대신 재생 프레임 사용 및 클릭 기록)
+        dry_run = get_dry_run(parameters)
+        if dry_run is not None and dry_run.frame_source is None:
+            # 재생 프레임이 없으면 화면을 볼 수 없으므로 모든 이미지를 찾아 클릭한 것으로 가정
+            assumed_results = []
+            for image_path in image_files:
+                image_name = os.path.basename(image_path)
+                dry_run.record_action("click", x=None, y=None, image=image_name)
+                assumed_results.append({"image": image_name, "found": True, "position": None, "touched": True})
+            return {
+                "action": "image-touch",
+                "status": "completed",
+                "output": {
+                    "success": True,
+                    "folder_path": folder_path,
+                    "total_images": len(image_files),
+                    "results": assumed_results,
+                    "dry_run": True,
+                },
+            }
+
         # 화면 캡처 및 입력 핸들러 초기화
-        # screen_capture: 화면 캡처 및 이미지 찾기용 객체
-        screen_capture = ScreenCapture()
-        # input_handler: 마우스 클릭 등 입력 처리용 객체
-        input_handler = InputHandler()
+        # screen_capture: 화면 캡처 및 이미지 찾기용 객체 (드라이런이면 재생 프레임에서 찾음)
+        screen_capture = ScreenCapture(frame_source=dry_run.frame_source if dry_run is not None else None)
+        # input_handler: 마우스 클릭 등 입력 처리용 객체 (드라이런이면 클릭을 세션에 기록하고 대기하지 않음)
+        if dry_run is not None:
+            input_handler = InputHandler(
+                backend=RecordingInputBackend(clock=dry_run.clock.monotonic, sink=dry_run.record_action),
+                pacing=PacingPolicy(),
+            )
+        else:
+            input_handler = InputHandler()
+
+        # cancel_token: 노드 실행 토큰 (이미지 찾기 재시도 대기 중에도 취소/시간 초과 시 즉시 중단)
+        cancel_token = get_cancel_token(parameters)
+        # max_attempts: 마감 시각(timeout 파라미터 또는 워크플로우 제한 시간)이 있으면 찾을 때까지 계속 시도
+        # (마감이 지나면 NodeExecutor가 reason="timeout"으로 실패 처리)
+        max_attempts = 0 if cancel_token.deadline is not None else 5
 
         # results: 각 이미지 처리 결과 리스트
         results = []
         # 각 이미지 파일을 순회하며 화면에서 찾고 터치 시도
         for i, image_path in enumerate(image_files):
+            cancel_token.raise_if_cancelled()
             try:
                 logger.debug(f"이미지 찾기 시도 {i + 1}/{len(image_files)}: {os.path.basename(image_path)}")
 
                 # 이미지 찾기 (threshold를 0.7로 낮춤, 필요시 더 낮출 수 있음)
+                # 재시도 대기가 있는 동기 작업이므로 스레드에서 실행 (이벤트 루프가 취소 요청을 처리할 수 있도록)
                 # location: 찾은 이미지의 위치 (x, y, width, height) 또는 None
-                location = screen_capture.find_template(image_path, threshold=0.7)
+                location = await asyncio.to_thread(
+                    screen_capture.find_template,
+                    image_path,
+                    threshold=0.7,
+                    max_attempts=max_attempts,
+                    cancel_token=cancel_token,
+                )
 
                 # 이미지를 찾았으면 터치 시도
                 if location:
@@ -103,7 +150,7 @@ class ImageTouchNode(BaseNode):
                     logger.debug(f"이미지 찾기 성공! 클릭 위치: ({center_x}, {center_y})")
 
                     # 터치 (클릭)
-                    # success: 클릭 성공 여부
+                    # success: 클릭 성공 여부 (드라이런이면 클릭하지 않고 기록)
                     success = input_handler.click(center_x, center_y)
 
                     # 결과에 추가 (찾음, 위치, 터치 성공 여부 포함)
@@ -126,6 +173,9 @@ class ImageTouchNode(BaseNode):
                         }
                     )
 
+            except ExecutionCancelledError:
+                # 실행 취소는 NodeExecutor에서 처리
+                raise
             except Exception as e:
                 # 이미지 처리 중 예외 발생 시 에러 로그 출력
                 logger.error(f"이미지 처리 중 오류 발생 ({os.path.basename(image_path)}): {e}")
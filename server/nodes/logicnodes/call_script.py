@@ -0,0 +1,139 @@
+"""
+스크립트 호출 노드
+다른 스크립트를 현재 실행 안에서 서브 워크플로우로 호출하는 노드입니다.
+
+여러 스크립트에서 반복되는 노드 묶음(예: 게임 창 포커스 → 팝업 닫기 → 인벤토리 열기)을
+하나의 스크립트로 만들어 두고 호출하면 노드를 복사할 필요가 없습니다.
+호출된 스크립트의 실행 계획은 캐시되어 모든 호출자가 공유합니다.
+"""
+
+import json
+from typing import Any
+
+from config.server_config import settings
+from log import log_manager
+from nodes.base_node import BaseNode
+from nodes.node_executor_wrapper import NodeExecutor
+from utils import create_failed_result, get_cancel_token, get_dry_run, get_parameter
+
+logger = log_manager.logger
+
+
+def _parse_call_params(value: Any) -> dict[str, Any] | None:
+    """
+    입력 파라미터를 dict로 변환합니다.
+
+    Args:
+        value: 입력 파라미터 (dict 또는 JSON 객체 문자열, 비어 있으면 빈 dict)
+
+    Returns:
+        입력 파라미터 dict 또는 None (형식이 잘못된 경우)
+    """
+    if value is None or value == "":
+        return {}
+    if isinstance(value, str):
+        try:
+            value = json.loads(value)
+        except json.JSONDecodeError:
+            return None
+    return value if isinstance(value, dict) else None
+
+
+class CallScriptNode(BaseNode):
+    """스크립트 호출 노드 클래스"""
+
+    @staticmethod
+    @NodeExecutor("call-script")
+    async def execute(parameters: dict[str, Any]) -> dict[str, Any]:
+        """
+        다른 스크립트를 호출합니다.
+
+        Args:
+            parameters: 노드 파라미터
+                - script_id: 호출할 스크립트 ID
+                - inputs: 입력 파라미터 (dict 또는 JSON 객체 문자열, 호출된 스크립트에서 {{params.이름}}으로 참조)
+
+        Returns:
+            실행 결과 딕셔너리
+            - script_id: 호출한 스크립트 ID
+            - script_name: 호출한 스크립트 이름
+            - executed_count: 실행한 노드 수
+            - result: 호출한 스크립트의 마지막 노드 출력
+            - outputs: 호출한 스크립트의 노드 ID별 출력
+        """
+        # 파라미터 추출
+        raw_script_id = get_parameter(parameters, "script_id", default=None)
+        try:
+            script_id = int(raw_script_id)
+        except (TypeError, ValueError):
+            return create_failed_result(
+                "call-script", "invalid_script_id", f"호출할 스크립트 ID가 올바르지 않습니다: {raw_script_id}"
+            )
+
+        call_params = _parse_call_params(get_parameter(parameters, "inputs", default={}))
+        if call_params is None:
+            return create_failed_result("call-script", "invalid_parameters", "입력 파라미터는 JSON 객체여야 합니다.")
+
+        # 재귀 호출 및 중첩 깊이 검사 (_call_stack: 최상위 스크립트부터 현재 스크립트까지의 ID)
+        call_stack: list[int] = list(parameters.get("_call_stack") or [])
+        if script_id in call_stack:
+            chain = " → ".join(str(item) for item in [*call_stack, script_id])
+            return create_failed_result(
+                "call-script",
+                "recursive_call",
+                f"스크립트 재귀 호출이 감지되었습니다: {chain}",
+                {"script_id": script_id, "call_stack": call_stack},
+            )
+        if len(call_stack) >= settings.CALL_SCRIPT_MAX_DEPTH:
+            return create_failed_result(
+                "call-script",
+                "max_depth_exceeded",
+                f"스크립트 호출 중첩 깊이가 최대값({settings.CALL_SCRIPT_MAX_DEPTH})을 초과했습니다.",
+                {"script_id": script_id, "call_stack": call_stack},
+            )
+
+        # _call_script: 서브 워크플로우 실행 함수 (ActionService.process_node가 전달)
+        call_script = parameters.get("_call_script")
+        if call_script is None:
+            return create_failed_result(
+                "call-script", "unsupported", "스크립트 호출은 워크플로우 실행 중에만 사용할 수 있습니다."
+            )
+
+        logger.info(f"[CallScriptNode] 스크립트 호출 - 스크립트 ID: {script_id}, 호출 스택: {call_stack}")
+        summary = await call_script(
+            script_id,
+            call_params,
+            [*call_stack, script_id],
+            execution_id=parameters.get("_execution_id"),
+            cancel_token=get_cancel_token(parameters),
+            dry_run=get_dry_run(parameters),
+        )
+
+        if not summary.get("found"):
+            return create_failed_result(
+                "call-script", "script_not_found", f"호출할 스크립트를 찾을 수 없습니다: {script_id}"
+            )
+
+        # 호출한 스크립트가 취소되었으면 현재 실행도 취소로 처리
+        if summary["status"] == "cancelled":
+            get_cancel_token(parameters).raise_if_cancelled()
+
+        output = {
+            "script_id": script_id,
+            "script_name": summary.get("script_name"),
+            "executed_count": summary.get("executed_count", 0),
+            "result": summary.get("result"),
+            "outputs": summary.get("outputs", {}),
+        }
+        if summary["status"] != "success":
+            return create_failed_result(
+                "call-script",
+                "sub_workflow_failed",
+                f"호출한 스크립트 실행 실패 (스크립트 ID: {script_id}): {summary.get('error_message')}",
+                output,
+            )
+
+        logger.info(
+            f"[CallScriptNode] 스크립트 호출 완료 - 스크립트 ID: {script_id}, 실행 노드: {output['executed_count']}개"
+        )
+        return {"action": "call-script", "status": "completed", "output": output}
@@ -45,9 +45,14 @@ import traceback
 from typing import Any, ParamSpec, TypeVar
 import uuid
 
+from config.nodes_config import get_node_default_timeout
+from config.server_config import settings
 from log import log_manager
 from utils import create_failed_result, normalize_result, validate_parameters
-from utils.log_client import get_log_client
+from utils.cancellation import ExecutionCancelledError, ExecutionTimeoutError, get_cancel_token
+from utils.dry_run import get_dry_run
+from utils.log_client import get_log_client, node_attempts
+from utils.retry_policy import RetryPolicy, get_failure_reason, get_retry_policy
 
 logger = log_manager.logger
 
@@ -55,6 +60,30 @@ P = ParamSpec("P")
 R = TypeVar("R")
 
 
+def resolve_node_timeout(action_name: str, parameters: dict[str, Any]) -> float | None:
+    """
+    노드 타임아웃(초)을 결정합니다.
+    우선순위: 파라미터의 timeout → 노드 설정(NODES_CONFIG)의 timeout 기본값 → NODE_DEFAULT_TIMEOUT_SECONDS
+
+    Args:
+        action_name: 노드 타입
+        parameters: 노드 파라미터
+
+    Returns:
+        타임아웃 (초) 또는 None (제한 없음)
+    """
+    try:
+        timeout = float(parameters.get("timeout") or 0)
+    except (TypeError, ValueError):
+        timeout = 0.0
+    if timeout > 0:
+        return timeout
+    default_timeout = get_node_default_timeout(action_name)
+    if default_timeout is not None:
+        return default_timeout
+    return settings.NODE_DEFAULT_TIMEOUT_SECONDS if settings.NODE_DEFAULT_TIMEOUT_SECONDS > 0 else None
+
+
 class NodeExecutor:
     """
     노드 execute 메서드를 래핑하는 클래스 기반 데코레이터
@@ -63,6 +92,9 @@ class NodeExecutor:
     - 파라미터 검증 및 정규화 (None이면 빈 딕셔너리로 변환)
     - 에러 처리 및 로깅 (에러 발생 시 자동으로 실패 결과 반환)
     - 결과 정규화 (None이거나 dict가 아니면 자동으로 표준 형식으로 변환)
+    - 실행 취소 처리 (취소된 실행의 노드는 실행하지 않고, 실행 중 취소되면 reason="cancelled" 실패 결과 반환)
+    - 타임아웃 처리 (min(노드 타임아웃, 워크플로우 남은 시간)이 지나면 노드를 중단하고 reason="timeout" 실패 결과 반환)
+    - 재시도 처리 (retry 정책이 있으면 실패한 시도를 지수 백오프 후 재실행, 시도 기록은 결과의 attempts에 포함)
 
     사용 예시:
         # 기본 사용법
@@ -125,39 +157,13 @@ class NodeExecutor:
             started_at = datetime.now()
             start_time_ms = time.time() * 1000
 
-            # 로그 클라이언트 가져오기
-            log_client = get_log_client()
+            # 로그 클라이언트 가져오기 (드라이런 실행은 실행 로그/통계에 섞이지 않도록 로그를 남기지 않음)
+            log_client = None if get_dry_run(validated_params) is not None else get_log_client()
+            # 같은 실행에서 다시 실행된 노드(반복, 재실행)의 로그가 이전 실행 로그와 구분되도록 실행 번호 부여
+            attempt = node_attempts.next(execution_id, node_id) if log_client is not None else 1
 
             # 실행 시작 로그 전송 (비동기, fire-and-forget - 백그라운드에서 실행)
-            _ = asyncio.create_task(  # noqa: RUF006
-                log_client.send_log_async(
-                    execution_id=execution_id,
-                    script_id=script_id,
-                    node_id=node_id,
-                    node_type=self.action_name,
-                    node_name=node_name,
-                    status="running",
-                    started_at=started_at,
-                    parameters=log_parameters,
-                )
-            )
-
-            try:
-                logger.debug(f"[{self.action_name}] 노드 실행 시작 - 파라미터: {validated_params}")
-
-                # 노드 실행
-                result = await func(validated_params)
-
-                # 결과 정규화
-                normalized_result = normalize_result(result, self.action_name)
-
-                # 실행 종료 시간
-                finished_at = datetime.now()
-                execution_time_ms = int((time.time() * 1000) - start_time_ms)
-
-                logger.debug(f"[{self.action_name}] 노드 실행 완료 - 결과: {normalized_result}")
-
-                # 실행 완료 로그 전송 (비동기, fire-and-forget - 백그라운드에서 실행)
+            if log_client is not None:
                 _ = asyncio.create_task(  # noqa: RUF006
                     log_client.send_log_async(
                         execution_id=execution_id,
@@ -165,35 +171,37 @@ class NodeExecutor:
                         node_id=node_id,
                         node_type=self.action_name,
                         node_name=node_name,
-                        status="completed",
+                        status="running",
                         started_at=started_at,
-                        finished_at=finished_at,
-                        execution_time_ms=execution_time_ms,
                         parameters=log_parameters,
-                        result=normalized_result,
+                        attempt=attempt,
                     )
                 )
 
-                return normalized_result
+            logger.debug(f"[{self.action_name}] 노드 실행 시작 - 파라미터: {validated_params}")
 
-            except Exception as e:
-                # 실행 종료 시간
-                finished_at = datetime.now()
-                execution_time_ms = int((time.time() * 1000) - start_time_ms)
-                error_trace = traceback.format_exc()
+            # 재시도 정책이 있으면 실패한 시도를 백오프 후 다시 실행 (시도 기록은 결과의 attempts에 누적)
+            try:
+                retry_policy = get_retry_policy(validated_params)
+            except ValueError as e:
+                retry_policy = None
+                logger.warning(f"[{self.action_name}] 재시도 설정 무시: {e!s}")
+
+            if retry_policy is None:
+                result, log_status, error_message, error_trace = await self._run_attempt(func, validated_params)
+            else:
+                result, log_status, error_message, error_trace = await self._run_with_retry(
+                    func, validated_params, retry_policy
+                )
 
-                logger.error(f"[{self.action_name}] 노드 실행 실패: {e}")
-                logger.error(f"[{self.action_name}] 스택 트레이스: {error_trace}")
+            # 실행 종료 시간
+            finished_at = datetime.now()
+            execution_time_ms = int((time.time() * 1000) - start_time_ms)
 
-                # 에러 결과 생성
-                error_result = create_failed_result(
-                    action=self.action_name,
-                    reason="execution_error",
-                    message=f"노드 실행 중 오류 발생: {e!s}",
-                    output={"error": str(e)},
-                )
+            logger.debug(f"[{self.action_name}] 노드 실행 종료 ({log_status}) - 결과: {result}")
 
-                # 실행 실패 로그 전송 (비동기, fire-and-forget - 백그라운드에서 실행)
+            # 실행 완료/실패 로그 전송 (노드당 한 행, 비동기 fire-and-forget - 백그라운드에서 실행)
+            if log_client is not None:
                 _ = asyncio.create_task(  # noqa: RUF006
                     log_client.send_log_async(
                         execution_id=execution_id,
@@ -201,19 +209,140 @@ class NodeExecutor:
                         node_id=node_id,
                         node_type=self.action_name,
                         node_name=node_name,
-                        status="failed",
+                        status=log_status,
                         started_at=started_at,
                         finished_at=finished_at,
                         execution_time_ms=execution_time_ms,
                         parameters=log_parameters,
-                        result=error_result,
-                        error_message=str(e),
+                        result=result,
+                        error_message=error_message,
                         error_traceback=error_trace,
+                        attempt=attempt,
                     )
                 )
 
-                return error_result
+            return result
 
         # 래핑된 함수에 action_name 속성 추가 (자동 핸들러 등록을 위해)
         wrapper.action_name = self.action_name
         return wrapper
+
+    async def _run_attempt(
+        self, func: Callable[[dict[str, Any]], Any], parameters: dict[str, Any]
+    ) -> tuple[dict[str, Any], str, str | None, str | None]:
+        """
+        노드를 한 번 실행합니다. (취소/타임아웃/예외를 실패 결과로 변환)
+
+        Args:
+            func: 노드의 execute 함수
+            parameters: 검증된 노드 파라미터 (_cancel_token은 이 시도를 감싸는 토큰)
+
+        Returns:
+            (정규화된 결과, 로그 상태(completed/failed), 에러 메시지, 스택 트레이스)
+        """
+        try:
+            # 이미 취소된 실행이면 노드를 실행하지 않음
+            cancel_token = get_cancel_token(parameters)
+            cancel_token.raise_if_cancelled()
+
+            # 노드 실행 (노드 단위 토큰의 마감 = min(노드 타임아웃, 워크플로우 남은 시간))
+            node_timeout = resolve_node_timeout(self.action_name, parameters)
+            with cancel_token.child(
+                node_timeout, f"노드 실행 시간({node_timeout:g}초)을 초과했습니다." if node_timeout else None
+            ) as node_token:
+                result = await node_token.run(func({**parameters, "_cancel_token": node_token}))
+
+            # 결과 정규화
+            return normalize_result(result, self.action_name), "completed", None, None
+
+        except ExecutionCancelledError as e:
+            # 실행 취소 또는 시간 초과 (대기/폴링/HTTP 요청 중 취소 토큰이 취소됨)
+            reason = "timeout" if isinstance(e, ExecutionTimeoutError) else "cancelled"
+            logger.info(f"[{self.action_name}] 노드 실행 중단됨 ({reason}) - {e.reason}")
+
+            # 실패 상태로 기록 (사유는 result.error.reason으로 구분)
+            cancelled_result = create_failed_result(
+                action=self.action_name,
+                reason=reason,
+                message=e.reason,
+                output={"error": e.reason},
+            )
+            return cancelled_result, "failed", e.reason, None
+
+        except Exception as e:
+            error_trace = traceback.format_exc()
+
+            logger.error(f"[{self.action_name}] 노드 실행 실패: {e}")
+            logger.error(f"[{self.action_name}] 스택 트레이스: {error_trace}")
+
+            # 에러 결과 생성
+            error_result = create_failed_result(
+                action=self.action_name,
+                reason="execution_error",
+                message=f"노드 실행 중 오류 발생: {e!s}",
+                output={"error": str(e)},
+            )
+            return error_result, "failed", str(e), error_trace
+
+    async def _run_with_retry(
+        self, func: Callable[[dict[str, Any]], Any], parameters: dict[str, Any], policy: RetryPolicy
+    ) -> tuple[dict[str, Any], str, str | None, str | None]:
+        """
+        재시도 정책에 따라 노드를 실행합니다.
+        모든 시도는 총 시간 예산(budget_seconds)과 워크플로우 남은 시간 안에서 실행되며,
+        각 시도의 기록은 최종 결과의 attempts에 담깁니다. (시도마다 로그 행을 만들지 않음)
+
+        Args:
+            func: 노드의 execute 함수
+            parameters: 검증된 노드 파라미터
+            policy: 재시도 정책
+
+        Returns:
+            (마지막 시도 결과, 로그 상태, 에러 메시지, 스택 트레이스)
+        """
+        # attempts: 시도별 기록 (시도 번호, 상태, 실패 사유, 실행 시간, 다음 시도 전 대기 시간)
+        attempts: list[dict[str, Any]] = []
+        budget_message = (
+            f"재시도 시간 예산({policy.budget_seconds:g}초)을 초과했습니다." if policy.budget_seconds else None
+        )
+
+        with get_cancel_token(parameters).child(policy.budget_seconds, budget_message) as retry_token:
+            attempt_params = {**parameters, "_cancel_token": retry_token}
+            attempt = 0
+            while True:
+                attempt += 1
+                attempt_started_at = datetime.now()
+                attempt_start = time.monotonic()
+                outcome = await self._run_attempt(func, attempt_params)
+                result = outcome[0]
+
+                record: dict[str, Any] = {
+                    "attempt": attempt,
+                    "status": result.get("status"),
+                    "reason": get_failure_reason(result),
+                    "started_at": attempt_started_at.isoformat(),
+                    "execution_time_ms": int((time.monotonic() - attempt_start) * 1000),
+                }
+                attempts.append(record)
+
+                if attempt >= policy.max_attempts or not policy.should_retry(result):
+                    break
+
+                # 다음 시도 전 대기 (남은 예산/워크플로우 시간 안에 대기할 수 없으면 재시도 중단)
+                delay = policy.backoff_delay(attempt)
+                remaining = retry_token.remaining()
+                if retry_token.cancelled or (remaining is not None and remaining <= delay):
+                    break
+                record["retry_delay_ms"] = int(delay * 1000)
+                logger.info(
+                    f"[{self.action_name}] 재시도 {attempt + 1}/{policy.max_attempts} - {delay:.2f}초 후 "
+                    f"(사유: {record['reason'] or result.get('status')})"
+                )
+                try:
+                    await retry_token.sleep(delay)
+                except ExecutionCancelledError:
+                    # 대기 중 실행이 취소되면 마지막 시도 결과로 종료
+                    break
+
+        _, log_status, error_message, error_trace = outcome
+        return {**result, "attempts": attempts}, log_status, error_message, error_trace
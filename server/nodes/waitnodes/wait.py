@@ -3,13 +3,12 @@
 지정된 시간만큼 대기하는 노드입니다.
 """
 
-import asyncio
 from typing import Any
 
 from log import log_manager
 from nodes.base_node import BaseNode
 from nodes.node_executor_wrapper import NodeExecutor
-from utils import get_parameter
+from utils import get_cancel_token, get_parameter
 
 logger = log_manager.logger
 
@@ -49,8 +48,8 @@ class WaitNode(BaseNode):
         # 대기 시작 로그
         logger.info(f"[WaitNode] {wait_time}초 대기 시작")
 
-        # 비동기 대기
-        await asyncio.sleep(wait_time)
+        # 비동기 대기 (실행이 취소되면 즉시 중단)
+        await get_cancel_token(parameters).sleep(wait_time)
 
         # 대기 완료 로그
         logger.info(f"[WaitNode] {wait_time}초 대기 완료")
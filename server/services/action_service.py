@@ -2,15 +2,23 @@
 액션 처리 서비스
 """
 
+import asyncio
+from datetime import datetime
 import inspect
+import time
 from typing import Any
 
 from log import log_manager
 
 # 노드 모듈 import (자동으로 모든 노드가 import됨)
 import nodes
-from services.condition_service import ConditionService
 from services.node_execution_context import NodeExecutionContext
+from services.node_result_cache import NodeCachePolicy, NodeResultCache, node_result_cache
+from utils.cancellation import CancellationToken
+from utils.dry_run import DryRunSession
+from utils.log_client import get_log_client, node_attempts
+from utils.parameter_template import ParameterTemplate
+from utils.retry_policy import RetryPolicy
 
 # config 모듈은 직접 import (같은 레벨에 있으므로)
 try:
@@ -131,8 +139,8 @@ class ActionService:
                     return result
 
             # 노드 핸들러 사용
-            logger.info(f"[process_action] 사용 가능한 핸들러: {list(self.node_handlers.keys())}")
-            logger.info(f"[process_action] 요청된 액션 타입: {action_type}")
+            logger.debug(f"[process_action] 사용 가능한 핸들러: {list(self.node_handlers.keys())}")
+            logger.debug(f"[process_action] 요청된 액션 타입: {action_type}")
 
             handler = self.node_handlers.get(action_type)
             if not handler:
@@ -141,7 +149,7 @@ class ActionService:
                 )
                 raise ValueError(f"지원하지 않는 액션 타입: {action_type}")
 
-            logger.info(f"[process_action] 핸들러 찾음: {handler} (action_type: {action_type})")
+            logger.debug(f"[process_action] 핸들러 찾음: {handler} (action_type: {action_type})")
 
             logger.debug(f"핸들러 실행 중: {handler.__name__}")
             # 핸들러 실행 (비동기 함수)
@@ -167,6 +175,105 @@ class ActionService:
             # 예외 재발생 (상위에서 처리하도록)
             raise e
 
+    @staticmethod
+    def _is_cacheable(result: Any) -> bool:
+        """
+        노드 실행 결과를 캐시에 저장할 수 있는지 확인합니다.
+
+        Args:
+            result: 노드 실행 결과
+
+        Returns:
+            성공한 dict 결과이면 True
+        """
+        return (
+            isinstance(result, dict) and result.get("status") not in ("failed", "cancelled") and not result.get("error")
+        )
+
+    @staticmethod
+    def _use_cached_result(
+        cached: tuple[dict[str, Any], float],
+        cache_key: str | None,
+        node_data: dict[str, Any],
+        log_node_type: str,
+        node_id: str,
+        node_name: str | None,
+    ) -> dict[str, Any]:
+        """
+        캐시된 결과에 캐시 히트 정보를 표시하고 실행 로그를 전송합니다.
+        캐시 히트 로그는 result.meta.cache_hit으로 구분되어 평균 실행 시간 통계에서 제외됩니다.
+
+        Args:
+            cached: (캐시된 결과, 캐시된 지 경과한 시간(초))
+            cache_key: 캐시 키
+            node_data: 노드 데이터 (로그 추적용 메타데이터 포함)
+            log_node_type: 로그에 기록할 노드 타입
+            node_id: 로그에 기록할 노드 ID (호출된 스크립트의 노드는 "<스크립트 ID>:<노드 ID>")
+            node_name: 노드 이름
+
+        Returns:
+            캐시 히트 정보(meta)가 포함된 결과
+        """
+        started_at = datetime.now()
+        start_time = time.perf_counter()
+        cached_result, age_seconds = cached
+        # meta: 캐시 히트 여부와 캐시된 결과의 나이 (로그/통계에서 실제 실행과 구분하기 위함)
+        result = {
+            **cached_result,
+            "meta": {"cache_hit": True, "cache_key": cache_key, "cache_age_ms": int(age_seconds * 1000)},
+        }
+        logger.info(f"[process_node] 캐시 히트 - 노드 ID: {node_id}, 캐시 나이: {result['meta']['cache_age_ms']}ms")
+
+        # 실행 로그 전송 (비동기, fire-and-forget - 백그라운드에서 실행)
+        _ = asyncio.create_task(  # noqa: RUF006
+            get_log_client().send_log_async(
+                execution_id=node_data.get("_execution_id"),
+                script_id=node_data.get("_script_id"),
+                node_id=node_id,
+                node_type=log_node_type,
+                node_name=node_name,
+                status="completed",
+                started_at=started_at,
+                finished_at=datetime.now(),
+                execution_time_ms=int((time.perf_counter() - start_time) * 1000),
+                parameters={k: v for k, v in node_data.items() if not k.startswith("_")},
+                result=result,
+                attempt=node_attempts.next(node_data.get("_execution_id"), node_id),
+            )
+        )
+        return result
+
+    async def call_script(
+        self,
+        script_id: int,
+        params: dict[str, Any],
+        call_stack: list[int],
+        execution_id: str | None = None,
+        cancel_token: CancellationToken | None = None,
+        dry_run: DryRunSession | None = None,
+    ) -> dict[str, Any]:
+        """
+        다른 스크립트를 서브 워크플로우로 실행합니다. (call-script 노드에 전달되는 실행 함수)
+        스크립트의 캐시된 실행 계획을 같은 ActionService로 실행합니다. (ScriptRunner.call_script 참조)
+
+        Args:
+            script_id: 호출할 스크립트 ID
+            params: 입력 파라미터
+            call_stack: 호출된 스크립트를 포함한 호출 스택
+            execution_id: 워크플로우 실행 ID (로그 추적용)
+            cancel_token: 호출한 워크플로우의 실행 취소 토큰
+            dry_run: 호출한 워크플로우의 드라이런 세션
+
+        Returns:
+            호출 결과 딕셔너리
+        """
+        # 순환 import 방지를 위해 지연 import (ScriptRunner가 ActionService를 사용)
+        from services.script_runner import ScriptRunner
+
+        return await ScriptRunner(action_service=self).call_script(
+            script_id, params, call_stack, execution_id=execution_id, cancel_token=cancel_token, dry_run=dry_run
+        )
+
     async def process_node(
         self,
         node: dict[str, Any],
@@ -193,12 +300,11 @@ class ActionService:
 
         try:
             node_type = node.get("type")
-            node_data = node.get("data")
             node_id = node.get("id", "")
 
-            # node_data가 None이면 빈 dict로 변환
-            if node_data is None:
-                node_data = {}
+            # node_data: 노드 데이터 복사본 (None이면 빈 dict)
+            # 실행 계획은 여러 실행이 공유하므로 원본 노드 데이터를 수정하지 않도록 복사해서 사용
+            node_data = dict(node.get("data") or {})
 
             # parameters를 node_data에 병합 (parameters가 우선순위가 높음)
             # DB에서 불러온 노드는 parameters 필드에 파라미터가 저장되어 있음
@@ -208,6 +314,16 @@ class ActionService:
                 node_data = {**node_data, **node_parameters}
                 logger.debug(f"[process_node] parameters 병합 완료: {list(node_parameters.keys())}")
 
+            # 파라미터 템플릿 치환 (예: {{nodes.login.output.token}} → 해당 노드 출력 값)
+            # 실행 시작 시 컴파일된 템플릿을 사용하고, 없으면(단일 노드 실행 등) 여기서 컴파일
+            if context is not None and context.parameter_templates is not None:
+                template = context.parameter_templates.get(node_id)
+            else:
+                template = ParameterTemplate.compile(node_data, node_type)
+            if template is not None:
+                node_data = template.render(node_data, context)
+                logger.debug(f"[process_node] 파라미터 템플릿 치환 완료: {list(template.renderers)}")
+
             node_name = node_data.get("title") or node_data.get("name")
 
             # 로그 추적을 위한 메타데이터를 node_data에 추가 (내부 메타데이터는 _ 접두사 사용)
@@ -218,23 +334,34 @@ class ActionService:
             if script_id is not None:
                 node_data["_script_id"] = script_id
             # node_id: 노드 ID (로그 추적용)
-            node_data["_node_id"] = node_id
+            # 호출된 스크립트의 노드는 호출한 실행 ID로 기록되므로 "<스크립트 ID>:<노드 ID>"로 구분
+            log_node_prefix = context.workflow_data.get("log_node_prefix", "") if context else ""
+            node_data["_node_id"] = f"{log_node_prefix}{node_id}"
             # node_name: 노드 이름 (로그 추적용, 있으면만 추가)
             if node_name:
                 node_data["_node_name"] = node_name
 
-            logger.info(f"[process_node] 노드 타입: {node_type}")
-            logger.info(f"[process_node] 노드 데이터: {node_data}")
-            logger.info(f"[process_node] 노드 데이터 키 목록: {list(node_data.keys()) if node_data else []}")
+            # 노드 데이터에는 입력 값(계정 정보, HTTP 헤더 등)이 들어 있을 수 있으므로 값은 로그에 남기지 않음
+            logger.info(f"[process_node] 노드 실행 - 노드 ID: {node_id}, 타입: {node_type}")
+            logger.debug(f"[process_node] 노드 데이터 키 목록: {list(node_data.keys()) if node_data else []}")
 
             # folder_path 파라미터 확인 (image-touch 노드용)
             # image-touch 노드는 이미지 폴더 경로가 필요함
             if node_type == "image-touch":
                 folder_path = node_data.get("folder_path")
-                logger.info(f"[process_node][image-touch] folder_path 값: {folder_path}")
+                logger.debug(f"[process_node][image-touch] folder_path 값: {folder_path}")
                 # folder_path가 없으면 경고 출력
                 if not folder_path:
-                    logger.warning(f"[process_node][image-touch] ⚠️ folder_path가 없습니다! node_data 전체: {node_data}")
+                    logger.warning(f"[process_node][image-touch] ⚠️ folder_path가 없습니다! 노드 ID: {node_id}")
+
+            # 재시도 정책 해석 (노드의 retry 필드 또는 retry 파라미터, NodeExecutor가 실패 시 재시도에 사용)
+            try:
+                retry_policy = RetryPolicy.from_config(node.get("retry", node_data.get("retry")))
+            except ValueError as e:
+                retry_policy = None
+                logger.warning(f"[process_node] 재시도 설정 무시 - 노드 ID: {node_id}, 사유: {e!s}")
+            if retry_policy is not None:
+                node_data["_retry_policy"] = retry_policy
 
             # 컨텍스트가 있으면 현재 노드 설정
             # 컨텍스트는 노드 간 데이터 전달을 위한 객체
@@ -242,27 +369,19 @@ class ActionService:
                 # 현재 노드 ID 설정 (다음 노드에서 이전 노드로 참조할 때 사용)
                 context.set_current_node(node_id)
 
-                # 조건 노드인 경우 조건 서비스를 통해 데이터 준비
-                # 조건 노드는 이전 노드의 출력을 받아서 조건을 평가함
-                if node_type == "condition":
-                    node_data = ConditionService.prepare_condition_node_data(node_data, context)
-
-                # 엑셀 닫기 노드인 경우 이전 노드의 출력에서 execution_id 가져오기
-                # excel-close 노드는 excel-open 노드에서 생성한 엑셀 객체를 닫기 위해 execution_id가 필요함
-                if node_type == "excel-close":
-                    # 이전 노드의 결과 가져오기
-                    prev_result = context.get_previous_node_result()
-                    # 이전 노드 결과가 있고 dict 타입이면 처리
-                    if prev_result and isinstance(prev_result, dict):
-                        # 이전 노드의 출력 가져오기
-                        prev_output = prev_result.get("output")
-                        # 출력이 dict이고 execution_id가 있으면 가져오기
-                        if isinstance(prev_output, dict) and "execution_id" in prev_output:
-                            # 이전 노드의 출력에서 execution_id를 가져와서 node_data에 추가
-                            node_data["_execution_id_from_prev"] = prev_output.get("execution_id")
-                            logger.info(
-                                f"[process_node][excel-close] 이전 노드 출력에서 execution_id 가져옴: {prev_output.get('execution_id')}"
-                            )
+                # 실행 취소 토큰 전달 (노드가 대기/폴링/HTTP 요청 중 취소를 확인하는 데 사용)
+                node_data["_cancel_token"] = context.cancel_token
+
+                # 드라이런 세션 전달 (입력 동작은 기록만 하고 화면 캡처는 재생 프레임으로 대체)
+                dry_run = context.workflow_data.get("dry_run")
+                if dry_run is not None:
+                    node_data["_dry_run"] = dry_run
+
+            # 스크립트 호출 노드: 호출 스택(재귀 감지용)과 서브 워크플로우 실행 함수 전달
+            if node_type == "call-script":
+                call_stack = context.workflow_data.get("call_stack") if context else None
+                node_data["_call_stack"] = list(call_stack or ([script_id] if script_id is not None else []))
+                node_data["_call_script"] = self.call_script
 
                 logger.debug(f"준비된 노드 데이터: {node_data}")
 
@@ -276,10 +395,48 @@ class ActionService:
                 result = {"action": node_type, "status": "completed", "output": output_override}
                 logger.debug(f"출력 오버라이드 사용: {output_override}")
             else:
-                # 액션 실행 (입력이 없어도 처리)
                 node_type_str = str(node_type) if node_type else "unknown"
-                result = await self.process_action(node_type_str, node_data, action_node_type)
-                logger.debug(f"process_action 결과: {result}")
+
+                # 캐시 정책 해석 (노드의 cache 필드 또는 cache 파라미터, 설정한 노드만 캐시 사용)
+                # 드라이런 결과는 실제 실행 결과가 아니므로 캐시를 사용하지 않음
+                try:
+                    cache_policy = (
+                        None
+                        if "_dry_run" in node_data
+                        else NodeCachePolicy.from_config(node.get("cache", node_data.get("cache")))
+                    )
+                except ValueError as e:
+                    cache_policy = None
+                    logger.warning(f"[process_node] 캐시 설정 무시 - 노드 ID: {node_id}, 사유: {e!s}")
+
+                # cache_key: (노드 타입, 정규화된 파라미터, 참조하는 이전 노드 출력)으로 만든 캐시 키
+                cache_key = None
+                cached = None
+                if cache_policy is not None:
+                    cache_key = NodeResultCache.make_key(
+                        f"{node_type_str}:{action_node_type or ''}", node_data, cache_policy.upstream_outputs(context)
+                    )
+                    cached = node_result_cache.get(cache_key)
+
+                if cached is not None:
+                    # 캐시 히트: 노드를 실행하지 않고 저장된 결과 사용 (로그에 캐시 히트 표시)
+                    result = self._use_cached_result(
+                        cached,
+                        cache_key,
+                        node_data,
+                        action_node_type or node_type_str,
+                        node_data["_node_id"],
+                        node_name,
+                    )
+                else:
+                    # 액션 실행 (입력이 없어도 처리)
+                    result = await self.process_action(node_type_str, node_data, action_node_type)
+                    logger.debug(f"process_action 결과: {result}")
+
+                    # 성공한 결과만 캐시에 저장 (재시도 기록 등 실행별 정보는 제외)
+                    if cache_key is not None and cache_policy is not None and self._is_cacheable(result):
+                        cacheable = {k: v for k, v in result.items() if k not in ("attempts", "meta")}
+                        node_result_cache.put(cache_key, cacheable, cache_policy.ttl_seconds)
 
             # 결과가 None이면 기본값으로 변환
             if result is None:
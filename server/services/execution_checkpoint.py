@@ -0,0 +1,180 @@
+"""
+실행 체크포인트
+서버 측 스크립트 실행(ScriptRunner) 중 실행 위치와 실행 컨텍스트를 주기적으로 DB에 저장하여,
+서버 프로세스가 종료되어도 마지막 체크포인트부터 실행을 재개할 수 있게 합니다.
+
+- 실행 위치(cursor): 다음에 실행할 노드 ID, 방문한 노드, 반복 노드의 반복 횟수/본문 위치
+- 실행 컨텍스트: 보존 중인 노드 결과 (마지막 체크포인트 이후 추가/변경/제거된 노드만 반영하는 증분 쓰기)
+- 저장 간격: CHECKPOINT_INTERVAL_SECONDS (실행별로 지정 가능, 0이면 노드마다 저장)
+
+재개 시 마지막 체크포인트 이후에 실행된 노드는 다시 실행됩니다.
+"""
+
+import json
+import time
+from typing import Any
+
+from config.server_config import settings
+from db.database import db_manager
+from log import log_manager
+from services.node_execution_context import NodeExecutionContext, NodeResultRecord
+
+logger = log_manager.logger
+
+
+class ExecutionCheckpointer:
+    """
+    실행 체크포인트 저장 클래스
+    마지막으로 저장한 결과 레코드를 기억하여 변경된 노드 결과만 저장합니다.
+    """
+
+    def __init__(
+        self,
+        execution_id: str,
+        script_id: int,
+        interval_seconds: float | None = None,
+        sequence: int = 0,
+        completed_nodes: int = 0,
+    ) -> None:
+        """
+        ExecutionCheckpointer 초기화
+
+        Args:
+            execution_id: 워크플로우 실행 ID
+            script_id: 스크립트 ID
+            interval_seconds: 체크포인트 저장 최소 간격 (초, None이면 설정값, 0이면 노드마다 저장)
+            sequence: 시작 체크포인트 순번 (재개 시 이전 순번부터 이어감)
+            completed_nodes: 지금까지 실행한 노드 수 (재개 시 이전 값부터 이어감)
+        """
+        self.execution_id = execution_id
+        self.script_id = script_id
+        self.interval_seconds = max(
+            0.0, settings.CHECKPOINT_INTERVAL_SECONDS if interval_seconds is None else interval_seconds
+        )
+        self.sequence = sequence
+        self.completed_nodes = completed_nodes
+        # _saved: 노드 ID → 마지막으로 저장한 결과 레코드 (레코드 객체가 바뀌었으면 변경된 노드)
+        self._saved: dict[str, NodeResultRecord] = {}
+        # _next_position: 다음에 저장할 결과의 순서 값 (계속 증가하므로 복원 시 실행 순서가 유지됨)
+        self._next_position = 0
+        self._last_saved_at: float | None = None
+        # 통계 (저장 횟수, 저장한 노드 결과 수)
+        self.writes = 0
+        self.rows_written = 0
+
+    def mark_saved(self, context: NodeExecutionContext, next_position: int = 0) -> None:
+        """
+        현재 컨텍스트의 결과를 이미 저장된 것으로 표시합니다. (체크포인트에서 복원한 직후 호출)
+
+        Args:
+            context: 노드 실행 컨텍스트
+            next_position: 다음에 저장할 결과의 순서 값 (복원한 결과의 최대 순서 + 1)
+        """
+        self._saved = {record.node_id: record for record in context.records()}
+        self._next_position = next_position
+        self._last_saved_at = time.monotonic()
+
+    def node_completed(self, cursor_state: dict[str, Any], context: NodeExecutionContext) -> bool:
+        """
+        노드 하나가 완료될 때마다 호출합니다. 저장 간격이 지났으면 체크포인트를 저장합니다.
+
+        Args:
+            cursor_state: 다음에 실행할 위치
+            context: 노드 실행 컨텍스트
+
+        Returns:
+            저장 여부
+        """
+        self.completed_nodes += 1
+        now = time.monotonic()
+        if self._last_saved_at is not None and now - self._last_saved_at < self.interval_seconds:
+            return False
+        return self.save(cursor_state, context)
+
+    def save(self, cursor_state: dict[str, Any], context: NodeExecutionContext, status: str = "running") -> bool:
+        """
+        체크포인트를 저장합니다. (저장 실패는 실행을 중단하지 않고 경고만 남김)
+
+        Args:
+            cursor_state: 다음에 실행할 위치
+            context: 노드 실행 컨텍스트
+            status: 체크포인트 상태
+
+        Returns:
+            저장 성공 여부
+        """
+        records = context.records()
+        current_ids = {record.node_id for record in records}
+        # upserts: 마지막 저장 이후 추가/변경된 노드 결과 (레코드 객체가 바뀐 노드만, 실행 순서대로)
+        upserts: list[tuple[str, str | None, int, str]] = []
+        for record in records:
+            if self._saved.get(record.node_id) is record:
+                continue
+            result_json = json.dumps(record.result, ensure_ascii=False, default=str)
+            upserts.append((record.node_id, record.node_name, self._next_position + len(upserts), result_json))
+        deletes = [node_id for node_id in self._saved if node_id not in current_ids]
+
+        try:
+            db_manager.execution_checkpoints.save_checkpoint(
+                execution_id=self.execution_id,
+                script_id=self.script_id,
+                cursor_state=cursor_state,
+                node_name_map=context.node_name_map,
+                sequence=self.sequence + 1,
+                completed_nodes=self.completed_nodes,
+                upserts=upserts,
+                deletes=deletes,
+                status=status,
+            )
+        except Exception as e:
+            logger.warning(
+                f"[ExecutionCheckpointer] 체크포인트 저장 실패 (무시) - 실행 ID: {self.execution_id}, 에러: {e!s}"
+            )
+            return False
+
+        self.sequence += 1
+        self.writes += 1
+        self.rows_written += len(upserts)
+        self._next_position += len(upserts)
+        self._saved = {record.node_id: record for record in records}
+        self._last_saved_at = time.monotonic()
+        logger.debug(
+            f"[ExecutionCheckpointer] 체크포인트 저장 - 실행 ID: {self.execution_id}, 순번: {self.sequence}, "
+            f"변경 노드: {len(upserts)}개, 제거 노드: {len(deletes)}개"
+        )
+        return True
+
+    def finish(self, status: str, error_message: str | None = None) -> None:
+        """
+        실행 종료 시 체크포인트를 정리합니다.
+        성공한 실행은 재개할 필요가 없으므로 삭제하고, 실패/취소된 실행은 상태만 변경하여 재개할 수 있게 남깁니다.
+
+        Args:
+            status: 실행 최종 상태 (success, error, cancelled)
+            error_message: 에러 메시지
+        """
+        try:
+            if status == "success":
+                db_manager.execution_checkpoints.delete_checkpoint(self.execution_id)
+            else:
+                checkpoint_status = "cancelled" if status == "cancelled" else "failed"
+                db_manager.execution_checkpoints.update_status(self.execution_id, checkpoint_status, error_message)
+        except Exception as e:
+            logger.warning(
+                f"[ExecutionCheckpointer] 체크포인트 정리 실패 (무시) - 실행 ID: {self.execution_id}, 에러: {e!s}"
+            )
+
+
+def restore_context(checkpoint: dict[str, Any], context: NodeExecutionContext) -> None:
+    """
+    체크포인트에 보존된 노드 결과를 실행 컨텍스트에 복원합니다.
+
+    Args:
+        checkpoint: get_checkpoint(include_results=True)로 조회한 체크포인트
+        context: 복원할 노드 실행 컨텍스트
+    """
+    for item in checkpoint.get("results", []):
+        context.add_node_result(item["node_id"], item.get("node_name"), item["result"])
+    # 결과 없이 이름만 남은 노드(보존 정책으로 제거된 노드)의 이름 매핑도 복원
+    for node_name, node_id in (checkpoint.get("node_name_map") or {}).items():
+        context.node_name_map.setdefault(node_name, node_id)
@@ -0,0 +1,723 @@
+"""
+실행 큐 서비스
+서버에서 실행되는 스크립트들의 실행 순서와 동시 실행을 조정합니다.
+
+주요 기능:
+- 스케줄링: priority(우선순위 높은 순 → 등록 순) 또는 fifo(등록 순)
+- 리소스별 동시 실행 제한: 마우스/키보드(input), Excel 등 같은 리소스를 쓰는 실행은 한도만큼만 동시에 실행
+- 활성 스크립트 전체 실행: execution_order 순서대로 활성 스크립트를 큐에 등록 (순서 보장)
+- 메트릭: 대기열 깊이, 대기 시간 통계, 리소스 사용량
+- 대기 중인 실행 조회/순서 변경/취소
+
+사용 예시:
+    run = await execution_queue.enqueue_script(script_id=1, priority=5)
+    execution_queue.move_run(run.run_id, position=0)
+    execution_queue.cancel_run(run.run_id)
+"""
+
+import asyncio
+from collections import deque
+from collections.abc import AsyncIterator, Awaitable, Callable
+import contextlib
+from datetime import datetime
+from enum import Enum
+import heapq
+import math
+import time
+from typing import TYPE_CHECKING, Any
+import uuid
+
+from config.nodes_config import get_node_resources
+from config.server_config import settings
+from db.database import db_manager
+from log import log_manager
+from utils.cancellation import cancellation_registry
+from utils.execution_id_generator import generate_execution_id
+
+if TYPE_CHECKING:
+    from services.script_runner import ScriptRunner
+
+logger = log_manager.logger
+
+
+class QueuedRunStatus(Enum):
+    """큐에 등록된 실행의 상태 열거형"""
+
+    QUEUED = "queued"
+    RUNNING = "running"
+    COMPLETED = "completed"
+    FAILED = "failed"
+    CANCELLED = "cancelled"
+
+
+class QueuedRun:
+    """큐에 등록된 스크립트 실행 한 건"""
+
+    def __init__(
+        self,
+        script_id: int,
+        priority: int,
+        resources: list[str],
+        order_key: int,
+        source: str = "api",
+        batch_id: str | None = None,
+        script_name: str | None = None,
+        timeout_seconds: float | None = None,
+        resume_execution_id: str | None = None,
+        checkpoint_interval_seconds: float | None = None,
+    ) -> None:
+        # run_id: 큐 실행 ID (큐 안에서 실행을 식별)
+        self.run_id = f"run_{uuid.uuid4().hex[:12]}"
+        self.script_id = script_id
+        self.script_name = script_name
+        # priority: 우선순위 (값이 클수록 먼저 실행, priority 모드에서만 사용)
+        self.priority = priority
+        # resources: 실행 중 점유하는 리소스 목록
+        self.resources = resources
+        # order_key: 같은 우선순위 안에서의 순서 (작을수록 먼저 실행)
+        self.order_key = order_key
+        # source: 등록 경로 (api, run_all, schedule 등)
+        self.source = source
+        # batch_id: 함께 등록된 실행 묶음 ID (활성 스크립트 전체 실행 등)
+        self.batch_id = batch_id
+        # timeout_seconds: 실행 제한 시간 (실행 시작부터 계산, None이면 WORKFLOW_TIMEOUT_SECONDS 적용)
+        self.timeout_seconds = timeout_seconds
+        # resume: 체크포인트에서 재개하는 실행인지 여부 (재개 시 execution_id는 원래 실행 ID를 그대로 사용)
+        self.resume = resume_execution_id is not None
+        # checkpoint_interval_seconds: 체크포인트 저장 최소 간격 (None이면 CHECKPOINT_INTERVAL_SECONDS 적용)
+        self.checkpoint_interval_seconds = checkpoint_interval_seconds
+        self.status = QueuedRunStatus.QUEUED
+
+        self.enqueued_at = datetime.now().isoformat()
+        self.started_at: str | None = None
+        self.finished_at: str | None = None
+        # 대기/실행 시간 계산용 단조 시계 값 (시스템 시간 변경의 영향을 받지 않음)
+        self.enqueued_monotonic = time.monotonic()
+        self.started_monotonic: float | None = None
+        self.wait_time_ms: int | None = None
+        self.run_time_ms: int | None = None
+
+        # execution_id: 실제 워크플로우 실행 ID (실행 시작 시 발급, 취소 토큰 조회에 사용)
+        self.execution_id: str | None = resume_execution_id
+        self.result_status: str | None = None
+        self.error_message: str | None = None
+        self.task: asyncio.Task | None = None
+
+    def sort_key(self, scheduling: str) -> tuple[int, int]:
+        """스케줄링 방식에 따른 정렬 키"""
+        if scheduling == "priority":
+            return (-self.priority, self.order_key)
+        return (0, self.order_key)
+
+    def waited_ms(self) -> int:
+        """등록 후 현재까지(또는 실행 시작까지) 대기한 시간 (밀리초)"""
+        end = self.started_monotonic if self.started_monotonic is not None else time.monotonic()
+        return int((end - self.enqueued_monotonic) * 1000)
+
+    def to_dict(self) -> dict[str, Any]:
+        """실행 정보를 딕셔너리로 변환합니다."""
+        return {
+            "run_id": self.run_id,
+            "script_id": self.script_id,
+            "script_name": self.script_name,
+            "priority": self.priority,
+            "resources": self.resources,
+            "source": self.source,
+            "batch_id": self.batch_id,
+            "timeout_seconds": self.timeout_seconds,
+            "resume": self.resume,
+            "status": self.status.value,
+            "enqueued_at": self.enqueued_at,
+            "started_at": self.started_at,
+            "finished_at": self.finished_at,
+            "wait_time_ms": self.wait_time_ms if self.wait_time_ms is not None else self.waited_ms(),
+            "run_time_ms": self.run_time_ms,
+            "execution_id": self.execution_id,
+            "result_status": self.result_status,
+            "error_message": self.error_message,
+        }
+
+
+class ResourceLimiter:
+    """
+    리소스별 동시 사용 한도를 관리하는 클래스
+
+    한도가 설정되지 않은 리소스는 기본 한도 1로 취급합니다.
+    (예: 배치 실행 순서 보장을 위한 "batch:<id>" 리소스)
+    """
+
+    def __init__(self, limits: dict[str, int], on_release: Callable[[], None] | None = None) -> None:
+        """
+        ResourceLimiter 초기화
+
+        Args:
+            limits: 리소스별 동시 사용 한도 (예: {"input": 1})
+            on_release: 리소스가 반환될 때 호출할 콜백
+        """
+        self.limits = limits
+        # usage: 리소스별 현재 사용 수
+        self.usage: dict[str, int] = {}
+        self._on_release = on_release
+        # _waiters: 리소스 반환을 기다리는 Future 목록 (resource_slot 사용자)
+        self._waiters: list[asyncio.Future] = []
+
+    def can_acquire(self, resources: list[str]) -> bool:
+        """모든 리소스를 지금 바로 점유할 수 있는지 확인"""
+        return all(self.usage.get(name, 0) < self.limits.get(name, 1) for name in resources)
+
+    def try_acquire(self, resources: list[str]) -> bool:
+        """
+        리소스를 점유합니다. 하나라도 한도에 도달했으면 아무것도 점유하지 않습니다.
+
+        Returns:
+            점유 성공 여부
+        """
+        if not self.can_acquire(resources):
+            return False
+        for name in resources:
+            self.usage[name] = self.usage.get(name, 0) + 1
+        return True
+
+    def release(self, resources: list[str]) -> None:
+        """점유한 리소스를 반환하고 대기자를 깨웁니다."""
+        for name in resources:
+            count = self.usage.get(name, 0) - 1
+            if count > 0:
+                self.usage[name] = count
+            else:
+                self.usage.pop(name, None)
+
+        # 대기 중인 모든 요청을 깨워서 다시 점유를 시도하게 함
+        waiters, self._waiters = self._waiters, []
+        for waiter in waiters:
+            if not waiter.done():
+                waiter.set_result(None)
+
+        if self._on_release:
+            self._on_release()
+
+    async def acquire(self, resources: list[str]) -> None:
+        """리소스를 점유할 수 있을 때까지 기다린 뒤 점유합니다."""
+        while not self.try_acquire(resources):
+            waiter = asyncio.get_running_loop().create_future()
+            self._waiters.append(waiter)
+            try:
+                await waiter
+            finally:
+                if waiter in self._waiters:
+                    self._waiters.remove(waiter)
+
+    @contextlib.asynccontextmanager
+    async def slot(self, resources: list[str]) -> AsyncIterator[None]:
+        """리소스를 점유한 상태로 블록을 실행하는 컨텍스트 매니저"""
+        await self.acquire(resources)
+        try:
+            yield
+        finally:
+            self.release(resources)
+
+
+def parse_resource_limits(raw: str) -> dict[str, int]:
+    """
+    "input=1,excel=1" 형식의 리소스 한도 문자열을 파싱합니다.
+
+    Args:
+        raw: 리소스 한도 문자열
+
+    Returns:
+        리소스별 한도 딕셔너리 (잘못된 항목은 무시)
+    """
+    limits: dict[str, int] = {}
+    for item in raw.split(","):
+        name, _, value = item.partition("=")
+        name = name.strip()
+        if not name:
+            continue
+        try:
+            limits[name] = max(1, int(value.strip()))
+        except ValueError:
+            logger.warning(f"[ExecutionQueue] 잘못된 리소스 한도 설정 무시: {item}")
+    return limits
+
+
+def resources_for_nodes(nodes: list[dict[str, Any]]) -> list[str]:
+    """
+    노드 목록이 점유하는 리소스 목록을 계산합니다.
+
+    Args:
+        nodes: 노드 목록 (type 필드 사용)
+
+    Returns:
+        리소스 이름 목록 (정렬됨, 중복 제거)
+    """
+    resources: set[str] = set()
+    for node in nodes:
+        resources.update(get_node_resources(str(node.get("type", ""))))
+    return sorted(resources)
+
+
+def _percentile(sorted_values: list[int], ratio: float) -> int | None:
+    """정렬된 값 목록에서 백분위 값 계산 (nearest-rank)"""
+    if not sorted_values:
+        return None
+    index = min(len(sorted_values) - 1, max(0, math.ceil(ratio * len(sorted_values)) - 1))
+    return sorted_values[index]
+
+
+class ExecutionQueue:
+    """
+    스크립트 실행 큐 클래스
+
+    대기열은 힙으로 관리하고, 취소/순서 변경된 항목은 힙에서 즉시 제거하지 않고
+    꺼낼 때 건너뜁니다 (지연 삭제). 디스패치는 별도 백그라운드 태스크 없이
+    등록/완료/리소스 반환 시점에만 수행되므로 큐가 비어 있을 때는 비용이 없습니다.
+    """
+
+    def __init__(
+        self,
+        scheduling: str | None = None,
+        max_concurrent_runs: int | None = None,
+        resource_limits: dict[str, int] | None = None,
+        history_size: int | None = None,
+        run_executor: Callable[[QueuedRun], Awaitable[dict[str, Any]]] | None = None,
+    ) -> None:
+        """
+        ExecutionQueue 초기화
+
+        Args:
+            scheduling: 스케줄링 방식 ("priority" 또는 "fifo", None이면 설정값 사용)
+            max_concurrent_runs: 최대 동시 실행 수 (None이면 설정값 사용)
+            resource_limits: 리소스별 동시 사용 한도 (None이면 설정값 사용)
+            history_size: 완료 기록/대기 시간 샘플 보관 개수 (None이면 설정값 사용)
+            run_executor: 실행 한 건을 처리하는 코루틴 함수 (None이면 ScriptRunner 사용)
+        """
+        scheduling = (scheduling or settings.QUEUE_SCHEDULING).lower()
+        self.scheduling = scheduling if scheduling in ("priority", "fifo") else "priority"
+        self.max_concurrent_runs = max(1, max_concurrent_runs or settings.QUEUE_MAX_CONCURRENT_RUNS)
+        limits = (
+            resource_limits if resource_limits is not None else parse_resource_limits(settings.QUEUE_RESOURCE_LIMITS)
+        )
+        self.limiter = ResourceLimiter(limits, on_release=self._schedule_dispatch)
+        history_size = history_size or settings.QUEUE_HISTORY_SIZE
+
+        # _heap: (정렬 키, 실행 ID) 힙 - 취소/순서 변경된 항목은 꺼낼 때 건너뜀
+        self._heap: list[tuple[tuple[int, int], str]] = []
+        # _runs: 대기 중이거나 실행 중인 실행 (실행 ID → 실행)
+        self._runs: dict[str, QueuedRun] = {}
+        # _history: 종료된 실행 기록 (최근 history_size개)
+        self._history: deque[QueuedRun] = deque(maxlen=history_size)
+        # _wait_samples: 실행 시작까지의 대기 시간 샘플 (밀리초)
+        self._wait_samples: deque[int] = deque(maxlen=history_size)
+        # _sequence: 등록 순서 카운터 (order_key 발급용)
+        self._sequence = 0
+        # _running_count: 현재 실행 중인 실행 수
+        self._running_count = 0
+        # _dispatch_scheduled: 디스패치 예약 여부 (중복 예약 방지)
+        self._dispatch_scheduled = False
+        # _totals: 누적 카운터
+        self._totals = {"enqueued": 0, "completed": 0, "failed": 0, "cancelled": 0}
+
+        self._run_executor = run_executor
+        self._script_runner: ScriptRunner | None = None
+
+    # ------------------------------------------------------------------
+    # 등록
+    # ------------------------------------------------------------------
+    async def enqueue_script(
+        self,
+        script_id: int,
+        priority: int = 0,
+        source: str = "api",
+        batch_id: str | None = None,
+        extra_resources: list[str] | None = None,
+        timeout_seconds: float | None = None,
+        resume_execution_id: str | None = None,
+        checkpoint_interval_seconds: float | None = None,
+    ) -> QueuedRun:
+        """
+        스크립트 실행을 큐에 등록합니다.
+
+        Args:
+            script_id: 스크립트 ID
+            priority: 우선순위 (값이 클수록 먼저 실행)
+            source: 등록 경로 (api, run_all, schedule 등)
+            batch_id: 실행 묶음 ID
+            extra_resources: 노드 타입 외에 추가로 점유할 리소스
+            timeout_seconds: 실행 제한 시간 (초, 실행 시작부터 계산)
+            resume_execution_id: 체크포인트에서 재개할 실행 ID (지정 시 마지막 체크포인트부터 실행)
+            checkpoint_interval_seconds: 체크포인트 저장 최소 간격 (초)
+
+        Returns:
+            등록된 실행
+        """
+        script = db_manager.get_script(script_id)
+        if not script:
+            raise ValueError(f"스크립트를 찾을 수 없습니다: {script_id}")
+
+        resources = set(resources_for_nodes(script.get("nodes", [])))
+        resources.update(extra_resources or [])
+
+        self._sequence += 1
+        run = QueuedRun(
+            script_id=script_id,
+            priority=priority,
+            resources=sorted(resources),
+            order_key=self._sequence,
+            source=source,
+            batch_id=batch_id,
+            script_name=script.get("name"),
+            timeout_seconds=timeout_seconds,
+            resume_execution_id=resume_execution_id,
+            checkpoint_interval_seconds=checkpoint_interval_seconds,
+        )
+        self._runs[run.run_id] = run
+        heapq.heappush(self._heap, (run.sort_key(self.scheduling), run.run_id))
+        self._totals["enqueued"] += 1
+
+        logger.info(
+            f"[ExecutionQueue] 실행 등록 - 실행 ID: {run.run_id}, 스크립트 ID: {script_id}, 우선순위: {priority}, "
+            f"리소스: {run.resources}, 대기열 깊이: {self.queue_depth()}"
+        )
+        self._dispatch()
+        return run
+
+    async def enqueue_active_scripts(
+        self, priority: int = 0, timeout_seconds: float | None = None, checkpoint_interval_seconds: float | None = None
+    ) -> list[QueuedRun]:
+        """
+        활성 스크립트 전체를 execution_order 순서대로 큐에 등록합니다.
+
+        같은 배치의 실행들은 배치 전용 리소스("batch:<id>")를 공유하므로
+        한 번에 하나씩, 등록된 순서대로 실행됩니다.
+
+        Args:
+            priority: 배치 전체에 적용할 우선순위
+            timeout_seconds: 스크립트별 실행 제한 시간 (초)
+            checkpoint_interval_seconds: 체크포인트 저장 최소 간격 (초)
+
+        Returns:
+            등록된 실행 목록 (실행 순서)
+        """
+        batch_id = f"batch_{uuid.uuid4().hex[:12]}"
+        # get_all_scripts는 execution_order 순서로 정렬되어 반환됨
+        scripts = [script for script in db_manager.get_all_scripts() if script.get("active", True)]
+
+        runs = []
+        for script in scripts:
+            run = await self.enqueue_script(
+                script["id"],
+                priority=priority,
+                source="run_all",
+                batch_id=batch_id,
+                extra_resources=[f"batch:{batch_id}"],
+                timeout_seconds=timeout_seconds,
+                checkpoint_interval_seconds=checkpoint_interval_seconds,
+            )
+            runs.append(run)
+
+        logger.info(f"[ExecutionQueue] 활성 스크립트 전체 등록 - 배치 ID: {batch_id}, 스크립트 {len(runs)}개")
+        return runs
+
+    # ------------------------------------------------------------------
+    # 조회
+    # ------------------------------------------------------------------
+    def get_run(self, run_id: str) -> QueuedRun | None:
+        """실행 ID로 실행 조회 (대기/실행 중 또는 최근 종료 기록)"""
+        run = self._runs.get(run_id)
+        if run:
+            return run
+        for finished in self._history:
+            if finished.run_id == run_id:
+                return finished
+        return None
+
+    def list_queued(self) -> list[QueuedRun]:
+        """대기 중인 실행 목록 (실행될 순서)"""
+        queued = [run for run in self._runs.values() if run.status == QueuedRunStatus.QUEUED]
+        return sorted(queued, key=lambda run: run.sort_key(self.scheduling))
+
+    def list_running(self) -> list[QueuedRun]:
+        """실행 중인 실행 목록"""
+        return [run for run in self._runs.values() if run.status == QueuedRunStatus.RUNNING]
+
+    def list_history(self) -> list[QueuedRun]:
+        """최근 종료된 실행 목록 (최신순)"""
+        return list(reversed(self._history))
+
+    def queue_depth(self) -> int:
+        """대기열 깊이 (대기 중인 실행 수)"""
+        return len(self._runs) - self._running_count
+
+    def get_metrics(self) -> dict[str, Any]:
+        """
+        큐 메트릭을 반환합니다.
+
+        Returns:
+            메트릭 딕셔너리 (대기열 깊이, 실행 수, 리소스 사용량, 대기 시간 통계, 누적 카운터)
+        """
+        queued = self.list_queued()
+        # queued_by_resource: 리소스별 대기 중인 실행 수
+        queued_by_resource: dict[str, int] = {}
+        for run in queued:
+            for name in run.resources:
+                queued_by_resource[name] = queued_by_resource.get(name, 0) + 1
+
+        samples = sorted(self._wait_samples)
+        return {
+            "scheduling": self.scheduling,
+            "queue_depth": len(queued),
+            "running": self._running_count,
+            "max_concurrent_runs": self.max_concurrent_runs,
+            "resource_limits": dict(self.limiter.limits),
+            "resource_usage": dict(self.limiter.usage),
+            "queued_by_resource": queued_by_resource,
+            "oldest_wait_ms": max((run.waited_ms() for run in queued), default=0),
+            "wait_time_ms": {
+                "samples": len(samples),
+                "avg": int(sum(samples) / len(samples)) if samples else None,
+                "p50": _percentile(samples, 0.5),
+                "p95": _percentile(samples, 0.95),
+                "max": samples[-1] if samples else None,
+            },
+            "totals": dict(self._totals),
+        }
+
+    # ------------------------------------------------------------------
+    # 순서 변경 / 취소
+    # ------------------------------------------------------------------
+    def move_run(self, run_id: str, position: int) -> bool:
+        """
+        대기 중인 실행의 순서를 변경합니다.
+
+        priority 모드에서는 이동한 위치의 우선순위를 따르도록 실행의 우선순위도 함께 조정합니다.
+
+        Args:
+            run_id: 실행 ID
+            position: 새 위치 (0부터 시작, 범위를 벗어나면 맨 앞/맨 뒤)
+
+        Returns:
+            성공 여부 (대기 중인 실행이 아니면 False)
+        """
+        queued = self.list_queued()
+        target = next((run for run in queued if run.run_id == run_id), None)
+        if target is None:
+            return False
+
+        queued.remove(target)
+        position = max(0, min(position, len(queued)))
+        queued.insert(position, target)
+
+        if self.scheduling == "priority" and len(queued) > 1:
+            # 뒤쪽 이웃의 우선순위를 따르고, 맨 뒤로 이동한 경우 앞쪽 이웃을 따름
+            neighbor = queued[position + 1] if position + 1 < len(queued) else queued[position - 1]
+            target.priority = neighbor.priority
+
+        self._reassign_order(queued)
+        logger.info(f"[ExecutionQueue] 실행 순서 변경 - 실행 ID: {run_id}, 새 위치: {position}")
+        return True
+
+    def set_priority(self, run_id: str, priority: int) -> bool:
+        """
+        대기 중인 실행의 우선순위를 변경합니다.
+
+        Args:
+            run_id: 실행 ID
+            priority: 새 우선순위
+
+        Returns:
+            성공 여부
+        """
+        run = self._runs.get(run_id)
+        if run is None or run.status != QueuedRunStatus.QUEUED:
+            return False
+        run.priority = priority
+        heapq.heappush(self._heap, (run.sort_key(self.scheduling), run.run_id))
+        logger.info(f"[ExecutionQueue] 우선순위 변경 - 실행 ID: {run_id}, 우선순위: {priority}")
+        self._dispatch()
+        return True
+
+    def _reassign_order(self, queued: list[QueuedRun]) -> None:
+        """대기 중인 실행들의 순서 키를 다시 발급하고 힙을 재구성합니다."""
+        for run in queued:
+            self._sequence += 1
+            run.order_key = self._sequence
+        self._heap = [(run.sort_key(self.scheduling), run.run_id) for run in queued]
+        heapq.heapify(self._heap)
+        self._dispatch()
+
+    def cancel_run(self, run_id: str) -> bool:
+        """
+        실행을 취소합니다. 대기 중이면 대기열에서 제거하고, 실행 중이면 취소 토큰으로 협력적 취소를 요청합니다.
+        (취소 토큰이 아직 등록되지 않은 실행은 실행 태스크를 취소)
+
+        Args:
+            run_id: 실행 ID
+
+        Returns:
+            성공 여부 (이미 종료되었거나 없는 실행이면 False)
+        """
+        run = self._runs.get(run_id)
+        if run is None:
+            return False
+
+        if run.status == QueuedRunStatus.QUEUED:
+            # 힙 항목은 꺼낼 때 건너뜀 (지연 삭제)
+            self._finish(run, QueuedRunStatus.CANCELLED)
+            logger.info(f"[ExecutionQueue] 대기 중인 실행 취소 - 실행 ID: {run_id}")
+            return True
+
+        if run.status == QueuedRunStatus.RUNNING and run.task and not run.task.done():
+            # 협력적 취소: 진행 중인 대기/이미지 찾기/HTTP 요청이 즉시 중단되고 엑셀 정리 후 종료됨
+            if not (run.execution_id and cancellation_registry.cancel(run.execution_id, "실행 큐에서 취소되었습니다.")):
+                run.task.cancel()
+            logger.info(f"[ExecutionQueue] 실행 중인 실행 취소 요청 - 실행 ID: {run_id}")
+            return True
+        return False
+
+    def cancel_batch(self, batch_id: str) -> int:
+        """
+        배치에 속한 모든 실행을 취소합니다.
+
+        Args:
+            batch_id: 배치 ID
+
+        Returns:
+            취소된 실행 수
+        """
+        run_ids = [run.run_id for run in self._runs.values() if run.batch_id == batch_id]
+        return sum(1 for run_id in run_ids if self.cancel_run(run_id))
+
+    # ------------------------------------------------------------------
+    # 리소스 슬롯 (큐를 거치지 않는 직접 실행용)
+    # ------------------------------------------------------------------
+    def resource_slot(self, resources: list[str]) -> contextlib.AbstractAsyncContextManager[None]:
+        """
+        큐를 거치지 않는 실행(/api/execute-nodes 등)이 리소스를 점유하도록 하는 컨텍스트 매니저
+
+        Args:
+            resources: 점유할 리소스 목록
+
+        Returns:
+            비동기 컨텍스트 매니저
+        """
+        return self.limiter.slot(resources)
+
+    # ------------------------------------------------------------------
+    # 디스패치 / 실행
+    # ------------------------------------------------------------------
+    def _schedule_dispatch(self) -> None:
+        """
+        리소스 반환 후 디스패치를 예약합니다.
+        리소스를 기다리던 직접 실행 요청이 먼저 깨어날 수 있도록 다음 루프 반복으로 미룹니다.
+        """
+        if self._dispatch_scheduled:
+            return
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return
+        self._dispatch_scheduled = True
+        loop.call_soon(self._dispatch)
+
+    def _dispatch(self) -> None:
+        """
+        실행 가능한 대기 실행들을 순서대로 시작합니다. 리소스가 부족한 실행은 건너뜁니다.
+        단, 배치의 앞선 실행이 막히면 같은 배치의 뒤 실행도 함께 미뤄 배치 안의 실행 순서를 지킵니다.
+        """
+        self._dispatch_scheduled = False
+        # blocked: 리소스 부족으로 이번에 시작하지 못한 힙 항목 (다시 힙에 넣음)
+        blocked: list[tuple[tuple[int, int], str]] = []
+        # held_batches: 앞선 실행이 막혀 이번 디스패치에서 시작하지 않을 배치 ID
+        held_batches: set[str] = set()
+
+        while self._heap and self._running_count < self.max_concurrent_runs:
+            entry = heapq.heappop(self._heap)
+            sort_key, run_id = entry
+            run = self._runs.get(run_id)
+            # 취소되었거나 순서가 바뀌어 키가 달라진 항목은 버림
+            if run is None or run.status != QueuedRunStatus.QUEUED or run.sort_key(self.scheduling) != sort_key:
+                continue
+            if run.batch_id is not None and run.batch_id in held_batches:
+                blocked.append(entry)
+                continue
+            if not self.limiter.try_acquire(run.resources):
+                blocked.append(entry)
+                if run.batch_id is not None:
+                    held_batches.add(run.batch_id)
+                continue
+            self._start(run)
+
+        for entry in blocked:
+            heapq.heappush(self._heap, entry)
+
+    def _start(self, run: QueuedRun) -> None:
+        """실행을 시작합니다 (리소스는 이미 점유된 상태)."""
+        run.status = QueuedRunStatus.RUNNING
+        run.started_monotonic = time.monotonic()
+        run.started_at = datetime.now().isoformat()
+        run.wait_time_ms = run.waited_ms()
+        self._wait_samples.append(run.wait_time_ms)
+        self._running_count += 1
+
+        logger.info(
+            f"[ExecutionQueue] 실행 시작 - 실행 ID: {run.run_id}, 스크립트 ID: {run.script_id}, "
+            f"대기 시간: {run.wait_time_ms}ms"
+        )
+        run.task = asyncio.create_task(self._run(run))
+
+    async def _run(self, run: QueuedRun) -> None:
+        """실행 한 건을 처리하고 결과를 기록합니다."""
+        final_status = QueuedRunStatus.FAILED
+        try:
+            summary = await self._execute(run)
+            run.execution_id = summary.get("execution_id") or run.execution_id
+            run.result_status = summary.get("status")
+            run.error_message = summary.get("error_message")
+            final_status = {
+                "error": QueuedRunStatus.FAILED,
+                "cancelled": QueuedRunStatus.CANCELLED,
+            }.get(run.result_status or "", QueuedRunStatus.COMPLETED)
+        except asyncio.CancelledError:
+            final_status = QueuedRunStatus.CANCELLED
+            run.error_message = "실행이 취소되었습니다."
+        except Exception as e:
+            run.error_message = str(e)
+            logger.error(f"[ExecutionQueue] 실행 실패 - 실행 ID: {run.run_id}, 에러: {e!s}")
+        finally:
+            if run.started_monotonic is not None:
+                run.run_time_ms = int((time.monotonic() - run.started_monotonic) * 1000)
+            self._running_count -= 1
+            self._finish(run, final_status)
+            # 리소스 반환 (반환 콜백에서 다음 실행 디스패치가 예약됨)
+            self.limiter.release(run.resources)
+
+    async def _execute(self, run: QueuedRun) -> dict[str, Any]:
+        """실행 한 건을 실제로 수행합니다."""
+        # 실행 ID를 미리 발급해 두어 실행 중 취소 토큰으로 취소할 수 있게 함
+        run.execution_id = run.execution_id or generate_execution_id()
+        if self._run_executor is not None:
+            return await self._run_executor(run)
+        if self._script_runner is None:
+            from services.script_runner import ScriptRunner
+
+            self._script_runner = ScriptRunner()
+        return await self._script_runner.run_script(
+            run.script_id,
+            execution_id=run.execution_id,
+            timeout_seconds=run.timeout_seconds,
+            resume=run.resume,
+            checkpoint_interval_seconds=run.checkpoint_interval_seconds,
+        )
+
+    def _finish(self, run: QueuedRun, status: QueuedRunStatus) -> None:
+        """실행을 종료 상태로 전환하고 기록으로 옮깁니다."""
+        run.status = status
+        run.finished_at = datetime.now().isoformat()
+        self._runs.pop(run.run_id, None)
+        self._history.append(run)
+        self._totals[status.value] = self._totals.get(status.value, 0) + 1
+        logger.info(f"[ExecutionQueue] 실행 종료 - 실행 ID: {run.run_id}, 상태: {status.value}")
+
+
+# 전역 실행 큐 인스턴스
+execution_queue = ExecutionQueue()
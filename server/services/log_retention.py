@@ -0,0 +1,254 @@
+"""
+노드 실행 로그 보존 서비스
+node_execution_logs가 끝없이 커지지 않도록 기간/개수 제한을 넘은 로그를 정리합니다.
+
+- 개수 제한: LOG_RETENTION_MAX_ROWS개를 넘는 로그를 오래된 것부터 정리
+- 기간 제한: 시작 시간이 LOG_RETENTION_DAYS일보다 오래된 로그를 정리
+- 일별 집계: 정리하는 로그는 (날짜, 스크립트, 노드 타입)별 집계(node_execution_log_rollups)에 더한 뒤 삭제
+  (실행/완료/실패/시간 초과/캐시 히트 수, 실행 시간 합계/최대/p50/p95)
+- 보관(선택): LOG_ARCHIVE_DIR을 설정하면 삭제 전 원본 로그를 gzip 압축 NDJSON 세그먼트 파일에 기록
+- 점진적 정리: LOG_RETENTION_CHUNK_SIZE개씩 트랜잭션을 나누고 청크 사이에 쉬어 로그 기록을 오래 막지 않으며,
+  청크마다 빈 페이지를 LOG_VACUUM_PAGES개까지 반환 (auto_vacuum=INCREMENTAL DB)
+
+LOG_RETENTION_INTERVAL_SECONDS마다 자동으로 실행하며, /api/logs/retention/run으로 바로 실행할 수도 있습니다.
+"""
+
+import asyncio
+import contextlib
+from datetime import datetime, timedelta, timezone
+import gzip
+import json
+import os
+import threading
+import time
+from typing import Any
+
+from config.server_config import settings
+from db.database import db_manager
+from log import log_manager
+
+logger = log_manager.logger
+
+# 서버 시작 후 첫 자동 실행까지 대기 시간 (초) - 시작 직후의 부하와 겹치지 않게 함
+_FIRST_RUN_DELAY_SECONDS = 60.0
+
+
+class LogArchiveSegment:
+    """정리한 원본 로그를 기록하는 gzip 압축 NDJSON 세그먼트 파일 (보존 정책 실행 한 번당 파일 하나)"""
+
+    __slots__ = ("path", "records")
+
+    def __init__(self, archive_dir: str) -> None:
+        """
+        LogArchiveSegment 초기화 (파일은 첫 기록 때 생성)
+
+        Args:
+            archive_dir: 세그먼트 파일을 둘 폴더
+        """
+        self.path = os.path.join(archive_dir, f"node_execution_logs-{datetime.now():%Y%m%d-%H%M%S-%f}.ndjson.gz")
+        self.records = 0
+
+    def write(self, records: list[dict[str, Any]]) -> None:
+        """
+        로그를 한 줄에 하나씩 덧붙입니다. (청크마다 gzip 멤버 하나, 이어 붙인 파일도 gzip으로 그대로 읽힘)
+
+        Args:
+            records: 원본 로그 목록
+        """
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        with gzip.open(self.path, "at", encoding="utf-8") as file:
+            for record in records:
+                file.write(json.dumps(record, ensure_ascii=False, default=str))
+                file.write("\n")
+        self.records += len(records)
+
+
+class LogRetention:
+    """노드 실행 로그 보존 정책을 실행하는 클래스"""
+
+    def __init__(
+        self,
+        retention_days: int | None = None,
+        max_rows: int | None = None,
+        interval: float | None = None,
+        chunk_size: int | None = None,
+        chunk_pause: float | None = None,
+        archive_dir: str | None = None,
+        vacuum_pages: int | None = None,
+    ) -> None:
+        """
+        LogRetention 초기화 (None인 값은 같은 이름의 LOG_RETENTION_*/LOG_ARCHIVE_DIR/LOG_VACUUM_PAGES 설정 사용)
+
+        Args:
+            retention_days: 로그 보존 기간 (일, 0이면 기간 제한 없음)
+            max_rows: 보존할 최대 로그 수 (0이면 개수 제한 없음)
+            interval: 자동 실행 주기 (초, 0 이하면 자동 실행 안 함)
+            chunk_size: 한 트랜잭션에서 정리할 최대 로그 수
+            chunk_pause: 청크 사이 쉬는 시간 (초)
+            archive_dir: 원본 로그 보관 폴더 (빈 값이면 보관하지 않음)
+            vacuum_pages: 청크마다 반환할 최대 빈 페이지 수 (0이면 반환하지 않음)
+        """
+        self.retention_days = max(0, settings.LOG_RETENTION_DAYS if retention_days is None else retention_days)
+        self.max_rows = max(0, settings.LOG_RETENTION_MAX_ROWS if max_rows is None else max_rows)
+        self.interval = settings.LOG_RETENTION_INTERVAL_SECONDS if interval is None else interval
+        self.chunk_size = max(1, settings.LOG_RETENTION_CHUNK_SIZE if chunk_size is None else chunk_size)
+        self.chunk_pause = max(0.0, settings.LOG_RETENTION_CHUNK_PAUSE_SECONDS if chunk_pause is None else chunk_pause)
+        self.archive_dir = settings.LOG_ARCHIVE_DIR if archive_dir is None else archive_dir
+        self.vacuum_pages = max(0, settings.LOG_VACUUM_PAGES if vacuum_pages is None else vacuum_pages)
+        self._task: asyncio.Task[None] | None = None
+        # _run_lock: 자동 실행과 수동 실행이 겹치지 않게 함, _stop_requested: 서버 종료 시 청크 사이에서 중단
+        self._run_lock = threading.Lock()
+        self._stop_requested = threading.Event()
+        self.last_report: dict[str, Any] | None = None
+
+    @property
+    def running(self) -> bool:
+        """자동 실행 태스크 실행 여부"""
+        return self._task is not None and not self._task.done()
+
+    async def start(self) -> None:
+        """자동 실행 태스크를 시작합니다. (서버 시작 시 호출)"""
+        if self.running or self.interval <= 0 or not (self.retention_days or self.max_rows):
+            return
+        self._stop_requested.clear()
+        self._task = asyncio.create_task(self._loop())
+        logger.info(
+            f"[LogRetention] 로그 보존 정책 시작 - 기간: {self.retention_days}일, 최대: {self.max_rows}개, "
+            f"주기: {self.interval}초, 보관 폴더: {self.archive_dir or '없음'}"
+        )
+
+    async def stop(self) -> None:
+        """자동 실행 태스크를 중지합니다. (서버 종료 시 호출, 실행 중이면 현재 청크까지만 정리)"""
+        self._stop_requested.set()
+        if self._task is None:
+            return
+        self._task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await self._task
+        self._task = None
+
+    async def _loop(self) -> None:
+        """주기마다 보존 정책을 실행합니다. (실패는 경고만 남기고 다음 주기에 다시 시도)"""
+        delay = min(_FIRST_RUN_DELAY_SECONDS, self.interval)
+        while True:
+            await asyncio.sleep(delay)
+            delay = self.interval
+            try:
+                await asyncio.to_thread(self.run)
+            except Exception as e:
+                logger.warning(f"[LogRetention] 로그 보존 정책 실행 실패 (무시): {e!s}")
+
+    def run(self) -> dict[str, Any]:
+        """
+        보존 정책을 한 번 실행합니다. (개수 제한 → 기간 제한 순서, 청크 단위)
+
+        Returns:
+            실행 결과 (정리한 로그 수, 청크 수, 반환한 페이지 수, 보관 파일 등)
+
+        Raises:
+            RuntimeError: 이미 실행 중인 경우
+        """
+        if not self._run_lock.acquire(blocking=False):
+            raise RuntimeError("로그 보존 정책이 이미 실행 중입니다.")
+        try:
+            return self._run()
+        finally:
+            self._run_lock.release()
+
+    def _run(self) -> dict[str, Any]:
+        """보존 정책 실행 구현 (run에서 잠금을 잡은 뒤 호출)"""
+        started = time.perf_counter()
+        segment = LogArchiveSegment(self.archive_dir) if self.archive_dir else None
+        archive = segment.write if segment is not None else None
+        report: dict[str, Any] = {
+            "started_at": datetime.now().isoformat(),
+            "retired_by_rows": 0,
+            "retired_by_age": 0,
+            "chunks": 0,
+            "vacuumed_pages": 0,
+            "stopped": False,
+        }
+
+        # 1. 개수 제한 (기준 ID 이하 로그)
+        if self.max_rows:
+            max_id = db_manager.log_rollups.row_limit_threshold(self.max_rows)
+            if max_id is not None:
+                report["retired_by_rows"] = self._retire_in_chunks(report, max_id=max_id, archive=archive)
+
+        # 2. 기간 제한 (시작 시간은 로컬 ISO 형식, 시작 시간이 없는 로그의 생성 시간은 UTC)
+        if self.retention_days and not report["stopped"]:
+            report["retired_by_age"] = self._retire_in_chunks(
+                report,
+                started_before=(datetime.now() - timedelta(days=self.retention_days)).isoformat(),
+                created_before=(datetime.now(timezone.utc) - timedelta(days=self.retention_days)).strftime(
+                    "%Y-%m-%d %H:%M:%S"
+                ),
+                archive=archive,
+            )
+
+        # 3. 어떤 로그도 참조하지 않는 공유 파라미터 정리 (스크립트 삭제로 함께 지워진 로그 등)
+        if not report["stopped"]:
+            report["pruned_payloads"] = db_manager.node_execution_logs.prune_payloads()
+
+        report["retired"] = report["retired_by_rows"] + report["retired_by_age"]
+        report["archive"] = segment.path if segment is not None and segment.records else None
+        report["duration_ms"] = round((time.perf_counter() - started) * 1000, 3)
+        self.last_report = report
+        if report["retired"]:
+            logger.info(
+                f"[LogRetention] 로그 {report['retired']}개 정리 (개수 제한 {report['retired_by_rows']}개, "
+                f"기간 제한 {report['retired_by_age']}개) - 청크: {report['chunks']}개, "
+                f"반환 페이지: {report['vacuumed_pages']}개, 소요: {report['duration_ms']}ms"
+            )
+        return report
+
+    def _retire_in_chunks(self, report: dict[str, Any], **criteria: Any) -> int:
+        """
+        정리 대상이 남지 않을 때까지 청크 단위로 정리합니다.
+
+        Args:
+            report: 실행 결과 (청크 수, 반환 페이지 수, 중단 여부를 갱신)
+            **criteria: LogRollupRepository.retire_logs의 정리 조건 (max_id 또는 started_before/created_before, archive)
+
+        Returns:
+            정리한 로그 수
+        """
+        retired = 0
+        while True:
+            if self._stop_requested.is_set():
+                report["stopped"] = True
+                return retired
+            count = db_manager.log_rollups.retire_logs(self.chunk_size, **criteria)
+            if count == 0:
+                return retired
+            retired += count
+            report["chunks"] += 1
+            if self.vacuum_pages:
+                report["vacuumed_pages"] += db_manager.log_rollups.incremental_vacuum(self.vacuum_pages)
+            if count < self.chunk_size:
+                return retired
+            # 청크 사이에 쉬어 다른 쓰기(로그 싱크 등)가 잠금을 얻을 수 있게 함
+            time.sleep(self.chunk_pause)
+
+    def status(self) -> dict[str, Any]:
+        """
+        보존 정책 설정과 마지막 실행 결과를 반환합니다.
+
+        Returns:
+            상태 딕셔너리 (설정값, 자동 실행 여부, 실행 중 여부, 마지막 실행 결과)
+        """
+        return {
+            "retention_days": self.retention_days,
+            "max_rows": self.max_rows,
+            "interval": self.interval,
+            "chunk_size": self.chunk_size,
+            "archive_dir": self.archive_dir or None,
+            "vacuum_pages": self.vacuum_pages,
+            "scheduled": self.running,
+            "in_progress": self._run_lock.locked(),
+            "last_report": self.last_report,
+        }
+
+
+# 전역 로그 보존 정책 인스턴스
+log_retention = LogRetention()
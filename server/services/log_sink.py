@@ -0,0 +1,195 @@
+"""
+노드 실행 로그 싱크
+서버 프로세스 안에서 실행되는 노드의 실행 로그를 asyncio 큐에 모아, 하나의 작성 태스크가 일괄로 DB에 기록합니다.
+(노드 이벤트마다 자기 자신의 /api/logs/node-execution으로 HTTP 요청을 보내고 DB 연결을 새로 열던 방식을 대체)
+
+- 일괄 쓰기: 큐에 쌓인 로그를 최대 LOG_SINK_BATCH_SIZE개씩 하나의 트랜잭션으로 기록
+- 쓰기 시점: 배치가 가득 차거나 첫 로그가 들어온 뒤 LOG_SINK_FLUSH_INTERVAL_SECONDS가 지나면 기록
+- 역압(backpressure): 큐가 LOG_SINK_MAX_QUEUE_SIZE개로 가득 차면 가장 오래된 로그를 버리고 새 로그를 넣음
+  (로그 기록이 늦어져도 노드 실행은 멈추지 않음)
+- 로그 통계: 기록과 같은 트랜잭션에서 DB 트리거가 갱신 (별도 재계산 없음)
+
+원격 워커처럼 다른 프로세스에서 실행되는 경우에는 LogClient가 기존대로 HTTP로 전송합니다.
+"""
+
+import asyncio
+import contextlib
+import time
+from typing import Any
+
+from config.server_config import settings
+from db.database import db_manager
+from log import log_manager
+
+logger = log_manager.logger
+
+
+class LogSink:
+    """
+    노드 실행 로그 일괄 기록 클래스
+    submit()은 이벤트 루프에서 대기 없이 호출되며, 실제 DB 쓰기는 작성 태스크 하나가 담당합니다.
+    """
+
+    def __init__(
+        self,
+        batch_size: int | None = None,
+        flush_interval: float | None = None,
+        max_queue_size: int | None = None,
+    ) -> None:
+        """
+        LogSink 초기화
+
+        Args:
+            batch_size: 한 번에 기록할 최대 로그 수 (None이면 LOG_SINK_BATCH_SIZE)
+            flush_interval: 첫 로그가 들어온 뒤 기록까지 기다리는 최대 시간 (초, None이면 LOG_SINK_FLUSH_INTERVAL_SECONDS)
+            max_queue_size: 큐 최대 크기 (None이면 LOG_SINK_MAX_QUEUE_SIZE, 가득 차면 가장 오래된 로그를 버림)
+        """
+        self.batch_size = max(1, settings.LOG_SINK_BATCH_SIZE if batch_size is None else batch_size)
+        self.flush_interval = max(
+            0.0, settings.LOG_SINK_FLUSH_INTERVAL_SECONDS if flush_interval is None else flush_interval
+        )
+        self.max_queue_size = max(1, settings.LOG_SINK_MAX_QUEUE_SIZE if max_queue_size is None else max_queue_size)
+        self._queue: asyncio.Queue[dict[str, Any]] | None = None
+        self._task: asyncio.Task[None] | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+        # _pending: 큐에서 꺼내 모으는 중인 배치 (중지 시 큐에 남은 로그와 함께 기록)
+        self._pending: list[dict[str, Any]] = []
+        # 통계 (받은 로그, 기록한 로그, 버린 로그, 기록 실패한 로그, 기록 횟수, 마지막 기록 소요 시간)
+        self.submitted = 0
+        self.written = 0
+        self.dropped = 0
+        self.failed = 0
+        self.flushes = 0
+        self.last_flush_ms = 0.0
+
+    @property
+    def running(self) -> bool:
+        """작성 태스크 실행 여부"""
+        return self._task is not None and not self._task.done()
+
+    def accepts_from_current_loop(self) -> bool:
+        """현재 이벤트 루프에서 submit()을 호출할 수 있는지 여부 (싱크가 시작된 루프와 같아야 함)"""
+        if not self.running:
+            return False
+        try:
+            return asyncio.get_running_loop() is self._loop
+        except RuntimeError:
+            return False
+
+    async def start(self) -> None:
+        """작성 태스크를 시작합니다. (서버 시작 시 호출)"""
+        if self.running:
+            return
+        self._loop = asyncio.get_running_loop()
+        self._queue = asyncio.Queue(maxsize=self.max_queue_size)
+        self._task = asyncio.create_task(self._writer_loop())
+        logger.info(
+            f"[LogSink] 로그 싱크 시작 - 배치: {self.batch_size}개, 간격: {self.flush_interval}초, "
+            f"큐 최대: {self.max_queue_size}개"
+        )
+
+    async def stop(self) -> None:
+        """작성 태스크를 중지하고 큐에 남은 로그를 모두 기록합니다. (서버 종료 시 호출)"""
+        if self._task is None:
+            return
+        self._task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await self._task
+        self._task = None
+        # 모으던 배치와 큐에 남은 로그 기록
+        remaining, self._pending = self._pending, []
+        while self._queue is not None and not self._queue.empty():
+            remaining.append(self._queue.get_nowait())
+        for index in range(0, len(remaining), self.batch_size):
+            await self._flush(remaining[index : index + self.batch_size])
+        logger.info(f"[LogSink] 로그 싱크 중지 - 기록: {self.written}개, 버림: {self.dropped}개")
+
+    def submit(self, record: dict[str, Any]) -> bool:
+        """
+        로그를 큐에 넣습니다. (대기하지 않음, 큐가 가득 차면 가장 오래된 로그를 버림)
+
+        Args:
+            record: 로그 레코드 (NodeExecutionLogRepository.create_log 인자와 같은 키)
+
+        Returns:
+            큐에 넣었는지 여부 (싱크가 시작되지 않았으면 False)
+        """
+        if self._queue is None or not self.running:
+            return False
+        if self._queue.full():
+            with contextlib.suppress(asyncio.QueueEmpty):
+                self._queue.get_nowait()
+                self.dropped += 1
+                if self.dropped == 1 or self.dropped % 1000 == 0:
+                    logger.warning(f"[LogSink] 로그 큐가 가득 차 오래된 로그를 버렸습니다. (누적 {self.dropped}개)")
+        self._queue.put_nowait(record)
+        self.submitted += 1
+        return True
+
+    async def _writer_loop(self) -> None:
+        """큐에서 로그를 모아 배치가 가득 차거나 간격이 지나면 기록합니다."""
+        queue = self._queue
+        if queue is None:
+            return
+        pending = self._pending
+        while True:
+            pending.append(await queue.get())
+            deadline = time.monotonic() + self.flush_interval
+            while len(pending) < self.batch_size:
+                # 이미 쌓인 로그는 대기 없이 가져옴
+                while len(pending) < self.batch_size and not queue.empty():
+                    pending.append(queue.get_nowait())
+                remaining = deadline - time.monotonic()
+                if len(pending) >= self.batch_size or remaining <= 0:
+                    break
+                try:
+                    pending.append(await asyncio.wait_for(queue.get(), timeout=remaining))
+                except asyncio.TimeoutError:
+                    break
+            # 기록을 시작하면 배치를 넘겨받음 (기록 중 중지되어도 같은 로그를 두 번 기록하지 않음)
+            batch = list(pending)
+            pending.clear()
+            await self._flush(batch)
+
+    async def _flush(self, batch: list[dict[str, Any]]) -> None:
+        """
+        배치 하나를 하나의 트랜잭션으로 기록합니다. (기록 실패는 경고만 남기고 버림)
+
+        Args:
+            batch: 기록할 로그 레코드 목록
+        """
+        started = time.perf_counter()
+        try:
+            await asyncio.to_thread(db_manager.node_execution_logs.write_logs, batch)
+        except Exception as e:
+            self.failed += len(batch)
+            logger.warning(f"[LogSink] 로그 {len(batch)}개 기록 실패 (버림): {e!s}")
+            return
+        self.written += len(batch)
+        self.flushes += 1
+        self.last_flush_ms = (time.perf_counter() - started) * 1000
+
+    def stats(self) -> dict[str, Any]:
+        """
+        싱크 상태와 통계를 반환합니다.
+
+        Returns:
+            통계 딕셔너리 (running, queued, submitted, written, dropped, failed, flushes, last_flush_ms 등)
+        """
+        return {
+            "running": self.running,
+            "queued": self._queue.qsize() if self._queue is not None else 0,
+            "batch_size": self.batch_size,
+            "flush_interval": self.flush_interval,
+            "max_queue_size": self.max_queue_size,
+            "submitted": self.submitted,
+            "written": self.written,
+            "dropped": self.dropped,
+            "failed": self.failed,
+            "flushes": self.flushes,
+            "last_flush_ms": round(self.last_flush_ms, 3),
+        }
+
+
+# 전역 로그 싱크 인스턴스
+log_sink = LogSink()
@@ -1,34 +1,120 @@
 """
 노드 실행 컨텍스트 관리
 노드 간 데이터 전달을 위한 컨텍스트 클래스
+
+- 실행 순서: OrderedDict로 관리하여 추가/재실행/이전 노드 조회를 모두 O(1)로 처리
+- 보존 정책: 최근 NODE_CONTEXT_MAX_RESULTS개 결과와 고정(pin)된 노드 결과만 유지
+- 큰 출력: 직렬화 크기가 NODE_CONTEXT_SPILL_THRESHOLD_BYTES를 넘으면 임시 파일로 내보내고, 참조할 때 다시 읽음
 """
 
-from typing import Any
+from collections import OrderedDict
+import contextlib
+import json
+import os
+import shutil
+import tempfile
+from typing import TYPE_CHECKING, Any
+import weakref
 
+from config.server_config import settings
 from log import log_manager
+from utils.cancellation import CancellationToken
+
+if TYPE_CHECKING:
+    from utils.parameter_template import ParameterTemplate
 
 logger = log_manager.logger
 
 
+class NodeResultRecord:
+    """
+    노드 실행 결과 레코드
+    출력이 임시 파일로 내보내진 경우 result 조회 시 파일에서 다시 읽어 원래 결과를 복원합니다.
+    """
+
+    __slots__ = ("_result", "node_id", "node_name", "size_bytes", "spill_path")
+
+    def __init__(
+        self,
+        node_id: str,
+        node_name: str | None,
+        result: dict[str, Any],
+        spill_path: str | None = None,
+        size_bytes: int | None = None,
+    ) -> None:
+        """
+        NodeResultRecord 초기화
+
+        Args:
+            node_id: 노드 ID
+            node_name: 노드 이름
+            result: 노드 실행 결과 (출력을 내보낸 경우 output이 제외된 결과)
+            spill_path: 출력을 내보낸 임시 파일 경로 (None이면 메모리에 보관)
+            size_bytes: 출력의 직렬화 크기 (바이트, 측정하지 않았으면 None)
+        """
+        self.node_id = node_id
+        self.node_name = node_name
+        self._result = result
+        self.spill_path = spill_path
+        self.size_bytes = size_bytes
+
+    @property
+    def spilled(self) -> bool:
+        """출력이 임시 파일로 내보내졌는지 여부"""
+        return self.spill_path is not None
+
+    @property
+    def result(self) -> dict[str, Any]:
+        """노드 실행 결과 (내보낸 출력은 임시 파일에서 다시 읽음)"""
+        if self.spill_path is None:
+            return self._result
+        with open(self.spill_path, encoding="utf-8") as f:
+            return {**self._result, "output": json.load(f)}
+
+    def to_dict(self) -> dict[str, Any]:
+        """
+        레코드를 딕셔너리로 변환합니다. (응답용)
+        내보낸 출력은 다시 읽지 않고 크기 정보만 표시합니다.
+        """
+        if self.spill_path is None:
+            return self._result
+        return {**self._result, "output": {"_spilled": True, "size_bytes": self.size_bytes}}
+
+
 class NodeExecutionContext:
     """
     노드 실행 컨텍스트 클래스
     이전 노드들의 실행 결과를 저장하고 관리합니다.
     """
 
-    def __init__(self) -> None:
-        """컨텍스트 초기화"""
-        # 노드별 실행 결과 저장: {node_id: {result_data}}
-        # key: 노드 ID, value: 노드 실행 결과 (표준 형식: {action, status, output})
-        self.node_results: dict[str, dict[str, Any]] = {}
+    def __init__(
+        self,
+        cancel_token: CancellationToken | None = None,
+        max_results: int | None = None,
+        spill_threshold_bytes: int | None = None,
+    ) -> None:
+        """
+        컨텍스트 초기화
+
+        Args:
+            cancel_token: 실행 취소 토큰 (None이면 취소되지 않는 새 토큰 사용)
+            max_results: 보존할 최근 노드 결과 개수 (None이면 설정값, 0이면 제한 없음)
+            spill_threshold_bytes: 임시 파일로 내보낼 출력 크기 기준 (바이트, None이면 설정값, 0이면 사용 안 함)
+        """
+        # 노드별 실행 결과 레코드 (실행 순서대로 정렬, 마지막 항목이 가장 최근에 실행된 노드)
+        # key: 노드 ID, value: 노드 실행 결과 레코드 (표준 형식: {action, status, output})
+        self._records: OrderedDict[str, NodeResultRecord] = OrderedDict()
 
         # 노드 이름으로 ID 찾기: {node_name: node_id}
         # key: 노드 이름, value: 노드 ID (이름으로 노드를 찾을 때 사용)
         self.node_name_map: dict[str, str] = {}
 
-        # 실행 순서 저장
-        # 노드가 실행된 순서대로 노드 ID를 저장 (이전 노드 찾기용)
-        self.execution_order: list[str] = []
+        # 보존 정책과 관계없이 유지할 노드 ID 또는 이름 (다른 노드가 참조하는 노드)
+        self.pinned_node_ids: set[str] = set()
+
+        # 실행 시작 시 컴파일된 노드별 파라미터 템플릿 (None이면 노드 실행 시 컴파일)
+        # key: 노드 ID, value: 컴파일된 템플릿 (표현식이 없는 노드는 None)
+        self.parameter_templates: dict[str, ParameterTemplate | None] | None = None
 
         # 현재 실행 중인 노드 ID
         # 현재 실행 중인 노드의 ID (디버깅 및 로깅용)
@@ -38,28 +124,63 @@ class NodeExecutionContext:
         # 워크플로우 전체에서 공유할 데이터 (향후 확장용)
         self.workflow_data: dict[str, Any] = {}
 
+        # 실행 취소 토큰
+        # 노드 실행 시 파라미터(_cancel_token)로 전달되어 대기/폴링/HTTP 요청을 중단하는 데 사용
+        self.cancel_token = cancel_token or CancellationToken()
+
+        # 보존 정책 / 출력 내보내기 설정
+        self.max_results = settings.NODE_CONTEXT_MAX_RESULTS if max_results is None else max_results
+        self.spill_threshold_bytes = (
+            settings.NODE_CONTEXT_SPILL_THRESHOLD_BYTES if spill_threshold_bytes is None else spill_threshold_bytes
+        )
+
+        # 내보낸 출력을 저장하는 임시 디렉토리 (처음 내보낼 때 생성, 컨텍스트가 사라지면 삭제)
+        self._spill_dir: str | None = None
+        self._spill_finalizer: weakref.finalize | None = None
+
+    @property
+    def node_results(self) -> dict[str, dict[str, Any]]:
+        """노드별 실행 결과 ({node_id: result}, 내보낸 출력은 다시 읽음)"""
+        return {node_id: record.result for node_id, record in self._records.items()}
+
+    @property
+    def execution_order(self) -> list[str]:
+        """실행 순서 (보존 중인 노드 ID, 마지막 항목이 가장 최근에 실행된 노드)"""
+        return list(self._records)
+
     def add_node_result(self, node_id: str, node_name: str | None, result: dict[str, Any]) -> None:
         """
         노드 실행 결과를 추가합니다.
+        이미 실행된 노드(반복 실행 등)는 결과를 교체하고 가장 최근 노드로 이동합니다.
 
         Args:
             node_id: 노드 ID
             node_name: 노드 이름 (선택적)
             result: 노드 실행 결과
         """
-        # 노드 실행 결과 저장
-        self.node_results[node_id] = result
+        previous = self._records.pop(node_id, None)
+        if previous is not None:
+            self._remove_spill_file(previous)
+
+        self._records[node_id] = self._make_record(node_id, node_name, result)
 
         # 노드 이름이 있으면 이름-ID 매핑 추가
         if node_name:
             self.node_name_map[node_name] = node_id
 
-        # 실행 순서에 노드 ID 추가 (중복 방지)
-        if node_id not in self.execution_order:
-            self.execution_order.append(node_id)
+        self._apply_retention()
 
         logger.debug(f"노드 실행 결과 추가: {node_id} ({node_name})")
 
+    def pin(self, *node_ids: str) -> None:
+        """
+        보존 정책과 관계없이 결과를 유지할 노드를 지정합니다.
+
+        Args:
+            node_ids: 유지할 노드 ID 또는 이름 목록
+        """
+        self.pinned_node_ids.update(node_ids)
+
     def get_node_result(self, node_id: str | None = None) -> dict[str, Any] | None:
         """
         특정 노드의 실행 결과를 가져옵니다.
@@ -72,16 +193,11 @@ class NodeExecutionContext:
         """
         # node_id가 None이면 현재 노드의 이전 노드 결과 반환
         if node_id is None:
-            # 실행 순서가 있으면 마지막 노드(이전 노드)의 결과 반환
-            if len(self.execution_order) > 0:
-                # prev_node_id: 이전 노드 ID (실행 순서의 마지막 요소)
-                prev_node_id = self.execution_order[-1]
-                return self.node_results.get(prev_node_id)
-            # 실행 순서가 없으면 None 반환
-            return None
+            return self.get_previous_node_result()
 
         # node_id가 지정되었으면 해당 노드의 결과 반환
-        return self.node_results.get(node_id)
+        record = self._records.get(node_id)
+        return record.result if record is not None else None
 
     def get_node_result_by_name(self, node_name: str) -> dict[str, Any] | None:
         """
@@ -95,23 +211,19 @@ class NodeExecutionContext:
         """
         node_id = self.node_name_map.get(node_name)
         if node_id:
-            return self.node_results.get(node_id)
+            return self.get_node_result(node_id)
         return None
 
     def get_previous_node_result(self) -> dict[str, Any] | None:
         """
-        이전 노드의 실행 결과를 가져옵니다.
+        이전 노드(가장 최근에 실행된 노드)의 실행 결과를 가져옵니다.
 
         Returns:
             이전 노드의 실행 결과 또는 None
         """
-        # 실행 순서가 있으면 마지막 노드(이전 노드)의 결과 반환
-        if len(self.execution_order) > 0:
-            # prev_node_id: 이전 노드 ID (실행 순서의 마지막 요소)
-            prev_node_id = self.execution_order[-1]
-            return self.node_results.get(prev_node_id)
-        # 실행 순서가 없으면 None 반환
-        return None
+        if not self._records:
+            return None
+        return self._records[next(reversed(self._records))].result
 
     def set_current_node(self, node_id: str) -> None:
         """현재 실행 중인 노드 설정"""
@@ -119,21 +231,30 @@ class NodeExecutionContext:
 
     def get_all_results(self) -> dict[str, dict[str, Any]]:
         """모든 노드의 실행 결과를 반환합니다."""
-        return self.node_results.copy()
+        return self.node_results
+
+    def records(self) -> list[NodeResultRecord]:
+        """보존 중인 결과 레코드를 실행 순서대로 반환합니다. (출력을 불러오지 않음, 체크포인트 변경 감지용)"""
+        return list(self._records.values())
 
     def clear(self) -> None:
-        """컨텍스트 초기화"""
-        self.node_results.clear()
+        """컨텍스트 초기화 (내보낸 출력 파일도 삭제)"""
+        self._records.clear()
         self.node_name_map.clear()
-        self.execution_order.clear()
+        self.pinned_node_ids.clear()
+        self.parameter_templates = None
         self.current_node_id = None
         self.workflow_data.clear()
+        if self._spill_finalizer is not None:
+            self._spill_finalizer()
+        self._spill_dir = None
+        self._spill_finalizer = None
         logger.debug("노드 실행 컨텍스트 초기화됨")
 
     def to_dict(self) -> dict[str, Any]:
-        """컨텍스트를 딕셔너리로 변환합니다."""
+        """컨텍스트를 딕셔너리로 변환합니다. (내보낸 출력은 크기 정보만 포함)"""
         return {
-            "node_results": self.node_results,
+            "node_results": {node_id: record.to_dict() for node_id, record in self._records.items()},
             "node_name_map": self.node_name_map,
             "execution_order": self.execution_order,
             "current_node_id": self.current_node_id,
@@ -144,9 +265,89 @@ class NodeExecutionContext:
     def from_dict(cls, data: dict[str, Any]) -> "NodeExecutionContext":
         """딕셔너리에서 컨텍스트를 생성합니다."""
         context = cls()
-        context.node_results = data.get("node_results", {})
-        context.node_name_map = data.get("node_name_map", {})
-        context.execution_order = data.get("execution_order", [])
+        node_results = data.get("node_results", {})
+        node_names = {node_id: name for name, node_id in data.get("node_name_map", {}).items()}
+        for node_id in data.get("execution_order") or list(node_results):
+            if node_id in node_results:
+                context.add_node_result(node_id, node_names.get(node_id), node_results[node_id])
         context.current_node_id = data.get("current_node_id")
         context.workflow_data = data.get("workflow_data", {})
         return context
+
+    def _make_record(self, node_id: str, node_name: str | None, result: dict[str, Any]) -> NodeResultRecord:
+        """
+        결과 레코드를 생성합니다. 출력이 기준 크기를 넘으면 임시 파일로 내보냅니다.
+
+        Args:
+            node_id: 노드 ID
+            node_name: 노드 이름
+            result: 노드 실행 결과
+
+        Returns:
+            결과 레코드
+        """
+        output = result.get("output") if isinstance(result, dict) else None
+        # 스칼라 출력은 크기가 작으므로 직렬화하지 않음 (dict/list/문자열만 크기 확인)
+        if self.spill_threshold_bytes <= 0 or not isinstance(output, (dict, list, str)):
+            return NodeResultRecord(node_id, node_name, result)
+        # 문자열은 UTF-8 최대 크기(문자당 4바이트)로도 기준보다 작으면 직렬화 생략
+        if isinstance(output, str) and len(output) * 4 < self.spill_threshold_bytes:
+            return NodeResultRecord(node_id, node_name, result)
+
+        try:
+            serialized = json.dumps(output, ensure_ascii=False)
+        except (TypeError, ValueError):
+            # JSON으로 직렬화할 수 없는 출력(엑셀 객체 등)은 메모리에 보관
+            return NodeResultRecord(node_id, node_name, result)
+
+        encoded = serialized.encode("utf-8")
+        if len(encoded) <= self.spill_threshold_bytes:
+            return NodeResultRecord(node_id, node_name, result, size_bytes=len(encoded))
+
+        try:
+            fd, spill_path = tempfile.mkstemp(prefix=f"{node_id}_", suffix=".json", dir=self._get_spill_dir())
+            with os.fdopen(fd, "wb") as f:
+                f.write(encoded)
+        except OSError as e:
+            logger.warning(f"노드 출력 임시 파일 저장 실패 (메모리에 보관): {node_id}, 오류: {e!s}")
+            return NodeResultRecord(node_id, node_name, result, size_bytes=len(encoded))
+
+        logger.debug(f"노드 출력 임시 파일로 내보냄: {node_id} ({len(encoded)} bytes)")
+        stripped = {k: v for k, v in result.items() if k != "output"}
+        return NodeResultRecord(node_id, node_name, stripped, spill_path=spill_path, size_bytes=len(encoded))
+
+    def _get_spill_dir(self) -> str:
+        """내보낸 출력을 저장할 임시 디렉토리를 반환합니다. (없으면 생성)"""
+        if self._spill_dir is None:
+            self._spill_dir = tempfile.mkdtemp(prefix="node_context_")
+            # 컨텍스트가 정리되거나 프로세스가 종료될 때 임시 디렉토리 삭제
+            self._spill_finalizer = weakref.finalize(self, shutil.rmtree, self._spill_dir, True)
+        return self._spill_dir
+
+    def _apply_retention(self) -> None:
+        """보존 개수를 넘으면 고정되지 않은 가장 오래된 결과부터 제거합니다."""
+        if self.max_results <= 0 or len(self._records) <= self.max_results:
+            return
+
+        excess = len(self._records) - self.max_results
+        # 가장 최근 결과는 이전 노드로 참조되므로 제외 (앞쪽부터 확인하므로 보통 첫 항목에서 끝남)
+        newest = next(reversed(self._records))
+        victims: list[str] = []
+        for node_id in self._records:
+            if len(victims) >= excess or node_id == newest:
+                break
+            if node_id not in self.pinned_node_ids and self._records[node_id].node_name not in self.pinned_node_ids:
+                victims.append(node_id)
+
+        for node_id in victims:
+            record = self._records.pop(node_id)
+            self._remove_spill_file(record)
+            if record.node_name and self.node_name_map.get(record.node_name) == node_id:
+                del self.node_name_map[record.node_name]
+
+    @staticmethod
+    def _remove_spill_file(record: NodeResultRecord) -> None:
+        """레코드의 내보낸 출력 파일을 삭제합니다."""
+        if record.spill_path is not None:
+            with contextlib.suppress(OSError):
+                os.remove(record.spill_path)
@@ -0,0 +1,250 @@
+"""
+노드 결과 캐시
+결정적인 노드(조건 평가, 자주 바뀌지 않는 HTTP GET 등)의 실행 결과를 재사용합니다.
+
+노드 파라미터(또는 노드 객체)의 cache 설정으로 노드별로 켜는 방식(opt-in)이며,
+캐시 키는 (노드 타입, 정규화된 파라미터, 참조하는 이전 노드 출력)입니다.
+ActionService.process_node가 process_action 호출 전에 캐시를 조회하고, 성공한 결과만 저장합니다.
+
+설정 형식 (cache):
+    true                                  # 기본 TTL로 캐시
+    120                                   # TTL(초)
+    {"ttl_seconds": 120, "inputs": "previous"}
+        - ttl_seconds: 캐시 유지 시간 (초, 기본 NODE_CACHE_DEFAULT_TTL_SECONDS)
+        - inputs: 키에 포함할 이전 노드 출력
+            "previous" (기본): 직전 노드 출력
+            "none": 이전 노드 출력과 무관
+            ["node_1", "node_2"]: 지정한 노드들의 출력
+"""
+
+from collections import OrderedDict
+import copy
+import hashlib
+import json
+import threading
+import time
+from typing import Any
+
+from config.server_config import settings
+from log import log_manager
+from services.node_execution_context import NodeExecutionContext
+
+logger = log_manager.logger
+
+# 캐시 키 계산 시 제외할 파라미터 (표시용 메타데이터 및 실행 정책)
+_NON_KEY_PARAMETERS = frozenset({"title", "name", "description", "cache", "retry", "output_override"})
+
+
+class NodeCachePolicy:
+    """노드별 캐시 설정 클래스"""
+
+    def __init__(self, ttl_seconds: float, inputs: str | list[str] = "previous") -> None:
+        """
+        NodeCachePolicy 초기화
+
+        Args:
+            ttl_seconds: 캐시 유지 시간 (초)
+            inputs: 키에 포함할 이전 노드 출력 ("previous", "none" 또는 노드 ID 목록)
+        """
+        self.ttl_seconds = ttl_seconds
+        self.inputs = inputs
+
+    @classmethod
+    def from_config(cls, config: Any) -> "NodeCachePolicy | None":
+        """
+        선언된 캐시 설정으로 정책을 생성합니다.
+
+        Args:
+            config: 캐시 설정 (true, TTL 숫자 또는 dict)
+
+        Returns:
+            캐시 정책 또는 None (설정이 없거나 꺼져 있는 경우)
+
+        Raises:
+            ValueError: 설정 형식이 잘못된 경우
+        """
+        if config is None or config is False:
+            return None
+        if config is True:
+            config = {}
+        elif isinstance(config, (int, float, str)):
+            config = {"ttl_seconds": config}
+        if not isinstance(config, dict):
+            raise ValueError("캐시 설정은 true, TTL(초) 또는 객체여야 합니다.")
+        if config.get("enabled") is False:
+            return None
+
+        try:
+            ttl_seconds = float(config.get("ttl_seconds", settings.NODE_CACHE_DEFAULT_TTL_SECONDS))
+        except (TypeError, ValueError) as e:
+            raise ValueError(f"ttl_seconds 값이 올바르지 않습니다: {e!s}") from e
+        if ttl_seconds <= 0:
+            return None
+
+        inputs = config.get("inputs", "previous")
+        if isinstance(inputs, list):
+            inputs = [str(node_id) for node_id in inputs]
+        elif inputs not in ("previous", "none"):
+            raise ValueError("inputs는 'previous', 'none' 또는 노드 ID 목록이어야 합니다.")
+
+        return cls(ttl_seconds=ttl_seconds, inputs=inputs)
+
+    def upstream_outputs(self, context: NodeExecutionContext | None) -> Any:
+        """
+        캐시 키에 포함할 이전 노드 출력을 가져옵니다.
+
+        Args:
+            context: 노드 실행 컨텍스트
+
+        Returns:
+            이전 노드 출력 (직렬화 가능한 값)
+        """
+        if context is None or self.inputs == "none":
+            return None
+        if self.inputs == "previous":
+            previous = context.get_previous_node_result()
+            return previous.get("output") if isinstance(previous, dict) else None
+        return {node_id: (context.get_node_result(node_id) or {}).get("output") for node_id in self.inputs}
+
+
+def cache_referenced_node_ids(nodes: list[dict[str, Any]]) -> set[str]:
+    """
+    캐시 설정의 inputs로 지정된 노드 ID를 수집합니다.
+    (실행 컨텍스트의 보존 정책에서 제외하여 캐시 키 계산 시 항상 참조할 수 있도록 함)
+
+    Args:
+        nodes: 실행할 노드 목록
+
+    Returns:
+        참조되는 노드 ID 집합
+    """
+    node_ids: set[str] = set()
+    for node in nodes:
+        parameters = {**(node.get("data") or {}), **(node.get("parameters") or {})}
+        config = node.get("cache", parameters.get("cache"))
+        if isinstance(config, dict) and isinstance(config.get("inputs"), list):
+            node_ids.update(str(node_id) for node_id in config["inputs"])
+    return node_ids
+
+
+class CacheEntry:
+    """캐시 항목 (결과와 만료 시각)"""
+
+    __slots__ = ("created_at", "expires_at", "result")
+
+    def __init__(self, result: dict[str, Any], ttl_seconds: float) -> None:
+        self.result = result
+        self.created_at = time.monotonic()
+        self.expires_at = self.created_at + ttl_seconds
+
+
+class NodeResultCache:
+    """
+    노드 결과 캐시 클래스 (TTL + LRU)
+    OrderedDict로 사용 순서를 유지하여 조회/저장/가장 오래된 항목 제거를 모두 O(1)로 처리합니다.
+    """
+
+    def __init__(self, max_entries: int | None = None) -> None:
+        """
+        NodeResultCache 초기화
+
+        Args:
+            max_entries: 최대 항목 수 (초과 시 가장 오래 사용되지 않은 항목부터 제거)
+        """
+        self.max_entries = max(1, max_entries or settings.NODE_CACHE_MAX_ENTRIES)
+        # _entries: 캐시 키 → 캐시 항목 (앞쪽일수록 오래 사용되지 않음)
+        self._entries: OrderedDict[str, CacheEntry] = OrderedDict()
+        self._lock = threading.Lock()
+        # 통계 (히트/미스/만료/LRU 제거 횟수)
+        self._stats = {"hits": 0, "misses": 0, "expired": 0, "evicted": 0}
+
+    @staticmethod
+    def make_key(node_type: str, parameters: dict[str, Any], upstream: Any = None) -> str:
+        """
+        캐시 키를 생성합니다.
+
+        Args:
+            node_type: 노드 타입 (실제 노드 종류 포함)
+            parameters: 노드 파라미터 (내부 메타데이터(_ 접두사)와 표시용 필드는 제외)
+            upstream: 키에 포함할 이전 노드 출력
+
+        Returns:
+            캐시 키 (SHA-256 해시)
+        """
+        normalized = {k: v for k, v in parameters.items() if not k.startswith("_") and k not in _NON_KEY_PARAMETERS}
+        payload = json.dumps(
+            [node_type, normalized, upstream], sort_keys=True, ensure_ascii=False, separators=(",", ":"), default=str
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> tuple[dict[str, Any], float] | None:
+        """
+        캐시된 결과를 조회합니다.
+
+        Args:
+            key: 캐시 키
+
+        Returns:
+            (결과 복사본, 캐시된 지 경과한 시간(초)) 또는 None (없거나 만료됨)
+        """
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self._stats["misses"] += 1
+                return None
+            if entry.expires_at <= now:
+                del self._entries[key]
+                self._stats["expired"] += 1
+                self._stats["misses"] += 1
+                return None
+            self._entries.move_to_end(key)
+            self._stats["hits"] += 1
+            result = entry.result
+            age = now - entry.created_at
+        return copy.deepcopy(result), age
+
+    def put(self, key: str, result: dict[str, Any], ttl_seconds: float) -> None:
+        """
+        결과를 캐시에 저장합니다.
+
+        Args:
+            key: 캐시 키
+            result: 노드 실행 결과 (복사본이 저장됨)
+            ttl_seconds: 캐시 유지 시간 (초)
+        """
+        entry = CacheEntry(copy.deepcopy(result), ttl_seconds)
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self._stats["evicted"] += 1
+
+    def clear(self) -> int:
+        """
+        캐시를 비웁니다.
+
+        Returns:
+            삭제된 항목 수
+        """
+        with self._lock:
+            count = len(self._entries)
+            self._entries.clear()
+        logger.info(f"[NodeResultCache] 캐시 초기화 - {count}개 항목 삭제")
+        return count
+
+    def stats(self) -> dict[str, Any]:
+        """캐시 통계를 반환합니다."""
+        with self._lock:
+            lookups = self._stats["hits"] + self._stats["misses"]
+            return {
+                "entries": len(self._entries),
+                "max_entries": self.max_entries,
+                **self._stats,
+                "hit_rate": round(self._stats["hits"] / lookups * 100, 2) if lookups else 0,
+            }
+
+
+# 전역 노드 결과 캐시 인스턴스
+node_result_cache = NodeResultCache()
@@ -0,0 +1,503 @@
+"""
+서버 측 스크립트 실행기
+DB에 저장된 스크립트를 브라우저 없이 서버에서 직접 실행합니다.
+실행 큐(ExecutionQueue)에서 스크립트 실행 작업을 처리할 때 사용합니다.
+"""
+
+import asyncio
+from collections import deque
+import time
+from typing import Any
+
+from config.server_config import settings
+from db.database import db_manager
+from log import log_manager
+from nodes.excelnodes.excel_manager import cleanup_excel_objects
+from services.action_service import ActionService
+from services.execution_checkpoint import ExecutionCheckpointer, restore_context
+from services.node_execution_context import NodeExecutionContext
+from services.workflow_plan import WorkflowPlan, workflow_plan_cache
+from utils.cancellation import CancellationToken, apply_workflow_timeout, cancellation_registry
+from utils.dry_run import DryRunSession
+from utils.execution_id_generator import generate_execution_id
+
+logger = log_manager.logger
+
+
+def _new_run_state() -> dict[str, Any]:
+    """
+    실행 상태 딕셔너리를 생성합니다.
+    노드 결과는 실행 컨텍스트와 같은 보존 정책으로 최근 NODE_CONTEXT_MAX_RESULTS개만 유지하고(0이면 제한 없음),
+    실행한 노드 수는 executed_count로 따로 셉니다. (긴 반복 실행에서 결과가 계속 쌓이지 않도록)
+    """
+    return {
+        "results": deque(maxlen=settings.NODE_CONTEXT_MAX_RESULTS or None),
+        "executed_count": 0,
+        "error_message": None,
+    }
+
+
+def _is_failed_result(result: dict[str, Any]) -> bool:
+    """실행 결과가 실패인지 확인 (status가 failed이거나 error 필드가 있는 경우)"""
+    return result.get("status") == "failed" or bool(result.get("error"))
+
+
+class ScriptRunner:
+    """
+    스크립트 실행기 클래스
+    스크립트의 노드/연결 정보로 실행 계획을 만들고, 계획에 따라 노드를 순차 실행합니다.
+    """
+
+    def __init__(self, action_service: ActionService | None = None) -> None:
+        """
+        ScriptRunner 초기화
+
+        Args:
+            action_service: 노드 실행에 사용할 액션 서비스 (None이면 새로 생성)
+        """
+        self.action_service = action_service or ActionService()
+
+    def load_plan(self, script_id: int) -> WorkflowPlan | None:
+        """
+        스크립트의 실행 계획을 가져옵니다. (캐시된 계획을 모든 실행/호출이 공유)
+
+        Args:
+            script_id: 스크립트 ID
+
+        Returns:
+            실행 계획 또는 None (스크립트가 없는 경우)
+        """
+        return workflow_plan_cache.get(script_id)
+
+    @staticmethod
+    def _create_context(
+        plan: WorkflowPlan,
+        cancel_token: CancellationToken | None,
+        call_stack: list[int],
+        dry_run: DryRunSession | None = None,
+    ) -> NodeExecutionContext:
+        """
+        실행 계획용 노드 실행 컨텍스트를 생성합니다.
+
+        Args:
+            plan: 실행 계획
+            cancel_token: 실행 취소 토큰
+            call_stack: 스크립트 호출 스택 (최상위 스크립트부터 현재 스크립트까지의 ID)
+            dry_run: 드라이런 세션 (None이면 실제 실행)
+
+        Returns:
+            노드 실행 컨텍스트
+        """
+        context = NodeExecutionContext(cancel_token=cancel_token)
+        # 계획에 미리 컴파일된 파라미터 템플릿 사용 (다른 노드가 참조하는 결과는 보존)
+        context.parameter_templates = plan.parameter_templates
+        context.pin(*plan.pinned_node_refs)
+        context.workflow_data["call_stack"] = call_stack
+        if dry_run is not None:
+            context.workflow_data["dry_run"] = dry_run
+        return context
+
+    async def run_script(
+        self,
+        script_id: int,
+        execution_id: str | None = None,
+        timeout_seconds: float | None = None,
+        resume: bool = False,
+        checkpoint_interval_seconds: float | None = None,
+        dry_run: DryRunSession | None = None,
+    ) -> dict[str, Any]:
+        """
+        스크립트를 실행합니다.
+        실행 중에는 execution_id로 취소 토큰이 등록되어 cancellation_registry.cancel(execution_id)로
+        취소할 수 있습니다. 취소되어도 엑셀 객체 정리와 실행 기록 갱신은 수행됩니다.
+        제한 시간이 있으면 각 노드는 min(노드 타임아웃, 남은 시간) 안에서 실행됩니다.
+        CHECKPOINT_ENABLED이면 실행 위치와 컨텍스트를 주기적으로 체크포인트로 저장하며,
+        resume=True이면 execution_id의 마지막 체크포인트부터 실행을 재개합니다.
+        dry_run이 있으면 가상 시계로 실행하여 대기는 즉시 끝나고(제한 시간도 가상 시간 기준) 입력 동작은 기록만 하며,
+        실행 기록/체크포인트/노드 실행 로그를 남기지 않습니다.
+
+        Args:
+            script_id: 스크립트 ID
+            execution_id: 워크플로우 실행 ID (None이면 새로 생성, 재개 시 필수)
+            timeout_seconds: 실행 제한 시간 (초, None이면 WORKFLOW_TIMEOUT_SECONDS 적용)
+            resume: 체크포인트에서 재개 여부
+            checkpoint_interval_seconds: 체크포인트 저장 최소 간격 (초, None이면 CHECKPOINT_INTERVAL_SECONDS 적용)
+            dry_run: 드라이런 세션 (None이면 실제 실행, 체크포인트 재개와 함께 사용할 수 없음)
+
+        Returns:
+            실행 요약 딕셔너리
+            - execution_id: 워크플로우 실행 ID
+            - script_id: 스크립트 ID
+            - status: 최종 상태 (success, error, cancelled)
+            - error_message: 에러 메시지 (실패 시)
+            - execution_time_ms: 실행 시간 (밀리초)
+            - results: 최근 노드 실행 결과 목록 (최대 NODE_CONTEXT_MAX_RESULTS개, 재개한 경우 재개 후 실행한 노드만)
+            - executed_count: 실행한 노드 수 (재개한 경우 재개 후 실행한 노드만)
+            - resumed: 체크포인트에서 재개했는지 여부
+            - checkpoints: 저장한 체크포인트 수
+            - dry_run: 드라이런 결과 요약 (드라이런일 때만, DryRunSession.summary 참조)
+
+        Raises:
+            ValueError: 스크립트 또는 재개할 체크포인트가 없거나, 드라이런으로 재개하려는 경우
+        """
+        if resume and dry_run is not None:
+            raise ValueError("드라이런은 체크포인트에서 재개할 수 없습니다.")
+        checkpoint = None
+        if resume:
+            if not execution_id:
+                raise ValueError("재개할 실행 ID가 필요합니다.")
+            checkpoint = db_manager.execution_checkpoints.get_checkpoint(execution_id, include_results=True)
+            if checkpoint is None or checkpoint["script_id"] != script_id:
+                raise ValueError(f"재개할 체크포인트를 찾을 수 없습니다: {execution_id}")
+
+        execution_id = execution_id or generate_execution_id()
+        plan = self.load_plan(script_id)
+        if plan is None:
+            raise ValueError(f"스크립트를 찾을 수 없습니다: {script_id}")
+
+        logger.info(
+            f"[ScriptRunner] 스크립트 {'드라이런' if dry_run else '실행'} {'재개' if checkpoint else '시작'} - "
+            f"스크립트 ID: {script_id}, 실행 ID: {execution_id}, 노드 개수: {len(plan.nodes_by_id)}"
+        )
+
+        execution_start_time = time.time()
+        execution_record_id = None
+        if dry_run is None:
+            try:
+                execution_record_id = db_manager.record_script_execution(script_id=script_id, status="running")
+            except Exception as e:
+                logger.warning(f"[ScriptRunner] 스크립트 실행 기록 저장 실패 (무시): {e!s}")
+
+        # state: 실행 중 누적되는 결과/에러 정보
+        state = _new_run_state()
+
+        # checkpointer: 실행 위치/컨텍스트 체크포인트 저장 (재개 시 이전 순번부터 이어감)
+        checkpointer: ExecutionCheckpointer | None = None
+        if settings.CHECKPOINT_ENABLED and dry_run is None:
+            checkpointer = ExecutionCheckpointer(
+                execution_id,
+                script_id,
+                interval_seconds=checkpoint_interval_seconds,
+                sequence=checkpoint["sequence"] if checkpoint else 0,
+                completed_nodes=checkpoint["completed_nodes"] if checkpoint else 0,
+            )
+
+        if checkpoint is not None:
+            # 취소된 실행을 재개하는 경우 이전 취소 기록 때문에 시작하자마자 취소되지 않도록 기록을 지움
+            cancellation_registry.forget(execution_id)
+        with cancellation_registry.track(execution_id) as cancel_token:
+            if dry_run is not None:
+                # 가상 시계 연결 (제한 시간도 가상 시간 기준으로 적용되도록 제한 시간 설정 전에 연결)
+                cancel_token.clock = dry_run.clock
+            apply_workflow_timeout(cancel_token, timeout_seconds)
+            context = self._create_context(plan, cancel_token, [script_id], dry_run)
+            if checkpoint is not None:
+                restore_context(checkpoint, context)
+                if checkpointer is not None:
+                    positions = [item["position"] for item in checkpoint.get("results", [])]
+                    checkpointer.mark_saved(context, max(positions, default=-1) + 1)
+                db_manager.execution_checkpoints.update_status(execution_id, "running")
+            try:
+                await self._run_plan(
+                    plan,
+                    context,
+                    execution_id,
+                    script_id,
+                    state,
+                    checkpointer=checkpointer,
+                    cursor_state=checkpoint["cursor_state"] if checkpoint else None,
+                )
+            except asyncio.CancelledError:
+                # 태스크 자체가 취소된 경우에도 실행 기록은 취소 상태로 남김
+                cancel_token.cancel("실행 태스크가 취소되었습니다.")
+                state["error_message"] = cancel_token.reason
+                raise
+            finally:
+                # 실행이 어떻게 끝나든 (취소 포함) 엑셀 객체 정리 (리소스 누수 방지)
+                try:
+                    cleanup_excel_objects(execution_id)
+                except Exception as e:
+                    logger.warning(f"[ScriptRunner] 엑셀 객체 정리 중 오류 발생 (무시): {e!s}")
+
+                if cancel_token.cancelled:
+                    final_status = "cancelled"
+                    state["error_message"] = state["error_message"] or cancel_token.reason
+                else:
+                    final_status = "error" if state["error_message"] is not None else "success"
+                execution_time_ms = int((time.time() - execution_start_time) * 1000)
+
+                # 성공하면 체크포인트 삭제, 실패/취소되면 재개할 수 있도록 상태만 변경
+                if checkpointer is not None:
+                    checkpointer.finish(final_status, state["error_message"])
+
+                if execution_record_id:
+                    try:
+                        db_manager.record_script_execution(
+                            script_id=script_id,
+                            status=final_status,
+                            error_message=state["error_message"],
+                            execution_time_ms=execution_time_ms,
+                            execution_id=execution_record_id,
+                        )
+                    except Exception as e:
+                        logger.warning(f"[ScriptRunner] 스크립트 실행 기록 업데이트 실패 (무시): {e!s}")
+
+        logger.info(
+            f"[ScriptRunner] 스크립트 실행 완료 - 스크립트 ID: {script_id}, 상태: {final_status}, "
+            f"실행 노드: {state['executed_count']}개, 실행 시간: {execution_time_ms}ms"
+        )
+
+        return {
+            "execution_id": execution_id,
+            "script_id": script_id,
+            "status": final_status,
+            "error_message": state["error_message"],
+            "execution_time_ms": execution_time_ms,
+            "results": list(state["results"]),
+            "executed_count": state["executed_count"],
+            "resumed": checkpoint is not None,
+            "checkpoints": checkpointer.writes if checkpointer else 0,
+            **({"dry_run": dry_run.summary()} if dry_run is not None else {}),
+        }
+
+    async def call_script(
+        self,
+        script_id: int,
+        params: dict[str, Any],
+        call_stack: list[int],
+        execution_id: str | None = None,
+        cancel_token: CancellationToken | None = None,
+        dry_run: DryRunSession | None = None,
+    ) -> dict[str, Any]:
+        """
+        다른 스크립트를 현재 실행 안에서 호출합니다. (call-script 노드에서 사용)
+        호출된 스크립트는 캐시된 실행 계획을 별도의 노드 실행 컨텍스트로 실행하며,
+        취소 토큰(제한 시간 포함)과 실행 ID는 호출한 워크플로우와 공유합니다.
+        (실행 로그의 노드 ID는 "<스크립트 ID>:<노드 ID>"로 기록되어 호출한 스크립트의 노드와 구분됩니다)
+        재귀 호출과 최대 중첩 깊이 검사는 호출자(call-script 노드)가 담당합니다.
+
+        Args:
+            script_id: 호출할 스크립트 ID
+            params: 입력 파라미터 (호출된 스크립트에서 {{params.<이름>}}으로 참조)
+            call_stack: 호출된 스크립트를 포함한 호출 스택
+            execution_id: 워크플로우 실행 ID (로그 추적용)
+            cancel_token: 호출한 워크플로우의 실행 취소 토큰
+            dry_run: 호출한 워크플로우의 드라이런 세션 (가상 시계와 입력 기록을 공유)
+
+        Returns:
+            호출 결과 딕셔너리
+            - found: 스크립트 존재 여부
+            - script_name: 스크립트 이름
+            - status: 최종 상태 (success, error, cancelled)
+            - error_message: 에러 메시지 (실패 시)
+            - executed_count: 실행한 노드 수
+            - result: 마지막으로 실행한 노드의 출력
+            - outputs: 노드 ID → 출력 (실행 컨텍스트에 남아 있는 노드)
+        """
+        entry = workflow_plan_cache.get_entry(script_id)
+        if entry is None:
+            return {"found": False, "script_name": None, "status": "error", "error_message": None}
+        plan, script_name = entry
+
+        execution_id = execution_id or generate_execution_id()
+        context = self._create_context(plan, cancel_token, call_stack, dry_run)
+        context.workflow_data["params"] = params
+        # 호출된 스크립트의 노드 로그는 호출한 실행 ID를 공유하므로 노드 ID에 스크립트 ID를 붙여 구분
+        context.workflow_data["log_node_prefix"] = f"{script_id}:"
+
+        state = _new_run_state()
+        try:
+            await self._run_plan(plan, context, execution_id, script_id, state)
+            if context.cancel_token.cancelled:
+                status = "cancelled"
+                state["error_message"] = state["error_message"] or context.cancel_token.reason
+            else:
+                status = "error" if state["error_message"] is not None else "success"
+            last_result = state["results"][-1] if state["results"] else None
+            return {
+                "found": True,
+                "script_name": script_name,
+                "status": status,
+                "error_message": state["error_message"],
+                "executed_count": state["executed_count"],
+                "result": last_result.get("output") if isinstance(last_result, dict) else None,
+                "outputs": {node_id: result.get("output") for node_id, result in context.node_results.items()},
+            }
+        finally:
+            context.clear()
+
+    async def _run_plan(
+        self,
+        plan: WorkflowPlan,
+        context: NodeExecutionContext,
+        execution_id: str,
+        script_id: int,
+        state: dict[str, Any],
+        checkpointer: ExecutionCheckpointer | None = None,
+        cursor_state: dict[str, Any] | None = None,
+    ) -> None:
+        """
+        실행 계획에 따라 노드를 순차 실행합니다. 노드가 실패하면 즉시 중단합니다.
+
+        Args:
+            plan: 실행 계획
+            context: 노드 실행 컨텍스트
+            execution_id: 워크플로우 실행 ID
+            script_id: 스크립트 ID
+            state: 결과/에러 누적용 딕셔너리
+            checkpointer: 체크포인트 저장기 (None이면 저장하지 않음)
+            cursor_state: 재개할 실행 위치 (체크포인트의 cursor_state, None이면 시작 노드부터)
+                - node_id: 다음에 실행할 메인 경로 노드 ID
+                - visited: 메인 경로에서 이미 실행한 노드 ID 목록
+                - repeat: 반복 노드 실행 중이면 {"iteration", "index", "total"} (다음에 실행할 반복 회차/본문 위치)
+        """
+        cursor_state = cursor_state or {}
+        node_id = cursor_state.get("node_id", plan.start_node_id)
+        # visited: 메인 경로에서 이미 실행한 노드 ID (순환 연결 방지)
+        visited: set[str] = set(cursor_state.get("visited") or []) - {node_id}
+        # resume_repeat: 재개할 반복 노드의 진행 위치 (반복 노드 자체는 다시 실행하지 않음)
+        resume_repeat = cursor_state.get("repeat")
+
+        while node_id and node_id not in visited:
+            visited.add(node_id)
+            node = plan.get_node(node_id)
+            if node is None:
+                break
+
+            if resume_repeat is not None and node.get("type") == "repeat":
+                result = context.get_node_result(node_id) or {"output": {"repeat_count": resume_repeat["total"]}}
+                start_iteration, start_index = int(resume_repeat["iteration"]), int(resume_repeat["index"])
+                resume_repeat = None
+            else:
+                result = await self._execute_node(node, context, execution_id, script_id, state)
+                if result is None:
+                    return
+                start_iteration, start_index = 1, 0
+
+            # 반복 노드: bottom 연결점의 체인을 repeat_count만큼 실행
+            if node.get("type") == "repeat":
+                output = result.get("output") or {}
+                repeat_count = int(output.get("repeat_count", 1)) if isinstance(output, dict) else 1
+                body = plan.repeat_bodies.get(node_id, [])
+                completed = await self._run_repeat_body(
+                    plan,
+                    node_id,
+                    body,
+                    repeat_count,
+                    (start_iteration, start_index),
+                    context,
+                    execution_id,
+                    script_id,
+                    state,
+                    checkpointer,
+                    visited,
+                )
+                if not completed:
+                    return
+                # 반복 블록의 노드는 메인 경로에서 다시 실행하지 않음
+                visited.update(body)
+
+            node_id = plan.next_node_id(node_id, result)
+            if checkpointer is not None:
+                checkpointer.node_completed({"node_id": node_id, "visited": sorted(visited)}, context)
+
+    async def _run_repeat_body(
+        self,
+        plan: WorkflowPlan,
+        repeat_node_id: str,
+        body: list[str],
+        repeat_count: int,
+        start: tuple[int, int],
+        context: NodeExecutionContext,
+        execution_id: str,
+        script_id: int,
+        state: dict[str, Any],
+        checkpointer: ExecutionCheckpointer | None,
+        visited: set[str],
+    ) -> bool:
+        """
+        반복 노드의 본문 체인을 반복 실행합니다. 본문 노드가 끝날 때마다 반복 진행 위치를 체크포인트로 남깁니다.
+
+        Args:
+            plan: 실행 계획
+            repeat_node_id: 반복 노드 ID
+            body: 반복할 노드 ID 체인
+            repeat_count: 반복 횟수
+            start: 시작할 (반복 회차, 본문 위치) (재개 시 체크포인트의 위치)
+            context: 노드 실행 컨텍스트
+            execution_id: 워크플로우 실행 ID
+            script_id: 스크립트 ID
+            state: 결과/에러 누적용 딕셔너리
+            checkpointer: 체크포인트 저장기
+            visited: 메인 경로에서 이미 실행한 노드 ID
+
+        Returns:
+            모든 반복 완료 여부 (노드 실패/취소 시 False)
+        """
+        start_iteration, start_index = start
+        for iteration in range(start_iteration, repeat_count + 1):
+            first_index = start_index if iteration == start_iteration else 0
+            for index in range(first_index, len(body)):
+                body_node = plan.get_node(body[index])
+                if body_node is not None:
+                    node_with_repeat = {
+                        **body_node,
+                        "repeat_info": {
+                            **(body_node.get("repeat_info") or {}),
+                            "current_iteration": iteration,
+                            "total_iterations": repeat_count,
+                        },
+                    }
+                    if await self._execute_node(node_with_repeat, context, execution_id, script_id, state) is None:
+                        return False
+
+                if checkpointer is not None:
+                    # 다음에 실행할 반복 회차/본문 위치
+                    next_iteration, next_index = (iteration, index + 1) if index + 1 < len(body) else (iteration + 1, 0)
+                    checkpointer.node_completed(
+                        {
+                            "node_id": repeat_node_id,
+                            "visited": sorted(visited),
+                            "repeat": {"iteration": next_iteration, "index": next_index, "total": repeat_count},
+                        },
+                        context,
+                    )
+        return True
+
+    async def _execute_node(
+        self,
+        node: dict[str, Any],
+        context: NodeExecutionContext,
+        execution_id: str,
+        script_id: int,
+        state: dict[str, Any],
+    ) -> dict[str, Any] | None:
+        """
+        단일 노드를 실행하고 결과를 state에 누적합니다.
+
+        Returns:
+            노드 실행 결과 (실패 시 None - 호출자는 실행을 중단해야 함)
+        """
+        node_id = node.get("id", "")
+
+        # 실행이 취소되었으면 다음 노드를 실행하지 않고 중단
+        if context.cancel_token.cancelled:
+            state["error_message"] = context.cancel_token.reason
+            logger.info(f"[ScriptRunner] 실행 취소로 중단 - 노드 ID: {node_id}, 사유: {state['error_message']}")
+            return None
+
+        try:
+            result = await self.action_service.process_node(
+                node, context, execution_id=execution_id, script_id=script_id
+            )
+        except Exception as e:
+            result = {"action": node.get("type", "unknown"), "status": "failed", "error": str(e), "output": None}
+
+        state["results"].append(result)
+        state["executed_count"] += 1
+        if _is_failed_result(result):
+            error = result.get("error") or result.get("message") or "노드 실행 실패"
+            state["error_message"] = error.get("message", str(error)) if isinstance(error, dict) else str(error)
+            logger.error(f"[ScriptRunner] 노드 실행 실패로 중단 - 노드 ID: {node_id}, 에러: {state['error_message']}")
+            return None
+        return result
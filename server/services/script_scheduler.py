@@ -0,0 +1,335 @@
+"""
+스크립트 예약 실행 서비스
+schedules 테이블의 크론/간격 예약을 읽어 정해진 시각에 실행 큐에 스크립트 실행을 등록합니다.
+
+주요 기능:
+- 크론 표현식(5필드) 또는 고정 간격(초) 예약
+- 지터: 정시 실행 시각에 0~jitter_seconds초의 랜덤 지연을 더해 동시 실행 몰림 방지
+- 놓친 실행 처리 정책 (서버 중지/절전 등으로 유예 시간보다 늦은 경우)
+    - skip: 놓친 실행은 건너뛰고 다음 정시 실행부터 재개
+    - catch_up_once: 놓친 실행이 몇 번이든 한 번만 실행한 뒤 다음 정시 실행부터 재개
+- 이전 예약 실행이 아직 큐에서 대기 중이면 이번 실행은 건너뜀 (큐 적체 방지)
+
+예약마다 태스크를 만들지 않고 (실행 시각, 예약 ID, 버전) 힙 하나와 타이머 태스크 하나로 모든 예약을 처리합니다.
+예약이 수정/삭제되면 버전을 올리고, 힙에 남은 이전 항목은 꺼낼 때 건너뜁니다 (지연 삭제).
+
+사용 예시:
+    await script_scheduler.start()
+    await script_scheduler.reload_schedule(schedule_id)
+    await script_scheduler.stop()
+"""
+
+import asyncio
+import contextlib
+from datetime import datetime, timedelta
+import heapq
+import random
+import time
+from typing import Any
+
+from config.server_config import settings
+from db.database import db_manager
+from log import log_manager
+from services.execution_queue import QueuedRunStatus, execution_queue
+from utils.cron_expression import CronExpression
+
+logger = log_manager.logger
+
+# DB에 저장하는 시각 형식 (로컬 시각)
+_TIME_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+# 타이머 최대 대기 시간 (초) - 시스템 시각 변경/절전 복귀 시에도 이 간격 안에 다시 확인
+_MAX_SLEEP_SECONDS = 60.0
+
+
+def compute_next_run(
+    schedule_type: str,
+    cron_expression: str | None,
+    interval_seconds: int | None,
+    after: datetime,
+) -> datetime:
+    """
+    예약 설정으로 기준 시각 이후의 다음 정시 실행 시각을 계산합니다.
+
+    Args:
+        schedule_type: 예약 방식 (cron, interval)
+        cron_expression: 크론 표현식 (cron 방식일 때 필수)
+        interval_seconds: 실행 간격 초 (interval 방식일 때 필수)
+        after: 기준 시각
+
+    Returns:
+        다음 실행 시각
+
+    Raises:
+        ValueError: 예약 설정이 잘못된 경우
+    """
+    if schedule_type == "cron":
+        if not cron_expression:
+            raise ValueError("cron 예약에는 cron_expression이 필요합니다.")
+        return CronExpression(cron_expression).next_after(after)
+    if schedule_type == "interval":
+        if not interval_seconds or interval_seconds < 1:
+            raise ValueError("interval 예약에는 1 이상의 interval_seconds가 필요합니다.")
+        return after.replace(microsecond=0) + timedelta(seconds=interval_seconds)
+    raise ValueError(f"지원하지 않는 예약 방식입니다: {schedule_type} (cron, interval)")
+
+
+def format_schedule_time(moment: datetime) -> str:
+    """예약 시각을 DB 저장 형식 문자열로 변환"""
+    return moment.strftime(_TIME_FORMAT)
+
+
+class ScheduleEntry:
+    """
+    스케줄러가 메모리에 보관하는 예약 한 건의 상태
+    크론 표현식은 한 번만 파싱해 두고 다음 실행 시각 계산에 재사용합니다.
+    """
+
+    def __init__(self, schedule: dict[str, Any], version: int) -> None:
+        """
+        ScheduleEntry 초기화
+
+        Args:
+            schedule: schedules 테이블 행
+            version: 힙 항목 유효성 확인용 버전
+        """
+        self.schedule_id: int = schedule["id"]
+        self.script_id: int = schedule["script_id"]
+        self.schedule_type: str = schedule["schedule_type"]
+        self.interval_seconds: int | None = schedule.get("interval_seconds")
+        self.jitter_seconds: int = schedule.get("jitter_seconds") or 0
+        self.missed_run_policy: str = schedule.get("missed_run_policy") or "skip"
+        self.priority: int = schedule.get("priority") or 0
+        self.last_run_id: str | None = schedule.get("last_run_id")
+        self.version = version
+        self.cron = CronExpression(schedule["cron_expression"]) if self.schedule_type == "cron" else None
+        # nominal_at: 지터가 적용되지 않은 다음 정시 실행 시각
+        self.nominal_at: datetime = datetime.now()
+        # fire_at: 지터가 적용된 실제 실행 시각 (time.time() 기준)
+        self.fire_at: float = 0.0
+
+    def next_after(self, moment: datetime) -> datetime:
+        """기준 시각 이후의 다음 정시 실행 시각"""
+        if self.cron is not None:
+            return self.cron.next_after(moment)
+        return moment + timedelta(seconds=self.interval_seconds or 1)
+
+    def next_after_now(self, now: datetime) -> datetime:
+        """
+        놓친 실행을 건너뛰고 현재 이후의 첫 정시 실행 시각을 계산합니다.
+        간격 예약은 기존 주기(nominal_at 기준)를 유지합니다.
+        """
+        if self.cron is not None:
+            return self.cron.next_after(now)
+        interval = self.interval_seconds or 1
+        elapsed = (now - self.nominal_at).total_seconds()
+        return self.nominal_at + timedelta(seconds=(int(elapsed // interval) + 1) * interval)
+
+    def to_dict(self) -> dict[str, Any]:
+        """API 응답용 딕셔너리 변환"""
+        return {
+            "schedule_id": self.schedule_id,
+            "script_id": self.script_id,
+            "next_run_at": format_schedule_time(self.nominal_at),
+            "fire_at": datetime.fromtimestamp(self.fire_at).isoformat(timespec="seconds"),
+            "last_run_id": self.last_run_id,
+        }
+
+
+class ScriptScheduler:
+    """
+    스크립트 예약 실행 스케줄러 클래스
+
+    모든 예약을 (실행 시각, 예약 ID, 버전) 힙 하나로 관리하고, 타이머 태스크 하나가
+    가장 이른 실행 시각까지 대기합니다. 예약이 추가/수정되면 이벤트로 타이머를 깨워 다시 계산합니다.
+    """
+
+    def __init__(self, misfire_grace_seconds: int | None = None) -> None:
+        """
+        ScriptScheduler 초기화
+
+        Args:
+            misfire_grace_seconds: 이 시간(초)보다 늦어진 실행은 놓친 실행으로 처리 (None이면 설정값 사용)
+        """
+        self.misfire_grace_seconds = (
+            misfire_grace_seconds if misfire_grace_seconds is not None else settings.SCHEDULER_MISFIRE_GRACE_SECONDS
+        )
+        # _heap: (실행 시각, 예약 ID, 버전) 힙 - 버전이 다른 항목은 꺼낼 때 건너뜀
+        self._heap: list[tuple[float, int, int]] = []
+        # _entries: 활성 예약 (예약 ID → 상태)
+        self._entries: dict[int, ScheduleEntry] = {}
+        # _version: 예약 상태 버전 카운터
+        self._version = 0
+        self._wakeup: asyncio.Event | None = None
+        self._task: asyncio.Task[None] | None = None
+
+    @property
+    def running(self) -> bool:
+        """타이머 태스크 실행 여부"""
+        return self._task is not None and not self._task.done()
+
+    async def start(self) -> None:
+        """활성화된 예약을 DB에서 불러오고 타이머 태스크를 시작합니다."""
+        if self.running:
+            return
+        self._wakeup = asyncio.Event()
+        for schedule in db_manager.schedules.get_enabled_schedules():
+            self._add_entry(schedule)
+        self._task = asyncio.create_task(self._timer_loop())
+        logger.info(f"[ScriptScheduler] 스케줄러 시작 - 활성 예약: {len(self._entries)}개")
+
+    async def stop(self) -> None:
+        """타이머 태스크를 중지합니다. (이미 큐에 등록된 실행은 영향을 받지 않음)"""
+        if self._task is not None:
+            self._task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._task
+        self._task = None
+        self._heap.clear()
+        self._entries.clear()
+        logger.info("[ScriptScheduler] 스케줄러 중지")
+
+    async def reload_schedule(self, schedule_id: int) -> None:
+        """
+        예약 한 건을 DB에서 다시 읽어 반영합니다. (생성/수정 후 호출)
+        비활성화되었거나 삭제된 예약은 스케줄러에서 제거됩니다.
+        스케줄러가 시작되지 않은 상태면 DB 변경만 유지되고 start() 시 반영됩니다.
+
+        Args:
+            schedule_id: 예약 ID
+        """
+        self.remove_schedule(schedule_id)
+        if not self.running:
+            return
+        schedule = db_manager.schedules.get_schedule(schedule_id)
+        if schedule and schedule["enabled"]:
+            self._add_entry(schedule)
+            self._notify()
+
+    def remove_schedule(self, schedule_id: int) -> None:
+        """
+        예약을 스케줄러에서 제거합니다. 힙에 남은 항목은 꺼낼 때 건너뜁니다.
+
+        Args:
+            schedule_id: 예약 ID
+        """
+        self._entries.pop(schedule_id, None)
+
+    def list_upcoming(self) -> list[dict[str, Any]]:
+        """활성 예약의 다음 실행 시각 목록 (실행 시각 순)"""
+        entries = sorted(self._entries.values(), key=lambda entry: entry.fire_at)
+        return [entry.to_dict() for entry in entries]
+
+    def _add_entry(self, schedule: dict[str, Any]) -> None:
+        """예약을 메모리 상태와 힙에 추가"""
+        self._version += 1
+        try:
+            entry = ScheduleEntry(schedule, self._version)
+            if schedule.get("next_run_at"):
+                entry.nominal_at = datetime.fromisoformat(schedule["next_run_at"])
+            else:
+                entry.nominal_at = entry.next_after(datetime.now())
+        except ValueError as e:
+            logger.error(f"[ScriptScheduler] 예약 설정 오류로 건너뜀 - 예약 ID: {schedule.get('id')}, 오류: {e}")
+            return
+
+        self._entries[entry.schedule_id] = entry
+        self._push(entry)
+
+    def _push(self, entry: ScheduleEntry) -> None:
+        """정시 실행 시각에 지터를 더해 힙에 등록"""
+        jitter = random.uniform(0, entry.jitter_seconds) if entry.jitter_seconds > 0 else 0.0
+        entry.fire_at = entry.nominal_at.timestamp() + jitter
+        heapq.heappush(self._heap, (entry.fire_at, entry.schedule_id, entry.version))
+
+    def _notify(self) -> None:
+        """타이머 태스크를 깨워 가장 이른 실행 시각을 다시 계산하게 함"""
+        if self._wakeup is not None:
+            self._wakeup.set()
+
+    def _peek(self) -> tuple[float, ScheduleEntry] | None:
+        """유효한 힙 최상단 항목 조회 (제거/수정된 예약의 이전 항목은 버림)"""
+        while self._heap:
+            fire_at, schedule_id, version = self._heap[0]
+            entry = self._entries.get(schedule_id)
+            if entry is not None and entry.version == version:
+                return fire_at, entry
+            heapq.heappop(self._heap)
+        return None
+
+    async def _timer_loop(self) -> None:
+        """가장 이른 실행 시각까지 대기했다가 도래한 예약을 실행하는 타이머 루프"""
+        assert self._wakeup is not None
+        while True:
+            top = self._peek()
+            delay = _MAX_SLEEP_SECONDS if top is None else top[0] - time.time()
+            if top is None or delay > 0:
+                self._wakeup.clear()
+                with contextlib.suppress(asyncio.TimeoutError):
+                    await asyncio.wait_for(self._wakeup.wait(), timeout=min(delay, _MAX_SLEEP_SECONDS))
+                continue
+
+            heapq.heappop(self._heap)
+            entry = top[1]
+            try:
+                await self._fire(entry)
+            except Exception as e:
+                logger.error(f"[ScriptScheduler] 예약 실행 처리 실패 - 예약 ID: {entry.schedule_id}, 오류: {e}")
+                # 실패한 예약도 다음 정시 실행은 유지
+                entry.nominal_at = entry.next_after_now(datetime.now())
+                self._push(entry)
+
+    async def _fire(self, entry: ScheduleEntry) -> None:
+        """
+        도래한 예약을 처리합니다.
+        놓친 실행이면 정책에 따라 건너뛰거나 한 번만 실행하고, 다음 실행 시각을 현재 이후로 옮깁니다.
+        """
+        now = datetime.now()
+        missed = (now - entry.nominal_at).total_seconds() > self.misfire_grace_seconds
+        should_run = not missed or entry.missed_run_policy == "catch_up_once"
+
+        last_run_at: str | None = None
+        if should_run:
+            if self._previous_run_pending(entry):
+                logger.warning(
+                    f"[ScriptScheduler] 이전 예약 실행이 아직 대기 중이어서 건너뜀 - "
+                    f"예약 ID: {entry.schedule_id}, 실행 ID: {entry.last_run_id}"
+                )
+            else:
+                run = await execution_queue.enqueue_script(entry.script_id, priority=entry.priority, source="schedule")
+                entry.last_run_id = run.run_id
+                last_run_at = format_schedule_time(now)
+                logger.info(
+                    f"[ScriptScheduler] 예약 실행 등록 - 예약 ID: {entry.schedule_id}, "
+                    f"스크립트 ID: {entry.script_id}, 실행 ID: {run.run_id}, 놓친 실행 보충: {missed}"
+                )
+        else:
+            logger.info(
+                f"[ScriptScheduler] 놓친 실행 건너뜀 - 예약 ID: {entry.schedule_id}, "
+                f"예정 시각: {format_schedule_time(entry.nominal_at)}"
+            )
+
+        # 다음 정시 실행 시각: 놓친 실행이면 현재 이후로 건너뛰고, 아니면 이번 정시 실행 시각 기준으로 계산
+        next_at = entry.next_after_now(now) if missed else entry.next_after(entry.nominal_at)
+        if next_at <= now - timedelta(seconds=self.misfire_grace_seconds):
+            next_at = entry.next_after_now(now)
+        entry.nominal_at = next_at
+
+        db_manager.schedules.update_run_state(
+            entry.schedule_id,
+            next_run_at=format_schedule_time(next_at),
+            last_run_at=last_run_at,
+            last_run_id=entry.last_run_id if last_run_at else None,
+        )
+        self._push(entry)
+
+    def _previous_run_pending(self, entry: ScheduleEntry) -> bool:
+        """이전 예약 실행이 아직 큐에서 대기 중인지 확인"""
+        if not entry.last_run_id:
+            return False
+        run = execution_queue.get_run(entry.last_run_id)
+        return run is not None and run.status == QueuedRunStatus.QUEUED
+
+
+# 전역 스케줄러 인스턴스
+script_scheduler = ScriptScheduler()
@@ -0,0 +1,97 @@
+"""
+통계 보정 서비스
+로그 통계(log_stats)와 대시보드 통계(dashboard_stats)는 DB 트리거가 기록과 함께 증감시키므로
+조회 API는 저장된 값을 읽기만 합니다. 이 서비스는 STATS_RECONCILE_INTERVAL_SECONDS마다 전체 재계산으로
+저장된 값을 보정하고, 어긋난 값이 있으면 로그로 남깁니다.
+(트리거 생성 전에 쓰인 로그, 직접 수정한 DB 등으로 생긴 차이를 바로잡는 용도)
+"""
+
+import asyncio
+import contextlib
+from typing import Any
+
+from config.server_config import settings
+from db.database import db_manager
+from log import log_manager
+
+logger = log_manager.logger
+
+
+class StatsReconciler:
+    """저장된 통계를 주기적으로 전체 재계산 값과 맞추는 클래스"""
+
+    def __init__(self, interval: float | None = None) -> None:
+        """
+        StatsReconciler 초기화
+
+        Args:
+            interval: 보정 주기 (초, None이면 STATS_RECONCILE_INTERVAL_SECONDS, 0 이하면 보정 안 함)
+        """
+        self.interval = settings.STATS_RECONCILE_INTERVAL_SECONDS if interval is None else interval
+        self._task: asyncio.Task[None] | None = None
+        # 통계 (보정 횟수, 어긋난 값을 바로잡은 횟수)
+        self.runs = 0
+        self.corrections = 0
+
+    @property
+    def running(self) -> bool:
+        """보정 태스크 실행 여부"""
+        return self._task is not None and not self._task.done()
+
+    async def start(self) -> None:
+        """보정 태스크를 시작합니다. (서버 시작 시 호출, 첫 보정은 한 주기 뒤)"""
+        if self.running or self.interval <= 0:
+            return
+        self._task = asyncio.create_task(self._loop())
+        logger.info(f"[StatsReconciler] 통계 보정 시작 - 주기: {self.interval}초")
+
+    async def stop(self) -> None:
+        """보정 태스크를 중지합니다. (서버 종료 시 호출)"""
+        if self._task is None:
+            return
+        self._task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await self._task
+        self._task = None
+
+    async def _loop(self) -> None:
+        """주기마다 보정합니다. (보정 실패는 경고만 남기고 다음 주기에 다시 시도)"""
+        while True:
+            await asyncio.sleep(self.interval)
+            try:
+                await asyncio.to_thread(self.reconcile)
+            except Exception as e:
+                logger.warning(f"[StatsReconciler] 통계 보정 실패 (무시): {e!s}")
+
+    def reconcile(self) -> dict[str, dict[str, Any]]:
+        """
+        로그/대시보드 통계를 전체 재계산 값으로 보정합니다.
+
+        Returns:
+            통계 종류별 어긋났던 값 ({"log_stats": {키: {"stored", "actual"}}, "dashboard_stats": {...}})
+        """
+        stored_log_stats = db_manager.log_stats.get_log_stats()
+        actual_log_stats = db_manager.log_stats.calculate_and_update_stats()
+        stored_dashboard_stats = db_manager.get_dashboard_stats()
+        actual_dashboard_stats = db_manager.calculate_and_update_dashboard_stats()
+
+        drift = {
+            "log_stats": _diff(stored_log_stats, actual_log_stats),
+            "dashboard_stats": _diff(stored_dashboard_stats, actual_dashboard_stats),
+        }
+        self.runs += 1
+        if drift["log_stats"] or drift["dashboard_stats"]:
+            self.corrections += 1
+            logger.info(f"[StatsReconciler] 어긋난 통계 보정: {drift}")
+        return drift
+
+
+def _diff(stored: dict[str, Any], actual: dict[str, Any]) -> dict[str, dict[str, Any]]:
+    """저장된 값과 실제 값이 다른 키만 반환"""
+    return {
+        key: {"stored": stored.get(key), "actual": value} for key, value in actual.items() if stored.get(key) != value
+    }
+
+
+# 전역 통계 보정 인스턴스
+stats_reconciler = StatsReconciler()
@@ -0,0 +1,227 @@
+"""
+워크플로우 실행 계획
+저장된 스크립트의 노드/연결 정보를 서버에서 실행할 수 있는 형태로 변환합니다.
+
+클라이언트(workflow-execution-service.js)의 실행 순서 규칙을 그대로 따릅니다.
+- 시작 노드(start)부터 연결을 따라 순차 실행
+- 조건 노드(condition): 결과(True/False)에 따라 "true"/"false" 연결점으로 분기
+- 반복 노드(repeat): "bottom" 연결점에 연결된 노드 체인을 repeat_count만큼 반복한 뒤 출력 연결점으로 진행
+- 그 외 노드: 일반 출력 연결(outputType 없음 또는 "output") 중 첫 번째를 따라감
+
+실행 계획은 파라미터 템플릿까지 미리 컴파일하며, 스크립트별로 캐시되어
+스크립트 실행과 다른 스크립트의 호출(call-script 노드)이 같은 계획을 공유합니다.
+캐시된 계획은 스크립트 저장/삭제 시 무효화됩니다.
+"""
+
+from collections import OrderedDict
+import threading
+from typing import Any
+
+from config.server_config import settings
+from db.database import db_manager
+from log import log_manager
+from services.node_result_cache import cache_referenced_node_ids
+from utils.parameter_template import ParameterTemplate, compile_node_templates, referenced_node_refs
+
+logger = log_manager.logger
+
+# 일반 출력 연결점 타입 (outputType이 없거나 "output"인 연결)
+_DEFAULT_OUTPUT_TYPES = (None, "output")
+
+
+class WorkflowPlan:
+    """
+    워크플로우 실행 계획 클래스
+    노드 조회와 다음 노드 결정을 O(1)로 할 수 있도록 연결 정보를 미리 인덱싱합니다.
+    """
+
+    def __init__(self, nodes: list[dict[str, Any]], connections: list[dict[str, Any]]) -> None:
+        """
+        실행 계획 생성
+
+        Args:
+            nodes: 노드 목록 (db_manager.get_script()의 nodes 형식)
+            connections: 연결 정보 목록 ({"from", "to", "outputType"})
+        """
+        # nodes_by_id: 노드 ID → 노드 데이터
+        self.nodes_by_id: dict[str, dict[str, Any]] = {node["id"]: node for node in nodes if node.get("id")}
+
+        # next_map: 노드 ID → [(다음 노드 ID, outputType), ...] (연결 순서 유지)
+        self.next_map: dict[str, list[tuple[str, str | None]]] = {}
+        for conn in connections:
+            from_id = conn.get("from")
+            to_id = conn.get("to")
+            if from_id and to_id and to_id in self.nodes_by_id:
+                self.next_map.setdefault(from_id, []).append((to_id, conn.get("outputType")))
+
+        # start_node_id: 실행을 시작할 노드 ID (start 노드가 없으면 X 좌표가 가장 작은 노드)
+        self.start_node_id = self._find_start_node_id(nodes)
+
+        # repeat_bodies: 반복 노드 ID → 반복할 노드 ID 체인 (계획 생성 시 한 번만 계산)
+        self.repeat_bodies: dict[str, list[str]] = {
+            node_id: self._build_repeat_body(node_id)
+            for node_id, node in self.nodes_by_id.items()
+            if node.get("type") == "repeat"
+        }
+
+        # parameter_templates: 노드 ID → 컴파일된 파라미터 템플릿 (계획 생성 시 한 번만 컴파일)
+        self.parameter_templates: dict[str, ParameterTemplate | None] = compile_node_templates(nodes)
+        # pinned_node_refs: 다른 노드가 참조하여 실행 컨텍스트에서 항상 보존할 노드 ID/이름
+        self.pinned_node_refs: frozenset[str] = frozenset(
+            referenced_node_refs(self.parameter_templates) | cache_referenced_node_ids(nodes)
+        )
+
+    def _find_start_node_id(self, nodes: list[dict[str, Any]]) -> str | None:
+        """시작 노드 ID 찾기"""
+        for node in nodes:
+            if node.get("id") == "start" or node.get("type") == "start":
+                return node["id"]
+        if not nodes:
+            return None
+        # 시작 노드가 없으면 클라이언트와 동일하게 X 좌표 순서의 첫 노드 사용
+        first = min(nodes, key=lambda n: (n.get("position") or {}).get("x", 0))
+        return first.get("id")
+
+    def _build_repeat_body(self, repeat_node_id: str) -> list[str]:
+        """
+        반복 노드의 "bottom" 연결점에 연결된 노드 체인을 구성합니다.
+
+        Args:
+            repeat_node_id: 반복 노드 ID
+
+        Returns:
+            반복할 노드 ID 목록 (체인 순서)
+        """
+        body: list[str] = []
+        current_id = self._first_next(repeat_node_id, ("bottom",))
+        visited: set[str] = set()
+        while current_id and current_id not in visited and current_id != repeat_node_id:
+            visited.add(current_id)
+            body.append(current_id)
+            current_id = self._first_next(current_id, _DEFAULT_OUTPUT_TYPES)
+        return body
+
+    def _first_next(self, node_id: str, output_types: tuple[str | None, ...]) -> str | None:
+        """지정한 연결점 타입 중 첫 번째 다음 노드 ID 반환"""
+        for to_id, output_type in self.next_map.get(node_id, []):
+            if output_type in output_types:
+                return to_id
+        return None
+
+    def get_node(self, node_id: str) -> dict[str, Any] | None:
+        """노드 ID로 노드 데이터 가져오기"""
+        return self.nodes_by_id.get(node_id)
+
+    def next_node_id(self, node_id: str, result: dict[str, Any] | None) -> str | None:
+        """
+        실행 결과를 바탕으로 다음에 실행할 노드 ID를 결정합니다.
+
+        Args:
+            node_id: 방금 실행한 노드 ID
+            result: 노드 실행 결과
+
+        Returns:
+            다음 노드 ID 또는 None (워크플로우 종료)
+        """
+        node = self.nodes_by_id.get(node_id) or {}
+        output = (result or {}).get("output")
+
+        # 조건 노드: 결과에 맞는 분기 연결점 선택
+        if node.get("type") == "condition" and isinstance(output, dict) and isinstance(output.get("result"), bool):
+            branch = "true" if output["result"] else "false"
+            return self._first_next(node_id, (branch,))
+
+        return self._first_next(node_id, _DEFAULT_OUTPUT_TYPES)
+
+
+class WorkflowPlanCache:
+    """
+    스크립트 실행 계획 캐시 클래스 (LRU)
+    스크립트 ID별로 실행 계획을 한 번만 만들어 모든 실행/호출이 공유합니다.
+    """
+
+    def __init__(self, max_entries: int | None = None) -> None:
+        """
+        WorkflowPlanCache 초기화
+
+        Args:
+            max_entries: 최대 항목 수 (초과 시 가장 오래 사용되지 않은 계획부터 제거)
+        """
+        self.max_entries = max(1, max_entries or settings.WORKFLOW_PLAN_CACHE_MAX_ENTRIES)
+        # _plans: 스크립트 ID → (실행 계획, 스크립트 이름) (앞쪽일수록 오래 사용되지 않음)
+        self._plans: OrderedDict[int, tuple[WorkflowPlan, str | None]] = OrderedDict()
+        self._lock = threading.Lock()
+        # 통계 (히트/미스/무효화 횟수)
+        self._stats = {"hits": 0, "misses": 0, "invalidations": 0}
+
+    def get(self, script_id: int) -> WorkflowPlan | None:
+        """
+        스크립트의 실행 계획을 가져옵니다. (없으면 DB에서 불러와 캐시)
+
+        Args:
+            script_id: 스크립트 ID
+
+        Returns:
+            실행 계획 또는 None (스크립트가 없는 경우)
+        """
+        entry = self.get_entry(script_id)
+        return entry[0] if entry else None
+
+    def get_entry(self, script_id: int) -> tuple[WorkflowPlan, str | None] | None:
+        """
+        스크립트의 실행 계획과 스크립트 이름을 가져옵니다.
+
+        Args:
+            script_id: 스크립트 ID
+
+        Returns:
+            (실행 계획, 스크립트 이름) 또는 None (스크립트가 없는 경우)
+        """
+        with self._lock:
+            entry = self._plans.get(script_id)
+            if entry is not None:
+                self._plans.move_to_end(script_id)
+                self._stats["hits"] += 1
+                return entry
+            self._stats["misses"] += 1
+
+        script = db_manager.get_script(script_id)
+        if not script:
+            return None
+        entry = (WorkflowPlan(script.get("nodes", []), script.get("connections", [])), script.get("name"))
+        logger.debug(
+            f"[WorkflowPlanCache] 실행 계획 생성 - 스크립트 ID: {script_id}, 노드 개수: {len(entry[0].nodes_by_id)}"
+        )
+
+        with self._lock:
+            self._plans[script_id] = entry
+            self._plans.move_to_end(script_id)
+            while len(self._plans) > self.max_entries:
+                self._plans.popitem(last=False)
+        return entry
+
+    def invalidate(self, script_id: int) -> None:
+        """
+        스크립트의 캐시된 실행 계획을 제거합니다. (스크립트 저장/삭제 시 호출)
+
+        Args:
+            script_id: 스크립트 ID
+        """
+        with self._lock:
+            if self._plans.pop(script_id, None) is not None:
+                self._stats["invalidations"] += 1
+
+    def clear(self) -> None:
+        """캐시를 비웁니다."""
+        with self._lock:
+            self._plans.clear()
+
+    def stats(self) -> dict[str, Any]:
+        """캐시 통계를 반환합니다."""
+        with self._lock:
+            return {"entries": len(self._plans), "max_entries": self.max_entries, **self._stats}
+
+
+# 전역 실행 계획 캐시 인스턴스 (스크립트 저장/삭제 시 자동 무효화)
+workflow_plan_cache = WorkflowPlanCache()
+db_manager.add_script_change_listener(workflow_plan_cache.invalidate)
@@ -2,6 +2,16 @@
 공통 유틸리티 모듈
 """
 
+from .cancellation import (
+    CancellationToken,
+    ExecutionCancelledError,
+    ExecutionTimeoutError,
+    cancellation_registry,
+    get_cancel_token,
+)
+from .cron_expression import CronExpression
+from .dry_run import DryRunSession, ReplayFrameSource, VirtualClock, get_dry_run
+from .parameter_template import ParameterTemplate, compile_field_path
 from .parameter_validator import get_parameter, validate_parameters
 from .result_formatter import (
     create_failed_result,
@@ -9,14 +19,29 @@ from .result_formatter import (
     ensure_output_is_dict,
     normalize_result,
 )
+from .retry_policy import RetryPolicy, get_retry_policy
 from .time_utils import get_korea_time_str
 
 __all__ = [
+    "CancellationToken",
+    "CronExpression",
+    "DryRunSession",
+    "ExecutionCancelledError",
+    "ExecutionTimeoutError",
+    "ParameterTemplate",
+    "ReplayFrameSource",
+    "RetryPolicy",
+    "VirtualClock",
+    "cancellation_registry",
+    "compile_field_path",
     "create_failed_result",
     "create_success_result",
     "ensure_output_is_dict",
+    "get_cancel_token",
+    "get_dry_run",
     "get_korea_time_str",
     "get_parameter",
+    "get_retry_policy",
     "normalize_result",
     "validate_parameters",
 ]
@@ -0,0 +1,462 @@
+"""
+실행 취소 유틸리티
+실행(execution_id) 단위의 협력적 취소 토큰과 토큰 저장소를 제공합니다.
+
+노드는 파라미터의 _cancel_token으로 토큰을 받아 대기/폴링/HTTP 요청 중에 취소를 확인합니다.
+- 비동기 대기: await token.sleep(초) → 취소되면 즉시 ExecutionCancelledError 발생
+- 비동기 작업: await token.run(코루틴) → 취소되면 작업을 중단하고 ExecutionCancelledError 발생
+- 스레드 대기: token.wait(초) → 취소되면 즉시 True 반환 (asyncio.to_thread로 실행하는 동기 코드용)
+
+토큰에는 마감 시각(deadline)을 둘 수 있습니다. 워크플로우 실행 토큰에 제한 시간을 설정하면
+NodeExecutor가 노드마다 min(노드 타임아웃, 남은 시간)을 마감으로 하는 자식 토큰을 만들어 실행하고,
+마감이 지나면 토큰이 시간 초과 상태로 취소되어 ExecutionTimeoutError가 발생합니다.
+
+토큰에 가상 시계(clock)를 연결하면 (드라이런 실행) sleep/wait는 실제로 대기하지 않고 가상 시간만 진행하며,
+마감 시각도 가상 시간 기준으로 계산합니다. 자식 토큰은 부모의 시계를 물려받습니다.
+
+사용 예시:
+    with cancellation_registry.track(execution_id) as token:
+        context = NodeExecutionContext(cancel_token=token)
+        ...
+    cancellation_registry.cancel(execution_id)  # 다른 요청에서 취소
+"""
+
+import asyncio
+from collections import OrderedDict
+from collections.abc import Awaitable, Iterator
+import contextlib
+import threading
+import time
+from typing import TYPE_CHECKING, Any, TypeVar
+
+from config.server_config import settings
+
+if TYPE_CHECKING:
+    from utils.dry_run import VirtualClock
+
+T = TypeVar("T")
+
+# 취소된 실행 ID를 기억해 둘 개수 (같은 execution_id로 이어지는 요청을 즉시 취소하기 위함)
+_CANCELLED_HISTORY_SIZE = 200
+
+
+class ExecutionCancelledError(Exception):
+    """실행이 취소되었을 때 발생하는 예외"""
+
+    def __init__(self, reason: str | None = None) -> None:
+        self.reason = reason or "실행이 취소되었습니다."
+        super().__init__(self.reason)
+
+
+class ExecutionTimeoutError(ExecutionCancelledError):
+    """노드 타임아웃 또는 워크플로우 제한 시간이 지났을 때 발생하는 예외 (취소의 한 종류)"""
+
+    def __init__(self, reason: str | None = None) -> None:
+        super().__init__(reason or "실행 시간이 초과되었습니다.")
+
+
+class CancellationToken:
+    """
+    협력적 취소 토큰 클래스
+    이벤트 루프와 작업 스레드 양쪽에서 취소 여부를 확인하고 대기를 즉시 중단할 수 있습니다.
+    """
+
+    def __init__(self, execution_id: str | None = None) -> None:
+        """
+        CancellationToken 초기화
+
+        Args:
+            execution_id: 토큰이 속한 실행 ID (로그/응답용)
+        """
+        self.execution_id = execution_id
+        self.reason: str | None = None
+        # timed_out: 마감 시각이 지나서 취소되었는지 여부 (사용자 취소와 구분)
+        self.timed_out = False
+        # deadline: 마감 시각 (time.monotonic 기준 - 가상 시계가 있으면 가상 시각 기준, None이면 제한 없음)
+        self.deadline: float | None = None
+        # clock: 가상 시계 (드라이런 실행, None이면 실제 시간으로 대기)
+        self.clock: VirtualClock | None = None
+        # _deadline_message: 마감 시각이 지났을 때 사용할 사유
+        self._deadline_message: str | None = None
+        # _children: 이 토큰이 취소되면 함께 취소할 자식 토큰 (노드 단위 토큰)
+        self._children: set[CancellationToken] = set()
+        # _event: 스레드에서도 대기 가능한 취소 플래그
+        self._event = threading.Event()
+        # _waiters: 취소 시 깨울 이벤트 루프 Future 목록 (루프, Future)
+        self._waiters: set[tuple[asyncio.AbstractEventLoop, asyncio.Future[None]]] = set()
+        self._lock = threading.Lock()
+
+    def __repr__(self) -> str:
+        return (
+            f"CancellationToken(execution_id={self.execution_id!r}, cancelled={self.cancelled}, "
+            f"timed_out={self.timed_out})"
+        )
+
+    @property
+    def cancelled(self) -> bool:
+        """취소 여부"""
+        return self._event.is_set()
+
+    def cancel(self, reason: str | None = None, timed_out: bool = False) -> None:
+        """
+        토큰을 취소합니다. 대기 중인 sleep/run/wait가 즉시 깨어나고 자식 토큰도 함께 취소됩니다.
+        (어느 스레드에서 호출해도 안전)
+
+        Args:
+            reason: 취소 사유
+            timed_out: 마감 시각 초과로 인한 취소 여부
+        """
+        with self._lock:
+            if self._event.is_set():
+                return
+            self.reason = reason or ("실행 시간이 초과되었습니다." if timed_out else "실행이 취소되었습니다.")
+            self.timed_out = timed_out
+            self._event.set()
+            waiters = list(self._waiters)
+            self._waiters.clear()
+            children = list(self._children)
+
+        for loop, future in waiters:
+            with contextlib.suppress(RuntimeError):
+                loop.call_soon_threadsafe(_resolve_future, future)
+        for child in children:
+            child.cancel(self.reason, timed_out=timed_out)
+
+    def raise_if_cancelled(self) -> None:
+        """
+        취소되었으면 예외를 발생시킵니다.
+
+        Raises:
+            ExecutionTimeoutError: 마감 시각 초과로 취소된 경우
+            ExecutionCancelledError: 그 외 취소된 경우
+        """
+        if self._event.is_set():
+            raise self._error()
+
+    def set_deadline(self, seconds: float | None, message: str | None = None) -> None:
+        """
+        지금부터 seconds초 뒤를 마감 시각으로 설정합니다. 기존 마감보다 늦어지지는 않습니다.
+
+        Args:
+            seconds: 제한 시간 (초, None이면 변경 없음)
+            message: 마감 시각이 지났을 때 사용할 사유
+        """
+        if seconds is None:
+            return
+        deadline = self._now() + max(0.0, seconds)
+        with self._lock:
+            if self.deadline is None or deadline < self.deadline:
+                self.deadline = deadline
+                self._deadline_message = message or f"제한 시간({seconds:g}초)을 초과했습니다."
+
+    def remaining(self) -> float | None:
+        """
+        마감 시각까지 남은 시간을 반환합니다.
+
+        Returns:
+            남은 시간 (초, 0 이상) 또는 None (마감 없음)
+        """
+        if self.deadline is None:
+            return None
+        return max(0.0, self.deadline - self._now())
+
+    @contextlib.contextmanager
+    def child(self, timeout: float | None = None, message: str | None = None) -> Iterator["CancellationToken"]:
+        """
+        이 토큰에 연결된 자식 토큰을 만듭니다. (노드 단위 타임아웃용)
+        부모가 취소되면 자식도 취소되며, 자식의 마감 시각은 min(지금 + timeout, 부모의 마감 시각)입니다.
+
+        Args:
+            timeout: 자식 토큰의 제한 시간 (초, None이면 부모의 마감만 적용)
+            message: 자식 토큰의 제한 시간이 지났을 때 사용할 사유
+
+        Yields:
+            자식 토큰
+        """
+        token = CancellationToken(self.execution_id)
+        token.clock = self.clock
+        if self.deadline is not None:
+            token.deadline = self.deadline
+            token._deadline_message = self._deadline_message
+        token.set_deadline(timeout, message)
+
+        with self._lock:
+            cancelled = self._event.is_set()
+            if not cancelled:
+                self._children.add(token)
+        if cancelled:
+            token.cancel(self.reason, timed_out=self.timed_out)
+        try:
+            yield token
+        finally:
+            with self._lock:
+                self._children.discard(token)
+
+    def wait(self, seconds: float) -> bool:
+        """
+        스레드에서 지정 시간만큼 대기합니다. 취소되면 즉시 반환합니다.
+
+        Args:
+            seconds: 대기 시간 (초)
+
+        Returns:
+            취소 여부
+        """
+        if self.clock is not None:
+            self._advance_clock(seconds)
+            return self._event.is_set()
+        return self._event.wait(max(0.0, seconds))
+
+    async def sleep(self, seconds: float) -> None:
+        """
+        지정 시간만큼 비동기 대기합니다.
+
+        Args:
+            seconds: 대기 시간 (초)
+
+        Raises:
+            ExecutionCancelledError: 대기 중 취소된 경우 (즉시 발생)
+        """
+        self.raise_if_cancelled()
+        if self.clock is not None:
+            # 가상 시계: 시간만 진행하고 이벤트 루프에 한 번 양보 (다른 태스크의 취소 요청 처리)
+            self._advance_clock(seconds)
+            await asyncio.sleep(0)
+            self.raise_if_cancelled()
+            return
+        future = self._register_waiter()
+        try:
+            await asyncio.wait({future}, timeout=max(0.0, seconds))
+        finally:
+            self._unregister_waiter(future)
+        self.raise_if_cancelled()
+
+    async def run(self, awaitable: Awaitable[T]) -> T:
+        """
+        비동기 작업을 실행하되, 취소되거나 마감 시각이 지나면 작업을 중단합니다.
+        마감 시각이 지나면 토큰을 시간 초과 상태로 취소하므로 작업 스레드의 wait()도 함께 깨어납니다.
+
+        Args:
+            awaitable: 실행할 코루틴/Future
+
+        Returns:
+            작업 결과
+
+        Raises:
+            ExecutionTimeoutError: 마감 시각이 지난 경우
+            ExecutionCancelledError: 작업 중 취소된 경우
+        """
+        remaining = self.remaining()
+        if remaining is not None and remaining <= 0:
+            self._expire()
+        if self.cancelled:
+            # 이미 취소된 경우 코루틴을 시작하지 않고 닫음 (never awaited 경고 방지)
+            if asyncio.iscoroutine(awaitable):
+                awaitable.close()
+            raise self._error()
+        task = asyncio.ensure_future(awaitable)
+        future = self._register_waiter()
+        # 가상 시계에서는 실제 시간으로 마감을 기다리지 않음 (가상 대기가 마감을 지나면 토큰이 취소됨)
+        timeout = None if self.clock is not None else remaining
+        try:
+            await asyncio.wait({task, future}, timeout=timeout, return_when=asyncio.FIRST_COMPLETED)
+        except asyncio.CancelledError:
+            # 상위 태스크가 취소되면 작업도 함께 취소
+            task.cancel()
+            raise
+        finally:
+            self._unregister_waiter(future)
+
+        if not task.done():
+            # 취소가 아니라면 마감 시각 초과
+            self._expire()
+            task.cancel()
+            with contextlib.suppress(asyncio.CancelledError, Exception):
+                await task
+            raise self._error()
+        return task.result()
+
+    def _now(self) -> float:
+        """현재 시각 (가상 시계가 있으면 가상 시각)"""
+        return self.clock.monotonic() if self.clock is not None else time.monotonic()
+
+    def _advance_clock(self, seconds: float) -> None:
+        """
+        가상 시간을 진행합니다. 마감 시각을 지나게 되면 마감 시각까지만 진행하고 시간 초과로 취소합니다.
+
+        Args:
+            seconds: 진행할 시간 (초)
+        """
+        if self.clock is None or self.cancelled:
+            return
+        seconds = max(0.0, seconds)
+        remaining = self.remaining()
+        if remaining is not None and seconds >= remaining:
+            self.clock.advance(remaining)
+            self._expire()
+            return
+        self.clock.advance(seconds)
+
+    def _expire(self) -> None:
+        """마감 시각 초과로 토큰 취소"""
+        self.cancel(self._deadline_message, timed_out=True)
+
+    def _error(self) -> ExecutionCancelledError:
+        """취소 상태에 맞는 예외 생성"""
+        if self.timed_out:
+            return ExecutionTimeoutError(self.reason)
+        return ExecutionCancelledError(self.reason)
+
+    def _register_waiter(self) -> "asyncio.Future[None]":
+        """취소 시 완료될 Future 등록"""
+        loop = asyncio.get_running_loop()
+        future: asyncio.Future[None] = loop.create_future()
+        with self._lock:
+            if self._event.is_set():
+                future.set_result(None)
+            else:
+                self._waiters.add((loop, future))
+        return future
+
+    def _unregister_waiter(self, future: "asyncio.Future[None]") -> None:
+        """대기가 끝난 Future 제거"""
+        with self._lock:
+            self._waiters.discard((future.get_loop(), future))
+        if not future.done():
+            future.cancel()
+
+
+def _resolve_future(future: "asyncio.Future[None]") -> None:
+    """이벤트 루프 스레드에서 Future 완료 처리"""
+    if not future.done():
+        future.set_result(None)
+
+
+def get_cancel_token(parameters: dict[str, Any] | None) -> CancellationToken:
+    """
+    노드 파라미터에서 취소 토큰을 가져옵니다.
+    토큰이 없으면 (단일 액션 실행 등) 취소되지 않는 새 토큰을 반환합니다.
+
+    Args:
+        parameters: 노드 파라미터
+
+    Returns:
+        취소 토큰
+    """
+    token = (parameters or {}).get("_cancel_token")
+    return token if isinstance(token, CancellationToken) else CancellationToken()
+
+
+def apply_workflow_timeout(token: CancellationToken, timeout_seconds: float | None) -> None:
+    """
+    워크플로우 실행 토큰에 제한 시간을 설정합니다.
+
+    Args:
+        token: 워크플로우 실행 토큰
+        timeout_seconds: 제한 시간 (초, None이면 WORKFLOW_TIMEOUT_SECONDS 적용, 0 이하면 제한 없음)
+    """
+    if timeout_seconds is None:
+        timeout_seconds = settings.WORKFLOW_TIMEOUT_SECONDS
+    if timeout_seconds and timeout_seconds > 0:
+        token.set_deadline(timeout_seconds, f"워크플로우 제한 시간({timeout_seconds:g}초)을 초과했습니다.")
+
+
+class CancellationRegistry:
+    """
+    실행 ID별 취소 토큰 저장소 클래스
+    같은 execution_id로 동시에/연속으로 들어오는 요청(UI의 노드별 실행 요청 등)은 같은 토큰을 공유합니다.
+    """
+
+    def __init__(self, cancelled_history_size: int = _CANCELLED_HISTORY_SIZE) -> None:
+        """
+        CancellationRegistry 초기화
+
+        Args:
+            cancelled_history_size: 취소된 실행 ID를 기억할 개수
+        """
+        # _tokens: 실행 중인 실행의 토큰 (실행 ID → 토큰)
+        self._tokens: dict[str, CancellationToken] = {}
+        # _ref_counts: 실행 ID별 토큰 사용 중인 요청 수
+        self._ref_counts: dict[str, int] = {}
+        # _cancelled: 최근 취소된 실행 ID와 사유 (이후 같은 ID로 시작하는 요청은 즉시 취소 상태)
+        self._cancelled: OrderedDict[str, str] = OrderedDict()
+        self._cancelled_history_size = cancelled_history_size
+        self._lock = threading.Lock()
+
+    @contextlib.contextmanager
+    def track(self, execution_id: str) -> Iterator[CancellationToken]:
+        """
+        실행 동안 취소 토큰을 등록합니다.
+
+        Args:
+            execution_id: 실행 ID
+
+        Yields:
+            취소 토큰 (이미 취소된 실행 ID면 취소된 상태)
+        """
+        with self._lock:
+            token = self._tokens.get(execution_id)
+            if token is None:
+                token = CancellationToken(execution_id)
+                self._tokens[execution_id] = token
+                if execution_id in self._cancelled:
+                    token.cancel(self._cancelled[execution_id])
+            self._ref_counts[execution_id] = self._ref_counts.get(execution_id, 0) + 1
+        try:
+            yield token
+        finally:
+            with self._lock:
+                remaining = self._ref_counts.get(execution_id, 1) - 1
+                if remaining > 0:
+                    self._ref_counts[execution_id] = remaining
+                else:
+                    self._ref_counts.pop(execution_id, None)
+                    self._tokens.pop(execution_id, None)
+
+    def get(self, execution_id: str) -> CancellationToken | None:
+        """실행 중인 실행의 토큰 조회"""
+        return self._tokens.get(execution_id)
+
+    def cancel(self, execution_id: str, reason: str | None = None) -> bool:
+        """
+        실행을 취소합니다.
+
+        Args:
+            execution_id: 실행 ID
+            reason: 취소 사유
+
+        Returns:
+            실행 중인 실행을 찾아 취소했으면 True
+        """
+        reason = reason or "사용자 요청으로 실행이 취소되었습니다."
+        with self._lock:
+            token = self._tokens.get(execution_id)
+            if token is None:
+                return False
+            self._cancelled[execution_id] = reason
+            self._cancelled.move_to_end(execution_id)
+            while len(self._cancelled) > self._cancelled_history_size:
+                self._cancelled.popitem(last=False)
+        token.cancel(reason)
+        return True
+
+    def forget(self, execution_id: str) -> None:
+        """
+        취소 기록에서 실행 ID를 지웁니다. (취소된 실행을 같은 실행 ID로 재개할 때 바로 취소되지 않도록)
+
+        Args:
+            execution_id: 실행 ID
+        """
+        with self._lock:
+            self._cancelled.pop(execution_id, None)
+
+    def list_active(self) -> list[dict[str, Any]]:
+        """실행 중인 실행 목록"""
+        return [
+            {"execution_id": execution_id, "cancelled": token.cancelled, "reason": token.reason}
+            for execution_id, token in list(self._tokens.items())
+        ]
+
+
+# 전역 취소 토큰 저장소 인스턴스
+cancellation_registry = CancellationRegistry()
@@ -0,0 +1,361 @@
+"""
+조건 술어(predicate) 컴파일 유틸리티
+조건 정의를 한 번만 해석하여 값을 받아 True/False를 반환하는 함수로 컴파일합니다.
+
+- 비교값은 컴파일 시 미리 변환됩니다. (문자열/숫자/정규식/범위/집합)
+- 필드 경로는 컴파일 시 미리 분리됩니다.
+- 같은 조건 정의는 캐시된 술어를 재사용합니다.
+
+조건 정의 형식:
+    {"condition_type": "greater_than", "field_path": "output.hp", "compare_value": 30}
+    {"and": [조건, 조건, ...]}, {"or": [조건, ...]}, {"not": 조건}
+
+조건 타입:
+    equals / not_equals / contains / not_contains        # 문자열 비교
+    greater_than / less_than / greater_or_equal / less_or_equal   # 숫자 비교
+    is_empty / is_not_empty
+    regex / not_regex                                   # 정규식 검색 (compare_value: 패턴)
+    between / not_between                               # 범위 (compare_value: [최소, 최대] 또는 "최소,최대", 양 끝 포함)
+    in / not_in                                         # 포함 여부 (compare_value: 목록 또는 "a,b,c")
+"""
+
+from collections.abc import Callable
+from functools import lru_cache
+import json
+import math
+import re
+from typing import Any
+
+import numpy as np
+
+from utils.parameter_template import compile_field_path
+
+# 스칼라 검사 함수 / 배치 검사 함수 타입
+ScalarTest = Callable[[Any], bool]
+VectorTest = Callable[[list[Any]], np.ndarray]
+
+
+class ConditionError(ValueError):
+    """잘못된 조건 정의 예외"""
+
+
+def _to_float(value: Any) -> float | None:
+    """숫자로 변환합니다. (변환할 수 없거나 NaN이면 None)"""
+    try:
+        number = float(value)
+    except (TypeError, ValueError):
+        return None
+    return None if math.isnan(number) else number
+
+
+def _to_float_array(values: list[Any]) -> np.ndarray:
+    """값 목록을 float 배열로 변환합니다. (변환할 수 없는 값은 NaN)"""
+    return np.fromiter(
+        (number if (number := _to_float(value)) is not None else np.nan for value in values),
+        dtype=float,
+        count=len(values),
+    )
+
+
+def _to_str_array(values: list[Any]) -> np.ndarray:
+    """값 목록을 문자열 배열로 변환합니다. (스칼라 비교와 같이 str() 사용)"""
+    return np.array([str(value) for value in values], dtype=str) if values else np.array([], dtype=str)
+
+
+def _is_empty(value: Any) -> bool:
+    """비어있음 확인 (None, 빈 문자열, 빈 리스트/딕셔너리)"""
+    return value is None or value == "" or (isinstance(value, (list, dict)) and len(value) == 0)
+
+
+def _is_not_none(value: Any) -> bool:
+    """None이 아닌지 확인"""
+    return value is not None
+
+
+def _split_list(compare_value: Any) -> list[Any]:
+    """비교값을 목록으로 변환합니다. (문자열은 쉼표로 분리)"""
+    if isinstance(compare_value, (list, tuple, set)):
+        return list(compare_value)
+    if isinstance(compare_value, str):
+        return [item.strip() for item in compare_value.split(",") if item.strip()]
+    return [compare_value]
+
+
+def _never(_value: Any) -> bool:
+    return False
+
+
+def _never_vector(values: list[Any]) -> np.ndarray:
+    return np.zeros(len(values), dtype=bool)
+
+
+def _build_string_test(condition_type: str, compare_value: Any) -> tuple[ScalarTest, VectorTest]:
+    """문자열 비교 검사 함수를 만듭니다. (equals, not_equals, contains, not_contains)"""
+    text = str(compare_value)
+    if condition_type == "equals":
+        return (lambda value: str(value) == text), (lambda values: _to_str_array(values) == text)
+    if condition_type == "not_equals":
+        return (lambda value: str(value) != text), (lambda values: _to_str_array(values) != text)
+    if condition_type == "contains":
+        return (lambda value: text in str(value)), (lambda values: np.char.find(_to_str_array(values), text) >= 0)
+    return (lambda value: text not in str(value)), (lambda values: np.char.find(_to_str_array(values), text) < 0)
+
+
+# 숫자 비교 연산자 (스칼라/배열 공용)
+_NUMERIC_OPERATORS: dict[str, Callable[[Any, float], Any]] = {
+    "greater_than": lambda a, b: a > b,
+    "less_than": lambda a, b: a < b,
+    "greater_or_equal": lambda a, b: a >= b,
+    "less_or_equal": lambda a, b: a <= b,
+}
+
+
+def _build_numeric_test(condition_type: str, compare_value: Any) -> tuple[ScalarTest, VectorTest]:
+    """숫자 비교 검사 함수를 만듭니다. (숫자로 변환할 수 없는 값은 False)"""
+    operator = _NUMERIC_OPERATORS[condition_type]
+    target = _to_float(compare_value)
+    if target is None:
+        return _never, _never_vector
+
+    def scalar(value: Any) -> bool:
+        number = _to_float(value)
+        return number is not None and bool(operator(number, target))
+
+    # NaN과의 비교는 항상 False이므로 변환 실패 값은 자동으로 제외됨
+    return scalar, (lambda values: operator(_to_float_array(values), target))
+
+
+def _build_range_test(condition_type: str, compare_value: Any) -> tuple[ScalarTest, VectorTest]:
+    """범위 검사 함수를 만듭니다. (between, not_between, 양 끝 포함)"""
+    bounds = [_to_float(item) for item in _split_list(compare_value)]
+    if len(bounds) != 2 or bounds[0] is None or bounds[1] is None:
+        raise ConditionError(f"{condition_type}의 비교값은 [최소, 최대] 형식이어야 합니다: {compare_value}")
+    low, high = min(bounds[0], bounds[1]), max(bounds[0], bounds[1])
+    inside = condition_type == "between"
+
+    def scalar(value: Any) -> bool:
+        number = _to_float(value)
+        return number is not None and (low <= number <= high) == inside
+
+    def vector(values: list[Any]) -> np.ndarray:
+        numbers = _to_float_array(values)
+        within = (numbers >= low) & (numbers <= high)
+        return within if inside else ~within & ~np.isnan(numbers)
+
+    return scalar, vector
+
+
+def _build_membership_test(condition_type: str, compare_value: Any) -> tuple[ScalarTest, VectorTest]:
+    """포함 여부 검사 함수를 만듭니다. (in, not_in, 문자열로 비교)"""
+    members = frozenset(str(item) for item in _split_list(compare_value))
+    member_array = np.array(sorted(members), dtype=str)
+    if condition_type == "in":
+        return (lambda value: str(value) in members), (lambda values: np.isin(_to_str_array(values), member_array))
+    return (
+        (lambda value: str(value) not in members),
+        (lambda values: ~np.isin(_to_str_array(values), member_array)),
+    )
+
+
+# 정규식 특수 문자 (하나도 없는 패턴은 문자열 그대로 검색하는 것과 같음)
+_REGEX_SPECIAL_CHARS = frozenset(".^$*+?{}[]()|\\")
+
+
+def _build_regex_test(condition_type: str, compare_value: Any) -> tuple[ScalarTest, VectorTest]:
+    """
+    정규식 검사 함수를 만듭니다. (regex, not_regex, 패턴은 미리 컴파일)
+    numpy에는 정규식 연산이 없으므로, 특수 문자가 없는 패턴만 np.char.find로 배열 연산하고
+    그 외 패턴은 값마다 컴파일된 패턴으로 검사합니다.
+    """
+    text = str(compare_value)
+    try:
+        pattern = re.compile(text)
+    except re.error as e:
+        raise ConditionError(f"정규식이 올바르지 않습니다: {compare_value} ({e!s})") from e
+    expected = condition_type == "regex"
+
+    def scalar(value: Any) -> bool:
+        return (value is not None and pattern.search(str(value)) is not None) == expected
+
+    if _REGEX_SPECIAL_CHARS.isdisjoint(text):
+        # 특수 문자가 없는 패턴: 문자열 포함 검사와 같음 (None은 정규식 검사처럼 일치하지 않음으로 처리)
+        def vector(values: list[Any]) -> np.ndarray:
+            present = np.fromiter(map(_is_not_none, values), dtype=bool, count=len(values))
+            found = (np.char.find(_to_str_array(values), text) >= 0) & present
+            return found if expected else ~found
+
+    else:
+
+        def vector(values: list[Any]) -> np.ndarray:
+            return np.fromiter(map(scalar, values), dtype=bool, count=len(values))
+
+    return scalar, vector
+
+
+def _build_empty_test(condition_type: str, _compare_value: Any) -> tuple[ScalarTest, VectorTest]:
+    """
+    비어있음 검사 함수를 만듭니다. (is_empty, is_not_empty)
+    비어있음은 값의 타입(None, 빈 문자열, 빈 리스트/딕셔너리)으로 판단하므로 배열 연산으로 바꿀 수 없어 값마다 검사합니다.
+    (문자열 배열로 바꾸면 str()이 큰 리스트/딕셔너리를 직렬화하여 오히려 느려짐)
+    """
+    expected = condition_type == "is_empty"
+
+    def scalar(value: Any) -> bool:
+        return _is_empty(value) == expected
+
+    def vector(values: list[Any]) -> np.ndarray:
+        return np.fromiter(map(scalar, values), dtype=bool, count=len(values))
+
+    return scalar, vector
+
+
+# 조건 타입별 검사 함수 생성기
+_TEST_BUILDERS: dict[str, Callable[[str, Any], tuple[ScalarTest, VectorTest]]] = {
+    "equals": _build_string_test,
+    "not_equals": _build_string_test,
+    "contains": _build_string_test,
+    "not_contains": _build_string_test,
+    "greater_than": _build_numeric_test,
+    "less_than": _build_numeric_test,
+    "greater_or_equal": _build_numeric_test,
+    "less_or_equal": _build_numeric_test,
+    "is_empty": _build_empty_test,
+    "is_not_empty": _build_empty_test,
+    "regex": _build_regex_test,
+    "not_regex": _build_regex_test,
+    "between": _build_range_test,
+    "not_between": _build_range_test,
+    "in": _build_membership_test,
+    "not_in": _build_membership_test,
+}
+
+# 지원하는 조건 타입 목록
+CONDITION_TYPES = tuple(_TEST_BUILDERS)
+
+
+class Predicate:
+    """
+    컴파일된 조건 술어 클래스
+    입력 값(조건 노드의 previous_output)을 받아 필드 경로를 따라간 값에 검사 함수를 적용합니다.
+    """
+
+    __slots__ = ("_scalar", "_vector", "description")
+
+    def __init__(self, scalar: ScalarTest, vector: VectorTest, description: str) -> None:
+        """
+        Predicate 초기화
+
+        Args:
+            scalar: 입력 하나를 평가하는 함수
+            vector: 입력 목록을 한 번에 평가하는 함수 (bool 배열 반환)
+            description: 조건 설명 (로그용)
+        """
+        self._scalar = scalar
+        self._vector = vector
+        self.description = description
+
+    def __call__(self, value: Any) -> bool:
+        return self._scalar(value)
+
+    def evaluate_batch(self, values: list[Any]) -> np.ndarray:
+        """
+        입력 목록 전체에 조건을 한 번에 평가합니다.
+        문자열/숫자/범위/포함 검사와 특수 문자가 없는 정규식은 numpy 배열 연산으로 평가하고,
+        일반 정규식과 비어있음 검사는 값마다 평가합니다.
+
+        Args:
+            values: 입력 값 목록
+
+        Returns:
+            각 입력의 평가 결과 (bool 배열)
+        """
+        return np.asarray(self._vector(list(values)), dtype=bool)
+
+    def __repr__(self) -> str:
+        return f"Predicate({self.description})"
+
+
+def _compile_leaf(definition: dict[str, Any]) -> Predicate:
+    """단일 조건을 컴파일합니다."""
+    condition_type = definition.get("condition_type") or definition.get("op") or "equals"
+    builder = _TEST_BUILDERS.get(condition_type)
+    if builder is None:
+        raise ConditionError(f"지원하지 않는 조건 타입입니다: {condition_type}")
+    scalar_test, vector_test = builder(condition_type, definition.get("compare_value", ""))
+
+    field_path = definition.get("field_path") or ""
+    if not field_path:
+        return Predicate(scalar_test, vector_test, condition_type)
+
+    # 필드 경로는 미리 분리된 접근 함수로 변환 ("output." 접두사는 입력이 이미 output이므로 생략)
+    access = compile_field_path(field_path, "output")
+    return Predicate(
+        lambda value: scalar_test(access(value)),
+        lambda values: vector_test([access(value) for value in values]),
+        f"{field_path} {condition_type}",
+    )
+
+
+def _compile_combination(combinator: str, items: Any) -> Predicate:
+    """and/or 조합 조건을 컴파일합니다."""
+    if not isinstance(items, list) or not items:
+        raise ConditionError(f"{combinator} 조건은 하나 이상의 조건 목록이어야 합니다.")
+    children = [_compile_definition(item) for item in items]
+    description = f" {combinator} ".join(f"({child.description})" for child in children)
+    if combinator == "and":
+        return Predicate(
+            lambda value: all(child(value) for child in children),
+            lambda values: np.logical_and.reduce([child.evaluate_batch(values) for child in children]),
+            description,
+        )
+    return Predicate(
+        lambda value: any(child(value) for child in children),
+        lambda values: np.logical_or.reduce([child.evaluate_batch(values) for child in children]),
+        description,
+    )
+
+
+def _compile_definition(definition: Any) -> Predicate:
+    """조건 정의(단일 조건 또는 and/or/not 조합)를 재귀적으로 컴파일합니다."""
+    if not isinstance(definition, dict):
+        raise ConditionError(f"조건 정의는 객체여야 합니다: {definition!r}")
+
+    if "not" in definition:
+        inner = _compile_definition(definition["not"])
+        return Predicate(
+            lambda value: not inner(value),
+            lambda values: ~inner.evaluate_batch(values),
+            f"not ({inner.description})",
+        )
+
+    for combinator in ("and", "or"):
+        if combinator in definition:
+            return _compile_combination(combinator, definition[combinator])
+
+    return _compile_leaf(definition)
+
+
+@lru_cache(maxsize=256)
+def _compile_cached(canonical: str) -> Predicate:
+    """정규화된 조건 정의(JSON)로 술어를 컴파일합니다. (같은 정의는 재사용)"""
+    return _compile_definition(json.loads(canonical))
+
+
+def compile_condition(definition: dict[str, Any]) -> Predicate:
+    """
+    조건 정의를 술어로 컴파일합니다. (같은 정의는 캐시된 술어 재사용)
+
+    Args:
+        definition: 조건 정의 (단일 조건 또는 and/or/not 조합)
+
+    Returns:
+        컴파일된 술어
+
+    Raises:
+        ConditionError: 조건 정의가 잘못된 경우
+    """
+    try:
+        canonical = json.dumps(definition, sort_keys=True, ensure_ascii=False)
+    except (TypeError, ValueError) as e:
+        raise ConditionError(f"조건 정의를 해석할 수 없습니다: {e!s}") from e
+    return _compile_cached(canonical)
@@ -0,0 +1,162 @@
+"""
+크론 표현식 유틸리티
+5필드 크론 표현식(분 시 일 월 요일)을 파싱하고 다음 실행 시각을 계산합니다.
+
+지원 문법:
+- "*": 모든 값
+- "5", "1,15,30": 단일 값 / 목록
+- "1-5": 범위
+- "*/10", "0-30/5": 간격
+- 월/요일 이름: jan~dec, sun~sat (대소문자 무관)
+- 요일은 0~7 (0과 7 모두 일요일)
+
+일/요일 필드가 둘 다 지정된 경우 표준 크론과 동일하게 둘 중 하나만 맞아도 실행합니다.
+
+사용 예시:
+    cron = CronExpression("*/15 9-18 * * mon-fri")
+    next_time = cron.next_after(datetime.now())
+"""
+
+from datetime import datetime, timedelta
+
+# 필드별 (최소값, 최대값)
+_FIELD_RANGES = [(0, 59), (0, 23), (1, 31), (1, 12), (0, 7)]
+_FIELD_NAMES = ["minute", "hour", "day", "month", "weekday"]
+
+_MONTH_NAMES = {
+    name: index + 1
+    for index, name in enumerate(["jan", "feb", "mar", "apr", "may", "jun", "jul", "aug", "sep", "oct", "nov", "dec"])
+}
+_WEEKDAY_NAMES = {name: index for index, name in enumerate(["sun", "mon", "tue", "wed", "thu", "fri", "sat"])}
+
+# 다음 실행 시각 탐색 상한 (윤년 2월 29일 같은 드문 조합도 찾을 수 있도록 5년)
+_MAX_SEARCH_YEARS = 5
+
+
+class CronExpression:
+    """
+    크론 표현식 클래스
+    생성 시 각 필드를 허용 값 집합으로 미리 변환해 두므로 다음 실행 시각 계산에 문자열 파싱이 없습니다.
+    """
+
+    def __init__(self, expression: str) -> None:
+        """
+        크론 표현식 파싱
+
+        Args:
+            expression: 5필드 크론 표현식 (예: "0 */2 * * *")
+
+        Raises:
+            ValueError: 표현식 형식이 잘못된 경우
+        """
+        self.expression = expression.strip()
+        fields = self.expression.split()
+        if len(fields) != 5:
+            raise ValueError(f"크론 표현식은 5개 필드(분 시 일 월 요일)여야 합니다: '{expression}'")
+
+        parsed = [_parse_field(field, index) for index, field in enumerate(fields)]
+        self.minutes, self.hours, self.days, self.months, weekdays = parsed
+        # 7(일요일)은 0으로 통일 (Python weekday 변환 시 사용)
+        self.weekdays = {0 if day == 7 else day for day in weekdays}
+
+        # 일/요일 필드가 "*"로 시작하면 제한 없음으로 취급 (표준 크론의 OR 규칙 판단용)
+        self.day_restricted = not fields[2].startswith("*")
+        self.weekday_restricted = not fields[4].startswith("*")
+
+    def _day_matches(self, moment: datetime) -> bool:
+        """날짜가 일/요일 필드 조건을 만족하는지 확인"""
+        # Python weekday: 월=0 ... 일=6 → 크론 요일: 일=0 ... 토=6
+        cron_weekday = (moment.weekday() + 1) % 7
+        day_ok = moment.day in self.days
+        weekday_ok = cron_weekday in self.weekdays
+        if self.day_restricted and self.weekday_restricted:
+            return day_ok or weekday_ok
+        return day_ok and weekday_ok
+
+    def next_after(self, moment: datetime) -> datetime:
+        """
+        주어진 시각 이후(초과)의 다음 실행 시각을 계산합니다.
+
+        Args:
+            moment: 기준 시각
+
+        Returns:
+            다음 실행 시각 (초/마이크로초는 0)
+
+        Raises:
+            ValueError: 탐색 범위 안에서 실행 시각을 찾지 못한 경우 (예: "0 0 31 2 *")
+        """
+        candidate = moment.replace(second=0, microsecond=0) + timedelta(minutes=1)
+        limit = moment + timedelta(days=366 * _MAX_SEARCH_YEARS)
+
+        # 큰 단위부터 맞춰 나가며, 맞지 않으면 해당 단위의 다음 시작점으로 건너뜀
+        while candidate <= limit:
+            if candidate.month not in self.months:
+                year = candidate.year + (1 if candidate.month == 12 else 0)
+                month = 1 if candidate.month == 12 else candidate.month + 1
+                candidate = candidate.replace(year=year, month=month, day=1, hour=0, minute=0)
+                continue
+            if not self._day_matches(candidate):
+                candidate = (candidate + timedelta(days=1)).replace(hour=0, minute=0)
+                continue
+            if candidate.hour not in self.hours:
+                candidate = (candidate + timedelta(hours=1)).replace(minute=0)
+                continue
+            if candidate.minute not in self.minutes:
+                candidate += timedelta(minutes=1)
+                continue
+            return candidate
+
+        raise ValueError(f"크론 표현식에 해당하는 실행 시각을 찾을 수 없습니다: '{self.expression}'")
+
+
+def _parse_value(token: str, index: int) -> int:
+    """필드 값 하나를 정수로 변환 (월/요일 이름 지원)"""
+    lowered = token.lower()
+    if index == 3 and lowered in _MONTH_NAMES:
+        return _MONTH_NAMES[lowered]
+    if index == 4 and lowered in _WEEKDAY_NAMES:
+        return _WEEKDAY_NAMES[lowered]
+    try:
+        return int(token)
+    except ValueError:
+        raise ValueError(f"{_FIELD_NAMES[index]} 필드의 값이 잘못되었습니다: '{token}'")
+
+
+def _parse_field(field: str, index: int) -> set[int]:
+    """
+    크론 필드 하나를 허용 값 집합으로 변환합니다.
+
+    Args:
+        field: 필드 문자열 (예: "*/5", "1-5", "0,30")
+        index: 필드 위치 (0: 분, 1: 시, 2: 일, 3: 월, 4: 요일)
+
+    Returns:
+        허용 값 집합
+    """
+    minimum, maximum = _FIELD_RANGES[index]
+    values: set[int] = set()
+
+    for part in field.split(","):
+        range_part, _, step_part = part.partition("/")
+        step = 1
+        if step_part:
+            step = _parse_value(step_part, index) if step_part.isdigit() else 0
+            if step < 1:
+                raise ValueError(f"{_FIELD_NAMES[index]} 필드의 간격이 잘못되었습니다: '{part}'")
+
+        if range_part == "*":
+            start, end = minimum, maximum
+        elif "-" in range_part:
+            start_token, _, end_token = range_part.partition("-")
+            start, end = _parse_value(start_token, index), _parse_value(end_token, index)
+        else:
+            start = _parse_value(range_part, index)
+            # "5/10"처럼 시작값에 간격만 붙은 경우 최대값까지 반복
+            end = maximum if step_part else start
+
+        if start < minimum or end > maximum or start > end:
+            raise ValueError(f"{_FIELD_NAMES[index]} 필드의 범위가 잘못되었습니다: '{part}' ({minimum}~{maximum})")
+        values.update(range(start, end + 1, step))
+
+    return values
@@ -0,0 +1,219 @@
+"""
+드라이런(dry-run) 실행 유틸리티
+실제 입력/대기 없이 워크플로우의 흐름만 빠르게 검증하기 위한 가상 시계, 입력 기록기, 화면 재생 소스를 제공합니다.
+
+- 가상 시계(VirtualClock): 취소 토큰에 연결되면 sleep/wait가 실제로 대기하지 않고 가상 시간만 진행합니다.
+  (대기 노드, 재시도 백오프, 이미지 찾기 재시도 간격 모두 즉시 끝남. 제한 시간도 가상 시간 기준)
+- 입력 기록(record_action): 클릭/창 포커스 등 입력 동작을 실제로 수행하지 않고 가상 시각과 함께 기록합니다.
+- 화면 재생 소스(ReplayFrameSource): 화면 캡처 대신 폴더의 프레임 이미지를 이름 순서대로 하나씩 반환합니다.
+
+노드는 파라미터의 _dry_run으로 세션을 받아 입력/화면 캡처를 대체합니다.
+
+사용 예시:
+    session = DryRunSession(frame_source=ReplayFrameSource("frames/login"))
+    token.clock = session.clock
+    ...
+    session.summary()  # {"virtual_elapsed_seconds": 1200.0, "actions": [...], ...}
+"""
+
+import os
+import threading
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    import numpy as np
+
+# 재생 프레임으로 사용할 이미지 확장자
+_FRAME_EXTENSIONS = {".png", ".jpg", ".jpeg", ".bmp", ".tiff", ".webp"}
+
+
+class VirtualClock:
+    """
+    가상 시계 클래스
+    advance()로만 시간이 흐르며, 이벤트 루프와 작업 스레드 양쪽에서 안전하게 사용할 수 있습니다.
+    """
+
+    __slots__ = ("_lock", "_now")
+
+    def __init__(self, start: float = 0.0) -> None:
+        """
+        VirtualClock 초기화
+
+        Args:
+            start: 시작 시각 (초)
+        """
+        self._now = start
+        self._lock = threading.Lock()
+
+    def monotonic(self) -> float:
+        """현재 가상 시각 (time.monotonic 대체)"""
+        return self._now
+
+    def advance(self, seconds: float) -> float:
+        """
+        가상 시간을 진행합니다.
+
+        Args:
+            seconds: 진행할 시간 (초, 음수는 0으로 처리)
+
+        Returns:
+            진행 후 가상 시각
+        """
+        with self._lock:
+            self._now += max(0.0, seconds)
+            return self._now
+
+
+class ReplayFrameSource:
+    """
+    화면 재생 소스 클래스
+    폴더의 프레임 이미지를 이름 순서대로 화면 캡처 결과로 반환합니다.
+    마지막 프레임 이후에는 마지막 프레임을 계속 반환합니다. (loop=True이면 처음부터 반복)
+    """
+
+    def __init__(self, frames_dir: str, loop: bool = False) -> None:
+        """
+        ReplayFrameSource 초기화
+
+        Args:
+            frames_dir: 프레임 이미지 폴더 경로
+            loop: 마지막 프레임 이후 처음부터 반복할지 여부
+
+        Raises:
+            ValueError: 폴더가 없거나 프레임 이미지가 없는 경우
+        """
+        if not os.path.isdir(frames_dir):
+            raise ValueError(f"재생 프레임 폴더를 찾을 수 없습니다: {frames_dir}")
+        self.frames_dir = frames_dir
+        self.loop = loop
+        # frame_paths: 프레임 이미지 경로 (이름 순서)
+        self.frame_paths = sorted(
+            os.path.join(frames_dir, name)
+            for name in os.listdir(frames_dir)
+            if os.path.splitext(name.lower())[1] in _FRAME_EXTENSIONS and os.path.isfile(os.path.join(frames_dir, name))
+        )
+        if not self.frame_paths:
+            raise ValueError(f"재생할 프레임 이미지가 없습니다: {frames_dir}")
+        # _frames: 디코딩한 프레임 (경로 → 이미지, 처음 사용할 때 한 번만 디코딩)
+        self._frames: dict[str, np.ndarray] = {}
+        self._index = 0
+        self._lock = threading.Lock()
+        # served: 반환한 프레임 수
+        self.served = 0
+
+    def _load(self, path: str) -> "np.ndarray":
+        """프레임 이미지를 디코딩합니다. (한글 경로 지원을 위해 imdecode 사용)"""
+        frame = self._frames.get(path)
+        if frame is None:
+            # 드라이런에서만 사용하므로 OpenCV는 지연 import
+            import cv2
+            import numpy as np
+
+            with open(path, "rb") as f:
+                frame = cv2.imdecode(np.frombuffer(f.read(), np.uint8), cv2.IMREAD_COLOR)
+            if frame is None:
+                raise ValueError(f"프레임 이미지를 디코딩할 수 없습니다: {path}")
+            self._frames[path] = frame
+        return frame
+
+    def peek(self) -> "np.ndarray":
+        """다음 프레임을 소비하지 않고 반환합니다. (화면 크기 조회용)"""
+        with self._lock:
+            return self._load(self.frame_paths[min(self._index, len(self.frame_paths) - 1)])
+
+    def next_frame(self, region: tuple[int, int, int, int] | None = None) -> "np.ndarray":
+        """
+        다음 프레임을 반환합니다.
+
+        Args:
+            region: 잘라낼 영역 (x, y, width, height)
+
+        Returns:
+            프레임 이미지 (BGR numpy array)
+        """
+        with self._lock:
+            path = self.frame_paths[self._index]
+            if self._index + 1 < len(self.frame_paths):
+                self._index += 1
+            elif self.loop:
+                self._index = 0
+            self.served += 1
+            frame = self._load(path)
+        if region:
+            x, y, width, height = region
+            return frame[y : y + height, x : x + width]
+        return frame
+
+
+class DryRunSession:
+    """
+    드라이런 세션 클래스
+    실행 하나의 가상 시계, 기록한 입력 동작, 화면 재생 소스를 보관합니다.
+    """
+
+    def __init__(self, frame_source: ReplayFrameSource | None = None, max_actions: int = 10000) -> None:
+        """
+        DryRunSession 초기화
+
+        Args:
+            frame_source: 화면 재생 소스 (None이면 이미지 찾기를 성공으로 가정)
+            max_actions: 기록할 최대 입력 동작 수 (넘으면 개수만 셈)
+        """
+        self.clock = VirtualClock()
+        self.frame_source = frame_source
+        self.max_actions = max_actions
+        # actions: 기록한 입력 동작 [{"t": 가상 시각, "action": 동작, ...}, ...]
+        self.actions: list[dict[str, Any]] = []
+        # dropped_actions: max_actions를 넘어 기록하지 않은 동작 수
+        self.dropped_actions = 0
+        self._lock = threading.Lock()
+
+    def record_action(self, action: str, **details: Any) -> bool:
+        """
+        입력 동작을 수행하는 대신 기록합니다.
+
+        Args:
+            action: 동작 이름 (예: "click", "focus")
+            **details: 동작 정보 (좌표, 대상 등)
+
+        Returns:
+            항상 True (입력 동작 성공으로 처리)
+        """
+        with self._lock:
+            if len(self.actions) < self.max_actions:
+                self.actions.append({"t": round(self.clock.monotonic(), 3), "action": action, **details})
+            else:
+                self.dropped_actions += 1
+        return True
+
+    def summary(self) -> dict[str, Any]:
+        """
+        드라이런 결과 요약을 반환합니다.
+
+        Returns:
+            요약 딕셔너리
+            - virtual_elapsed_seconds: 진행한 가상 시간 (실제 실행했다면 걸렸을 대기 시간)
+            - actions: 기록한 입력 동작 목록
+            - dropped_actions: 기록하지 않은 입력 동작 수
+            - frames_served: 재생한 프레임 수 (재생 소스가 없으면 None)
+        """
+        return {
+            "virtual_elapsed_seconds": round(self.clock.monotonic(), 3),
+            "actions": list(self.actions),
+            "dropped_actions": self.dropped_actions,
+            "frames_served": self.frame_source.served if self.frame_source else None,
+        }
+
+
+def get_dry_run(parameters: dict[str, Any] | None) -> DryRunSession | None:
+    """
+    노드 파라미터에서 드라이런 세션을 가져옵니다.
+
+    Args:
+        parameters: 노드 파라미터
+
+    Returns:
+        드라이런 세션 또는 None (실제 실행)
+    """
+    session = (parameters or {}).get("_dry_run")
+    return session if isinstance(session, DryRunSession) else None
@@ -1,29 +1,118 @@
 """
 로그 클라이언트 유틸리티
 wrapper에서 서버로 로그를 전송하는 기능을 제공합니다.
+
+- local 모드 (기본): 서버 프로세스 안에서 실행 중이면 로그 싱크(services/log_sink.py)에 넣어 일괄 기록
+- http 모드: /api/logs/node-execution으로 로그마다 전송 (로그 싱크가 시작되지 않은 프로세스도 이 방식 사용)
+- buffered 모드: 로그를 모아 /api/logs/node-execution/batch로 전송 (원격 워커용)
+  LOG_CLIENT_BATCH_SIZE개가 모이거나 LOG_CLIENT_FLUSH_INTERVAL_SECONDS가 지나면 전송하며,
+  같은 노드의 running → completed/failed 로그는 전송 전에 하나로 합칩니다.
+
+HTTP 전송은 keep-alive 연결을 재사용하는 세션 하나로 보냅니다. (프로세스 종료 전 close() 호출)
+
+로그 행은 (execution_id, node_id, attempt)로 구분되므로, 같은 실행에서 노드가 다시 실행될 때(반복 노드, 재실행)마다
+NodeAttemptCounter로 attempt를 1씩 올려 이전 실행의 로그를 덮거나 버려지지 않게 합니다.
 """
 
 import asyncio
+from collections import OrderedDict, deque
+from collections.abc import Callable
+import contextlib
 from datetime import datetime
 from typing import Any
 
 import aiohttp
 
 from config.server_config import settings
+from db.node_execution_log_repository import coalesce_log_records
 from log import log_manager
 
 logger = log_manager.logger
 
 
+# 실행 번호를 기억할 최대 실행 수 (넘으면 가장 오래 사용하지 않은 실행부터 잊고, 다시 사용될 때 DB에서 불러옴)
+_MAX_TRACKED_EXECUTIONS = 1024
+
+
+def _load_recorded_attempts(execution_id: str) -> dict[str, int]:
+    """DB에 기록된 실행의 노드별 마지막 실행 번호 (조회에 실패하면 빈 딕셔너리)"""
+    try:
+        from db.database import db_manager
+
+        return db_manager.node_execution_logs.get_node_attempts(execution_id)
+    except Exception as e:
+        logger.warning(f"[NodeAttemptCounter] 실행 번호 조회 실패 - 실행 ID: {execution_id}, 에러: {e!s}")
+        return {}
+
+
+class NodeAttemptCounter:
+    """
+    실행별 노드 실행 번호(attempt) 카운터
+    같은 실행 안에서 노드가 실행될 때마다 1, 2, 3, ...을 부여합니다. (running/완료 로그는 같은 번호 사용)
+    기억하지 않는 실행(처음 실행, 잊힌 오래 실행 중인 실행, 서버 재시작 후 재개한 실행)은
+    DB에 기록된 번호부터 이어서 부여하므로 이전 로그 행을 덮지 않습니다.
+    """
+
+    def __init__(
+        self,
+        max_executions: int = _MAX_TRACKED_EXECUTIONS,
+        load_attempts: Callable[[str], dict[str, int]] = _load_recorded_attempts,
+    ) -> None:
+        """
+        NodeAttemptCounter 초기화
+
+        Args:
+            max_executions: 실행 번호를 기억할 최대 실행 수
+            load_attempts: 기억하지 않는 실행의 노드별 마지막 실행 번호를 불러오는 함수
+        """
+        self.max_executions = max(1, max_executions)
+        self.load_attempts = load_attempts
+        # 실행 ID별 {노드 ID: 마지막 실행 번호} (최근에 사용한 실행이 뒤)
+        self._attempts: OrderedDict[str, dict[str, int]] = OrderedDict()
+
+    def _counts(self, execution_id: str) -> dict[str, int]:
+        """실행의 노드별 실행 번호 (없으면 기록된 번호로 생성, 최근 사용으로 표시)"""
+        counts = self._attempts.get(execution_id)
+        if counts is None:
+            counts = self._attempts[execution_id] = dict(self.load_attempts(execution_id))
+            while len(self._attempts) > self.max_executions:
+                self._attempts.popitem(last=False)
+        else:
+            self._attempts.move_to_end(execution_id)
+        return counts
+
+    def next(self, execution_id: str | None, node_id: str) -> int:
+        """
+        노드의 다음 실행 번호를 반환합니다.
+
+        Args:
+            execution_id: 워크플로우 실행 ID (None이면 항상 1 - 실행 ID가 없는 로그는 유니크 검사 대상이 아님)
+            node_id: 노드 ID
+
+        Returns:
+            실행 번호 (1부터 시작)
+        """
+        if execution_id is None:
+            return 1
+        counts = self._counts(execution_id)
+        counts[node_id] = counts.get(node_id, 0) + 1
+        return counts[node_id]
+
+
+# 전역 노드 실행 번호 카운터
+node_attempts = NodeAttemptCounter()
+
+
 class LogClient:
     """로그 서버로 전송하는 클라이언트"""
 
-    def __init__(self, base_url: str | None = None) -> None:
+    def __init__(self, base_url: str | None = None, mode: str | None = None) -> None:
         """
         LogClient 초기화
 
         Args:
             base_url: API 서버 기본 URL (None이면 설정에서 가져옴)
+            mode: 전송 방식 ("local", "http", "buffered", None이면 LOG_SINK_MODE 설정값 - base_url을 지정하면 local 대신 http)
         """
         if base_url:
             self.base_url = base_url.rstrip("/")
@@ -36,7 +125,34 @@ class LogClient:
             self.base_url = f"http://{api_host}:{api_port}"
 
         self.log_endpoint = f"{self.base_url}/api/logs/node-execution"
+        self.batch_endpoint = f"{self.log_endpoint}/batch"
         self.enabled = True  # 로그 전송 활성화 여부
+        # mode: 전송 방식 (원격 서버 URL을 지정했으면 local 대신 HTTP)
+        self.mode = (mode or settings.LOG_SINK_MODE).lower()
+        if base_url and self.mode == "local":
+            self.mode = "http"
+        self.batch_size = max(1, settings.LOG_CLIENT_BATCH_SIZE)
+        self.flush_interval = max(0.0, settings.LOG_CLIENT_FLUSH_INTERVAL_SECONDS)
+        # _buffer: buffered 모드에서 전송 대기 중인 로그 (가득 차면 가장 오래된 로그부터 버림)
+        self._buffer: deque[dict[str, Any]] = deque(maxlen=max(1, settings.LOG_SINK_MAX_QUEUE_SIZE))
+        self._flush_task: asyncio.Task[None] | None = None
+        self._flush_wakeup: asyncio.Event | None = None
+        # _session: keep-alive 연결을 재사용하는 HTTP 세션 (세션을 만든 이벤트 루프에서만 사용)
+        self._session: aiohttp.ClientSession | None = None
+        self._session_loop: asyncio.AbstractEventLoop | None = None
+        # dropped: buffered 모드에서 버퍼가 가득 차 버린 로그 수
+        self.dropped = 0
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        """현재 이벤트 루프의 HTTP 세션을 반환합니다. (없거나 다른 루프에서 만든 세션이면 새로 생성)"""
+        loop = asyncio.get_running_loop()
+        if self._session is None or self._session.closed or self._session_loop is not loop:
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=4, keepalive_timeout=30),
+                timeout=aiohttp.ClientTimeout(total=5),
+            )
+            self._session_loop = loop
+        return self._session
 
     async def send_log(
         self,
@@ -53,6 +169,7 @@ class LogClient:
         result: dict[str, Any] | None = None,
         error_message: str | None = None,
         error_traceback: str | None = None,
+        attempt: int = 1,
     ) -> bool:
         """
         노드 실행 로그를 서버로 전송합니다.
@@ -71,6 +188,7 @@ class LogClient:
             result: 실행 결과
             error_message: 에러 메시지
             error_traceback: 에러 스택 트레이스
+            attempt: 같은 실행 안에서 노드의 실행 번호 (기본 1)
 
         Returns:
             전송 성공 여부
@@ -88,6 +206,7 @@ class LogClient:
             "execution_id": execution_id,
             "script_id": script_id,
             "node_id": node_id,
+            "attempt": attempt,
             "node_type": node_type,
             "node_name": node_name,
             "status": status,
@@ -100,11 +219,20 @@ class LogClient:
             "error_traceback": error_traceback,
         }
 
+        if self.mode == "local":
+            # 서비스 패키지가 이 모듈을 import하므로 순환 import를 피하기 위해 지연 import
+            from services.log_sink import log_sink
+
+            # 같은 프로세스의 로그 싱크가 실행 중이면 HTTP 대신 큐에 넣음 (싱크가 없으면 HTTP로 전송)
+            if log_sink.accepts_from_current_loop() and log_sink.submit(payload):
+                return True
+
+        if self.mode == "buffered":
+            self._enqueue(payload)
+            return True
+
         try:
-            async with (
-                aiohttp.ClientSession() as session,
-                session.post(self.log_endpoint, json=payload, timeout=aiohttp.ClientTimeout(total=5)) as response,
-            ):
+            async with self._get_session().post(self.log_endpoint, json=payload) as response:
                 if response.status == 200:
                     logger.debug(f"[LogClient] 로그 전송 성공 - 노드 ID: {node_id}, 상태: {status}")
                     return True
@@ -133,6 +261,7 @@ class LogClient:
         result: dict[str, Any] | None = None,
         error_message: str | None = None,
         error_traceback: str | None = None,
+        attempt: int = 1,
     ) -> None:
         """
         노드 실행 로그를 비동기로 전송합니다 (fire-and-forget).
@@ -152,6 +281,7 @@ class LogClient:
             result: 실행 결과
             error_message: 에러 메시지
             error_traceback: 에러 스택 트레이스
+            attempt: 같은 실행 안에서 노드의 실행 번호 (기본 1)
         """
         try:
             await self.send_log(
@@ -168,11 +298,80 @@ class LogClient:
                 result=result,
                 error_message=error_message,
                 error_traceback=error_traceback,
+                attempt=attempt,
             )
         except Exception as e:
             # 로그 전송 실패는 노드 실행에 영향을 주지 않도록 조용히 처리
             logger.debug(f"[LogClient] 로그 전송 실패 (무시됨): {e!s}")
 
+    def _enqueue(self, payload: dict[str, Any]) -> None:
+        """
+        buffered 모드에서 로그를 버퍼에 넣고 전송을 예약합니다.
+
+        Args:
+            payload: 로그 레코드
+        """
+        if len(self._buffer) == self._buffer.maxlen:
+            self.dropped += 1
+            if self.dropped == 1 or self.dropped % 1000 == 0:
+                logger.warning(f"[LogClient] 로그 버퍼가 가득 차 오래된 로그를 버렸습니다. (누적 {self.dropped}개)")
+        self._buffer.append(payload)
+
+        if self._flush_task is None or self._flush_task.done():
+            self._flush_wakeup = asyncio.Event()
+            self._flush_task = asyncio.get_running_loop().create_task(self._flush_loop())
+        elif len(self._buffer) >= self.batch_size and self._flush_wakeup is not None:
+            self._flush_wakeup.set()
+
+    async def _flush_loop(self) -> None:
+        """버퍼가 빌 때까지 전송 간격마다 (버퍼가 차면 즉시) 전송합니다."""
+        while self._buffer:
+            if len(self._buffer) < self.batch_size and self._flush_wakeup is not None:
+                with contextlib.suppress(asyncio.TimeoutError):
+                    await asyncio.wait_for(self._flush_wakeup.wait(), timeout=self.flush_interval)
+                self._flush_wakeup.clear()
+            await self.flush()
+
+    async def flush(self) -> bool:
+        """
+        buffered 모드에서 버퍼의 로그를 일괄 수집 API로 전송합니다. (전송 실패한 로그는 버림)
+
+        Returns:
+            모든 배치 전송 성공 여부
+        """
+        records = coalesce_log_records(list(self._buffer))
+        self._buffer.clear()
+        success = True
+        for index in range(0, len(records), self.batch_size):
+            batch = records[index : index + self.batch_size]
+            try:
+                async with self._get_session().post(self.batch_endpoint, json=batch) as response:
+                    if response.status == 200:
+                        logger.debug(f"[LogClient] 로그 일괄 전송 성공 - {len(batch)}개")
+                        continue
+                    error_text = await response.text()
+                    logger.warning(
+                        f"[LogClient] 로그 일괄 전송 실패 - {len(batch)}개, 상태 코드: {response.status}, 응답: {error_text}"
+                    )
+            except Exception as e:
+                logger.warning(f"[LogClient] 로그 일괄 전송 중 오류 발생 - {len(batch)}개, 오류: {e!s}")
+            success = False
+        return success
+
+    async def close(self) -> None:
+        """남은 로그를 전송하고 HTTP 세션을 닫습니다."""
+        if self._flush_task is not None and not self._flush_task.done():
+            # 대기 중인 전송을 바로 시작하게 하고 끝날 때까지 기다림
+            if self._flush_wakeup is not None:
+                self._flush_wakeup.set()
+            await self._flush_task
+        self._flush_task = None
+        if self._buffer:
+            await self.flush()
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+
 
 # 전역 로그 클라이언트 인스턴스
 _log_client: LogClient | None = None
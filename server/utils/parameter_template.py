@@ -0,0 +1,336 @@
+"""
+노드 파라미터 템플릿 유틸리티
+노드 파라미터에서 이전 노드의 출력을 참조하는 표현식을 해석합니다.
+
+표현식 형식:
+    {{previous.output.value}}              # 직전 노드 결과의 output.value
+    {{nodes.login.output.token}}           # 노드 ID(또는 이름)가 login인 노드 결과의 output.token
+    {{nodes.search.output.items.0.name}}   # 리스트는 숫자 인덱스로 접근
+    {{params.character_name}}              # 스크립트 호출(call-script 노드) 시 전달된 입력 파라미터
+
+- 파라미터 값 전체가 하나의 표현식이면 참조한 값을 타입 그대로 사용합니다.
+- 문자열 안에 섞여 있으면 문자열로 치환합니다. (예: "Bearer {{nodes.login.output.token}}")
+- 참조한 노드나 필드가 없으면 None(문자열 치환 시 빈 문자열)이 됩니다.
+
+표현식은 워크플로우 실행 시작 시 한 번만 해석되어 접근 함수(클로저)로 컴파일되며,
+노드 실행 시에는 문자열 파싱 없이 컴파일된 함수만 호출합니다.
+"""
+
+from collections.abc import Callable
+from functools import lru_cache
+import json
+import re
+from typing import TYPE_CHECKING, Any
+
+from config.nodes_config import get_node_default_templates, get_previous_output_parameters
+from log import log_manager
+
+if TYPE_CHECKING:
+    from services.node_execution_context import NodeExecutionContext
+
+logger = log_manager.logger
+
+# 표현식 패턴 ({{ ... }})
+TEMPLATE_PATTERN = re.compile(r"\{\{\s*([^{}]+?)\s*\}\}")
+
+# 렌더러: 컨텍스트를 받아 파라미터 값을 만드는 함수
+Renderer = Callable[["NodeExecutionContext | None"], Any]
+
+
+class TemplateError(ValueError):
+    """잘못된 템플릿 표현식 예외"""
+
+
+def _compile_keys(segments: list[str]) -> Callable[[Any], Any]:
+    """
+    분리된 필드 경로로 값 접근 함수를 만듭니다.
+
+    Args:
+        segments: 필드 경로 세그먼트 목록 (예: ["output", "items", "0"])
+
+    Returns:
+        값을 받아 경로를 따라간 결과를 반환하는 함수 (경로가 없으면 None)
+    """
+    # keys: (dict 키, 리스트 인덱스) 쌍 (숫자 세그먼트만 인덱스를 가짐)
+    keys = tuple((segment, int(segment) if segment.lstrip("-").isdigit() else None) for segment in segments)
+    if not keys:
+        return lambda value: value
+
+    def access(value: Any) -> Any:
+        for key, index in keys:
+            if isinstance(value, dict):
+                value = value.get(key)
+            elif isinstance(value, list) and index is not None and -len(value) <= index < len(value):
+                value = value[index]
+            else:
+                return None
+        return value
+
+    return access
+
+
+@lru_cache(maxsize=1024)
+def compile_field_path(field_path: str, root: str | None = None) -> Callable[[Any], Any]:
+    """
+    필드 경로(예: "output.value")를 값 접근 함수로 컴파일합니다. (같은 경로는 재사용)
+
+    Args:
+        field_path: 점(.)으로 구분된 필드 경로 (빈 문자열이면 값 전체)
+        root: 경로 첫 세그먼트가 이 값이면 생략 (예: 이미 output을 받은 경우 "output")
+
+    Returns:
+        값을 받아 경로를 따라간 결과를 반환하는 함수
+    """
+    segments = [segment for segment in field_path.strip().split(".") if segment]
+    if root is not None and segments and segments[0] == root:
+        segments = segments[1:]
+    return _compile_keys(segments)
+
+
+class Accessor:
+    """컴파일된 노드 출력 참조 표현식 (컨텍스트에서 노드 결과를 찾아 필드 경로를 따라감)"""
+
+    __slots__ = ("_get", "_source", "expression", "node_ref")
+
+    def __init__(self, expression: str) -> None:
+        """
+        Accessor 초기화 (표현식을 한 번만 해석)
+
+        Args:
+            expression: 중괄호를 제외한 표현식 (예: "nodes.login.output.token")
+
+        Raises:
+            TemplateError: 표현식 형식이 잘못된 경우
+        """
+        self.expression = expression
+        segments = expression.strip().split(".")
+        # node_ref: 참조하는 노드 ID 또는 이름 (previous/params면 None)
+        if segments[0] == "params":
+            self.node_ref: str | None = None
+            self._source: Callable[[NodeExecutionContext], Any] = _get_call_params
+            path = segments[1:]
+        elif segments[0] == "previous":
+            self.node_ref = None
+            self._source = _get_previous_result
+            path = segments[1:]
+        elif segments[0] == "nodes" and len(segments) >= 2 and segments[1]:
+            node_ref = segments[1]
+            self.node_ref = node_ref
+            self._source = lambda context: (
+                context.get_node_result(node_ref) or context.get_node_result_by_name(node_ref)
+            )
+            path = segments[2:]
+        else:
+            raise TemplateError(
+                f"지원하지 않는 표현식입니다: {{{{{expression}}}}} (previous.*, nodes.<노드>.* 또는 params.*)"
+            )
+        self._get = _compile_keys(path)
+
+    def __call__(self, context: "NodeExecutionContext | None") -> Any:
+        if context is None:
+            return None
+        return self._get(self._source(context))
+
+
+def _get_previous_result(context: "NodeExecutionContext") -> Any:
+    """직전 노드 결과를 반환합니다."""
+    return context.get_previous_node_result()
+
+
+def _get_call_params(context: "NodeExecutionContext") -> Any:
+    """스크립트 호출 시 전달된 입력 파라미터를 반환합니다. (호출된 스크립트가 아니면 None)"""
+    return context.workflow_data.get("params")
+
+
+@lru_cache(maxsize=1024)
+def compile_expression(expression: str) -> Accessor:
+    """
+    표현식을 접근 함수로 컴파일합니다. (같은 표현식은 재사용)
+
+    Args:
+        expression: 중괄호를 제외한 표현식
+
+    Returns:
+        컴파일된 접근 함수
+
+    Raises:
+        TemplateError: 표현식 형식이 잘못된 경우
+    """
+    return Accessor(expression)
+
+
+def _to_text(value: Any) -> str:
+    """문자열 치환용 변환 (None은 빈 문자열, dict/list는 JSON)"""
+    if value is None:
+        return ""
+    if isinstance(value, (dict, list)):
+        return json.dumps(value, ensure_ascii=False)
+    return str(value)
+
+
+def _compile_value(value: Any, referenced: set[str]) -> Renderer | None:
+    """
+    파라미터 값을 렌더러로 컴파일합니다.
+
+    Args:
+        value: 파라미터 값 (문자열, dict, list 등)
+        referenced: 참조하는 노드 ID/이름을 모을 집합
+
+    Returns:
+        렌더러 또는 None (표현식이 없는 값)
+
+    Raises:
+        TemplateError: 표현식 형식이 잘못된 경우
+    """
+    if isinstance(value, str):
+        if "{{" not in value:
+            return None
+        matches = list(TEMPLATE_PATTERN.finditer(value))
+        if not matches:
+            return None
+        accessors = [compile_expression(match.group(1)) for match in matches]
+        referenced.update(accessor.node_ref for accessor in accessors if accessor.node_ref)
+
+        # 값 전체가 하나의 표현식이면 참조한 값을 타입 그대로 사용
+        if len(matches) == 1 and matches[0].span() == (0, len(value)):
+            return accessors[0]
+
+        # 문자열 안의 표현식은 문자열로 치환 (리터럴 조각과 접근 함수를 번갈아 배치)
+        parts: list[str | Accessor] = []
+        position = 0
+        for match, accessor in zip(matches, accessors, strict=True):
+            if match.start() > position:
+                parts.append(value[position : match.start()])
+            parts.append(accessor)
+            position = match.end()
+        if position < len(value):
+            parts.append(value[position:])
+        return lambda context: "".join(part if isinstance(part, str) else _to_text(part(context)) for part in parts)
+
+    if isinstance(value, dict):
+        renderers = {key: _compile_value(item, referenced) for key, item in value.items()}
+        if not any(renderers.values()):
+            return None
+        return lambda context: {
+            key: (renderer(context) if renderer else value[key]) for key, renderer in renderers.items()
+        }
+
+    if isinstance(value, list):
+        item_renderers = [_compile_value(item, referenced) for item in value]
+        if not any(item_renderers):
+            return None
+        return lambda context: [
+            renderer(context) if renderer else item for renderer, item in zip(item_renderers, value, strict=True)
+        ]
+
+    return None
+
+
+class ParameterTemplate:
+    """노드 하나의 컴파일된 파라미터 템플릿 클래스"""
+
+    __slots__ = ("referenced_nodes", "renderers")
+
+    def __init__(self, renderers: dict[str, Renderer], referenced_nodes: frozenset[str]) -> None:
+        """
+        ParameterTemplate 초기화
+
+        Args:
+            renderers: 파라미터 이름 → 렌더러 (표현식이 있는 파라미터만)
+            referenced_nodes: 참조하는 노드 ID/이름
+        """
+        self.renderers = renderers
+        self.referenced_nodes = referenced_nodes
+
+    @classmethod
+    def compile(cls, parameters: dict[str, Any], node_type: str | None = None) -> "ParameterTemplate | None":
+        """
+        노드 파라미터를 컴파일합니다.
+
+        노드 타입별 기본 템플릿(조건 노드의 previous_output, 엑셀 닫기 노드의 execution_id 등)은
+        파라미터가 비어 있을 때 적용되고, "이전 노드 출력에서 선택"하는 파라미터의 필드 경로(예: "output.value")는
+        직전 노드 결과 참조로 해석합니다. 잘못된 표현식은 경고 로그를 남기고 문자열 그대로 사용합니다.
+
+        Args:
+            parameters: 노드 파라미터 (data와 parameters를 병합한 값)
+            node_type: 노드 타입
+
+        Returns:
+            컴파일된 템플릿 또는 None (표현식이 없는 경우)
+        """
+        sources = dict(parameters)
+        if node_type:
+            for key, template in get_node_default_templates(node_type).items():
+                if sources.get(key) in (None, ""):
+                    sources[key] = template
+            for key in get_previous_output_parameters(node_type):
+                value = sources.get(key)
+                if isinstance(value, str) and (value == "output" or value.startswith("output.")):
+                    sources[key] = f"{{{{previous.{value}}}}}"
+
+        renderers: dict[str, Renderer] = {}
+        referenced: set[str] = set()
+        for key, value in sources.items():
+            if key.startswith("_"):
+                continue
+            try:
+                renderer = _compile_value(value, referenced)
+            except TemplateError as e:
+                logger.warning(f"[ParameterTemplate] 파라미터 템플릿 무시 - 파라미터: {key}, 사유: {e!s}")
+                continue
+            if renderer is not None:
+                renderers[key] = renderer
+
+        if not renderers:
+            return None
+        return cls(renderers, frozenset(referenced))
+
+    def render(self, parameters: dict[str, Any], context: "NodeExecutionContext | None") -> dict[str, Any]:
+        """
+        표현식이 있는 파라미터를 컨텍스트의 노드 결과로 치환합니다.
+
+        Args:
+            parameters: 노드 파라미터
+            context: 노드 실행 컨텍스트
+
+        Returns:
+            치환된 파라미터 (새 dict)
+        """
+        rendered = dict(parameters)
+        for key, renderer in self.renderers.items():
+            rendered[key] = renderer(context)
+        return rendered
+
+
+def compile_node_templates(nodes: list[dict[str, Any]]) -> dict[str, ParameterTemplate | None]:
+    """
+    워크플로우의 모든 노드 파라미터를 컴파일합니다. (실행 시작 시 한 번 호출)
+
+    Args:
+        nodes: 실행할 노드 목록
+
+    Returns:
+        노드 ID → 컴파일된 템플릿 (표현식이 없는 노드는 None)
+    """
+    templates: dict[str, ParameterTemplate | None] = {}
+    for node in nodes:
+        parameters = {**(node.get("data") or {}), **(node.get("parameters") or {})}
+        templates[node.get("id", "")] = ParameterTemplate.compile(parameters, node.get("type"))
+    return templates
+
+
+def referenced_node_refs(templates: dict[str, ParameterTemplate | None]) -> set[str]:
+    """
+    컴파일된 템플릿이 참조하는 노드 ID/이름을 모두 수집합니다.
+
+    Args:
+        templates: 노드 ID → 컴파일된 템플릿
+
+    Returns:
+        참조하는 노드 ID/이름 집합
+    """
+    refs: set[str] = set()
+    for template in templates.values():
+        if template is not None:
+            refs.update(template.referenced_nodes)
+    return refs
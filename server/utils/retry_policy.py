@@ -0,0 +1,179 @@
+"""
+노드 재시도 정책 유틸리티
+노드 파라미터(또는 노드의 retry 필드)에 선언한 재시도 정책을 해석합니다.
+
+정책 형식 (retry):
+    {
+        "max_attempts": 3,                       # 최대 시도 횟수 (첫 시도 포함)
+        "retry_on": ["timeout", "request_failed"],  # 재시도할 실패 사유 ("failed"면 모든 실패)
+        "initial_delay": 0.5,                    # 첫 재시도 전 대기 시간 (초)
+        "backoff_multiplier": 2.0,               # 재시도마다 대기 시간 배수 (지수 백오프)
+        "max_delay": 30,                         # 대기 시간 상한 (초)
+        "jitter": 0.2,                           # 대기 시간 무작위 변동 비율 (0.2 → ±20%)
+        "budget_seconds": 60                     # 모든 시도와 대기를 합친 총 시간 예산 (초, 선택)
+    }
+
+숫자만 지정하면 max_attempts로 해석합니다. (예: "retry": 3)
+취소(reason="cancelled")된 시도는 재시도하지 않습니다.
+"""
+
+import random
+from typing import Any
+
+# 모든 실패를 재시도 대상으로 지정하는 retry_on 값
+RETRY_ON_ANY_FAILURE = "failed"
+
+
+class RetryPolicy:
+    """노드 재시도 정책 클래스"""
+
+    def __init__(
+        self,
+        max_attempts: int = 3,
+        retry_on: list[str] | None = None,
+        initial_delay: float = 0.5,
+        backoff_multiplier: float = 2.0,
+        max_delay: float = 30.0,
+        jitter: float = 0.2,
+        budget_seconds: float | None = None,
+    ) -> None:
+        """
+        RetryPolicy 초기화
+
+        Args:
+            max_attempts: 최대 시도 횟수 (첫 시도 포함, 1 이상)
+            retry_on: 재시도할 실패 사유 목록 (None이면 모든 실패)
+            initial_delay: 첫 재시도 전 대기 시간 (초)
+            backoff_multiplier: 재시도마다 대기 시간 배수
+            max_delay: 대기 시간 상한 (초)
+            jitter: 대기 시간 무작위 변동 비율 (0~1)
+            budget_seconds: 총 시간 예산 (초, None이면 제한 없음)
+        """
+        self.max_attempts = max(1, int(max_attempts))
+        # retry_on: frozenset으로 저장하여 실패 사유 조회를 O(1)로 처리
+        self.retry_on = frozenset(retry_on or [RETRY_ON_ANY_FAILURE])
+        self.initial_delay = max(0.0, float(initial_delay))
+        self.backoff_multiplier = max(1.0, float(backoff_multiplier))
+        self.max_delay = max(0.0, float(max_delay))
+        self.jitter = min(1.0, max(0.0, float(jitter)))
+        self.budget_seconds = float(budget_seconds) if budget_seconds else None
+
+    @classmethod
+    def from_config(cls, config: Any) -> "RetryPolicy | None":
+        """
+        선언된 재시도 설정으로 정책을 생성합니다.
+
+        Args:
+            config: 재시도 설정 (dict 또는 최대 시도 횟수 숫자)
+
+        Returns:
+            재시도 정책 또는 None (설정이 없거나 최대 시도 횟수가 1 이하인 경우)
+
+        Raises:
+            ValueError: 설정 형식이 잘못된 경우
+        """
+        if config is None or config is False or config == {}:
+            return None
+        if isinstance(config, bool):
+            raise ValueError("재시도 설정은 객체 또는 최대 시도 횟수여야 합니다.")
+        if isinstance(config, (int, float, str)):
+            config = {"max_attempts": config}
+        if not isinstance(config, dict):
+            raise ValueError("재시도 설정은 객체 또는 최대 시도 횟수여야 합니다.")
+
+        retry_on = config.get("retry_on")
+        if isinstance(retry_on, str):
+            retry_on = [item.strip() for item in retry_on.split(",") if item.strip()]
+        elif retry_on is not None and not isinstance(retry_on, list):
+            raise ValueError("retry_on은 실패 사유 목록이어야 합니다.")
+
+        try:
+            policy = cls(
+                max_attempts=int(config.get("max_attempts", 3)),
+                retry_on=[str(item) for item in retry_on] if retry_on else None,
+                initial_delay=float(config.get("initial_delay", 0.5)),
+                backoff_multiplier=float(config.get("backoff_multiplier", 2.0)),
+                max_delay=float(config.get("max_delay", 30.0)),
+                jitter=float(config.get("jitter", 0.2)),
+                budget_seconds=float(config["budget_seconds"]) if config.get("budget_seconds") else None,
+            )
+        except (TypeError, ValueError) as e:
+            raise ValueError(f"재시도 설정 값이 올바르지 않습니다: {e!s}") from e
+
+        return policy if policy.max_attempts > 1 else None
+
+    def should_retry(self, result: dict[str, Any]) -> bool:
+        """
+        실행 결과가 재시도 대상인지 확인합니다.
+
+        Args:
+            result: 정규화된 노드 실행 결과
+
+        Returns:
+            재시도 대상 여부
+        """
+        if result.get("status") != "failed" and not result.get("error"):
+            return False
+        reason = get_failure_reason(result)
+        if reason == "cancelled":
+            return False
+        return RETRY_ON_ANY_FAILURE in self.retry_on or reason in self.retry_on
+
+    def backoff_delay(self, attempt: int) -> float:
+        """
+        attempt번째 시도가 실패한 뒤 다음 시도 전까지 대기할 시간을 계산합니다.
+
+        Args:
+            attempt: 실패한 시도 번호 (1부터 시작)
+
+        Returns:
+            대기 시간 (초, 지수 백오프 + 지터)
+        """
+        delay = min(self.max_delay, self.initial_delay * (self.backoff_multiplier ** (attempt - 1)))
+        if self.jitter > 0 and delay > 0:
+            delay *= random.uniform(1.0 - self.jitter, 1.0 + self.jitter)
+        return max(0.0, delay)
+
+    def to_dict(self) -> dict[str, Any]:
+        """정책을 딕셔너리로 변환합니다."""
+        return {
+            "max_attempts": self.max_attempts,
+            "retry_on": sorted(self.retry_on),
+            "initial_delay": self.initial_delay,
+            "backoff_multiplier": self.backoff_multiplier,
+            "max_delay": self.max_delay,
+            "jitter": self.jitter,
+            "budget_seconds": self.budget_seconds,
+        }
+
+
+def get_failure_reason(result: dict[str, Any]) -> str | None:
+    """
+    실패 결과에서 실패 사유(error.reason)를 추출합니다.
+
+    Args:
+        result: 노드 실행 결과
+
+    Returns:
+        실패 사유 또는 None
+    """
+    error = result.get("error")
+    return error.get("reason") if isinstance(error, dict) else None
+
+
+def get_retry_policy(parameters: dict[str, Any] | None) -> RetryPolicy | None:
+    """
+    노드 파라미터에서 재시도 정책을 가져옵니다.
+    process_node에서 해석한 _retry_policy가 있으면 사용하고, 없으면 retry 파라미터를 해석합니다.
+
+    Args:
+        parameters: 노드 파라미터
+
+    Returns:
+        재시도 정책 또는 None
+    """
+    parameters = parameters or {}
+    policy = parameters.get("_retry_policy")
+    if isinstance(policy, RetryPolicy):
+        return policy
+    return RetryPolicy.from_config(parameters.get("retry"))
@@ -0,0 +1,67 @@
+"""
+서버 테스트 공통 설정
+서버 모듈은 server 디렉토리를 기준으로 import하므로(예: from db.database import db_manager) 경로에 추가하고,
+테스트마다 임시 파일 DB를 사용합니다.
+"""
+
+from collections.abc import Callable, Iterator
+from itertools import pairwise
+import os
+import sys
+from typing import Any
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "server"))
+
+from db.database import DatabaseManager, db_manager
+from services.workflow_plan import workflow_plan_cache
+
+
+@pytest.fixture
+def db(tmp_path: Any, monkeypatch: pytest.MonkeyPatch) -> Iterator[DatabaseManager]:
+    """임시 파일 DB로 초기화한 전역 db_manager (테스트가 끝나면 실행 계획 캐시도 비움)"""
+    monkeypatch.setattr(db_manager.connection, "db_path", str(tmp_path / "workflows.db"))
+    db_manager.init_database()
+    workflow_plan_cache.clear()
+    yield db_manager
+    workflow_plan_cache.clear()
+
+
+@pytest.fixture
+def create_workflow(db: DatabaseManager) -> Callable[..., int]:
+    """
+    시작 노드 뒤에 대기 노드를 순서대로 연결한 스크립트를 만드는 함수
+
+    사용 예시:
+        script_id = create_workflow("w1", "w2", "w3")  # start → w1 → w2 → w3
+    """
+
+    def create(*node_ids: str, name: str = "테스트 스크립트") -> int:
+        script_id = db.create_script(name)
+        nodes = [
+            {
+                "id": "start",
+                "type": "start",
+                "position": {"x": 0.0, "y": 0.0},
+                "data": {"title": "시작"},
+                "parameters": {},
+            }
+        ]
+        nodes += [
+            {
+                "id": node_id,
+                "type": "wait",
+                "position": {"x": 300.0 * index, "y": 0.0},
+                "data": {"title": node_id},
+                "parameters": {"wait_time": 0},
+            }
+            for index, node_id in enumerate(node_ids, start=1)
+        ]
+        connections = [
+            {"from": source, "to": target, "outputType": None} for source, target in pairwise(["start", *node_ids])
+        ]
+        db.save_script_data(script_id, nodes, connections)
+        return script_id
+
+    return create
@@ -0,0 +1,108 @@
+"""체크포인트 재개 테스트 (실패/취소/중단된 실행을 같은 실행 ID로 이어서 실행)"""
+
+import asyncio
+from collections.abc import Callable
+from typing import Any
+
+from db.database import DatabaseManager
+from services.action_service import ActionService
+from services.log_sink import log_sink
+from services.node_execution_context import NodeExecutionContext
+from services.script_runner import ScriptRunner
+from utils.cancellation import cancellation_registry
+
+
+class InterruptingActionService(ActionService):
+    """지정한 노드를 실행한 직후 실행을 취소하거나, 지정한 노드를 한 번 실패시키는 ActionService"""
+
+    def __init__(self, cancel_after: str | None = None, fail_at: str | None = None) -> None:
+        super().__init__()
+        self.cancel_after = cancel_after
+        self.fail_at = fail_at
+        self.executed: list[str] = []
+
+    async def process_node(
+        self,
+        node: dict[str, Any],
+        context: NodeExecutionContext | None = None,
+        execution_id: str | None = None,
+        script_id: int | None = None,
+    ) -> dict[str, Any]:
+        if node["id"] == self.fail_at:
+            self.fail_at = None
+            return {"action": node["type"], "status": "failed", "error": "테스트 실패", "output": None}
+        result = await super().process_node(node, context, execution_id=execution_id, script_id=script_id)
+        self.executed.append(node["id"])
+        if node["id"] == self.cancel_after and execution_id is not None:
+            cancellation_registry.cancel(execution_id, "실행 큐에서 취소되었습니다.")
+        return result
+
+
+def _run(service: ActionService, script_id: int, execution_id: str, resume: bool = False) -> dict[str, Any]:
+    """로그 싱크를 켠 상태로 스크립트를 실행합니다. (노드 실행 로그가 테스트 DB에 기록됨)"""
+
+    async def run() -> dict[str, Any]:
+        await log_sink.start()
+        try:
+            return await ScriptRunner(action_service=service).run_script(
+                script_id, execution_id=execution_id, resume=resume, checkpoint_interval_seconds=0
+            )
+        finally:
+            await log_sink.stop()
+
+    return asyncio.run(run())
+
+
+def test_resume_cancelled_run_executes_remaining_nodes(
+    db: DatabaseManager, create_workflow: Callable[..., int]
+) -> None:
+    script_id = create_workflow("w1", "w2", "w3")
+
+    first = _run(InterruptingActionService(cancel_after="w1"), script_id, "exec-cancelled")
+    assert first["status"] == "cancelled"
+    checkpoint = db.execution_checkpoints.get_checkpoint("exec-cancelled")
+    assert checkpoint["status"] == "cancelled"
+    assert checkpoint["cursor_state"]["node_id"] == "w2"
+    assert set(checkpoint["cursor_state"]["visited"]) == {"start", "w1"}
+
+    service = InterruptingActionService()
+    resumed = _run(service, script_id, "exec-cancelled", resume=True)
+    assert resumed["status"] == "success"
+    assert resumed["resumed"] is True
+    assert service.executed == ["w2", "w3"]
+    # 성공한 실행의 체크포인트는 삭제됨
+    assert db.execution_checkpoints.get_checkpoint("exec-cancelled") is None
+    # 재개 전후 실행한 노드가 노드마다 완료 로그 하나씩 남음
+    logs = db.node_execution_logs.get_logs_by_execution_id("exec-cancelled")
+    assert [(log["node_id"], log["status"]) for log in logs] == [
+        ("start", "completed"),
+        ("w1", "completed"),
+        ("w2", "completed"),
+        ("w3", "completed"),
+    ]
+
+
+def test_resume_failed_run_retries_failed_node(db: DatabaseManager, create_workflow: Callable[..., int]) -> None:
+    script_id = create_workflow("w1", "w2", "w3")
+
+    first = _run(InterruptingActionService(fail_at="w2"), script_id, "exec-failed")
+    assert first["status"] == "error"
+    assert db.execution_checkpoints.get_checkpoint("exec-failed")["status"] == "failed"
+
+    service = InterruptingActionService()
+    resumed = _run(service, script_id, "exec-failed", resume=True)
+    assert resumed["status"] == "success"
+    assert service.executed == ["w2", "w3"]
+
+
+def test_resume_interrupted_run(db: DatabaseManager, create_workflow: Callable[..., int]) -> None:
+    script_id = create_workflow("w1", "w2", "w3")
+    _run(InterruptingActionService(cancel_after="w2"), script_id, "exec-interrupted")
+    # 서버가 실행 도중 종료된 상황: 체크포인트가 running으로 남아 있다가 다음 시작 시 interrupted로 표시됨
+    db.execution_checkpoints.update_status("exec-interrupted", "running")
+    assert db.execution_checkpoints.mark_interrupted() == 1
+
+    service = InterruptingActionService()
+    resumed = _run(service, script_id, "exec-interrupted", resume=True)
+    assert resumed["status"] == "success"
+    assert service.executed == ["w3"]
@@ -0,0 +1,126 @@
+"""조건 술어의 배치 평가와 값별 평가 일치 테스트"""
+
+from typing import Any
+
+import pytest
+
+from utils.condition_predicate import CONDITION_TYPES, ConditionError, compile_condition
+
+# 문자열/숫자/불리언/컨테이너/None이 섞인 입력
+VALUES: list[Any] = [
+    None,
+    "",
+    " ",
+    "abc",
+    "ABC",
+    "a.c",
+    "xyz",
+    "10",
+    "-3.5",
+    " 42 ",
+    "1e3",
+    "nan",
+    "inf",
+    0,
+    5,
+    10,
+    -2.5,
+    100.0,
+    float("nan"),
+    True,
+    False,
+    [],
+    [1, 2],
+    {},
+    {"status": "ok"},
+    (),
+]
+
+# 조건 타입별 비교 값 (특수 문자가 없는 정규식과 일반 정규식을 모두 포함)
+COMPARE_VALUES: dict[str, list[Any]] = {
+    "equals": ["abc", "10", "", "None", 5],
+    "not_equals": ["abc", "10"],
+    "contains": ["b", "1", ""],
+    "not_contains": ["b", "1"],
+    "greater_than": [5, "4.5", "abc"],
+    "less_than": [5, "-1"],
+    "greater_or_equal": [10, "0"],
+    "less_or_equal": [10, "0"],
+    "is_empty": [""],
+    "is_not_empty": [""],
+    "regex": ["a", "a.c", "^[0-9]+$", ""],
+    "not_regex": ["a", "^x"],
+    "between": ["0,10", "10, 0", [1, 5]],
+    "not_between": ["0,10", "-3,3"],
+    "in": ["abc, 10, 5", ["abc", "True"], ""],
+    "not_in": ["abc, 10", ["xyz"]],
+}
+
+CASES = [
+    (condition_type, compare_value)
+    for condition_type in CONDITION_TYPES
+    for compare_value in COMPARE_VALUES[condition_type]
+]
+
+
+def _assert_batch_matches_scalar(definition: dict[str, Any], values: list[Any]) -> None:
+    predicate = compile_condition(definition)
+    batch = predicate.evaluate_batch(values)
+    assert batch.dtype == bool
+    assert batch.tolist() == [predicate(value) for value in values]
+
+
+def test_every_condition_type_has_cases() -> None:
+    assert set(COMPARE_VALUES) == set(CONDITION_TYPES)
+
+
+@pytest.mark.parametrize(("condition_type", "compare_value"), CASES)
+def test_batch_matches_scalar(condition_type: str, compare_value: Any) -> None:
+    _assert_batch_matches_scalar({"condition_type": condition_type, "compare_value": compare_value}, VALUES)
+
+
+@pytest.mark.parametrize(("condition_type", "compare_value"), CASES)
+def test_batch_matches_scalar_with_field_path(condition_type: str, compare_value: Any) -> None:
+    values = [{"data": {"value": value}} for value in VALUES] + [None, {}, {"data": None}, "text"]
+    definition = {"condition_type": condition_type, "compare_value": compare_value, "field_path": "output.data.value"}
+    _assert_batch_matches_scalar(definition, values)
+
+
+def test_batch_matches_scalar_for_combinations() -> None:
+    definition = {
+        "or": [
+            {
+                "and": [
+                    {"condition_type": "greater_than", "compare_value": 0},
+                    {"condition_type": "regex", "compare_value": "^[0-9]"},
+                ]
+            },
+            {"not": {"condition_type": "is_not_empty"}},
+            {"condition_type": "in", "compare_value": "abc, xyz"},
+        ]
+    }
+    _assert_batch_matches_scalar(definition, VALUES)
+
+
+def test_batch_of_nothing_is_empty() -> None:
+    for condition_type in CONDITION_TYPES:
+        predicate = compile_condition(
+            {"condition_type": condition_type, "compare_value": COMPARE_VALUES[condition_type][0]}
+        )
+        assert predicate.evaluate_batch([]).tolist() == []
+
+
+@pytest.mark.parametrize(
+    "definition",
+    [
+        {"condition_type": "unknown"},
+        {"condition_type": "regex", "compare_value": "("},
+        {"condition_type": "between", "compare_value": "a,b"},
+        {"condition_type": "between", "compare_value": "5"},
+        {"and": []},
+        {"not": "equals"},
+    ],
+)
+def test_invalid_definition_raises(definition: dict[str, Any]) -> None:
+    with pytest.raises(ConditionError):
+        compile_condition(definition)
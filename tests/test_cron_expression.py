@@ -0,0 +1,57 @@
+"""크론 표현식 다음 실행 시각 계산 테스트"""
+
+from datetime import datetime
+
+import pytest
+
+from utils.cron_expression import CronExpression
+
+# 기준 시각: 2026-10-19 (월) 10:07:30
+BASE = datetime(2026, 10, 19, 10, 7, 30)
+
+
+@pytest.mark.parametrize(
+    ("expression", "moment", "expected"),
+    [
+        ("* * * * *", BASE, datetime(2026, 10, 19, 10, 8)),
+        ("*/15 * * * *", BASE, datetime(2026, 10, 19, 10, 15)),
+        ("0 */2 * * *", BASE, datetime(2026, 10, 19, 12, 0)),
+        ("0,30 9-18 * * *", datetime(2026, 10, 19, 18, 30), datetime(2026, 10, 20, 9, 0)),
+        # 평일만: 금요일 저녁 이후 다음 실행은 월요일
+        ("30 9 * * mon-fri", datetime(2026, 10, 23, 18, 0), datetime(2026, 10, 26, 9, 30)),
+        # 요일 7도 일요일
+        ("0 8 * * 7", BASE, datetime(2026, 10, 25, 8, 0)),
+        ("0 0 1 jan *", BASE, datetime(2027, 1, 1, 0, 0)),
+        # 윤년의 2월 29일
+        ("0 12 29 2 *", BASE, datetime(2028, 2, 29, 12, 0)),
+        # 일/요일이 둘 다 지정되면 둘 중 하나만 맞아도 실행 (13일 또는 금요일)
+        ("0 0 13 * fri", BASE, datetime(2026, 10, 23, 0, 0)),
+        # 기준 시각과 정확히 같은 시각은 제외 (초과)
+        ("59 23 31 12 *", datetime(2026, 12, 31, 23, 59), datetime(2027, 12, 31, 23, 59)),
+    ],
+)
+def test_next_after(expression: str, moment: datetime, expected: datetime) -> None:
+    assert CronExpression(expression).next_after(moment) == expected
+
+
+def test_next_after_is_strictly_increasing() -> None:
+    cron = CronExpression("*/20 8-9 * * *")
+    moment = datetime(2026, 10, 19, 7, 0)
+    fired = []
+    for _ in range(7):
+        moment = cron.next_after(moment)
+        fired.append(moment.strftime("%d %H:%M"))
+    assert fired == ["19 08:00", "19 08:20", "19 08:40", "19 09:00", "19 09:20", "19 09:40", "20 08:00"]
+
+
+@pytest.mark.parametrize(
+    "expression", ["* * * *", "60 * * * *", "*/0 * * * *", "0 0 * 13 *", "5-1 * * * *", "x * * * *"]
+)
+def test_invalid_expression(expression: str) -> None:
+    with pytest.raises(ValueError, match=r"크론 표현식|필드"):
+        CronExpression(expression)
+
+
+def test_impossible_date_raises() -> None:
+    with pytest.raises(ValueError, match="실행 시각을 찾을 수 없습니다"):
+        CronExpression("0 0 31 2 *").next_after(BASE)
@@ -0,0 +1,119 @@
+"""실행 큐 테스트 (우선순위, 리소스 한도, 배치 실행 순서)"""
+
+import asyncio
+from typing import Any
+
+from db.database import DatabaseManager
+from services.execution_queue import ExecutionQueue, QueuedRun
+
+
+class GatedExecutor:
+    """스크립트별 게이트가 열릴 때까지 실행을 붙잡아 두는 실행 함수 (시작 순서 기록)"""
+
+    def __init__(self) -> None:
+        self.started: list[int] = []
+        self.gates: dict[int, asyncio.Event] = {}
+
+    def gate(self, script_id: int) -> asyncio.Event:
+        return self.gates.setdefault(script_id, asyncio.Event())
+
+    async def __call__(self, run: QueuedRun) -> dict[str, Any]:
+        self.started.append(run.script_id)
+        await self.gate(run.script_id).wait()
+        return {"execution_id": run.execution_id, "status": "success", "error_message": None}
+
+
+async def _settle() -> None:
+    """디스패치 예약(call_soon)과 실행 태스크가 진행되도록 이벤트 루프를 몇 번 돌림"""
+    for _ in range(10):
+        await asyncio.sleep(0)
+
+
+def _create_script(db: DatabaseManager, name: str, node_type: str = "wait") -> int:
+    script_id = db.create_script(name)
+    nodes = [
+        {"id": "start", "type": "start", "position": {"x": 0.0, "y": 0.0}, "data": {}, "parameters": {}},
+        {"id": "n1", "type": node_type, "position": {"x": 300.0, "y": 0.0}, "data": {}, "parameters": {}},
+    ]
+    db.save_script_data(script_id, nodes, [{"from": "start", "to": "n1", "outputType": None}])
+    return script_id
+
+
+def test_priority_scheduling_runs_higher_priority_first(db: DatabaseManager) -> None:
+    first, low, high = (_create_script(db, name) for name in ("first", "low", "high"))
+
+    async def scenario() -> list[int]:
+        executor = GatedExecutor()
+        queue = ExecutionQueue(scheduling="priority", max_concurrent_runs=1, resource_limits={}, run_executor=executor)
+        await queue.enqueue_script(first)
+        await queue.enqueue_script(low, priority=0)
+        await queue.enqueue_script(high, priority=5)
+        await _settle()
+        assert executor.started == [first]
+        assert [run.script_id for run in queue.list_queued()] == [high, low]
+
+        for script_id in (first, high, low):
+            executor.gate(script_id).set()
+            await _settle()
+        return executor.started
+
+    assert asyncio.run(scenario()) == [first, high, low]
+
+
+def test_resource_limit_serializes_runs_sharing_a_resource(db: DatabaseManager) -> None:
+    touch_a = _create_script(db, "touch a", "image-touch")
+    touch_b = _create_script(db, "touch b", "image-touch")
+    waiting = _create_script(db, "wait", "wait")
+
+    async def scenario() -> None:
+        executor = GatedExecutor()
+        queue = ExecutionQueue(max_concurrent_runs=5, resource_limits={"input": 1}, run_executor=executor)
+        run_a = await queue.enqueue_script(touch_a)
+        run_b = await queue.enqueue_script(touch_b)
+        await queue.enqueue_script(waiting)
+        await _settle()
+        # 입력 리소스를 쓰지 않는 실행은 막힌 실행을 건너뛰어 바로 시작
+        assert executor.started == [touch_a, waiting]
+        assert run_a.resources == ["input"]
+        assert queue.limiter.usage == {"input": 1}
+
+        executor.gate(touch_a).set()
+        await _settle()
+        assert executor.started == [touch_a, waiting, touch_b]
+        assert queue.get_run(run_b.run_id).status.value == "running"
+
+        executor.gate(touch_b).set()
+        executor.gate(waiting).set()
+        await _settle()
+        assert queue.limiter.usage == {}
+
+    asyncio.run(scenario())
+
+
+def test_blocked_batch_head_holds_back_rest_of_batch(db: DatabaseManager) -> None:
+    head = _create_script(db, "head", "image-touch")
+    tail = _create_script(db, "tail", "wait")
+
+    async def scenario() -> None:
+        executor = GatedExecutor()
+        queue = ExecutionQueue(max_concurrent_runs=5, resource_limits={"input": 1}, run_executor=executor)
+        # 다른 실행이 입력 리소스를 점유 중
+        assert queue.limiter.try_acquire(["input"])
+
+        runs = await queue.enqueue_active_scripts()
+        assert [run.script_id for run in runs] == [head, tail]
+        await _settle()
+        # 배치의 첫 실행이 막혀 있으므로 뒤 실행도 시작하지 않음 (execution_order 보장)
+        assert executor.started == []
+
+        queue.limiter.release(["input"])
+        await _settle()
+        assert executor.started == [head]
+
+        executor.gate(head).set()
+        await _settle()
+        assert executor.started == [head, tail]
+        executor.gate(tail).set()
+        await _settle()
+
+    asyncio.run(scenario())
@@ -0,0 +1,37 @@
+"""노드 실행 번호(attempt) 카운터 테스트"""
+
+from pathlib import Path
+
+import pytest
+
+from db.database import DatabaseManager, db_manager
+from utils.log_client import NodeAttemptCounter
+
+
+def test_counts_per_execution_and_node(db: DatabaseManager) -> None:
+    counter = NodeAttemptCounter()
+    assert [counter.next("e1", "n1") for _ in range(3)] == [1, 2, 3]
+    assert counter.next("e1", "n2") == 1
+    assert counter.next("e2", "n1") == 1
+    assert counter.next(None, "n1") == counter.next(None, "n1") == 1
+
+
+def test_forgotten_execution_continues_from_recorded_attempts(db: DatabaseManager) -> None:
+    script_id = db.create_script("실행 번호")
+    counter = NodeAttemptCounter(max_executions=1)
+    for _ in range(2):
+        attempt = counter.next("long", "loop")
+        db.node_execution_logs.create_log("long", script_id, "loop", "wait", "반복", "completed", attempt=attempt)
+
+    # 다른 실행이 시작되어 오래 실행 중인 실행을 잊어도 기록된 번호부터 이어서 부여
+    assert counter.next("other", "n1") == 1
+    assert counter.next("long", "loop") == 3
+    assert counter.next("long", "first") == 1
+
+
+def test_failed_lookup_starts_from_one(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    # 테이블이 없는 DB: 조회에 실패해도 실행 번호는 1부터 부여
+    monkeypatch.setattr(db_manager.connection, "db_path", str(tmp_path / "empty.db"))
+    counter = NodeAttemptCounter()
+    assert counter.next("e1", "n1") == 1
+    assert counter.next("e1", "n1") == 2
@@ -0,0 +1,156 @@
+"""노드 실행 로그 UPSERT와 통계/전문 검색 트리거 테스트"""
+
+from typing import Any
+
+import pytest
+
+from db.database import DatabaseManager
+
+
+@pytest.fixture
+def script_id(db: DatabaseManager) -> int:
+    return db.create_script("로그 테스트")
+
+
+def _stats(db: DatabaseManager) -> dict[str, int]:
+    stats = db.log_stats.get_log_stats()
+    return {
+        key: stats[key] for key in ("total", "completed", "failed", "timeout", "cache_hits", "average_execution_time")
+    }
+
+
+def _log(script_id: int, node_id: str, status: str, **fields: Any) -> dict[str, Any]:
+    return {
+        "execution_id": "e1",
+        "script_id": script_id,
+        "node_id": node_id,
+        "node_type": "wait",
+        "status": status,
+        **fields,
+    }
+
+
+def test_upsert_insert_update_delete_keeps_stats_in_sync(db: DatabaseManager, script_id: int) -> None:
+    logs = db.node_execution_logs
+    zero = {"total": 0, "completed": 0, "failed": 0, "timeout": 0, "cache_hits": 0, "average_execution_time": 0}
+    assert _stats(db) == zero
+
+    # 추가: running 로그는 실행 수만 늘림
+    log_id = logs.create_log("e1", script_id, "n1", "wait", "대기", "running")
+    assert _stats(db) == {**zero, "total": 1}
+
+    # 변경: 같은 키의 running 로그가 failed로 바뀜 (시간 초과)
+    updated_id = logs.create_log(
+        "e1",
+        script_id,
+        "n1",
+        "wait",
+        "대기",
+        "failed",
+        execution_time_ms=200,
+        result={"error": {"reason": "timeout", "message": "시간 초과"}},
+        error_message="시간 초과",
+    )
+    assert updated_id == log_id
+    assert _stats(db) == {**zero, "total": 1, "failed": 1, "timeout": 1, "average_execution_time": 200}
+
+    # 이미 끝난 로그는 바뀌지 않음
+    assert logs.create_log("e1", script_id, "n1", "wait", "대기", "completed", execution_time_ms=10) == log_id
+    assert logs.get_log(log_id)["status"] == "failed"
+    assert _stats(db)["completed"] == 0
+
+    # 같은 노드의 다음 실행(attempt 2)은 별도 로그, 캐시 히트는 평균 실행 시간에서 제외
+    second_id = logs.create_log(
+        "e1",
+        script_id,
+        "n1",
+        "wait",
+        "대기",
+        "completed",
+        execution_time_ms=5,
+        result={"meta": {"cache_hit": True}},
+        attempt=2,
+    )
+    assert second_id != log_id
+    assert _stats(db) == {
+        **zero,
+        "total": 1,
+        "completed": 1,
+        "failed": 1,
+        "timeout": 1,
+        "cache_hits": 1,
+        "average_execution_time": 200,
+    }
+
+    # 트리거가 유지한 값은 전체 재계산 결과와 같음
+    maintained = _stats(db)
+    db.log_stats.calculate_and_update_stats()
+    assert _stats(db) == maintained
+
+    # 삭제: 실행의 마지막 로그가 지워지면 실행 수도 줄어듦
+    assert logs.delete_logs_by_execution_id("e1") == 2
+    assert _stats(db) == zero
+
+
+def test_write_logs_matches_sequential_create_log(db: DatabaseManager, script_id: int) -> None:
+    records = [
+        _log(script_id, "n1", "running"),
+        _log(script_id, "n2", "running"),
+        _log(script_id, "n1", "completed", execution_time_ms=100),
+        _log(script_id, "n2", "failed", execution_time_ms=300, error_message="boom"),
+        _log(script_id, "n2", "completed", execution_time_ms=1),
+    ]
+    # 같은 노드의 레코드는 합쳐져 노드마다 한 행으로 기록됨
+    assert db.node_execution_logs.write_logs(records) == 2
+
+    logs = db.node_execution_logs.get_logs_by_execution_id("e1")
+    assert [(log["node_id"], log["status"], log["execution_time_ms"]) for log in logs] == [
+        ("n1", "completed", 100),
+        ("n2", "failed", 300),
+    ]
+    assert _stats(db) == {
+        "total": 1,
+        "completed": 1,
+        "failed": 1,
+        "timeout": 0,
+        "cache_hits": 0,
+        "average_execution_time": 200,
+    }
+
+
+def test_search_index_follows_insert_update_delete(db: DatabaseManager, script_id: int) -> None:
+    logs = db.node_execution_logs
+    log_id = logs.create_log("e1", script_id, "n1", "image-touch", "로그인 버튼", "running")
+    assert [log["id"] for log in logs.search_logs("로그인")[0]] == [log_id]
+    assert logs.search_logs("timeout")[1] == 0
+
+    logs.create_log(
+        "e1",
+        script_id,
+        "n1",
+        "image-touch",
+        "로그인 버튼",
+        "failed",
+        result={"error": {"reason": "timeout", "message": "이미지를 찾지 못했습니다"}},
+    )
+    assert logs.search_logs("timeout")[1] == 1
+    assert logs.search_logs("이미지")[1] == 1
+
+    logs.write_logs([_log(script_id, f"b{index}", "completed", node_name=f"배치 {index}") for index in range(3)])
+    assert logs.search_logs("배치")[1] == 3
+
+    logs.delete_logs_by_execution_id("e1")
+    assert logs.search_logs("로그인")[1] == 0
+    assert logs.search_logs("배치")[1] == 0
+
+
+def test_traceback_only_in_detail_or_requested_fields(db: DatabaseManager, script_id: int) -> None:
+    logs = db.node_execution_logs
+    log_id = logs.create_log(
+        "e1", script_id, "n1", "wait", "대기", "failed", error_message="boom", error_traceback="Traceback ..."
+    )
+
+    assert "error_traceback" not in logs.get_logs_by_execution_id("e1")[0]
+    assert "error_traceback" not in logs.list_logs(status="failed")[0][0]
+    assert logs.list_logs(fields=("id", "error_traceback"))[0] == [{"id": log_id, "error_traceback": "Traceback ..."}]
+    assert logs.get_log(log_id)["error_traceback"] == "Traceback ..."